@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""
+历史归档读取基准测试
+
+模拟 MCP 多日查询（如一个月的话题趋势）：逐日读取全部热榜数据，
+对比逐日打开 SQLite 读取与从按月 Parquet 归档读取的耗时，
+并校验两种方式返回的数据一致。
+
+依赖: pip install pyarrow
+运行方式: python benchmarks/bench_history_archive.py [--days 30] [--platforms 40] [--items 30] [--crawls 24]
+"""
+
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from dataclasses import replace
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 添加项目路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_storage_write import build_crawls
+from trendradar.storage.archive import HAS_PYARROW, HistoryArchive, compact_closed_days
+from trendradar.storage.local import LocalStorageBackend
+from mcp_server.services.parser_service import ParserService
+
+
+def main():
+    parser = argparse.ArgumentParser(description="历史归档读取基准测试")
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--platforms", type=int, default=40)
+    parser.add_argument("--items", type=int, default=30)
+    parser.add_argument("--crawls", type=int, default=24)
+    args = parser.parse_args()
+
+    if not HAS_PYARROW:
+        print("需要安装 pyarrow: pip install pyarrow")
+        sys.exit(1)
+
+    start_date = datetime(2026, 1, 1)
+    dates = [(start_date + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(args.days)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        output_dir = Path(tmp) / "output"
+        backend = LocalStorageBackend(data_dir=str(output_dir), enable_txt=False, enable_html=False)
+        with redirect_stdout(io.StringIO()):
+            for i, date_str in enumerate(dates):
+                for data in build_crawls(args.platforms, args.items, args.crawls, seed=i):
+                    backend.save_news_data(replace(data, date=date_str))
+            backend.cleanup()
+        print(f"{args.days} 天 × {args.platforms} 平台 × {args.items} 条 × {args.crawls} 次抓取")
+
+        # 逐日读取 SQLite（与归档前的 MCP 读取路径一致）
+        parser_service = ParserService(tmp)
+        start = time.perf_counter()
+        expected = [
+            parser_service._read_from_sqlite(datetime.strptime(d, "%Y-%m-%d"), None, "news")
+            for d in dates
+        ]
+        sqlite_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with redirect_stdout(io.StringIO()):
+            compact_closed_days(str(output_dir), before_date="9999-12-31", db_types=("news",))
+        compact_seconds = time.perf_counter() - start
+
+        # 新的读取器（不含已缓存的月份）
+        archive = HistoryArchive(str(output_dir))
+        start = time.perf_counter()
+        actual = [archive.read_day(d, "news") for d in dates]
+        archive_seconds = time.perf_counter() - start
+
+        sqlite_bytes = sum(f.stat().st_size for f in (output_dir / "news").glob("*.db"))
+        archive_bytes = sum(f.stat().st_size for f in (output_dir / "archive" / "news").glob("*.parquet"))
+        months = len(list((output_dir / "archive" / "news").glob("*.crawls.parquet")))
+
+        print(f"SQLite: 读取 {len(dates)} 个文件 {sqlite_seconds * 1000:.0f}ms，共 {sqlite_bytes / 1e6:.1f}MB")
+        print(f"归档:   读取 {months} 个月份 {archive_seconds * 1000:.0f}ms，共 {archive_bytes / 1e6:.1f}MB"
+              f"（归档耗时 {compact_seconds:.1f}s）")
+        print(f"加速: {sqlite_seconds / archive_seconds:.1f}x，结果一致: {expected == actual}")
+
+
+if __name__ == "__main__":
+    main()
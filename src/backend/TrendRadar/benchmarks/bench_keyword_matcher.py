@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""
+关键词匹配基准测试
+
+使用 config/frequency_words.txt 的词组规则，对比逐词组逐词匹配
+（matches_word_groups + 再次扫描词组确定命中词组，即 count_word_frequency 原有写法）
+与编译后的 KeywordMatcher 的耗时，并校验每个标题命中的词组完全一致。
+
+运行方式: python benchmarks/bench_keyword_matcher.py [--titles 20000] [--hit-rate 0.2] [--repeat 3]
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+# 添加项目路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from trendradar.core.frequency import _word_matches, load_frequency_words, matches_word_groups
+from trendradar.core.matcher import KeywordMatcher
+
+
+FILLER = "今日热点新闻发布会市场经济科技公司数据显示用户增长国际体育娱乐回应网友关注事件最新进展"
+
+
+def old_match_group(title, word_groups, filter_words, global_filters):
+    """原有写法：先判断是否匹配，再逐个词组查找第一个命中的词组"""
+    if not matches_word_groups(title, word_groups, filter_words, global_filters):
+        return None
+    title_lower = title.lower()
+    for index, group in enumerate(word_groups):
+        if group["required"] and not all(_word_matches(w, title_lower) for w in group["required"]):
+            continue
+        if group["normal"] and not any(_word_matches(w, title_lower) for w in group["normal"]):
+            continue
+        return index
+    return None
+
+
+def keyword_vocabulary(word_groups, filter_words, global_filters):
+    """从配置中提取可直接拼进标题的关键词（正则按 | 拆分并去掉 \\b）"""
+    vocabulary = []
+    words = [w for g in word_groups for w in g["required"] + g["normal"]] + list(filter_words)
+    for word in words:
+        if word.get("is_regex"):
+            vocabulary.extend(
+                part.replace("\\b", "") for part in word["word"].split("|")
+                if not re.search(r"[\\\[\]()*+?{}^$.]", part.replace("\\b", ""))
+            )
+        else:
+            vocabulary.append(word["word"])
+    vocabulary.extend(w.replace(".*", "") for w in global_filters)
+    return [w for w in vocabulary if w]
+
+
+def build_titles(count, vocabulary, hit_rate, seed=42):
+    """生成模拟标题，约 hit_rate 比例的标题包含 1~2 个关键词"""
+    rng = random.Random(seed)
+    titles = []
+    for _ in range(count):
+        parts = ["".join(rng.choice(FILLER) for _ in range(rng.randint(12, 30)))]
+        if rng.random() < hit_rate:
+            for _ in range(rng.randint(1, 2)):
+                keyword = rng.choice(vocabulary)
+                parts.insert(rng.randint(0, len(parts)), keyword.upper() if rng.random() < 0.3 else keyword)
+        titles.append(" ".join(parts))
+    return titles
+
+
+def main():
+    parser = argparse.ArgumentParser(description="关键词匹配基准测试")
+    parser.add_argument("--titles", type=int, default=20000)
+    parser.add_argument("--hit-rate", type=float, default=0.2)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--config", default="config/frequency_words.txt")
+    args = parser.parse_args()
+
+    word_groups, filter_words, global_filters = load_frequency_words(args.config)
+    vocabulary = keyword_vocabulary(word_groups, filter_words, global_filters)
+    titles = build_titles(args.titles, vocabulary, args.hit_rate)
+    print(f"{len(word_groups)} 个词组，{len(filter_words)} 个过滤词，{len(global_filters)} 个全局过滤词，"
+          f"{len(titles)} 条标题")
+
+    old_seconds = new_seconds = float("inf")
+    expected = actual = None
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        expected = [old_match_group(t, word_groups, filter_words, global_filters) for t in titles]
+        old_seconds = min(old_seconds, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        matcher = KeywordMatcher(word_groups, filter_words, global_filters)
+        actual = [matcher.match_group(t) for t in titles]
+        new_seconds = min(new_seconds, time.perf_counter() - start)
+
+    matched = sum(1 for index in expected if index is not None)
+    print(f"逐词匹配:   {old_seconds * 1000:.0f}ms（{len(titles) / old_seconds:,.0f} titles/sec）")
+    print(f"KeywordMatcher: {new_seconds * 1000:.0f}ms（{len(titles) / new_seconds:,.0f} titles/sec，含编译）")
+    print(f"加速: {old_seconds / new_seconds:.1f}x，命中 {matched} 条，结果一致: {expected == actual}")
+
+
+if __name__ == "__main__":
+    main()
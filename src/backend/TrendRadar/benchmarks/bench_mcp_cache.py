@@ -0,0 +1,190 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""
+MCP 缓存基准测试
+
+对比原有的无界字典缓存与有界 LRU CacheService：
+
+- 并发冷启动：多个线程同时查询同一天的数据，统计实际读取（loader 调用）次数与总耗时
+- 内存占用：依次查询大量不同的日期/平台组合，统计缓存估算占用的峰值
+- 变更令牌：抓取端逐次保存、每次保存之间 MCP 多次查询当天数据，
+  统计缓存命中率与读到过期数据的次数（与绕过缓存直接读取的结果比较）
+
+前两项的"读取"模拟 read_all_titles_for_date 从 SQLite 读取一天的数据（固定延迟 + 构建标题字典），
+变更令牌一项使用真实的 LocalStorageBackend 与 ParserService。
+
+运行方式: python benchmarks/bench_mcp_cache.py [--threads 16] [--titles 20000] [--keys 120] [--max-mb 64] [--crawls 24]
+"""
+
+import argparse
+import io
+import os
+import sys
+import tempfile
+import threading
+import time
+from contextlib import redirect_stdout
+from datetime import datetime
+from pathlib import Path
+
+# 添加项目路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_keyword_matcher import build_titles, FILLER
+from bench_storage_write import DATE, build_crawls
+from trendradar.storage.local import LocalStorageBackend
+from mcp_server.services import cache_service
+from mcp_server.services.cache_service import CacheService, approximate_size
+from mcp_server.services.parser_service import ParserService
+
+
+class OldCacheService:
+    """原有写法：无上限的字典 + 写入时间戳，只在 get 时删除过期条目"""
+
+    def __init__(self):
+        self._cache = {}
+        self._timestamps = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, ttl=900):
+        with self._lock:
+            if key in self._cache:
+                if time.time() - self._timestamps[key] < ttl:
+                    return self._cache[key]
+                del self._cache[key]
+                del self._timestamps[key]
+        return None
+
+    def set(self, key, value):
+        with self._lock:
+            self._cache[key] = value
+            self._timestamps[key] = time.time()
+
+
+def make_loader(titles, platforms: int, delay: float, counter):
+    """模拟读取一天的数据"""
+    def load():
+        with counter["lock"]:
+            counter["calls"] += 1
+        time.sleep(delay)
+        all_titles = {}
+        for i, title in enumerate(titles):
+            all_titles.setdefault(f"p{i % platforms}", {})[title] = {
+                "ranks": [i % 50 + 1], "url": f"https://example.com/{i}", "mobileUrl": "",
+            }
+        return all_titles, {f"p{p}": f"平台{p}" for p in range(platforms)}, {}
+    return load
+
+
+def change_token_run(crawls: int, reads: int):
+    """抓取端每保存一次，MCP 读取 reads 次，返回 (命中率, 过期次数, 读取次数, 单次取令牌耗时秒数)"""
+    date = datetime.strptime(DATE, "%Y-%m-%d")
+    with tempfile.TemporaryDirectory() as tmp:
+        backend = LocalStorageBackend(data_dir=str(Path(tmp) / "output"), enable_txt=False, enable_html=False)
+        cache_service._global_cache = CacheService()
+        parser = ParserService(tmp)
+        stale = 0
+        for data in build_crawls(40, 30, crawls):
+            with redirect_stdout(io.StringIO()):
+                backend.save_news_data(data)
+            for _ in range(reads):
+                cached = parser.read_all_titles_for_date(date)
+                if cached[0] != parser._read_day(date)[0]:
+                    stale += 1
+
+        start = time.perf_counter()
+        for _ in range(1000):
+            parser.get_change_token(date)
+        token_seconds = (time.perf_counter() - start) / 1000
+
+        stats = parser.cache.get_stats()
+        with redirect_stdout(io.StringIO()):
+            backend.cleanup()
+        return stats["hit_rate"], stale, crawls * reads, token_seconds
+
+
+def old_read(cache, key, loader):
+    """原有 read_all_titles_for_date 的缓存写法"""
+    cached = cache.get(key, ttl=3600)
+    if cached:
+        return cached
+    result = loader()
+    cache.set(key, result)
+    return result
+
+
+def concurrent_cold(read, threads: int):
+    """多个线程同时读取同一个未缓存的键，返回耗时"""
+    barrier = threading.Barrier(threads)
+
+    def worker():
+        barrier.wait()
+        read()
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    start = time.perf_counter()
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MCP 缓存基准测试")
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--titles", type=int, default=20000)
+    parser.add_argument("--platforms", type=int, default=40)
+    parser.add_argument("--keys", type=int, default=120)
+    parser.add_argument("--max-mb", type=float, default=64)
+    parser.add_argument("--delay", type=float, default=0.05, help="模拟单次 SQLite 读取的延迟（秒）")
+    parser.add_argument("--crawls", type=int, default=24)
+    parser.add_argument("--reads", type=int, default=20, help="每次抓取之间的查询次数")
+    args = parser.parse_args()
+
+    titles = build_titles(args.titles, list(FILLER), hit_rate=0.0)
+    day_bytes = approximate_size(make_loader(titles, args.platforms, 0, {"calls": 0, "lock": threading.Lock()})())
+    print(f"单日数据 {args.titles} 条标题，估算 {day_bytes / 1024 / 1024:.1f}MB")
+
+    # 并发冷启动
+    old_counter = {"calls": 0, "lock": threading.Lock()}
+    old_cache = OldCacheService()
+    old_loader = make_loader(titles, args.platforms, args.delay, old_counter)
+    old_seconds = concurrent_cold(lambda: old_read(old_cache, "read_all:news:2026-01-01:all", old_loader),
+                                  args.threads)
+
+    new_counter = {"calls": 0, "lock": threading.Lock()}
+    new_cache = CacheService(max_bytes=int(args.max_mb * 1024 * 1024))
+    new_loader = make_loader(titles, args.platforms, args.delay, new_counter)
+    new_seconds = concurrent_cold(
+        lambda: new_cache.get_or_load("read_all:news:2026-01-01:all", new_loader, ttl=3600), args.threads
+    )
+    print(f"{args.threads} 线程并发冷启动: 原有 {old_counter['calls']} 次读取 {old_seconds * 1000:.0f}ms，"
+          f"单飞 {new_counter['calls']} 次读取 {new_seconds * 1000:.0f}ms")
+
+    # 大量不同的日期/平台组合
+    counter = {"calls": 0, "lock": threading.Lock()}
+    loader = make_loader(titles, args.platforms, 0, counter)
+    old_cache = OldCacheService()
+    new_cache = CacheService(max_bytes=int(args.max_mb * 1024 * 1024))
+    peak = 0
+    for i in range(args.keys):
+        key = f"read_all:news:2026-01-{i % 31 + 1:02d}:p{i // 31}"
+        value = old_read(old_cache, key, loader)
+        new_cache.set(key, value, ttl=3600)
+        peak = max(peak, new_cache.get_stats()["approx_bytes"])
+    old_bytes = len(old_cache._cache) * day_bytes
+    stats = new_cache.get_stats()
+    print(f"{args.keys} 个不同的键: 原有缓存 {len(old_cache._cache)} 条约 {old_bytes / 1024 / 1024:.0f}MB，"
+          f"LRU 缓存 {stats['total_entries']} 条峰值 {peak / 1024 / 1024:.0f}MB（上限 {args.max_mb:.0f}MB，"
+          f"淘汰 {stats['evictions']} 条）")
+
+    # 变更令牌
+    hit_rate, stale, total_reads, token_seconds = change_token_run(args.crawls, args.reads)
+    print(f"变更令牌: {args.crawls} 次抓取 × {args.reads} 次查询，命中率 {hit_rate:.1%}，"
+          f"过期数据 {stale}/{total_reads} 次，取令牌 {token_seconds * 1e6:.1f}µs/次")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""
+远程同步基准测试（使用 moto 模拟 S3）
+
+对比 RemoteStorageBackend 的整库上传（full）与增量段上传（delta）模式：
+模拟一天内多次抓取，统计每次抓取下载与上传的字节数（各次抓取共用本地副本目录，
+与跨运行保留 output/.cache/remote 一致；--no-cache 时每次都下载整库），
+最后用新的后端实例从远程下载（基础库 + 回放增量段），校验与写入方的数据库内容一致，
+并校验两种模式最终的数据库内容一致。
+
+依赖: pip install "moto[s3]"
+运行方式: python benchmarks/bench_remote_sync.py [--platforms 40] [--items 30] [--crawls 30] [--compact-every 12] [--no-cache]
+"""
+
+import argparse
+import io
+import os
+import sqlite3
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from typing import Optional
+
+# 添加项目路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+try:
+    import boto3
+    from moto import mock_aws
+except ImportError:
+    print("需要安装 moto 和 boto3: pip install \"moto[s3]\"")
+    sys.exit(1)
+
+from bench_storage_write import DATE, build_crawls
+from trendradar.storage.remote import RemoteStorageBackend
+
+
+BUCKET = "trendradar-bench"
+TABLES = ("platforms", "news_items", "rank_history", "title_changes",
+          "crawl_records", "crawl_source_status")
+
+
+def make_backend(
+    sync_mode: str,
+    compact_every: int,
+    temp_dir: str,
+    cache_dir: Optional[str] = None,
+) -> RemoteStorageBackend:
+    """创建连接模拟 S3 的远程后端"""
+    return RemoteStorageBackend(
+        bucket_name=BUCKET,
+        access_key_id="test",
+        secret_access_key="test",
+        endpoint_url="https://s3.us-east-1.amazonaws.com",
+        region="us-east-1",
+        enable_html=False,
+        temp_dir=temp_dir,
+        sync_mode=sync_mode,
+        compact_every=compact_every,
+        cache_dir=cache_dir,
+    )
+
+
+def snapshot(db_path, with_timestamps: bool = True) -> dict:
+    """读取所有业务表内容（按 rowid 排序，可排除 *_at 写入时间列）"""
+    if db_path is None:
+        raise FileNotFoundError("远程数据库不存在，没有可比较的内容")
+    # 只读打开：路径不存在时报错，而不是在当前目录下新建空数据库
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        result = {}
+        for table in TABLES:
+            columns = [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+            if not with_timestamps:
+                columns = [c for c in columns if not c.endswith("_at")]
+            result[table] = conn.execute(
+                f"SELECT rowid, {', '.join(columns)} FROM {table} ORDER BY rowid"
+            ).fetchall()
+        return result
+    finally:
+        conn.close()
+
+
+def count_downloads(backend: RemoteStorageBackend, downloaded: list) -> None:
+    """统计后端 get_object 下载的字节数（累加到 downloaded[-1]）"""
+    get_object = backend.s3_client.get_object
+
+    def counting_get(**kwargs):
+        response = get_object(**kwargs)
+        downloaded[-1] += response.get("ContentLength", 0)
+        return response
+
+    backend.s3_client.get_object = counting_get
+
+
+def run(sync_mode: str, crawls, compact_every: int, use_cache: bool = True) -> tuple:
+    """
+    执行一次模拟（每次抓取使用新的后端实例，与 GitHub Actions 每次运行一个进程一致）
+
+    Returns:
+        (每次上传字节数列表, 每次下载字节数列表, 远程对象数, 回放是否一致, 不含写入时间列的数据库快照)
+    """
+    with mock_aws():
+        boto3.client("s3", region_name="us-east-1").create_bucket(Bucket=BUCKET)
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_dir = os.path.join(tmp, "cache") if use_cache else None
+            uploaded = []
+            downloaded = []
+            expected = comparable = None
+            for i, data in enumerate(crawls):
+                writer = make_backend(sync_mode, compact_every, os.path.join(tmp, f"writer{i}"), cache_dir)
+
+                # 统计下载与上传字节数
+                downloaded.append(0)
+                count_downloads(writer, downloaded)
+                uploaded.append(0)
+                put_object = writer.s3_client.put_object
+
+                def counting_put(**kwargs):
+                    uploaded[-1] += kwargs.get("ContentLength", 0)
+                    return put_object(**kwargs)
+
+                writer.s3_client.put_object = counting_put
+
+                with redirect_stdout(io.StringIO()):
+                    writer.save_news_data(data)
+                writer_db = writer._get_local_db_path(DATE)
+                expected = snapshot(writer_db)
+                comparable = snapshot(writer_db, with_timestamps=False)
+                with redirect_stdout(io.StringIO()):
+                    writer.cleanup()
+
+            reader = make_backend(sync_mode, compact_every, os.path.join(tmp, "reader"))
+            with redirect_stdout(io.StringIO()):
+                path = reader.download_database(f"news/{DATE}.db", os.path.join(tmp, "replica.db"))
+            actual = snapshot(path)
+
+            objects = reader.s3_client.list_objects_v2(Bucket=BUCKET).get("KeyCount", 0)
+            with redirect_stdout(io.StringIO()):
+                reader.cleanup()
+            return uploaded, downloaded, objects, expected == actual, comparable
+
+
+def main():
+    parser = argparse.ArgumentParser(description="远程同步基准测试")
+    parser.add_argument("--platforms", type=int, default=40)
+    parser.add_argument("--items", type=int, default=30)
+    parser.add_argument("--crawls", type=int, default=30)
+    parser.add_argument("--compact-every", type=int, default=12)
+    parser.add_argument("--no-cache", action="store_true", help="不保留本地副本（每次抓取下载整库）")
+    args = parser.parse_args()
+
+    crawls = build_crawls(args.platforms, args.items, args.crawls)
+    print(f"{args.crawls} 次抓取 × {args.platforms} 平台 × {args.items} 条，compact_every={args.compact_every}，"
+          f"本地副本: {'关闭' if args.no_cache else '开启'}")
+
+    snapshots = {}
+    for sync_mode in ("full", "delta"):
+        uploaded, downloaded, objects, consistent, snapshots[sync_mode] = run(
+            sync_mode, crawls, args.compact_every, use_cache=not args.no_cache
+        )
+        total = sum(uploaded)
+        total_down = sum(downloaded)
+        print(f"{sync_mode:>5}: 共上传 {total / 1e6:.2f}MB，"
+              f"平均每次 {total / len(uploaded) / 1e3:.1f}KB，"
+              f"最后一次 {uploaded[-1] / 1e3:.1f}KB；"
+              f"共下载 {total_down / 1e6:.2f}MB，"
+              f"平均每次 {total_down / len(downloaded) / 1e3:.1f}KB，"
+              f"最后一次 {downloaded[-1] / 1e3:.1f}KB；"
+              f"远程对象 {objects} 个，回放结果一致: {consistent}")
+
+    rows = sum(len(rows) for rows in snapshots["full"].values())
+    print(f"两种模式结果一致（不含写入时间列）: {snapshots['full'] == snapshots['delta']}（{rows} 行）")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""
+RSS 解析阶段基准测试
+
+对比 RSSFetcher 在抓取线程内解析（parse_workers=0）与解析进程池（流水线）的总耗时：
+模拟一组 RSS 源，其中部分为全文输出的大 Feed（类似 Substack 的 content:encoded），
+每次请求有固定的网络延迟。同时校验两种方式解析出的条目一致。
+
+网络请求用内存中的模拟会话代替（不访问外网），解析使用真实的 feedparser。
+解析进程池的收益取决于 CPU 核数：进程数不超过 CPU 核数 - 1，
+单核机器上进程池被关闭，第二次运行同样在抓取线程内解析。
+
+运行方式: python benchmarks/bench_rss_parse.py [--feeds 24] [--large 4] [--entries 40] [--large-kb 2048] [--latency 0.3] [--workers 4] [--parse-workers 2]
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+from contextlib import redirect_stdout
+from email.utils import formatdate
+
+# 添加项目路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from trendradar.crawler.parsing import ParseStage
+from trendradar.crawler.rss.fetcher import RSSFetcher, RSSFeedConfig
+
+
+PARAGRAPH = ("<p>Stablecoin issuers expanded reserves while on-chain activity rose across major networks. "
+             "Analysts noted ETF inflows and protocol upgrades as drivers of the latest move.</p>")
+
+
+def build_feed(feed_index: int, entries: int, content_bytes: int) -> bytes:
+    """生成 RSS 2.0 Feed（content_bytes > 0 时每个条目附带全文）"""
+    paragraphs = max(1, content_bytes // len(PARAGRAPH)) if content_bytes else 0
+    body = PARAGRAPH * paragraphs
+    parts = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/" '
+        'xmlns:dc="http://purl.org/dc/elements/1.1/"><channel>',
+        f"<title>Feed {feed_index}</title><link>https://feed{feed_index}.example.com/</link>",
+    ]
+    for i in range(entries):
+        parts.append(
+            f"<item><title>Feed {feed_index} story {i}: markets and protocols</title>"
+            f"<link>https://feed{feed_index}.example.com/p/{i}</link>"
+            f"<guid>feed{feed_index}-{i}</guid>"
+            f"<pubDate>{formatdate(1767225600 - i * 3600, usegmt=True)}</pubDate>"
+            f"<dc:creator>Author {i % 7}</dc:creator>"
+            f"<description><![CDATA[{PARAGRAPH}]]></description>"
+        )
+        if body:
+            parts.append(f"<content:encoded><![CDATA[{body}]]></content:encoded>")
+        parts.append("</item>")
+    parts.append("</channel></rss>")
+    return "".join(parts).encode("utf-8")
+
+
+class FakeResponse:
+    """模拟 requests.Response"""
+
+    def __init__(self, content: bytes):
+        self.status_code = 200
+        self.content = content
+        self.text = content.decode("utf-8")
+        self.headers = {}
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    """模拟会话：固定延迟后返回预先生成的 Feed"""
+
+    def __init__(self, bodies: dict, latency: float):
+        self.bodies = bodies
+        self.latency = latency
+
+    def get(self, url, timeout=None, headers=None):
+        time.sleep(self.latency)
+        return FakeResponse(self.bodies[url])
+
+
+def run(feeds, bodies, latency: float, workers: int, parse_workers: int):
+    """抓取所有源，返回 (耗时秒数, 各源条目)"""
+    fetcher = RSSFetcher(
+        feeds=feeds,
+        request_interval=0,
+        max_workers=workers,
+        max_per_host=workers,
+        parse_workers=parse_workers,
+    )
+    fetcher.session = FakeSession(bodies, latency)
+
+    start = time.perf_counter()
+    with redirect_stdout(io.StringIO()):
+        data = fetcher.fetch_all()
+    seconds = time.perf_counter() - start
+
+    items = {
+        feed_id: [(item.title, item.url, item.published_at, item.summary, item.author) for item in feed_items]
+        for feed_id, feed_items in data.items.items()
+    }
+    return seconds, items, data.failed_ids
+
+
+def main():
+    parser = argparse.ArgumentParser(description="RSS 解析阶段基准测试")
+    parser.add_argument("--feeds", type=int, default=24)
+    parser.add_argument("--large", type=int, default=4, help="其中全文输出的大 Feed 数量")
+    parser.add_argument("--entries", type=int, default=40, help="每个 Feed 的条目数")
+    parser.add_argument("--large-kb", type=int, default=2048, help="大 Feed 的大小（KB）")
+    parser.add_argument("--latency", type=float, default=0.3, help="模拟单次请求的网络延迟（秒）")
+    parser.add_argument("--workers", type=int, default=4, help="抓取线程数")
+    parser.add_argument("--parse-workers", type=int, default=2, help="解析进程数")
+    args = parser.parse_args()
+
+    feeds = []
+    bodies = {}
+    for i in range(args.feeds):
+        url = f"https://feed{i}.example.com/rss"
+        large = i < args.large
+        content_bytes = args.large_kb * 1024 // args.entries if large else 0
+        bodies[url] = build_feed(i, args.entries, content_bytes)
+        feeds.append(RSSFeedConfig(id=f"feed{i}", name=f"Feed {i}", url=url))
+
+    total_kb = sum(len(body) for body in bodies.values()) / 1024
+    print(f"{args.feeds} 个源（{args.large} 个大 Feed），共 {total_kb:.0f}KB，"
+          f"请求延迟 {args.latency * 1000:.0f}ms，抓取线程 {args.workers}，CPU {os.cpu_count()} 核")
+
+    inline_seconds, inline_items, inline_failed = run(feeds, bodies, args.latency, args.workers, 0)
+    print(f"抓取线程内解析: {inline_seconds:.2f}s")
+
+    # 实际进程数（不超过 CPU 核数 - 1）
+    effective = ParseStage(args.parse_workers).max_workers
+    if effective <= 0:
+        label = f"解析进程池（请求 {args.parse_workers} 进程，CPU 核数不足，实际在抓取线程内解析）"
+    elif effective < args.parse_workers:
+        label = f"解析进程池（{effective} 进程，请求 {args.parse_workers} 进程受 CPU 核数限制，含进程启动）"
+    else:
+        label = f"解析进程池（{effective} 进程，含进程启动）"
+
+    stage_seconds, stage_items, stage_failed = run(feeds, bodies, args.latency, args.workers, args.parse_workers)
+    print(f"{label}: {stage_seconds:.2f}s，加速 {inline_seconds / stage_seconds:.2f}x")
+
+    identical = inline_items == stage_items and inline_failed == stage_failed
+    print(f"条目 {sum(len(v) for v in inline_items.values())}/{sum(len(v) for v in stage_items.values())}，"
+          f"{'结果一致' if identical else '结果不一致'}")
+    if not identical:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
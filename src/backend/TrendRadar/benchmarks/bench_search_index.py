@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""
+关键词搜索基准测试
+
+模拟 MCP 按关键词搜索最近一个月的新闻：对比逐日读取全部标题做子串比较
+（原有写法，每次查询打开 N 个数据库）与全文搜索索引（output/.cache/search_index.db）的耗时，
+分别测试抓取端同步维护的索引，以及删除索引后首次查询时的补齐耗时，
+并校验两种方式返回的结果与顺序一致（含 1~2 字短关键词与大小写不同的关键词）。
+
+运行方式: python benchmarks/bench_search_index.py [--days 30] [--platforms 40] [--items 30] [--crawls 24]
+"""
+
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from dataclasses import replace
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 添加项目路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_storage_write import build_crawls
+from trendradar.storage.local import LocalStorageBackend
+from mcp_server.services import parser_service
+from mcp_server.services.parser_service import ParserService
+
+
+KEYWORDS = ["新", "更新", "P1 #1", "p17 #12", "#2", "不存在的关键词"]
+
+
+def scan_search(parser: ParserService, keyword: str, dates):
+    """原有写法：逐日读取全部标题（不使用缓存），逐条做不区分大小写的子串比较"""
+    results = []
+    for date in dates:
+        day = parser._read_day(date, None, "news")
+        if not day:
+            continue
+        all_titles, id_to_name, _ = day
+        for platform_id, titles in all_titles.items():
+            for title, info in titles.items():
+                if keyword.lower() in title.lower():
+                    results.append((date.strftime("%Y-%m-%d"), platform_id, title, info["ranks"], info.get("url", "")))
+    return results
+
+
+def index_search(parser: ParserService, keyword: str, dates):
+    """全文搜索索引"""
+    hits, total = parser.search_titles(keyword, dates[0], dates[-1])
+    assert total == len(hits)
+    return [(hit.date, hit.source_id, hit.title, hit.ranks, hit.url) for hit in hits]
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="关键词搜索基准测试")
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--platforms", type=int, default=40)
+    parser.add_argument("--items", type=int, default=30)
+    parser.add_argument("--crawls", type=int, default=24)
+    args = parser.parse_args()
+
+    start_date = datetime(2026, 1, 1)
+    dates = [start_date + timedelta(days=i) for i in range(args.days)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        output_dir = Path(tmp) / "output"
+        backend = LocalStorageBackend(data_dir=str(output_dir), enable_txt=False, enable_html=False)
+        start = time.perf_counter()
+        with redirect_stdout(io.StringIO()):
+            for i, date in enumerate(dates):
+                for data in build_crawls(args.platforms, args.items, args.crawls, seed=i):
+                    backend.save_news_data(replace(data, date=date.strftime("%Y-%m-%d")))
+            backend.cleanup()
+        print(f"{args.days} 天 × {args.platforms} 平台 × {args.items} 条 × {args.crawls} 次抓取"
+              f"（写入含索引维护 {time.perf_counter() - start:.1f}s）")
+
+        service = ParserService(tmp)
+        index_path = output_dir / ".cache" / "search_index.db"
+        print(f"索引文件 {index_path.stat().st_size / 1e6:.1f}MB")
+
+        # 抓取端维护的索引（首次查询只校验签名）
+        first_seconds, actual = timed(index_search, service, KEYWORDS[0], dates)
+        same = actual == scan_search(service, KEYWORDS[0], dates)
+        print(f"抓取端维护的索引首次查询: {first_seconds * 1000:.1f}ms，结果一致: {same}")
+
+        # 删除索引后首次查询：逐日补齐
+        parser_service.get_search_index(output_dir).close()
+        parser_service._search_indexes.clear()
+        for path in index_path.parent.glob("search_index.db*"):
+            path.unlink()
+        rebuild_seconds, _ = timed(index_search, service, KEYWORDS[0], dates)
+        print(f"删除索引后首次查询（补齐 {args.days} 天）: {rebuild_seconds * 1000:.0f}ms")
+
+        for keyword in KEYWORDS:
+            scan_seconds, expected = timed(scan_search, service, keyword, dates)
+            index_seconds, actual = timed(index_search, service, keyword, dates)
+            print(f"'{keyword}': 逐日扫描 {scan_seconds * 1000:.0f}ms，索引 {index_seconds * 1000:.1f}ms，"
+                  f"加速 {scan_seconds / index_seconds:.0f}x，命中 {len(actual)} 条，结果一致: {expected == actual}")
+
+
+if __name__ == "__main__":
+    main()
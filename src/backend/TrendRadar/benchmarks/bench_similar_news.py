@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""
+相似新闻聚合基准测试
+
+对比 aggregate_similar_news 原有的逐对 SequenceMatcher 贪心聚合（O(n²)）
+与 MinHash + LSH 候选对的 cluster_similar 的耗时，并统计两者分组的一致程度：
+
+- 分组一致率：两种实现中完全相同的分组占比
+- 同组召回：逐对比较中被并入同一组的标题对，在 LSH 实现中仍在同一组的比例
+
+模拟数据为若干条"原始新闻"在不同平台上的改写（加前缀、删改个别字、截断），
+混入互不相关的标题。逐对比较很慢，标题数较大时可以加 --skip-exhaustive 只测 LSH。
+
+运行方式: python benchmarks/bench_similar_news.py [--titles 1500] [--thresholds 0.6 0.7 0.8]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from difflib import SequenceMatcher
+
+# 添加项目路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_keyword_matcher import FILLER
+from trendradar.core.similarity import cluster_similar
+
+
+PREFIXES = ["", "", "【快讯】", "突发：", "最新！", "#热议# ", "独家 | "]
+
+
+def rewrite(title: str, rng: random.Random) -> str:
+    """模拟不同平台对同一新闻的改写"""
+    chars = list(title)
+    for _ in range(rng.randint(0, 3)):
+        position = rng.randrange(len(chars))
+        if rng.random() < 0.5:
+            del chars[position]
+        else:
+            chars[position] = rng.choice(FILLER)
+    if rng.random() < 0.2:
+        chars = chars[:max(8, len(chars) - rng.randint(1, 6))]
+    return rng.choice(PREFIXES) + "".join(chars)
+
+
+def build_titles(count: int, duplicate_rate: float = 0.6, seed: int = 42):
+    """生成模拟标题：约 duplicate_rate 比例的标题是某条原始新闻的改写，顺序打乱"""
+    rng = random.Random(seed)
+    titles = []
+    stories = []
+    while len(titles) < count:
+        base = "".join(rng.choice(FILLER) for _ in range(rng.randint(14, 36)))
+        if rng.random() < duplicate_rate and stories:
+            titles.append(rewrite(rng.choice(stories), rng))
+        else:
+            stories.append(base)
+            titles.append(base)
+    rng.shuffle(titles)
+    return titles
+
+
+def exhaustive_clusters(texts, threshold):
+    """原有写法：每个代表与其后所有未归组标题逐对计算 SequenceMatcher.ratio()"""
+    used = set()
+    groups = []
+    for i, text in enumerate(texts):
+        if i in used:
+            continue
+        used.add(i)
+        group = [i]
+        for j, other in enumerate(texts):
+            if j in used:
+                continue
+            if SequenceMatcher(None, text, other).ratio() >= threshold:
+                used.add(j)
+                group.append(j)
+        groups.append(group)
+    return groups
+
+
+def same_group_pairs(groups):
+    """同组标题对集合"""
+    return {(a, b) for group in groups for a in group for b in group if a < b}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="相似新闻聚合基准测试")
+    parser.add_argument("--titles", type=int, default=1500)
+    parser.add_argument("--thresholds", type=float, nargs="+", default=[0.6, 0.7, 0.8])
+    parser.add_argument("--skip-exhaustive", action="store_true")
+    args = parser.parse_args()
+
+    titles = build_titles(args.titles)
+    print(f"{len(titles)} 条标题")
+
+    for threshold in args.thresholds:
+        start = time.perf_counter()
+        clusters = [[i for i, _ in group] for group in cluster_similar(titles, threshold)]
+        lsh_seconds = time.perf_counter() - start
+        line = f"阈值 {threshold}: LSH {lsh_seconds * 1000:.0f}ms（{len(clusters)} 组）"
+
+        if not args.skip_exhaustive:
+            start = time.perf_counter()
+            expected = exhaustive_clusters(titles, threshold)
+            exhaustive_seconds = time.perf_counter() - start
+
+            expected_groups = {tuple(group) for group in expected}
+            identical = sum(1 for group in clusters if tuple(group) in expected_groups)
+            expected_pairs = same_group_pairs(expected)
+            recall = (len(expected_pairs & same_group_pairs(clusters)) / len(expected_pairs)
+                      if expected_pairs else 1.0)
+            line += (f"，逐对比较 {exhaustive_seconds * 1000:.0f}ms（{len(expected)} 组），"
+                     f"加速 {exhaustive_seconds / lsh_seconds:.1f}x，"
+                     f"分组一致率 {identical / len(expected):.2%}，同组召回 {recall:.2%}")
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""
+存储写入基准测试
+
+对比 LocalStorageBackend.save_news_data 的逐条写入与批量写入模式，
+模拟一天内多次抓取（大部分条目重复出现、部分标题变化），输出 rows/sec，
+并校验两种模式写入的数据库内容一致。
+
+运行方式: python benchmarks/bench_storage_write.py [--platforms 40] [--items 50] [--crawls 20]
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+
+# 添加项目路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from trendradar.storage.base import NewsData, NewsItem
+from trendradar.storage.local import LocalStorageBackend
+
+
+DATE = "2026-01-01"
+
+
+def build_crawls(platforms: int, items: int, crawls: int, seed: int = 42):
+    """生成多次抓取的模拟数据（每次约 20% 新条目，5% 标题变化）"""
+    rng = random.Random(seed)
+    next_id = {f"p{p}": items for p in range(platforms)}
+    current = {
+        f"p{p}": [(f"https://example.com/p{p}/{i}?utm_source=x", f"标题 p{p} #{i}") for i in range(items)]
+        for p in range(platforms)
+    }
+
+    result = []
+    for c in range(crawls):
+        crawl_time = f"{c // 60:02d}-{c % 60:02d}"
+        news_items = {}
+        for source_id, entries in current.items():
+            # 替换部分条目，模拟榜单变化
+            for _ in range(items // 5):
+                idx = rng.randrange(items)
+                n = next_id[source_id]
+                next_id[source_id] += 1
+                entries[idx] = (f"https://example.com/{source_id}/{n}", f"标题 {source_id} #{n}")
+            rng.shuffle(entries)
+            news_list = []
+            for rank, (url, title) in enumerate(entries, 1):
+                if rng.random() < 0.05:
+                    title = f"{title} (更新)"
+                news_list.append(NewsItem(
+                    title=title, source_id=source_id, rank=rank,
+                    url=url, mobile_url="", crawl_time=crawl_time,
+                ))
+            news_items[source_id] = news_list
+        result.append(NewsData(
+            date=DATE,
+            crawl_time=crawl_time,
+            items=news_items,
+            id_to_name={source_id: source_id for source_id in current},
+            failed_ids=[],
+        ))
+    return result
+
+
+def run(bulk_write: bool, crawls) -> tuple:
+    """执行一次写入，返回 (耗时秒数, 数据库快照)"""
+    with tempfile.TemporaryDirectory() as tmp:
+        backend = LocalStorageBackend(data_dir=tmp, enable_txt=False, enable_html=False,
+                                      bulk_write=bulk_write)
+        # 屏蔽每次保存的日志输出
+        stdout = sys.stdout
+        sys.stdout = open(os.devnull, "w")
+        try:
+            start = time.perf_counter()
+            for data in crawls:
+                backend.save_news_data(data)
+            elapsed = time.perf_counter() - start
+        finally:
+            sys.stdout.close()
+            sys.stdout = stdout
+
+        conn = backend._get_connection(DATE)
+        snapshot = {
+            table: conn.execute(query).fetchall()
+            for table, query in (
+                ("news_items", "SELECT id, title, platform_id, rank, url, first_crawl_time, "
+                               "last_crawl_time, crawl_count FROM news_items ORDER BY id"),
+                ("rank_history", "SELECT news_item_id, rank, crawl_time FROM rank_history "
+                                 "ORDER BY news_item_id, crawl_time, rank"),
+                ("title_changes", "SELECT news_item_id, old_title, new_title FROM title_changes "
+                                  "ORDER BY news_item_id, id"),
+            )
+        }
+        snapshot = {k: [tuple(r) for r in v] for k, v in snapshot.items()}
+        backend.cleanup()
+        return elapsed, snapshot
+
+
+def main():
+    parser = argparse.ArgumentParser(description="存储写入基准测试")
+    parser.add_argument("--platforms", type=int, default=40)
+    parser.add_argument("--items", type=int, default=50)
+    parser.add_argument("--crawls", type=int, default=20)
+    args = parser.parse_args()
+
+    crawls = build_crawls(args.platforms, args.items, args.crawls)
+    total_rows = sum(d.get_total_count() for d in crawls)
+    print(f"SQLite {sqlite3.sqlite_version}，{args.crawls} 次抓取 × {args.platforms} 平台 × {args.items} 条 = {total_rows} 行")
+
+    rowwise_time, rowwise_snapshot = run(False, crawls)
+    bulk_time, bulk_snapshot = run(True, crawls)
+
+    print(f"逐条写入: {rowwise_time:.3f}s  {total_rows / rowwise_time:,.0f} rows/sec")
+    print(f"批量写入: {bulk_time:.3f}s  {total_rows / bulk_time:,.0f} rows/sec")
+    print(f"加速比: {rowwise_time / bulk_time:.2f}x")
+    print(f"结果一致: {rowwise_snapshot == bulk_snapshot}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""
+Web3 HTML 提取基准测试
+
+对比 ChainCatcher / ME News 页面解析的 BeautifulSoup 实现与 lxml 实现：
+
+- 耗时：同一页面重复解析，统计单次平均耗时
+- 一致性：两种实现解析出的条目（标题、链接、时间、摘要、guid）逐条比较
+
+默认使用 benchmarks/fixtures/ 下保存的两个站点列表页（chaincatcher_news.html、menews_news.html），
+也可以用 --chaincatcher-html / --menews-html 指定其他保存的页面。
+保存的页面不存在或指定 --generated 时，使用生成的页面（结构仿照两个站点的列表页，
+快讯列表后附带较长的侧栏与页脚，条数可用 --items / --sidebar 调整）。
+
+运行方式: python benchmarks/bench_web3_html.py [--max-items 50] [--rounds 20] [--chaincatcher-html page.html] [--menews-html page.html] [--generated] [--items 200]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# 添加项目路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from trendradar.crawler.web3.chaincatcher import ChainCatcherCrawler
+from trendradar.crawler.web3.extract import HAS_LXML
+from trendradar.crawler.web3.menews import MeNewsCrawler
+
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+CHAINCATCHER_FIXTURE = os.path.join(FIXTURES_DIR, "chaincatcher_news.html")
+MENEWS_FIXTURE = os.path.join(FIXTURES_DIR, "menews_news.html")
+
+# 取全部条目（不能提前停止）时的 max_items
+ALL_ITEMS = 100000
+
+FILLER = "比特币 以太坊 稳定币 监管 交易所 链上数据 机构资金 ETF 流入 协议升级 "
+
+
+def build_chaincatcher_page(items: int, sidebar: int) -> str:
+    """生成仿 ChainCatcher 快讯页的 HTML"""
+    parts = [
+        "<html><head><title>区块链快讯</title>",
+        "<script>window.__STATE__ = {\"list\": []};</script>",
+        "<style>.news-item { margin: 0 }</style></head><body>",
+        "<header><nav><h3>区块链快讯</h3><h3>精选事件</h3></nav></header>",
+        "<main><div class=\"flash-list\">",
+    ]
+    for i in range(items):
+        parts.append(
+            f"<div class=\"news-item\" data-id=\"{i}\">"
+            f"<div class=\"news-time\"><span>{(i % 28) + 1:02d}-01 {i % 24:02d}:{i % 60:02d}</span></div>"
+            f"<a href=\"/article/{100000 + i}\"><h3>快讯标题 {i}：{FILLER[:20 + i % 20]} 微信扫码</h3></a>"
+            f"<div class=\"news-content\"><p>ChainCatcher 消息，第 {i} 条快讯正文。{FILLER * 3}</p></div>"
+            f"<div class=\"news-share\"><span>分享</span><span>微信</span></div>"
+            f"</div>"
+        )
+    parts.append("</div></main><aside>")
+    for i in range(sidebar):
+        parts.append(
+            f"<div class=\"side-item\"><a href=\"/topic/{i}\"><h4>专题 {i}：{FILLER[:30]}</h4></a>"
+            f"<p>{FILLER * 2}</p></div>"
+        )
+    parts.append("</aside><footer>")
+    for i in range(sidebar):
+        parts.append(f"<div class=\"footer-link\"><a href=\"/about/{i}\">关于我们 {i}</a></div>")
+    parts.append("</footer></body></html>")
+    return "".join(parts)
+
+
+def build_menews_page(items: int, sidebar: int) -> str:
+    """生成仿 ME News 新闻列表页的 HTML"""
+    parts = [
+        "<html><head><title>ME News</title></head><body>",
+        "<div class=\"header\"><a href=\"/\">首页</a></div>",
+        "<div class=\"main\"><div class=\"news-list-wrap\">",
+    ]
+    for i in range(items):
+        parts.append(
+            f"<div class=\"news-item card\">"
+            f"<a href=\"/news/detail/{200000 + i}\"><h2 class=\"news-title\">新闻标题 {i}：{FILLER[:24]}</h2></a>"
+            f"<div class=\"news-meta\"><span class=\"author\">ME News</span>"
+            f"<time datetime=\"2026-01-{(i % 28) + 1:02d}T{i % 24:02d}:{i % 60:02d}:00\">{i % 60} 分钟前</time></div>"
+            f"<div class=\"desc\">{FILLER * 4}</div>"
+            f"</div>"
+        )
+    parts.append("</div></div><div class=\"sidebar\">")
+    for i in range(sidebar):
+        parts.append(f"<div class=\"rank-item\"><a href=\"/news/detail/{i}\">热门 {i}</a><p>{FILLER}</p></div>")
+    parts.append("</div></body></html>")
+    return "".join(parts)
+
+
+def measure(parse, html: str, max_items: int, rounds: int):
+    """重复解析，返回 (单次平均耗时秒数, 最后一次的结果)"""
+    result = parse(html, max_items)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        result = parse(html, max_items)
+    return (time.perf_counter() - start) / rounds, result
+
+
+def compare(name: str, soup_parse, lxml_parse, html: str, max_items: int, rounds: int) -> bool:
+    """对比两种实现，输出耗时与一致性"""
+    soup_seconds, soup_items = measure(soup_parse, html, max_items, rounds)
+    lxml_seconds, lxml_items = measure(lxml_parse, html, max_items, rounds)
+
+    identical = soup_items == lxml_items
+    print(f"{name}（{len(html) / 1024:.0f}KB，max_items={max_items}）: "
+          f"BeautifulSoup {soup_seconds * 1000:.1f}ms，lxml {lxml_seconds * 1000:.1f}ms，"
+          f"加速 {soup_seconds / lxml_seconds:.1f}x，"
+          f"条目 {len(soup_items)}/{len(lxml_items)}，{'结果一致' if identical else '结果不一致'}")
+
+    if not identical:
+        for i, (old, new) in enumerate(zip(soup_items, lxml_items)):
+            if old != new:
+                print(f"  第 {i} 条不一致:\n    BeautifulSoup: {old}\n    lxml:          {new}")
+                break
+    return identical
+
+
+def read_html(path: str) -> str:
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        return f.read()
+
+
+def load_page(name: str, path, fixture: str, generated: bool, build) -> str:
+    """
+    读取基准测试页面
+
+    Args:
+        name: 站点名称（用于输出）
+        path: 命令行指定的页面路径
+        fixture: 保存的页面路径
+        generated: 是否强制使用生成的页面
+        build: 生成页面的函数（无参数）
+
+    Returns:
+        页面 HTML
+    """
+    if path:
+        print(f"{name}: 使用 {path}")
+        return read_html(path)
+    if not generated and os.path.exists(fixture):
+        print(f"{name}: 使用保存的页面 {os.path.relpath(fixture)}")
+        return read_html(fixture)
+    print(f"{name}: 使用生成的页面")
+    return build()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Web3 HTML 提取基准测试")
+    parser.add_argument("--max-items", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--chaincatcher-html", help="保存的 ChainCatcher 快讯页（默认 fixtures/chaincatcher_news.html）")
+    parser.add_argument("--menews-html", help="保存的 ME News 新闻页（默认 fixtures/menews_news.html）")
+    parser.add_argument("--generated", action="store_true", help="使用生成的页面而不是保存的页面")
+    parser.add_argument("--items", type=int, default=200, help="生成页面中的快讯/新闻条数")
+    parser.add_argument("--sidebar", type=int, default=300, help="生成页面中侧栏与页脚的条数")
+    args = parser.parse_args()
+
+    if not HAS_LXML:
+        print("未安装 lxml，无法对比")
+        return
+
+    chaincatcher = ChainCatcherCrawler()
+    menews = MeNewsCrawler()
+
+    cc_html = load_page("ChainCatcher", args.chaincatcher_html, CHAINCATCHER_FIXTURE, args.generated,
+                        lambda: build_chaincatcher_page(args.items, args.sidebar))
+    me_html = load_page("ME News", args.menews_html, MENEWS_FIXTURE, args.generated,
+                        lambda: build_menews_page(args.items, args.sidebar))
+
+    ok = compare("ChainCatcher", chaincatcher._parse_html_soup, chaincatcher._parse_html_lxml,
+                 cc_html, args.max_items, args.rounds)
+    # 取全部条目（不能提前停止）时的对比
+    ok = compare("ChainCatcher 全部条目", chaincatcher._parse_html_soup, chaincatcher._parse_html_lxml,
+                 cc_html, ALL_ITEMS, args.rounds) and ok
+    ok = compare("ME News", menews._parse_html_soup, menews._parse_html_lxml,
+                 me_html, args.max_items, args.rounds) and ok
+
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""
+词频统计权重计算基准测试
+
+对比 count_word_frequency 的两种排序实现：逐条调用 calculate_news_weight 的 Python 实现，
+与 NumPy 一次计算全部权重后统一排序的向量化实现，
+分别测试"全部新闻"（所有标题参与排序）与 config/frequency_words.txt 词组两种配置，
+并校验两种实现的输出序列化后逐字节一致。
+
+依赖: pip install numpy
+运行方式: python benchmarks/bench_word_frequency.py [--titles 10000 50000 100000] [--platforms 40]
+"""
+
+import argparse
+import io
+import json
+import os
+import random
+import sys
+import time
+from contextlib import redirect_stdout
+
+# 添加项目路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_keyword_matcher import build_titles, keyword_vocabulary
+from trendradar.core import scoring
+from trendradar.core.analyzer import calculate_news_weight, count_word_frequency
+from trendradar.core.frequency import load_frequency_words
+
+
+def build_day(titles, platforms: int, seed: int = 42):
+    """生成一天的抓取结果与标题统计信息（排名历史长度 1~48 次抓取）"""
+    rng = random.Random(seed)
+    results = {f"p{p}": {} for p in range(platforms)}
+    title_info = {f"p{p}": {} for p in range(platforms)}
+    for i, title in enumerate(titles):
+        source_id = f"p{i % platforms}"
+        crawls = rng.randint(1, 48)
+        ranks = [rng.randint(1, 50) for _ in range(crawls)]
+        first = rng.randrange(24 * 60 - crawls)
+        results[source_id][title] = {"ranks": ranks[-1:], "url": f"https://example.com/{i}", "mobileUrl": ""}
+        title_info[source_id][title] = {
+            "first_time": f"{first // 60:02d}-{first % 60:02d}",
+            "last_time": f"{(first + crawls) // 60:02d}-{(first + crawls) % 60:02d}",
+            "count": crawls,
+            "ranks": ranks,
+            "url": f"https://example.com/{i}",
+            "mobileUrl": "",
+        }
+    id_to_name = {source_id: f"平台{source_id}" for source_id in results}
+    return results, title_info, id_to_name
+
+
+def run(vectorized: bool, results, title_info, id_to_name, word_groups, filter_words, global_filters):
+    """执行一次统计，返回 (耗时秒数, 序列化后的输出)"""
+    saved = scoring.HAS_NUMPY
+    scoring.HAS_NUMPY = saved and vectorized
+    try:
+        with redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            stats, total = count_word_frequency(
+                results, word_groups, filter_words, id_to_name, title_info,
+                mode="daily", global_filters=global_filters,
+            )
+            seconds = time.perf_counter() - start
+    finally:
+        scoring.HAS_NUMPY = saved
+    return seconds, json.dumps([stats, total], ensure_ascii=False).encode("utf-8")
+
+
+def time_scoring(title_info, groups: int, rank_threshold: int = 3):
+    """单独对比排序阶段：逐条 calculate_news_weight + sorted 与 scoring.sort_groups"""
+    weight_config = {"RANK_WEIGHT": 0.4, "FREQUENCY_WEIGHT": 0.3, "HOTNESS_WEIGHT": 0.3}
+    rows = [info for source_titles in title_info.values() for info in source_titles.values()]
+    columns = scoring.TitleColumns()
+    for i, info in enumerate(rows):
+        columns.append(i % groups, info["ranks"], info["count"])
+
+    start = time.perf_counter()
+    expected = [[] for _ in range(groups)]
+    for i in range(len(rows)):
+        expected[i % groups].append(i)
+    expected = [
+        sorted(group_rows, key=lambda i: (
+            -calculate_news_weight(rows[i], rank_threshold, weight_config),
+            min(rows[i]["ranks"]),
+            -rows[i]["count"],
+        ))
+        for group_rows in expected
+    ]
+    python_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = scoring.sort_groups(columns, groups, rank_threshold, weight_config)
+    numpy_seconds = time.perf_counter() - start
+    return python_seconds, numpy_seconds, expected == actual
+
+
+def main():
+    parser = argparse.ArgumentParser(description="词频统计权重计算基准测试")
+    parser.add_argument("--titles", type=int, nargs="+", default=[10000, 50000, 100000])
+    parser.add_argument("--platforms", type=int, default=40)
+    parser.add_argument("--config", default="config/frequency_words.txt")
+    args = parser.parse_args()
+
+    if not scoring.HAS_NUMPY:
+        print("需要安装 numpy: pip install numpy")
+        sys.exit(1)
+
+    rules = load_frequency_words(args.config)
+    vocabulary = keyword_vocabulary(*rules)
+    for count in args.titles:
+        titles = build_titles(count, vocabulary, hit_rate=0.5)
+        results, title_info, id_to_name = build_day(titles, args.platforms)
+        python_seconds, numpy_seconds, same = time_scoring(title_info, len(rules[0]))
+        print(f"{count:>6} 条标题（仅排序阶段）: Python {python_seconds * 1000:.0f}ms，"
+              f"NumPy {numpy_seconds * 1000:.0f}ms，加速 {python_seconds / numpy_seconds:.2f}x，"
+              f"顺序一致: {same}")
+        for label, (word_groups, filter_words, global_filters) in (("全部新闻", ([], [], [])), ("频率词", rules)):
+            python_seconds, expected = run(False, results, title_info, id_to_name,
+                                           word_groups, filter_words, global_filters)
+            numpy_seconds, actual = run(True, results, title_info, id_to_name,
+                                        word_groups, filter_words, global_filters)
+            print(f"{count:>6} 条标题（{label}）: Python {python_seconds * 1000:.0f}ms，"
+                  f"NumPy {numpy_seconds * 1000:.0f}ms，加速 {python_seconds / numpy_seconds:.2f}x，"
+                  f"输出逐字节一致: {expected == actual}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""
+增量同步往返校验（使用 moto 模拟 S3）
+
+以 sync_mode="delta" 模拟一天内多次抓取（每次使用新的后端实例），每次保存后检查：
+
+- 增量段：上传请求带 Content-MD5，远程段数与本地记录的段号一致
+- 重试：每个增量段的第一次上传模拟网络错误，应重试后成功
+- 回放：新的后端实例下载基础库并回放增量段，内容与写入方一致
+- 本地副本：各次回放共用本地副本目录，基础库未变时只下载新的增量段，压缩后才重新下载基础库
+- 压缩：段数达到 compact_every 时上传整库，已合并的段被删除
+
+任一检查失败时以非零状态退出。
+
+依赖: pip install "moto[s3]"
+运行方式: python benchmarks/check_delta_sync.py [--platforms 5] [--items 10] [--crawls 8] [--compact-every 3]
+"""
+
+import argparse
+import io
+import os
+import sys
+import tempfile
+from contextlib import redirect_stdout
+
+# 添加项目路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+try:
+    import boto3
+    from moto import mock_aws
+except ImportError:
+    print("需要安装 moto 和 boto3: pip install \"moto[s3]\"")
+    sys.exit(1)
+
+from bench_remote_sync import BUCKET, make_backend, snapshot
+from bench_storage_write import DATE, build_crawls
+from trendradar.storage.delta_sync import get_sync_seq, parse_segment_seq
+
+
+DB_KEY = f"news/{DATE}.db"
+
+
+def check(crawls, compact_every: int) -> list:
+    """
+    执行一次增量同步往返，返回失败项列表（为空表示全部通过）
+    """
+    failures = []
+    compactions = 0
+    segments_uploaded = 0
+
+    with mock_aws():
+        s3 = boto3.client("s3", region_name="us-east-1")
+        s3.create_bucket(Bucket=BUCKET)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            reader_cache = os.path.join(tmp, "reader_cache")
+            previous_segments = 0
+            previous_base_seq = None
+            for i, data in enumerate(crawls, 1):
+                writer = make_backend("delta", compact_every, os.path.join(tmp, f"writer{i}"))
+
+                # 每个增量段第一次上传时模拟网络错误，并检查请求带 Content-MD5
+                put_object = writer.s3_client.put_object
+                failed_once = set()
+                retried = []
+
+                def flaky_put(**kwargs):
+                    key = kwargs["Key"]
+                    if "ContentMD5" not in kwargs:
+                        failures.append(f"第 {i} 次: {key} 上传未带 Content-MD5")
+                    if parse_segment_seq(key) is not None:
+                        if key not in failed_once:
+                            failed_once.add(key)
+                            raise ConnectionError("模拟网络错误")
+                        retried.append(key)
+                    return put_object(**kwargs)
+
+                writer.s3_client.put_object = flaky_put
+
+                with redirect_stdout(io.StringIO()):
+                    writer.save_news_data(data)
+                    seq, base_seq = get_sync_seq(writer._get_connection(DATE))
+                writer_db = writer._get_local_db_path(DATE)
+                expected = snapshot(writer_db)
+                with redirect_stdout(io.StringIO()):
+                    writer.cleanup()
+
+                if failed_once and sorted(failed_once) != sorted(retried):
+                    failures.append(f"第 {i} 次: 增量段上传失败后未重试成功")
+                segments_uploaded += len(retried)
+
+                keys = [obj["Key"] for obj in s3.list_objects_v2(Bucket=BUCKET).get("Contents", [])]
+                segments = [key for key in keys if parse_segment_seq(key) is not None]
+                if DB_KEY not in keys:
+                    failures.append(f"第 {i} 次: 远程缺少基础库")
+                if len(segments) != seq - base_seq:
+                    failures.append(f"第 {i} 次: 远程 {len(segments)} 个段，本地记录 {seq - base_seq} 个")
+                if previous_segments and not segments:
+                    compactions += 1
+                previous_segments = len(segments)
+
+                reader = make_backend("delta", compact_every, os.path.join(tmp, f"reader{i}"), reader_cache)
+                get_object = reader.s3_client.get_object
+                fetched = []
+
+                def recording_get(**kwargs):
+                    fetched.append(kwargs["Key"])
+                    return get_object(**kwargs)
+
+                reader.s3_client.get_object = recording_get
+                with redirect_stdout(io.StringIO()):
+                    path = reader.download_database(DB_KEY, os.path.join(tmp, f"replica{i}.db"))
+                actual = snapshot(path)
+                with redirect_stdout(io.StringIO()):
+                    reader.cleanup()
+                if actual != expected:
+                    failures.append(f"第 {i} 次: 回放结果与写入方不一致")
+
+                # 基础库未变时应沿用本地副本，只下载上次回放之后的增量段
+                base_fetched = DB_KEY in fetched
+                if base_fetched != (base_seq != previous_base_seq):
+                    failures.append(f"第 {i} 次: 基础库{'未变却重新下载' if base_fetched else '已更新却未下载'}")
+                segments_fetched = [key for key in fetched if parse_segment_seq(key) is not None]
+                if not base_fetched and len(segments_fetched) > 1:
+                    failures.append(f"第 {i} 次: 本地副本之后只有 1 个新增量段，下载了 {len(segments_fetched)} 个")
+                previous_base_seq = base_seq
+
+                print(f"第 {i} 次保存: 基础库段号 {base_seq}，当前段号 {seq}，远程增量段 {len(segments)} 个，"
+                      f"回放下载{'基础库 + ' if base_fetched else ''}{len(segments_fetched)} 个增量段")
+
+    if not segments_uploaded:
+        failures.append("没有上传过增量段（抓取次数过少？）")
+    if not compactions:
+        failures.append("没有发生压缩（抓取次数应大于 compact_every + 1）")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="增量同步往返校验")
+    parser.add_argument("--platforms", type=int, default=5)
+    parser.add_argument("--items", type=int, default=10)
+    parser.add_argument("--crawls", type=int, default=8)
+    parser.add_argument("--compact-every", type=int, default=3)
+    args = parser.parse_args()
+
+    crawls = build_crawls(args.platforms, args.items, args.crawls)
+    print(f"{args.crawls} 次抓取 × {args.platforms} 平台 × {args.items} 条，compact_every={args.compact_every}")
+
+    failures = check(crawls, args.compact_every)
+    if failures:
+        for failure in failures:
+            print(f"[失败] {failure}")
+        sys.exit(1)
+    print("增量上传、回放与压缩校验通过")
+
+
+if __name__ == "__main__":
+    main()
@@ -16,6 +16,12 @@ from .tools.search_tools import SearchTools
 from .tools.config_mgmt import ConfigManagementTools
 from .tools.system import SystemManagementTools
 from .tools.storage_sync import StorageSyncTools
+from .services.executor_service import (
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_PROCESS_WORKERS,
+    DEFAULT_TIMEOUT,
+    ToolExecutor,
+)
 from .utils.date_parser import DateParser
 from .utils.errors import MCPError
 
@@ -39,6 +45,34 @@ def _get_tools(project_root: Optional[str] = None):
     return _tools_instances
 
 
+# 全局工具执行器（工具调用在工作池中执行，不阻塞事件循环）
+_executor: Optional[ToolExecutor] = None
+
+
+def _get_executor() -> ToolExecutor:
+    """获取或创建工具执行器（run_server 未配置时使用默认参数）"""
+    global _executor
+    if _executor is None:
+        _executor = ToolExecutor(_get_tools)
+    return _executor
+
+
+async def _run_tool(tool_name: str, category: str, method: str, **kwargs):
+    """
+    在工作池中执行工具方法
+
+    Args:
+        tool_name: MCP 工具名（用于并发上限与超时配置）
+        category: 工具实例类别，即 _get_tools() 返回字典的键
+        method: 工具实例的方法名
+        **kwargs: 方法参数
+
+    Returns:
+        方法返回的结果字典；超时时返回 TOOL_TIMEOUT 错误
+    """
+    return await _get_executor().run(tool_name, category, method, **kwargs)
+
+
 # ==================== 日期解析工具（优先调用）====================
 
 @mcp.tool
@@ -145,8 +179,12 @@ async def get_latest_news(
 
     **注意**：如果用户询问"为什么只显示了部分"，说明他们需要完整数据
     """
-    tools = _get_tools()
-    result = tools['data'].get_latest_news(platforms=platforms, limit=limit, include_url=include_url)
+    result = await _run_tool(
+        'get_latest_news', 'data', 'get_latest_news',
+        platforms=platforms,
+        limit=limit,
+        include_url=include_url
+    )
     return json.dumps(result, ensure_ascii=False, indent=2)
 
 
@@ -175,8 +213,12 @@ async def get_trending_topics(
         - 使用预设关注词: get_trending_topics(mode="current")
         - 自动提取热点: get_trending_topics(extract_mode="auto_extract", top_n=20)
     """
-    tools = _get_tools()
-    result = tools['data'].get_trending_topics(top_n=top_n, mode=mode, extract_mode=extract_mode)
+    result = await _run_tool(
+        'get_trending_topics', 'data', 'get_trending_topics',
+        top_n=top_n,
+        mode=mode,
+        extract_mode=extract_mode
+    )
     return json.dumps(result, ensure_ascii=False, indent=2)
 
 
@@ -218,8 +260,12 @@ async def get_latest_rss(
         - 获取指定源: get_latest_rss(feeds=['hacker-news'])
         - 包含摘要: get_latest_rss(include_summary=True, limit=20)
     """
-    tools = _get_tools()
-    result = tools['data'].get_latest_rss(feeds=feeds, limit=limit, include_summary=include_summary)
+    result = await _run_tool(
+        'get_latest_rss', 'data', 'get_latest_rss',
+        feeds=feeds,
+        limit=limit,
+        include_summary=include_summary
+    )
     return json.dumps(result, ensure_ascii=False, indent=2)
 
 
@@ -229,7 +275,8 @@ async def search_rss(
     feeds: Optional[List[str]] = None,
     days: int = 7,
     limit: int = 50,
-    include_summary: bool = False
+    include_summary: bool = False,
+    offset: int = 0
 ) -> str:
     """
     搜索 RSS 数据
@@ -243,6 +290,7 @@ async def search_rss(
         days: 搜索最近 N 天的数据，默认 7 天，最大 30 天
         limit: 返回条数限制，默认50
         include_summary: 是否包含文章摘要，默认False
+        offset: 分页偏移，默认0（翻页时传入 offset=上一页 offset+limit）
 
     Returns:
         JSON格式的匹配 RSS 条目列表
@@ -251,13 +299,14 @@ async def search_rss(
         - search_rss(keyword="AI")
         - search_rss(keyword="machine learning", feeds=['hacker-news'], days=14)
     """
-    tools = _get_tools()
-    result = tools['data'].search_rss(
+    result = await _run_tool(
+        'search_rss', 'data', 'search_rss',
         keyword=keyword,
         feeds=feeds,
         days=days,
         limit=limit,
-        include_summary=include_summary
+        include_summary=include_summary,
+        offset=offset
     )
     return json.dumps(result, ensure_ascii=False, indent=2)
 
@@ -280,8 +329,7 @@ async def get_rss_feeds_status() -> str:
     Examples:
         - get_rss_feeds_status()  # 查看所有 RSS 源状态
     """
-    tools = _get_tools()
-    result = tools['data'].get_rss_feeds_status()
+    result = await _run_tool('get_rss_feeds_status', 'data', 'get_rss_feeds_status')
     return json.dumps(result, ensure_ascii=False, indent=2)
 
 
@@ -324,8 +372,8 @@ async def get_news_by_date(
 
     **注意**：如果用户询问"为什么只显示了部分"，说明他们需要完整数据
     """
-    tools = _get_tools()
-    result = tools['data'].get_news_by_date(
+    result = await _run_tool(
+        'get_news_by_date', 'data', 'get_news_by_date',
         date_range=date_range,
         platforms=platforms,
         limit=limit,
@@ -387,8 +435,8 @@ async def analyze_topic_trend(
         1. resolve_date_range("最近30天") → {"date_range": {"start": "2025-10-28", "end": "2025-11-26"}}
         2. analyze_topic_trend(topic="特斯拉", analysis_type="lifecycle", date_range=...)
     """
-    tools = _get_tools()
-    result = tools['analytics'].analyze_topic_trend_unified(
+    result = await _run_tool(
+        'analyze_topic_trend', 'analytics', 'analyze_topic_trend_unified',
         topic=topic,
         analysis_type=analysis_type,
         date_range=date_range,
@@ -433,8 +481,8 @@ async def analyze_data_insights(
         - analyze_data_insights(insight_type="platform_activity", date_range={"start": "2025-01-01", "end": "2025-01-07"})
         - analyze_data_insights(insight_type="keyword_cooccur", min_frequency=5, top_n=15)
     """
-    tools = _get_tools()
-    result = tools['analytics'].analyze_data_insights_unified(
+    result = await _run_tool(
+        'analyze_data_insights', 'analytics', 'analyze_data_insights_unified',
         insight_type=insight_type,
         topic=topic,
         date_range=date_range,
@@ -496,8 +544,8 @@ async def analyze_sentiment(
     - **默认展示方式**：展示完整的分析结果（包括所有新闻）
     - 仅在用户明确要求"总结"或"挑重点"时才进行筛选
     """
-    tools = _get_tools()
-    result = tools['analytics'].analyze_sentiment(
+    result = await _run_tool(
+        'analyze_sentiment', 'analytics', 'analyze_sentiment',
         topic=topic,
         platforms=platforms,
         date_range=date_range,
@@ -545,8 +593,8 @@ async def find_related_news(
     - 本工具返回完整的相关新闻列表（包括相似度分数）
     - 仅在用户明确要求"总结"时才进行筛选
     """
-    tools = _get_tools()
-    result = tools['search'].find_related_news_unified(
+    result = await _run_tool(
+        'find_related_news', 'search', 'find_related_news_unified',
         reference_title=reference_title,
         date_range=date_range,
         threshold=threshold,
@@ -574,8 +622,8 @@ async def generate_summary_report(
     Returns:
         JSON格式的摘要报告，包含Markdown格式内容
     """
-    tools = _get_tools()
-    result = tools['analytics'].generate_summary_report(
+    result = await _run_tool(
+        'generate_summary_report', 'analytics', 'generate_summary_report',
         report_type=report_type,
         date_range=date_range
     )
@@ -634,8 +682,8 @@ async def aggregate_news(
     - 跨平台新闻（is_cross_platform=true）通常更具新闻价值
     - 可优先展示 platform_count > 1 的新闻
     """
-    tools = _get_tools()
-    result = tools['analytics'].aggregate_news(
+    result = await _run_tool(
+        'aggregate_news', 'analytics', 'aggregate_news',
         date_range=date_range,
         platforms=platforms,
         similarity_threshold=similarity_threshold,
@@ -692,8 +740,8 @@ async def compare_periods(
             topic="人工智能"
           )
     """
-    tools = _get_tools()
-    result = tools['analytics'].compare_periods(
+    result = await _run_tool(
+        'compare_periods', 'analytics', 'compare_periods',
         period1=period1,
         period2=period2,
         topic=topic,
@@ -717,7 +765,8 @@ async def search_news(
     threshold: float = 0.6,
     include_url: bool = False,
     include_rss: bool = False,
-    rss_limit: int = 20
+    rss_limit: int = 20,
+    offset: int = 0
 ) -> str:
     """
     统一搜索接口，支持多种搜索模式，可同时搜索热榜和RSS
@@ -754,6 +803,7 @@ async def search_news(
                      - 设为True时，会在热榜结果后附加RSS搜索结果
                      - RSS结果独立展示，不影响热榜排名
         rss_limit: RSS返回条数限制，默认20（仅当include_rss=True时有效）
+        offset: 热榜结果分页偏移，默认0（翻页时传入 offset=上一页 offset+limit）
 
     Returns:
         JSON格式的搜索结果，包含：
@@ -784,8 +834,8 @@ async def search_news(
     - 仅在用户明确要求"总结"或"挑重点"时才进行筛选
     - 当include_rss=True时，热榜和RSS结果分开展示，RSS在热榜之后
     """
-    tools = _get_tools()
-    result = tools['search'].search_news_unified(
+    result = await _run_tool(
+        'search_news', 'search', 'search_news_unified',
         query=query,
         search_mode=search_mode,
         date_range=date_range,
@@ -795,7 +845,8 @@ async def search_news(
         threshold=threshold,
         include_url=include_url,
         include_rss=include_rss,
-        rss_limit=rss_limit
+        rss_limit=rss_limit,
+        offset=offset
     )
     return json.dumps(result, ensure_ascii=False, indent=2)
 
@@ -820,8 +871,7 @@ async def get_current_config(
     Returns:
         JSON格式的配置信息
     """
-    tools = _get_tools()
-    result = tools['config'].get_current_config(section=section)
+    result = await _run_tool('get_current_config', 'config', 'get_current_config', section=section)
     return json.dumps(result, ensure_ascii=False, indent=2)
 
 
@@ -835,8 +885,7 @@ async def get_system_status() -> str:
     Returns:
         JSON格式的系统状态信息
     """
-    tools = _get_tools()
-    result = tools['system'].get_system_status()
+    result = await _run_tool('get_system_status', 'system', 'get_system_status')
     return json.dumps(result, ensure_ascii=False, indent=2)
 
 
@@ -870,8 +919,12 @@ async def trigger_crawl(
         - 爬取并保存: trigger_crawl(platforms=['weibo'], save_to_local=True)
         - 使用默认平台: trigger_crawl()  # 爬取config.yaml中配置的所有平台
     """
-    tools = _get_tools()
-    result = tools['system'].trigger_crawl(platforms=platforms, save_to_local=save_to_local, include_url=include_url)
+    result = await _run_tool(
+        'trigger_crawl', 'system', 'trigger_crawl',
+        platforms=platforms,
+        save_to_local=save_to_local,
+        include_url=include_url
+    )
     return json.dumps(result, ensure_ascii=False, indent=2)
 
 
@@ -913,8 +966,7 @@ async def sync_from_remote(
         - S3_ACCESS_KEY_ID: 访问密钥 ID
         - S3_SECRET_ACCESS_KEY: 访问密钥
     """
-    tools = _get_tools()
-    result = tools['storage'].sync_from_remote(days=days)
+    result = await _run_tool('sync_from_remote', 'storage', 'sync_from_remote', days=days)
     return json.dumps(result, ensure_ascii=False, indent=2)
 
 
@@ -947,8 +999,7 @@ async def get_storage_status() -> str:
     Examples:
         - get_storage_status()  # 查看所有存储状态
     """
-    tools = _get_tools()
-    result = tools['storage'].get_storage_status()
+    result = await _run_tool('get_storage_status', 'storage', 'get_storage_status')
     return json.dumps(result, ensure_ascii=False, indent=2)
 
 
@@ -991,8 +1042,7 @@ async def list_available_dates(
         - list_available_dates(source="local")  # 仅查看本地
         - list_available_dates(source="remote")  # 仅查看远程
     """
-    tools = _get_tools()
-    result = tools['storage'].list_available_dates(source=source)
+    result = await _run_tool('list_available_dates', 'storage', 'list_available_dates', source=source)
     return json.dumps(result, ensure_ascii=False, indent=2)
 
 
@@ -1002,7 +1052,10 @@ def run_server(
     project_root: Optional[str] = None,
     transport: str = 'stdio',
     host: str = '0.0.0.0',
-    port: int = 3333
+    port: int = 3333,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    process_workers: int = DEFAULT_PROCESS_WORKERS,
+    tool_timeout: float = DEFAULT_TIMEOUT
 ):
     """
     启动 MCP 服务器
@@ -1012,9 +1065,23 @@ def run_server(
         transport: 传输模式，'stdio' 或 'http'
         host: HTTP模式的监听地址，默认 0.0.0.0
         port: HTTP模式的监听端口，默认 3333
+        max_workers: 执行工具调用的线程数，默认 8
+        process_workers: 执行 CPU 密集分析工具的进程数，默认 2（0 表示只用线程池）
+        tool_timeout: 工具调用的默认超时时间（秒），默认 120（0 表示不限制）
     """
-    # 初始化工具实例
+    global _executor
+
+    # 初始化工具实例与执行器
     _get_tools(project_root)
+    if _executor is not None:
+        _executor.shutdown()
+    _executor = ToolExecutor(
+        _get_tools,
+        project_root,
+        max_workers=max_workers,
+        process_workers=process_workers,
+        timeout=tool_timeout,
+    )
 
     # 打印启动信息
     print()
@@ -1035,6 +1102,9 @@ def run_server(
     else:
         print("  项目目录: 当前目录")
 
+    print(f"  工作线程: {max_workers}，分析进程: {process_workers}，"
+          f"默认超时: {f'{tool_timeout:g}s' if tool_timeout else '不限制'}")
+
     print()
     print("  已注册的工具:")
     print("    === 日期解析工具（推荐优先调用）===")
@@ -1075,18 +1145,21 @@ def run_server(
     print()
 
     # 根据传输模式运行服务器
-    if transport == 'stdio':
-        mcp.run(transport='stdio')
-    elif transport == 'http':
-        # HTTP 模式（生产推荐）
-        mcp.run(
-            transport='http',
-            host=host,
-            port=port,
-            path='/mcp'  # HTTP 端点路径
-        )
-    else:
-        raise ValueError(f"不支持的传输模式: {transport}")
+    try:
+        if transport == 'stdio':
+            mcp.run(transport='stdio')
+        elif transport == 'http':
+            # HTTP 模式（生产推荐）
+            mcp.run(
+                transport='http',
+                host=host,
+                port=port,
+                path='/mcp'  # HTTP 端点路径
+            )
+        else:
+            raise ValueError(f"不支持的传输模式: {transport}")
+    finally:
+        _executor.shutdown()
 
 
 if __name__ == '__main__':
@@ -1120,6 +1193,24 @@ if __name__ == '__main__':
         '--project-root',
         help='项目根目录路径'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help=f'执行工具调用的线程数，默认 {DEFAULT_MAX_WORKERS}'
+    )
+    parser.add_argument(
+        '--process-workers',
+        type=int,
+        default=DEFAULT_PROCESS_WORKERS,
+        help=f'执行 CPU 密集分析工具的进程数，默认 {DEFAULT_PROCESS_WORKERS}（0 表示只用线程池）'
+    )
+    parser.add_argument(
+        '--tool-timeout',
+        type=float,
+        default=DEFAULT_TIMEOUT,
+        help=f'工具调用的默认超时时间（秒），默认 {DEFAULT_TIMEOUT:g}（0 表示不限制）'
+    )
 
     args = parser.parse_args()
 
@@ -1127,5 +1218,8 @@ if __name__ == '__main__':
         project_root=args.project_root,
         transport=args.transport,
         host=args.host,
-        port=args.port
+        port=args.port,
+        max_workers=args.workers,
+        process_workers=args.process_workers,
+        tool_timeout=args.tool_timeout
     )
@@ -1,56 +1,294 @@
 """
 缓存服务
 
-实现TTL缓存机制，提升数据访问性能。
+实现有界 LRU + TTL 缓存，提升数据访问性能：
+
+- 条目数与估算内存占用（字节）双重上限，超出时淘汰最久未使用的条目
+- 按命名空间（缓存键第一个冒号之前的部分）设置默认 TTL
+- get_or_load 单飞加载：同一个键并发未命中时只执行一次加载，其余调用等待共享结果
+- 变更令牌：写入时可附带源数据的令牌（如 ParserService.get_change_token 返回的文件签名），
+  读取时令牌不一致即视为失效。源数据不变时条目一直有效（TTL 只作兜底），
+  抓取写入后下一次读取立即刷新
+- 命中 / 未命中 / 淘汰 / 过期 / 失效计数，通过 get_system_status 输出
 """
 
+import os
+import sys
 import time
-from typing import Any, Optional
-from threading import Lock
+from collections import OrderedDict
+from threading import Condition, Lock
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+# 默认上限（可通过环境变量 MCP_CACHE_MAX_ENTRIES / MCP_CACHE_MAX_MB 调整）
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# 默认 TTL（秒），命名空间未配置时使用
+DEFAULT_TTL = 900
+
+# 各命名空间的默认 TTL（秒）
+# 基于抓取数据的命名空间写入时附带变更令牌，数据变化即失效，TTL 只作兜底
+NAMESPACE_TTLS: Dict[str, int] = {
+    "latest_news": 3600,
+    "news_by_date": 3600,
+    "trending_topics": 1800,
+    "config": 3600,
+    "latest_rss": 3600,
+    "search_rss": 3600,
+    "rss_feeds_status": 300,
+    "read_all": 3600,
+}
+
+# 估算大小时的最大递归深度（更深的对象按浅层大小计）
+_SIZE_MAX_DEPTH = 6
+
+
+def namespace_of(key: str) -> str:
+    """缓存键的命名空间（第一个冒号之前的部分）"""
+    return key.split(":", 1)[0]
+
+
+def approximate_size(value: Any) -> int:
+    """
+    估算对象占用的内存（字节）
+
+    递归累加容器及其元素的 sys.getsizeof，同一对象只计一次，
+    用于缓存容量控制，不追求精确。
+
+    Args:
+        value: 任意对象
+
+    Returns:
+        估算字节数
+    """
+    seen = set()
+    total = 0
+    stack = [(value, 0)]
+    while stack:
+        obj, depth = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if depth >= _SIZE_MAX_DEPTH:
+            continue
+        if isinstance(obj, dict):
+            for k, v in obj.items():
+                stack.append((k, depth + 1))
+                stack.append((v, depth + 1))
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend((item, depth + 1) for item in obj)
+    return total
+
+
+class _CacheEntry:
+    """缓存条目"""
+
+    __slots__ = ("value", "created", "expires", "size", "token")
+
+    def __init__(self, value: Any, created: float, expires: float, size: int, token: Optional[Hashable]):
+        self.value = value
+        self.created = created
+        self.expires = expires
+        self.size = size
+        self.token = token
+
+
+class _Flight:
+    """进行中的加载（单飞）"""
+
+    __slots__ = ("generation", "token", "done", "value", "error")
+
+    def __init__(self, generation: int, token: Optional[Hashable]):
+        self.generation = generation
+        self.token = token
+        self.done = False
+        self.value = None
+        self.error: Optional[BaseException] = None
 
 
 class CacheService:
     """缓存服务类"""
 
-    def __init__(self):
-        """初始化缓存服务"""
-        self._cache = {}
-        self._timestamps = {}
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        namespace_ttls: Optional[Dict[str, int]] = None
+    ):
+        """
+        初始化缓存服务
+
+        Args:
+            max_entries: 最大条目数
+            max_bytes: 最大估算内存占用（字节）
+            namespace_ttls: 各命名空间的默认 TTL（秒），默认 NAMESPACE_TTLS
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.namespace_ttls = dict(NAMESPACE_TTLS if namespace_ttls is None else namespace_ttls)
+
+        self._cache: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self._generation = 0  # clear() 时递增，清空前开始的加载结果不再写入
+        self._inflight: Dict[str, _Flight] = {}
         self._lock = Lock()
+        self._loaded = Condition(self._lock)
 
-    def get(self, key: str, ttl: int = 900) -> Optional[Any]:
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+        self._loads = 0
+        self._coalesced = 0
+
+    def _ttl_for(self, key: str) -> int:
+        return self.namespace_ttls.get(namespace_of(key), DEFAULT_TTL)
+
+    def _remove(self, key: str) -> None:
+        """删除条目（调用方持有锁）"""
+        entry = self._cache.pop(key)
+        self._bytes -= entry.size
+
+    def _lookup(
+        self, key: str, ttl: Optional[int], token: Optional[Hashable], now: float
+    ) -> Optional[_CacheEntry]:
+        """查找未过期且令牌一致的条目并标记为最近使用，更新命中计数（调用方持有锁）"""
+        entry = self._cache.get(key)
+        if entry is not None:
+            if token is not None and entry.token != token:
+                # 源数据已变化
+                self._remove(key)
+                self._invalidations += 1
+            elif now < entry.expires and (ttl is None or now - entry.created < ttl):
+                self._cache.move_to_end(key)
+                self._hits += 1
+                return entry
+            else:
+                # 已过期，删除缓存
+                self._remove(key)
+                self._expirations += 1
+        self._misses += 1
+        return None
+
+    def _store(
+        self, key: str, value: Any, ttl: Optional[int], size: int, token: Optional[Hashable]
+    ) -> None:
+        """写入条目并按 LRU 淘汰超出上限的条目（调用方持有锁）"""
+        if key in self._cache:
+            self._remove(key)
+        if size > self.max_bytes:
+            # 单个值超过容量上限时不缓存，避免清空其他条目
+            return
+        now = time.time()
+        ttl = self._ttl_for(key) if ttl is None else ttl
+        self._cache[key] = _CacheEntry(value, now, now + ttl, size, token)
+        self._bytes += size
+
+        while self._cache and (len(self._cache) > self.max_entries or self._bytes > self.max_bytes):
+            oldest = next(iter(self._cache))
+            self._remove(oldest)
+            self._evictions += 1
+
+    def _finish(self, key: str, flight: _Flight) -> None:
+        """移除已完成的加载（令牌变化后同一个键可能已有新的加载，调用方持有锁）"""
+        if self._inflight.get(key) is flight:
+            del self._inflight[key]
+
+    def get(self, key: str, ttl: Optional[int] = None, token: Optional[Hashable] = None) -> Optional[Any]:
         """
         获取缓存数据
 
         Args:
             key: 缓存键
-            ttl: 存活时间（秒），默认15分钟
+            ttl: 存活时间（秒），默认使用写入时的命名空间 TTL；
+                 指定时按写入后经过的时间额外校验
+            token: 当前的源数据变更令牌，与写入时的令牌不一致时视为失效（None 表示不校验）
 
         Returns:
-            缓存的值，如果不存在或已过期则返回None
+            缓存的值，如果不存在、已过期或已失效则返回None
         """
         with self._lock:
-            if key in self._cache:
-                # 检查是否过期
-                if time.time() - self._timestamps[key] < ttl:
-                    return self._cache[key]
-                else:
-                    # 已过期，删除缓存
-                    del self._cache[key]
-                    del self._timestamps[key]
-        return None
+            entry = self._lookup(key, ttl, token, time.time())
+            return entry.value if entry is not None else None
 
-    def set(self, key: str, value: Any) -> None:
+    def set(
+        self, key: str, value: Any, ttl: Optional[int] = None, token: Optional[Hashable] = None
+    ) -> None:
         """
         设置缓存数据
 
         Args:
             key: 缓存键
             value: 缓存值
+            ttl: 存活时间（秒），默认使用命名空间 TTL
+            token: 生成该值时的源数据变更令牌（应在读取源数据之前获取）
+        """
+        size = approximate_size(value)
+        with self._lock:
+            self._store(key, value, ttl, size, token)
+
+    def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Any],
+        ttl: Optional[int] = None,
+        token: Optional[Hashable] = None
+    ) -> Any:
+        """
+        获取缓存数据，未命中时调用 loader 加载并缓存
+
+        同一个键的并发未命中只执行一次 loader，其余调用等待并共享结果
+        （loader 抛出的异常同样传递给所有等待者）。loader 返回 None 时不缓存。
+
+        Args:
+            key: 缓存键
+            loader: 加载函数
+            ttl: 存活时间（秒），同时用于校验已缓存条目与设置新条目，默认使用命名空间 TTL
+            token: 当前的源数据变更令牌（应在调用前获取），校验已缓存条目并随新条目保存
+
+        Returns:
+            缓存或新加载的值
         """
         with self._lock:
-            self._cache[key] = value
-            self._timestamps[key] = time.time()
+            entry = self._lookup(key, ttl, token, time.time())
+            if entry is not None:
+                return entry.value
+
+            flight = self._inflight.get(key)
+            if flight is not None and flight.token == token:
+                self._coalesced += 1
+                while not flight.done:
+                    self._loaded.wait()
+                if flight.error is not None:
+                    raise flight.error
+                return flight.value
+
+            flight = _Flight(self._generation, token)
+            self._inflight[key] = flight
+            self._loads += 1
+
+        try:
+            value = loader()
+            size = approximate_size(value) if value is not None else 0
+        except BaseException as e:
+            with self._lock:
+                flight.error = e
+                flight.done = True
+                self._finish(key, flight)
+                self._loaded.notify_all()
+            raise
+
+        with self._lock:
+            if value is not None and flight.generation == self._generation:
+                self._store(key, value, ttl, size, token)
+            flight.value = value
+            flight.done = True
+            self._finish(key, flight)
+            self._loaded.notify_all()
+        return value
 
     def delete(self, key: str) -> bool:
         """
@@ -64,8 +302,7 @@ class CacheService:
         """
         with self._lock:
             if key in self._cache:
-                del self._cache[key]
-                del self._timestamps[key]
+                self._remove(key)
                 return True
         return False
 
@@ -73,14 +310,15 @@ class CacheService:
         """清空所有缓存"""
         with self._lock:
             self._cache.clear()
-            self._timestamps.clear()
+            self._bytes = 0
+            self._generation += 1
 
-    def cleanup_expired(self, ttl: int = 900) -> int:
+    def cleanup_expired(self, ttl: Optional[int] = None) -> int:
         """
         清理过期缓存
 
         Args:
-            ttl: 存活时间（秒）
+            ttl: 存活时间（秒），指定时写入时间早于 ttl 的条目也视为过期
 
         Returns:
             清理的条目数量
@@ -88,13 +326,13 @@ class CacheService:
         with self._lock:
             current_time = time.time()
             expired_keys = [
-                key for key, timestamp in self._timestamps.items()
-                if current_time - timestamp >= ttl
+                key for key, entry in self._cache.items()
+                if current_time >= entry.expires or (ttl is not None and current_time - entry.created >= ttl)
             ]
 
             for key in expired_keys:
-                del self._cache[key]
-                del self._timestamps[key]
+                self._remove(key)
+            self._expirations += len(expired_keys)
 
             return len(expired_keys)
 
@@ -106,21 +344,38 @@ class CacheService:
             统计信息字典
         """
         with self._lock:
+            now = time.time()
+            created = [entry.created for entry in self._cache.values()]
+            namespaces: Dict[str, Dict[str, int]] = {}
+            for key, entry in self._cache.items():
+                stats = namespaces.setdefault(namespace_of(key), {"entries": 0, "bytes": 0})
+                stats["entries"] += 1
+                stats["bytes"] += entry.size
+            lookups = self._hits + self._misses
+
             return {
                 "total_entries": len(self._cache),
-                "oldest_entry_age": (
-                    time.time() - min(self._timestamps.values())
-                    if self._timestamps else 0
-                ),
-                "newest_entry_age": (
-                    time.time() - max(self._timestamps.values())
-                    if self._timestamps else 0
-                )
+                "max_entries": self.max_entries,
+                "approx_bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "invalidations": self._invalidations,
+                "loads": self._loads,
+                "coalesced_loads": self._coalesced,
+                "loading": len(self._inflight),
+                "namespaces": namespaces,
+                "oldest_entry_age": now - min(created) if created else 0,
+                "newest_entry_age": now - max(created) if created else 0,
             }
 
 
 # 全局缓存实例
 _global_cache = None
+_global_cache_lock = Lock()
 
 
 def get_cache() -> CacheService:
@@ -132,5 +387,11 @@ def get_cache() -> CacheService:
     """
     global _global_cache
     if _global_cache is None:
-        _global_cache = CacheService()
+        with _global_cache_lock:
+            if _global_cache is None:
+                _global_cache = CacheService(
+                    max_entries=int(os.environ.get("MCP_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)),
+                    max_bytes=int(float(os.environ.get("MCP_CACHE_MAX_MB", DEFAULT_MAX_BYTES / 1024 / 1024))
+                                  * 1024 * 1024),
+                )
     return _global_cache
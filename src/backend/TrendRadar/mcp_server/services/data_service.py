@@ -65,7 +65,8 @@ class DataService:
         """
         # 尝试从缓存获取
         cache_key = f"latest_news:{','.join(platforms or [])}:{limit}:{include_url}"
-        cached = self.cache.get(cache_key, ttl=900)  # 15分钟缓存
+        token = self.parser.get_change_token(None, "news")  # 抓取写入新数据后缓存失效
+        cached = self.cache.get(cache_key, token=token)
         if cached:
             return cached
 
@@ -113,7 +114,7 @@ class DataService:
         result = news_list[:limit]
 
         # 缓存结果
-        self.cache.set(cache_key, result)
+        self.cache.set(cache_key, result, token=token)
 
         return result
 
@@ -150,7 +151,8 @@ class DataService:
         # 尝试从缓存获取
         date_str = target_date.strftime("%Y-%m-%d")
         cache_key = f"news_by_date:{date_str}:{','.join(platforms or [])}:{limit}:{include_url}"
-        cached = self.cache.get(cache_key, ttl=1800)  # 30分钟缓存
+        token = self.parser.get_change_token(target_date, "news")
+        cached = self.cache.get(cache_key, token=token)
         if cached:
             return cached
 
@@ -192,8 +194,8 @@ class DataService:
         # 限制返回数量
         result = news_list[:limit]
 
-        # 缓存结果(历史数据缓存更久)
-        self.cache.set(cache_key, result)
+        # 缓存结果（直到该日期的数据变化）
+        self.cache.set(cache_key, result, token=token)
 
         return result
 
@@ -202,16 +204,20 @@ class DataService:
         keyword: str,
         date_range: Optional[Tuple[datetime, datetime]] = None,
         platforms: Optional[List[str]] = None,
-        limit: Optional[int] = None
+        limit: Optional[int] = None,
+        offset: int = 0
     ) -> Dict:
         """
         按关键词搜索新闻
 
+        优先使用全文搜索索引，索引不可用时逐日读取标题比较。
+
         Args:
             keyword: 搜索关键词
             date_range: 日期范围 (start_date, end_date)
             platforms: 平台过滤列表
             limit: 返回条数限制(可选)
+            offset: 分页偏移（跳过前 offset 条）
 
         Returns:
             搜索结果字典
@@ -230,9 +236,27 @@ class DataService:
         results = []
         platform_distribution = Counter()
 
-        # 遍历日期范围
+        searched = self.parser.search_titles(keyword, start_date, end_date, platform_ids=platforms)
+        if searched is not None:
+            hits, _ = searched
+            for hit in hits:
+                avg_rank = sum(hit.ranks) / len(hit.ranks) if hit.ranks else 0
+                results.append({
+                    "title": hit.title,
+                    "platform": hit.source_id,
+                    "platform_name": hit.source_name,
+                    "ranks": hit.ranks,
+                    "count": len(hit.ranks),
+                    "avg_rank": round(avg_rank, 2),
+                    "url": hit.url,
+                    "mobileUrl": hit.mobile_url,
+                    "date": hit.date
+                })
+                platform_distribution[hit.source_id] += 1
+
+        # 遍历日期范围（索引不可用时）
         current_date = start_date
-        while current_date <= end_date:
+        while searched is None and current_date <= end_date:
             try:
                 all_titles, id_to_name, _ = self.parser.read_all_titles_for_date(
                     date=current_date,
@@ -282,10 +306,13 @@ class DataService:
 
         avg_rank = sum(total_ranks) / len(total_ranks) if total_ranks else 0
 
-        # 限制返回数量(如果指定)
+        # 分页与限制返回数量(如果指定)
         total_found = len(results)
+        offset = max(0, offset or 0)
         if limit is not None and limit > 0:
-            results = results[:limit]
+            results = results[offset:offset + limit]
+        elif offset:
+            results = results[offset:]
 
         return {
             "results": results,
@@ -353,7 +380,8 @@ class DataService:
         """
         # 尝试从缓存获取
         cache_key = f"trending_topics:{top_n}:{mode}:{extract_mode}"
-        cached = self.cache.get(cache_key, ttl=1800)  # 30分钟缓存
+        token = self.parser.get_change_token(None, "news")
+        cached = self.cache.get(cache_key, token=token)
         if cached:
             return cached
 
@@ -377,13 +405,13 @@ class DataService:
         # 统计词频
         word_frequency = Counter()
         keyword_to_news = {}
+        word_groups = self.parser.parse_frequency_words() if extract_mode == "keywords" else []
 
         # 遍历要处理的标题
         for platform_id, titles in titles_to_process.items():
             for title in titles.keys():
                 if extract_mode == "keywords":
                     # 基于预设关键词统计
-                    word_groups = self.parser.parse_frequency_words()
                     for group in word_groups:
                         all_words = group.get("required", []) + group.get("normal", [])
                         for word in all_words:
@@ -429,7 +457,7 @@ class DataService:
         }
 
         # 缓存结果
-        self.cache.set(cache_key, result)
+        self.cache.set(cache_key, result, token=token)
 
         return result
 
@@ -479,6 +507,7 @@ class DataService:
                 "enable_crawler": advanced_crawler.get("enabled", True),
                 "use_proxy": advanced_crawler.get("use_proxy", False),
                 "request_interval": advanced_crawler.get("request_interval", 1),
+                "max_workers": advanced_crawler.get("max_workers", 4),
                 "retry_times": 3,
                 "platforms": [p["id"] for p in config_data.get("platforms", [])]
             }
@@ -692,7 +721,8 @@ class DataService:
             DataNotFoundError: 数据不存在
         """
         cache_key = f"latest_rss:{','.join(feeds or [])}:{limit}:{include_summary}"
-        cached = self.cache.get(cache_key, ttl=900)
+        token = self.parser.get_change_token(None, "rss")
+        cached = self.cache.get(cache_key, token=token)
         if cached:
             return cached
 
@@ -738,7 +768,7 @@ class DataService:
         result = rss_list[:limit]
 
         # 缓存结果
-        self.cache.set(cache_key, result)
+        self.cache.set(cache_key, result, token=token)
 
         return result
 
@@ -748,29 +778,59 @@ class DataService:
         feeds: Optional[List[str]] = None,
         days: int = 7,
         limit: int = 50,
-        include_summary: bool = False
+        include_summary: bool = False,
+        offset: int = 0
     ) -> List[Dict]:
         """
         搜索 RSS 数据
 
+        优先使用全文搜索索引，索引不可用时逐日读取条目比较。
+
         Args:
             keyword: 搜索关键词
             feeds: RSS 源 ID 列表，None 表示所有源
             days: 搜索最近 N 天的数据
             limit: 返回条数限制
             include_summary: 是否包含摘要
+            offset: 分页偏移（跳过前 offset 条）
 
         Returns:
             匹配的 RSS 条目列表
         """
-        cache_key = f"search_rss:{keyword}:{','.join(feeds or [])}:{days}:{limit}:{include_summary}"
-        cached = self.cache.get(cache_key, ttl=900)
+        offset = max(0, offset or 0)
+        cache_key = f"search_rss:{keyword}:{','.join(feeds or [])}:{days}:{limit}:{include_summary}:{offset}"
+        today = datetime.now()
+        token = tuple(
+            self.parser.get_change_token(today - timedelta(days=i), "rss") for i in range(days)
+        )
+        cached = self.cache.get(cache_key, token=token)
         if cached:
             return cached
 
-        results = []
-        today = datetime.now()
+        searched = self.parser.search_titles(
+            keyword, today - timedelta(days=days - 1), today, db_type="rss",
+            platform_ids=feeds, include_summary=True, order="published",
+            limit=limit, offset=offset
+        )
+        if searched is not None:
+            result = []
+            for hit in searched[0]:
+                rss_item = {
+                    "title": hit.title,
+                    "feed_id": hit.source_id,
+                    "feed_name": hit.source_name,
+                    "url": hit.url,
+                    "published_at": hit.published_at,
+                    "author": hit.author,
+                    "date": hit.date
+                }
+                if include_summary:
+                    rss_item["summary"] = hit.summary
+                result.append(rss_item)
+            self.cache.set(cache_key, result, token=token)
+            return result
 
+        results = []
         for i in range(days):
             target_date = today - timedelta(days=i)
 
@@ -809,11 +869,11 @@ class DataService:
         # 按发布时间排序
         results.sort(key=lambda x: x.get("published_at", ""), reverse=True)
 
-        # 限制返回数量
-        result = results[:limit]
+        # 分页与限制返回数量
+        result = results[offset:offset + limit]
 
         # 缓存结果
-        self.cache.set(cache_key, result)
+        self.cache.set(cache_key, result, token=token)
 
         return result
 
@@ -825,7 +885,8 @@ class DataService:
             RSS 源状态信息
         """
         cache_key = "rss_feeds_status"
-        cached = self.cache.get(cache_key, ttl=300)
+        token = self.parser.get_change_token(None, "rss")
+        cached = self.cache.get(cache_key, token=token)
         if cached:
             return cached
 
@@ -857,6 +918,6 @@ class DataService:
             "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         }
 
-        self.cache.set(cache_key, result)
+        self.cache.set(cache_key, result, token=token)
 
         return result
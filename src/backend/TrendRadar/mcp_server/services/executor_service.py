@@ -0,0 +1,187 @@
+"""
+工具执行服务
+
+MCP 工具函数都是 async 的，但工具实现是同步的（SQLite 读取、SequenceMatcher 聚合、
+trigger_crawl 的 HTTP 请求）。直接在事件循环里调用时，一个慢工具会阻塞所有客户端。
+这里把工具调用放到工作池执行：
+
+- 默认在线程池执行（SQLite / 网络 IO 会释放 GIL）
+- CPU 密集的分析工具（PROCESS_TOOLS）在进程池执行，进程内独立创建工具实例
+- 每个工具可设置并发上限（TOOL_CONCURRENCY），超出时在事件循环中排队等待
+- 每个工具有超时时间（TOOL_TIMEOUTS，含排队时间），超时后立即返回 TOOL_TIMEOUT 错误；
+  线程中的调用无法强制中断，会在后台继续执行完毕，执行完之前仍占用该工具的并发名额
+  （例如超时的 trigger_crawl 结束前不会启动新的抓取）
+"""
+
+import asyncio
+import functools
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional
+
+from ..utils.errors import MCPError, ToolTimeoutError
+
+
+# 默认工作线程数 / 进程数 / 超时时间（秒）
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_PROCESS_WORKERS = 2
+DEFAULT_TIMEOUT = 120.0
+
+# 在进程池执行的工具（CPU 密集）
+PROCESS_TOOLS = {
+    "analyze_data_insights",   # 关键词共现等
+    "aggregate_news",
+    "compare_periods",
+}
+
+# 工具并发上限（未列出的工具只受工作池大小限制）
+TOOL_CONCURRENCY: Dict[str, int] = {
+    "trigger_crawl": 1,
+    "sync_from_remote": 1,
+    "analyze_data_insights": 2,
+    "aggregate_news": 2,
+    "compare_periods": 2,
+}
+
+# 工具超时时间（秒，未列出的使用默认值）
+TOOL_TIMEOUTS: Dict[str, float] = {
+    "trigger_crawl": 300.0,
+    "sync_from_remote": 600.0,
+}
+
+
+# 进程池工作进程内的工具实例
+_process_tools: Optional[Dict[str, Any]] = None
+
+
+def _init_process_worker(tools_factory: Callable[[Optional[str]], Dict[str, Any]], project_root: Optional[str]):
+    """进程池初始化：在工作进程内创建工具实例"""
+    global _process_tools
+    _process_tools = tools_factory(project_root)
+
+
+def _call_in_process(category: str, method: str, kwargs: Dict[str, Any]) -> Any:
+    """在工作进程内调用工具方法"""
+    return getattr(_process_tools[category], method)(**kwargs)
+
+
+def _error_result(error: MCPError) -> Dict:
+    return {"success": False, "error": error.to_dict()}
+
+
+class ToolExecutor:
+    """工具执行器：线程池 + 进程池，带并发上限与超时"""
+
+    def __init__(
+        self,
+        tools_factory: Callable[[Optional[str]], Dict[str, Any]],
+        project_root: Optional[str] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        process_workers: int = DEFAULT_PROCESS_WORKERS,
+        timeout: float = DEFAULT_TIMEOUT,
+        tool_concurrency: Optional[Dict[str, int]] = None,
+        tool_timeouts: Optional[Dict[str, float]] = None,
+    ):
+        """
+        Args:
+            tools_factory: 创建工具实例字典的函数（需可被 pickle，即模块级函数），
+                参数为项目根目录
+            project_root: 项目根目录
+            max_workers: 线程池大小
+            process_workers: 进程池大小，0 表示不使用进程池（全部在线程池执行）
+            timeout: 默认超时时间（秒），0 表示不限制
+            tool_concurrency: 工具并发上限，默认 TOOL_CONCURRENCY
+            tool_timeouts: 工具超时时间，默认 TOOL_TIMEOUTS
+        """
+        self.tools_factory = tools_factory
+        self.project_root = project_root
+        self.max_workers = max_workers
+        self.process_workers = process_workers
+        self.timeout = timeout
+        self.tool_concurrency = dict(TOOL_CONCURRENCY if tool_concurrency is None else tool_concurrency)
+        self.tool_timeouts = dict(TOOL_TIMEOUTS if tool_timeouts is None else tool_timeouts)
+
+        self._threads = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="mcp-tool")
+        self._processes: Optional[ProcessPoolExecutor] = None
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def _process_pool(self) -> Optional[Executor]:
+        """懒加载进程池（spawn 方式启动，避免在多线程进程中 fork）"""
+        if self.process_workers <= 0:
+            return None
+        if self._processes is None:
+            self._processes = ProcessPoolExecutor(
+                max_workers=self.process_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_process_worker,
+                initargs=(self.tools_factory, self.project_root),
+            )
+        return self._processes
+
+    def _semaphore(self, tool_name: str) -> Optional[asyncio.Semaphore]:
+        limit = self.tool_concurrency.get(tool_name)
+        if not limit:
+            return None
+        if tool_name not in self._semaphores:
+            self._semaphores[tool_name] = asyncio.Semaphore(limit)
+        return self._semaphores[tool_name]
+
+    async def _execute(self, tool_name: str, category: str, method: str, kwargs: Dict[str, Any]) -> Any:
+        loop = asyncio.get_running_loop()
+        if tool_name in PROCESS_TOOLS:
+            pool = self._process_pool()
+            if pool is not None:
+                try:
+                    return await loop.run_in_executor(pool, _call_in_process, category, method, kwargs)
+                except BrokenProcessPool as e:
+                    # 工作进程异常退出：丢弃进程池（下次调用时重建），本次改在线程池执行
+                    print(f"[MCP] 进程池不可用，改用线程池执行 {tool_name}: {e}")
+                    self._processes = None
+
+        tools = self.tools_factory(self.project_root)
+        call = functools.partial(getattr(tools[category], method), **kwargs)
+        return await loop.run_in_executor(self._threads, call)
+
+    @staticmethod
+    def _on_done(semaphore: Optional[asyncio.Semaphore], task: asyncio.Future) -> None:
+        """调用结束：释放并发名额"""
+        if semaphore is not None:
+            semaphore.release()
+
+    async def run(self, tool_name: str, category: str, method: str, **kwargs) -> Any:
+        """
+        在工作池中执行工具方法
+
+        Args:
+            tool_name: MCP 工具名（用于并发上限与超时配置）
+            category: 工具实例类别（如 'data'、'analytics'）
+            method: 工具实例的方法名
+            **kwargs: 方法参数
+
+        Returns:
+            方法返回值；超时时返回 {"success": False, "error": {...}}
+        """
+        timeout = self.tool_timeouts.get(tool_name, self.timeout) or None
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout if timeout else None
+        semaphore = self._semaphore(tool_name)
+        try:
+            # 排队等待的时间也计入超时
+            if semaphore is not None:
+                await asyncio.wait_for(semaphore.acquire(), timeout)
+            task = asyncio.ensure_future(self._execute(tool_name, category, method, kwargs))
+            if semaphore is not None:
+                # 并发名额在调用真正结束时才释放（超时返回后仍在执行的调用继续占用）
+                task.add_done_callback(functools.partial(self._on_done, semaphore))
+            remaining = None if deadline is None else max(0.0, deadline - loop.time())
+            return await asyncio.wait_for(asyncio.shield(task), remaining)
+        except asyncio.TimeoutError:
+            return _error_result(ToolTimeoutError(tool_name, timeout))
+
+    def shutdown(self) -> None:
+        """关闭工作池（不等待正在执行的调用）"""
+        self._threads.shutdown(wait=False, cancel_futures=True)
+        if self._processes is not None:
+            self._processes.shutdown(wait=False, cancel_futures=True)
+            self._processes = None
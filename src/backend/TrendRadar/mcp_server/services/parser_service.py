@@ -3,13 +3,13 @@
 
 v2.0.0: 仅支持 SQLite 数据库，移除 TXT 文件支持
 新存储结构：output/{type}/{date}.db
+已归档的历史日期优先从 output/archive/{type}/{YYYY-MM}.parquet 读取
 """
 
 import re
-import sqlite3
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
-from datetime import datetime
+from datetime import datetime, timedelta
 
 import yaml
 
@@ -17,6 +17,70 @@ from ..utils.errors import FileParseError, DataNotFoundError
 from .cache_service import get_cache
 
 
+# 全局只读连接缓存（所有 ParserService 实例共享）
+_reader_connections = None
+
+
+def get_reader_connections():
+    """
+    获取全局只读 SQLite 连接缓存
+
+    按数据库文件复用连接，配合抓取端的 WAL 模式，读取不会阻塞写入；
+    文件被替换（如从远程同步覆盖）时自动重新打开。
+    多个线程共享同一缓存，读取时通过 lease() 租用连接，避免读到一半被其他线程关闭。
+
+    Returns:
+        SQLiteConnectionCache 实例
+    """
+    global _reader_connections
+    if _reader_connections is None:
+        from trendradar.storage.connection import SQLiteConnectionCache, READER_PRAGMAS
+        _reader_connections = SQLiteConnectionCache(max_connections=16, pragmas=READER_PRAGMAS)
+    return _reader_connections
+
+
+# 全局历史归档读取器（按数据目录共享，月份数据缓存在读取器内）
+_history_archives: Dict[str, object] = {}
+
+
+def get_history_archive(data_dir: Path):
+    """
+    获取数据目录对应的历史归档读取器
+
+    Args:
+        data_dir: 数据目录（output）
+
+    Returns:
+        HistoryArchive 实例
+    """
+    key = str(data_dir)
+    if key not in _history_archives:
+        from trendradar.storage.archive import HistoryArchive
+        _history_archives[key] = HistoryArchive(key)
+    return _history_archives[key]
+
+
+# 全局全文搜索索引（按数据目录共享）
+_search_indexes: Dict[str, object] = {}
+
+
+def get_search_index(data_dir: Path):
+    """
+    获取数据目录对应的全文搜索索引（output/.cache/search_index.db）
+
+    Args:
+        data_dir: 数据目录（output）
+
+    Returns:
+        SearchIndex 实例
+    """
+    key = str(data_dir)
+    if key not in _search_indexes:
+        from trendradar.storage.search_index import SearchIndex
+        _search_indexes[key] = SearchIndex(Path(data_dir) / ".cache" / "search_index.db")
+    return _search_indexes[key]
+
+
 class ParserService:
     """数据解析服务类"""
 
@@ -34,6 +98,7 @@ class ParserService:
             self.project_root = Path(project_root)
 
         self.cache = get_cache()
+        self.archive = get_history_archive(self.project_root / "output")
 
     @staticmethod
     def clean_title(title: str) -> str:
@@ -101,21 +166,19 @@ class ParserService:
         all_timestamps = {}
 
         try:
-            conn = sqlite3.connect(str(db_path))
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-
-            if db_type == "news":
-                return self._read_news_from_sqlite(cursor, platform_ids, all_titles, id_to_name, all_timestamps)
-            elif db_type == "rss":
-                return self._read_rss_from_sqlite(cursor, platform_ids, all_titles, id_to_name, all_timestamps)
+            with get_reader_connections().lease(db_path) as conn:
+                cursor = conn.cursor()
+                try:
+                    if db_type == "news":
+                        return self._read_news_from_sqlite(cursor, platform_ids, all_titles, id_to_name, all_timestamps)
+                    elif db_type == "rss":
+                        return self._read_rss_from_sqlite(cursor, platform_ids, all_titles, id_to_name, all_timestamps)
+                finally:
+                    cursor.close()
 
         except Exception as e:
             print(f"Warning: 从 SQLite 读取数据失败: {e}")
             return None
-        finally:
-            if 'conn' in locals():
-                conn.close()
 
     def _read_news_from_sqlite(
         self,
@@ -300,6 +363,122 @@ class ParserService:
 
         return (all_items, id_to_name, all_timestamps)
 
+    def _read_day(
+        self,
+        date: datetime = None,
+        platform_ids: Optional[List[str]] = None,
+        db_type: str = "news"
+    ) -> Optional[Tuple[Dict, Dict, Dict]]:
+        """读取指定日期的数据（不使用缓存），无数据时返回 None"""
+        date_str = self.get_date_folder_name(date)
+        is_today = (date is None) or (date.date() == datetime.now().date())
+
+        # 已归档的历史日期从归档读取（按月加载），其余（含当天）读取 SQLite
+        if not is_today and self.archive.contains(date_str, db_type):
+            return self.archive.read_day(date_str, db_type, platform_ids)
+        return self._read_from_sqlite(date, platform_ids, db_type)
+
+    def get_change_token(self, date: datetime = None, db_type: str = "news") -> Optional[str]:
+        """
+        指定日期源数据的变更令牌（与 _read_day 选择的数据源一致）
+
+        SQLite 数据为数据库文件签名（抓取端每次保存后都会变化），已归档日期为
+        月份 Parquet 文件签名。只做 stat，不打开数据库，可在每次查询缓存前调用。
+
+        Args:
+            date: 日期对象，默认为今天
+            db_type: 数据库类型 ("news" 或 "rss")
+
+        Returns:
+            令牌字符串，无数据时返回 None
+        """
+        from trendradar.storage.connection import file_signature
+
+        date_str = self.get_date_folder_name(date)
+        is_today = (date is None) or (date.date() == datetime.now().date())
+        if not is_today and self.archive.contains(date_str, db_type):
+            return self.archive.signature(date_str, db_type)
+        db_path = self._get_db_path(date, db_type)
+        return file_signature(db_path) if db_path else None
+
+    def _ensure_search_index(self, dates: List[datetime], db_type: str = "news"):
+        """
+        补齐日期范围内的搜索索引
+
+        抓取端保存数据时会同步更新索引；源数据签名与索引记录不一致时
+        （远程同步、历史归档、索引文件新建等）在这里重新索引该日期。
+
+        Returns:
+            SearchIndex 实例
+        """
+        from trendradar.storage.search_index import documents_from_titles
+
+        index = get_search_index(self.project_root / "output")
+        for date in dates:
+            date_str = self.get_date_folder_name(date)
+            # 先取签名再读取数据：读取期间数据更新时签名只会偏旧，下次查询会再次补齐
+            signature = self.get_change_token(date, db_type)
+            if index.get_signature(db_type, date_str) == signature:
+                continue
+            if signature is None:
+                index.remove_day(db_type, date_str)
+                continue
+            result = self._read_day(date, None, db_type)
+            documents = documents_from_titles(result[0], result[1]) if result else []
+            index.replace_documents(db_type, date_str, documents, signature)
+        return index
+
+    def search_titles(
+        self,
+        keyword: str,
+        start_date: datetime,
+        end_date: datetime,
+        db_type: str = "news",
+        platform_ids: Optional[List[str]] = None,
+        include_summary: bool = False,
+        order: str = "date",
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> Optional[Tuple[List, int]]:
+        """
+        通过全文搜索索引查找包含关键词的标题（不区分大小写的子串匹配）
+
+        Args:
+            keyword: 搜索关键词
+            start_date: 开始日期
+            end_date: 结束日期
+            db_type: 数据库类型 ("news" 或 "rss")
+            platform_ids: 平台/Feed ID 列表，None 表示全部
+            include_summary: 是否同时匹配摘要（RSS）
+            order: 排序方式（"date" / "published" / "relevance"，见 SearchIndex）
+            limit: 返回条数，None 表示全部
+            offset: 跳过的条数
+
+        Returns:
+            (SearchHit 列表, 命中总数)，索引不可用时返回 None（由调用方逐日扫描）
+        """
+        dates = []
+        current_date = start_date
+        while current_date <= end_date:
+            dates.append(current_date)
+            current_date += timedelta(days=1)
+
+        try:
+            index = self._ensure_search_index(dates, db_type)
+            return index.search(
+                db_type,
+                keyword,
+                [self.get_date_folder_name(date) for date in dates],
+                source_ids=platform_ids,
+                include_summary=include_summary,
+                order=order,
+                limit=limit,
+                offset=offset,
+            )
+        except Exception as e:
+            print(f"Warning: 搜索索引不可用，改为逐日扫描: {e}")
+            return None
+
     def read_all_titles_for_date(
         self,
         date: datetime = None,
@@ -324,16 +503,13 @@ class ParserService:
         platform_key = ','.join(sorted(platform_ids)) if platform_ids else 'all'
         cache_key = f"read_all:{db_type}:{date_str}:{platform_key}"
 
-        is_today = (date is None) or (date.date() == datetime.now().date())
-        ttl = 900 if is_today else 3600
-
-        cached = self.cache.get(cache_key, ttl=ttl)
-        if cached:
-            return cached
-
-        result = self._read_from_sqlite(date, platform_ids, db_type)
+        # 缓存一直有效直到抓取端写入新数据（变更令牌变化），并发查询同一天时只读取一次
+        result = self.cache.get_or_load(
+            cache_key,
+            lambda: self._read_day(date, platform_ids, db_type) or None,
+            token=self.get_change_token(date, db_type),
+        )
         if result:
-            self.cache.set(cache_key, result)
             return result
 
         raise DataNotFoundError(
@@ -414,15 +590,15 @@ class ParserService:
         Returns:
             日期字符串列表（YYYY-MM-DD 格式，降序排列）
         """
-        db_dir = self.project_root / "output" / db_type
-        if not db_dir.exists():
-            return []
+        # 源数据库可能已被保留期清理，归档中的日期同样可用
+        dates = set(self.archive.dates(db_type))
 
-        dates = []
-        for db_file in db_dir.glob("*.db"):
-            date_match = re.match(r'(\d{4}-\d{2}-\d{2})\.db$', db_file.name)
-            if date_match:
-                dates.append(date_match.group(1))
+        db_dir = self.project_root / "output" / db_type
+        if db_dir.exists():
+            for db_file in db_dir.glob("*.db"):
+                date_match = re.match(r'(\d{4}-\d{2}-\d{2})\.db$', db_file.name)
+                if date_match:
+                    dates.add(date_match.group(1))
 
         return sorted(dates, reverse=True)
 
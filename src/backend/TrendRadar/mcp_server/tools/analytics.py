@@ -951,6 +951,8 @@ class AnalyticsTools:
             all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date()
 
             # 计算相似度
+            from trendradar.core.similarity import sequence_similarity
+
             similar_items = []
 
             for platform_id, titles in all_titles.items():
@@ -960,10 +962,10 @@ class AnalyticsTools:
                     if title == reference_title:
                         continue
 
-                    # 计算相似度
-                    similarity = self._calculate_similarity(reference_title, title)
+                    # 计算相似度（上界低于阈值的标题直接跳过）
+                    similarity = sequence_similarity(reference_title, title, threshold)
 
-                    if similarity >= threshold:
+                    if similarity is not None:
                         news_item = {
                             "title": title,
                             "platform": platform_id,
@@ -2147,11 +2149,14 @@ class AnalyticsTools:
         sorted_news = sorted(news_list, key=lambda x: x.get("weight", 0), reverse=True)
 
         aggregated = []
-        used_indices = set()
 
-        for i, news in enumerate(sorted_news):
-            if i in used_indices:
-                continue
+        # 近似重复聚类：LSH 找候选对，只对候选对计算 SequenceMatcher 相似度
+        from trendradar.core.similarity import cluster_similar
+
+        clusters = cluster_similar([news["title"] for news in sorted_news], threshold)
+
+        for cluster in clusters:
+            news = sorted_news[cluster[0][0]]
 
             # 创建聚合组
             group = {
@@ -2176,45 +2181,36 @@ class AnalyticsTools:
                     "mobileUrl": news.get("mobileUrl", "")
                 }]
 
-            used_indices.add(i)
-
-            # 查找相似新闻
-            for j, other_news in enumerate(sorted_news):
-                if j in used_indices:
-                    continue
+            # 合并相似新闻
+            for j, _ in cluster[1:]:
+                other_news = sorted_news[j]
 
-                similarity = self._calculate_similarity(news["title"], other_news["title"])
+                if other_news["platform_name"] not in group["platforms"]:
+                    group["platforms"].append(other_news["platform_name"])
+                    group["platform_ids"].append(other_news["platform"])
 
-                if similarity >= threshold:
-                    # 合并到当前组
-                    if other_news["platform_name"] not in group["platforms"]:
-                        group["platforms"].append(other_news["platform_name"])
-                        group["platform_ids"].append(other_news["platform"])
+                if other_news["date"] not in group["dates"]:
+                    group["dates"].append(other_news["date"])
 
-                    if other_news["date"] not in group["dates"]:
-                        group["dates"].append(other_news["date"])
+                group["best_rank"] = min(group["best_rank"], other_news["rank"])
+                group["total_count"] += other_news["count"]
+                group["aggregate_weight"] += other_news.get("weight", 0) * 0.5  # 额外权重
 
-                    group["best_rank"] = min(group["best_rank"], other_news["rank"])
-                    group["total_count"] += other_news["count"]
-                    group["aggregate_weight"] += other_news.get("weight", 0) * 0.5  # 额外权重
+                group["sources"].append({
+                    "platform": other_news["platform_name"],
+                    "rank": other_news["rank"],
+                    "date": other_news["date"]
+                })
 
-                    group["sources"].append({
+                if include_url and other_news.get("url"):
+                    if "urls" not in group:
+                        group["urls"] = []
+                    group["urls"].append({
                         "platform": other_news["platform_name"],
-                        "rank": other_news["rank"],
-                        "date": other_news["date"]
+                        "url": other_news.get("url", ""),
+                        "mobileUrl": other_news.get("mobileUrl", "")
                     })
 
-                    if include_url and other_news.get("url"):
-                        if "urls" not in group:
-                            group["urls"] = []
-                        group["urls"].append({
-                            "platform": other_news["platform_name"],
-                            "url": other_news.get("url", ""),
-                            "mobileUrl": other_news.get("mobileUrl", "")
-                        })
-
-                    used_indices.add(j)
-
             # 添加聚合信息
             group["platform_count"] = len(group["platforms"])
             group["is_cross_platform"] = len(group["platforms"]) > 1
@@ -93,7 +93,8 @@ class DataQueryTools:
         keyword: str,
         date_range: Optional[Union[Dict, str]] = None,
         platforms: Optional[List[str]] = None,
-        limit: Optional[int] = None
+        limit: Optional[int] = None,
+        offset: int = 0
     ) -> Dict:
         """
         按关键词搜索历史新闻
@@ -103,6 +104,7 @@ class DataQueryTools:
             date_range: 日期范围，格式: {"start": "YYYY-MM-DD", "end": "YYYY-MM-DD"}
             platforms: 平台过滤列表
             limit: 返回条数限制（可选，默认返回所有）
+            offset: 分页偏移，默认0
 
         Returns:
             搜索结果字典
@@ -130,7 +132,8 @@ class DataQueryTools:
                 keyword=keyword,
                 date_range=date_range_tuple,
                 platforms=platforms,
-                limit=limit
+                limit=limit,
+                offset=max(0, int(offset or 0))
             )
 
             return {
@@ -366,7 +369,8 @@ class DataQueryTools:
         feeds: Optional[List[str]] = None,
         days: int = 7,
         limit: Optional[int] = None,
-        include_summary: bool = False
+        include_summary: bool = False,
+        offset: int = 0
     ) -> Dict:
         """
         搜索 RSS 数据
@@ -377,6 +381,7 @@ class DataQueryTools:
             days: 搜索最近 N 天的数据，默认 7 天
             limit: 返回条数限制，默认50
             include_summary: 是否包含摘要
+            offset: 分页偏移，默认0
 
         Returns:
             匹配的 RSS 条目列表
@@ -393,7 +398,8 @@ class DataQueryTools:
                 feeds=feeds,
                 days=days,
                 limit=limit,
-                include_summary=include_summary
+                include_summary=include_summary,
+                offset=max(0, int(offset or 0))
             )
 
             return {
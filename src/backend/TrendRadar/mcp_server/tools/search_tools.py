@@ -46,7 +46,8 @@ class SearchTools:
         threshold: float = 0.6,
         include_url: bool = False,
         include_rss: bool = False,
-        rss_limit: int = 20
+        rss_limit: int = 20,
+        offset: int = 0
     ) -> Dict:
         """
         统一新闻搜索工具 - 整合多种搜索模式，支持同时搜索热榜和RSS
@@ -72,6 +73,7 @@ class SearchTools:
             include_url: 是否包含URL链接，默认False（节省token）
             include_rss: 是否同时搜索RSS数据，默认False
             rss_limit: RSS返回条数限制，默认20
+            offset: 热榜结果分页偏移（跳过排序后的前 offset 条），默认0
 
         Returns:
             搜索结果字典，包含匹配的新闻列表（热榜和RSS分开展示）
@@ -101,6 +103,7 @@ class SearchTools:
 
             limit = validate_limit(limit, default=50)
             threshold = validate_threshold(threshold, default=0.6, min_value=0.0, max_value=1.0)
+            offset = max(0, int(offset or 0))
 
             # 处理日期范围
             if date_range:
@@ -127,9 +130,33 @@ class SearchTools:
 
             # 收集所有匹配的新闻
             all_matches = []
-            current_date = start_date
 
-            while current_date <= end_date:
+            # 关键词模式优先使用全文搜索索引（relevance 排序时按 bm25 相关度）
+            searched = None
+            if search_mode == "keyword":
+                searched = self.data_service.parser.search_titles(
+                    query, start_date, end_date, platform_ids=platforms,
+                    order="relevance" if sort_by == "relevance" else "date"
+                )
+            if searched is not None:
+                for hit in searched[0]:
+                    news_item = {
+                        "title": hit.title,
+                        "platform": hit.source_id,
+                        "platform_name": hit.source_name,
+                        "date": hit.date,
+                        "similarity_score": 1.0,  # 精确匹配，相似度为1
+                        "ranks": hit.ranks,
+                        "count": len(hit.ranks),
+                        "rank": hit.ranks[0] if hit.ranks else 999
+                    }
+                    if include_url:
+                        news_item["url"] = hit.url
+                        news_item["mobileUrl"] = hit.mobile_url
+                    all_matches.append(news_item)
+
+            current_date = start_date
+            while searched is None and current_date <= end_date:
                 try:
                     all_titles, id_to_name, timestamps = self.data_service.parser.read_all_titles_for_date(
                         date=current_date,
@@ -197,8 +224,8 @@ class SearchTools:
             elif sort_by == "date":
                 all_matches.sort(key=lambda x: x.get("date", ""), reverse=True)
 
-            # 限制返回数量
-            results = all_matches[:limit]
+            # 分页与限制返回数量
+            results = all_matches[offset:offset + limit]
 
             # 构建时间范围描述（正确判断是否为今天）
             if start_date.date() == datetime.now().date() and start_date == end_date:
@@ -214,6 +241,7 @@ class SearchTools:
                     "total_found": len(all_matches),
                     "returned_count": len(results),
                     "requested_limit": limit,
+                    "offset": offset,
                     "search_mode": search_mode,
                     "query": query,
                     "platforms": platforms or "所有平台",
@@ -923,6 +951,27 @@ class SearchTools:
         Returns:
             RSS 搜索结果字典
         """
+        searched = self.data_service.parser.search_titles(
+            query, start_date, end_date, db_type="rss",
+            include_summary=True, order="published", limit=limit
+        )
+        if searched is not None:
+            items = []
+            for hit in searched[0]:
+                rss_item = {
+                    "title": hit.title,
+                    "feed_id": hit.source_id,
+                    "feed_name": hit.source_name,
+                    "date": hit.date,
+                    "published_at": hit.published_at,
+                    "author": hit.author,
+                    "match_in": hit.match_in
+                }
+                if include_url:
+                    rss_item["url"] = hit.url
+                items.append(rss_item)
+            return {"items": items, "total": searched[1]}
+
         all_rss_matches = []
         query_lower = query.lower()
         current_date = start_date
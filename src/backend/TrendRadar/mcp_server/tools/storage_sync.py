@@ -64,6 +64,7 @@ class StorageSyncTools:
             "access_key_id": remote_config.get("access_key_id") or os.environ.get("S3_ACCESS_KEY_ID", ""),
             "secret_access_key": remote_config.get("secret_access_key") or os.environ.get("S3_SECRET_ACCESS_KEY", ""),
             "region": remote_config.get("region") or os.environ.get("S3_REGION", ""),
+            "transfer_workers": remote_config.get("transfer_workers", 4),
         }
 
     def _has_remote_config(self) -> bool:
@@ -98,6 +99,7 @@ class StorageSyncTools:
                 endpoint_url=remote_config["endpoint_url"],
                 region=remote_config.get("region", ""),
                 timezone=timezone,
+                transfer_workers=remote_config["transfer_workers"],
             )
             return self._remote_backend
         except ImportError:
@@ -235,29 +237,28 @@ class StorageSyncTools:
             skipped_dates = []
             failed_dates = []
 
+            pending_dates = []
             for date_str in target_dates:
                 # 检查本地是否已存在
                 if date_str in local_dates:
                     skipped_dates.append(date_str)
-                    continue
-
-                # 拉取单个日期
-                try:
-                    local_date_dir = local_dir / date_str
-                    local_db_path = local_date_dir / "news.db"
-                    remote_key = f"news/{date_str}.db"
-
-                    local_date_dir.mkdir(parents=True, exist_ok=True)
-                    remote_backend.s3_client.download_file(
-                        remote_backend.bucket_name,
-                        remote_key,
-                        str(local_db_path)
-                    )
+                else:
+                    pending_dates.append(date_str)
+
+            # 并行拉取（远程后端按 transfer_workers 限制并发）
+            results = remote_backend.download_databases([
+                (f"news/{date_str}.db", local_dir / date_str / "news.db")
+                for date_str in pending_dates
+            ])
+            for date_str in pending_dates:
+                path, error = results[f"news/{date_str}.db"]
+                if path is not None:
                     synced_dates.append(date_str)
                     print(f"[存储同步] 已拉取: {date_str}")
-                except Exception as e:
-                    failed_dates.append({"date": date_str, "error": str(e)})
-                    print(f"[存储同步] 拉取失败 ({date_str}): {e}")
+                else:
+                    error = error or "远程文件不存在"
+                    failed_dates.append({"date": date_str, "error": error})
+                    print(f"[存储同步] 拉取失败 ({date_str}): {error}")
 
             return {
                 "success": True,
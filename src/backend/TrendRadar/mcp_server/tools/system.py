@@ -148,11 +148,13 @@ class SystemManagementTools:
             
             fetcher = DataFetcher(proxy_url=proxy_url)
             request_interval = crawler_config.get("request_interval", 100)
+            max_workers = crawler_config.get("max_workers", 4)
 
             # 执行爬取
             results, id_to_name, failed_ids = fetcher.crawl_websites(
                 ids_list=ids,
-                request_interval=request_interval
+                request_interval=request_interval,
+                max_workers=max_workers
             )
 
             # 获取当前时间（统一使用 trendradar 的时间工具）
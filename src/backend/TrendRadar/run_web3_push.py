@@ -5,13 +5,14 @@ Web3 资讯抓取与推送脚本
 
 功能：
 1. 抓取 Web3 信息源（ChainCatcher、Cointelegraph 等）
-2. 生成资讯简报并保存为 HTML 报告
-3. 推送到配置的渠道（企业微信、Telegram 等）
+2. 跨来源去重（同一新闻合并为一条，已推送过的资讯不再推送）
+3. 生成资讯简报并保存为 HTML 报告
+4. 推送到配置的渠道（企业微信、Telegram 等）
 
 使用方法：
     python run_web3_push.py              # 正常运行（抓取 + 保存 + 推送）
     python run_web3_push.py --test       # 测试模式（只抓取不推送）
-    python run_web3_push.py --dry-run    # 预览模式（显示将要推送的内容）
+    python run_web3_push.py --dry-run    # 预览模式（显示将要推送的内容，不推送）
     python run_web3_push.py --no-save    # 不保存到文件
 """
 
@@ -19,6 +20,7 @@ import os
 import sys
 import json
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # 修复 Windows 终端编码问题
@@ -35,6 +37,9 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 # 如需限制，可设置为列表，例如: ["cointelegraph", "coindesk"]
 WEB3_RSS_IDS = None
 
+# 每次推送的最大条目数
+REPORT_MAX_ITEMS = 20
+
 
 def load_config():
     """加载配置文件"""
@@ -77,6 +82,12 @@ def crawl_web3_rss_sources(config):
     rss_fetch_config = rss_config.copy()
     rss_fetch_config["feeds"] = enabled_feeds
     rss_fetch_config["timezone"] = config.get("app", {}).get("timezone", "Asia/Shanghai")
+    rss_fetch_config.setdefault("max_workers", 4)
+    rss_fetch_config.setdefault("parse_workers", 0)
+    rss_fetch_config.setdefault(
+        "cache_path",
+        os.path.join(os.path.dirname(__file__), "output", ".cache", "rss_http.json"),
+    )
 
     print(f"[RSS] 共 {len(enabled_feeds)} 个已启用的 RSS 源")
     for feed in enabled_feeds:
@@ -87,13 +98,19 @@ def crawl_web3_rss_sources(config):
 
 
 def crawl_web3_sources(config):
-    """抓取 Web3 自定义爬虫信息源"""
+    """
+    抓取 Web3 自定义爬虫信息源
+
+    返回 (抓取结果, 抓取器)。增量抓取的水位不会自动提交，
+    需要在推送成功后调用抓取器的 commit_watermarks()。
+    未启用或没有信息源时两者均为 None。
+    """
     from trendradar.crawler.web3.fetcher import Web3Fetcher, Web3FeedConfig
 
     web3_config = config.get("web3", {})
     if not web3_config.get("enabled", True):
         print("ℹ️ Web3 爬虫已禁用")
-        return None
+        return None, None
 
     # 构建配置
     feeds = []
@@ -115,7 +132,7 @@ def crawl_web3_sources(config):
 
     if not feeds:
         print("ℹ️ 没有启用的 Web3 爬虫源")
-        return None
+        return None, None
 
     fetcher = Web3Fetcher(
         feeds=feeds,
@@ -124,9 +141,17 @@ def crawl_web3_sources(config):
         use_proxy=web3_config.get("use_proxy", False),
         proxy_url=web3_config.get("proxy_url", ""),
         timezone=config.get("app", {}).get("timezone", "Asia/Shanghai"),
+        max_workers=web3_config.get("max_workers", 4),
+        max_per_host=web3_config.get("max_per_host", 1),
+        cache_dir=web3_config.get(
+            "cache_dir",
+            os.path.join(os.path.dirname(__file__), "output", ".cache", "web3"),
+        ),
+        incremental=web3_config.get("incremental", True),
+        parse_workers=web3_config.get("parse_workers", 0),
     )
 
-    return fetcher.fetch_all()
+    return fetcher.fetch_all(), fetcher
 
 
 def collect_all_items(rss_data, web3_data):
@@ -169,7 +194,57 @@ def collect_all_items(rss_data, web3_data):
     return all_items
 
 
-def format_report(all_items, config, max_items=20):
+def deduplicate_items(all_items, config):
+    """
+    跨来源去重
+
+    返回 (去重后的全部资讯, 未推送过的资讯, 资讯索引)。
+    未启用去重时三者分别为原列表、原列表和 None。
+    """
+    from trendradar.core.dedup import StoryIndex, merge_duplicate_items
+
+    dedup_config = config.get("web3", {}).get("dedup", {})
+    if not dedup_config.get("enabled", True):
+        return all_items, all_items, None
+
+    threshold = dedup_config.get("similarity_threshold", 0.7)
+    stories = merge_duplicate_items(all_items, threshold)
+
+    story_index = StoryIndex(
+        path=dedup_config.get(
+            "index_path",
+            os.path.join(os.path.dirname(__file__), "output", ".cache", "web3_stories.json"),
+        ),
+        retention_hours=dedup_config.get("retention_hours", 48),
+        threshold=threshold,
+    )
+    new_stories = story_index.filter_new(stories)
+
+    print(f"[去重] {len(all_items)} 条 → {len(stories)} 条资讯（合并 {len(all_items) - len(stories)} 条重复），"
+          f"其中 {len(new_stories)} 条未推送过")
+    return stories, new_stories, story_index
+
+
+def pushed_source_keys(stories, unpushed):
+    """
+    已推送资讯的来源条目，用于提交 Web3 增量抓取水位
+
+    stories 中除 unpushed（超出报告条数未推送）以外的资讯都视为已推送：
+    本次报告中的资讯，以及之前已推送过、被去重过滤掉的资讯。
+
+    返回 (信息源 ID, URL) 集合，包含合并资讯的所有来源。
+    """
+    def source_keys(items):
+        return {
+            (source.get("source_id", ""), source.get("url", ""))
+            for item in items
+            for source in (item.get("sources") or [item])
+        }
+
+    return source_keys(stories) - source_keys(unpushed)
+
+
+def format_report(all_items, config, max_items=REPORT_MAX_ITEMS):
     """格式化推送报告（Markdown 格式）"""
     from trendradar.utils.time import get_configured_time
 
@@ -190,7 +265,7 @@ def format_report(all_items, config, max_items=20):
 
         for i, item in enumerate(all_items[:max_items], 1):
             title = item["title"][:55] + "..." if len(item["title"]) > 55 else item["title"]
-            source = item["source"]
+            source = " / ".join(s["source"] for s in item.get("sources", [])) or item["source"]
             lines.append(f"{i}. [{title}]({item['url']})")
             lines.append(f"   > 来源: {source}")
             lines.append("")
@@ -388,7 +463,7 @@ def main():
     """主函数"""
     parser = argparse.ArgumentParser(description="Web3 资讯抓取与推送")
     parser.add_argument("--test", action="store_true", help="测试模式（只抓取不推送）")
-    parser.add_argument("--dry-run", action="store_true", help="预览模式（显示将要推送的内容）")
+    parser.add_argument("--dry-run", action="store_true", help="预览模式（显示将要推送的内容，不推送）")
     parser.add_argument("--no-save", action="store_true", help="不保存数据到文件")
     parser.add_argument("--no-open", action="store_true", help="不自动打开 HTML 报告")
     args = parser.parse_args()
@@ -406,16 +481,17 @@ def main():
     print("[OK] 配置加载成功 ✅")
     print()
 
-    # 抓取 Web3 RSS 数据
+    # 同时抓取 Web3 RSS 数据与 Web3 爬虫数据（两者访问的站点互不相同）
     print("[2/5] 抓取 Web3 RSS 信息源...")
-    rss_data = crawl_web3_rss_sources(config)
+    print("[3/5] 抓取 Web3 爬虫信息源...")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        rss_future = executor.submit(crawl_web3_rss_sources, config)
+        web3_future = executor.submit(crawl_web3_sources, config)
+        rss_data = rss_future.result()
+        web3_data, web3_fetcher = web3_future.result()
+
     rss_count = rss_data.get_total_count() if rss_data else 0
     print(f"[OK] Web3 RSS 抓取完成: {rss_count} 条 ✅")
-    print()
-
-    # 抓取 Web3 爬虫数据
-    print("[3/5] 抓取 Web3 爬虫信息源...")
-    web3_data = crawl_web3_sources(config)
     web3_count = web3_data.get_total_count() if web3_data else 0
     print(f"[OK] Web3 爬虫抓取完成: {web3_count} 条 ✅")
     print()
@@ -423,11 +499,14 @@ def main():
     # 收集所有数据
     all_items = collect_all_items(rss_data, web3_data)
     print(f"[INFO] 共收集 {len(all_items)} 条 Web3 资讯")
+
+    # 跨来源去重（报告只包含未推送过的资讯）
+    all_items, push_items, story_index = deduplicate_items(all_items, config)
     print()
 
     # 生成报告
     print("[4/5] 生成推送报告...")
-    report = format_report(all_items, config)
+    report = format_report(push_items, config)
     print("[OK] 报告生成完成 ✅")
     print()
 
@@ -454,7 +533,7 @@ def main():
         print("[5/5] 跳过保存（--no-save）")
         print()
 
-    # 预览模式
+    # 预览模式（不推送，也不记录已推送资讯和抓取水位）
     if args.dry_run or args.test:
         print("=" * 60)
         print("  📋 推送内容预览")
@@ -466,23 +545,35 @@ def main():
 
         if args.test:
             print("[OK] 测试完成（未实际推送）✅")
-            return 0
+        else:
+            print("[OK] 预览完成（未实际推送）✅")
+        return 0
 
     # 推送
-    if not args.test:
-        print("[PUSH] 开始推送...")
-        print()
+    print("[PUSH] 开始推送...")
+    print()
 
-        # 企业微信
-        push_to_wework(report, config)
+    # 企业微信
+    wework_ok = push_to_wework(report, config)
 
-        # Telegram
-        push_to_telegram(report, config)
+    # Telegram
+    telegram_ok = push_to_telegram(report, config)
 
-        print()
-        print("=" * 60)
-        print("  ✅ 推送完成")
-        print("=" * 60)
+    # 记录已推送的资讯，后续运行不再重复推送（所有渠道都失败时不记录，下次重新推送）
+    if wework_ok or telegram_ok:
+        if story_index is not None:
+            story_index.add(push_items[:REPORT_MAX_ITEMS])
+            story_index.save()
+        # 推送成功后才提交增量抓取水位：超出报告条数未推送的资讯不提交，下次重新抓取
+        if web3_fetcher is not None:
+            web3_fetcher.commit_watermarks(pushed_source_keys(all_items, push_items[REPORT_MAX_ITEMS:]))
+    else:
+        print("[WARN] 没有推送成功的渠道，本次资讯不记为已推送")
+
+    print()
+    print("=" * 60)
+    print("  ✅ 推送完成")
+    print("=" * 60)
 
     return 0
 
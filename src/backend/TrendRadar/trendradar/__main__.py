@@ -113,6 +113,7 @@ class NewsAnalyzer:
         self.ctx = AppContext(config)
 
         self.request_interval = self.ctx.config["REQUEST_INTERVAL"]
+        self.max_workers = self.ctx.config.get("MAX_WORKERS", 4)
         self.report_mode = self.ctx.config["REPORT_MODE"]
         self.rank_threshold = self.ctx.rank_threshold
         self.is_github_actions = os.environ.get("GITHUB_ACTIONS") == "true"
@@ -120,7 +121,7 @@ class NewsAnalyzer:
         self.update_info = None
         self.proxy_url = None
         self._setup_proxy()
-        self.data_fetcher = DataFetcher(self.proxy_url)
+        self.data_fetcher = self._create_data_fetcher()
 
         # 初始化存储管理器（使用 AppContext）
         self._init_storage_manager()
@@ -128,6 +129,18 @@ class NewsAnalyzer:
         if self.is_github_actions:
             self._check_version_update()
 
+    def _create_data_fetcher(self) -> DataFetcher:
+        """创建数据获取器（共享连接池 + 可选的 HTTP 条件请求缓存）"""
+        cache_path = None
+        if self.ctx.config.get("HTTP_CACHE", True):
+            data_dir = self.ctx.config["STORAGE"]["LOCAL"]["DATA_DIR"]
+            cache_path = str(Path(data_dir) / ".cache" / "newsnow_http.json")
+        return DataFetcher(
+            self.proxy_url,
+            pool_size=self.ctx.config.get("POOL_SIZE", 10),
+            cache_path=cache_path,
+        )
+
     def _init_storage_manager(self) -> None:
         """初始化存储管理器（使用 AppContext）"""
         # 获取数据保留天数（支持环境变量覆盖）
@@ -599,18 +612,19 @@ class NewsAnalyzer:
         print(
             f"配置的监控平台: {[p.get('name', p['id']) for p in self.ctx.platforms]}"
         )
-        print(f"开始爬取数据，请求间隔 {self.request_interval} 毫秒")
+        print(f"开始爬取数据，请求间隔 {self.request_interval} 毫秒，并发数 {self.max_workers}")
         Path("output").mkdir(parents=True, exist_ok=True)
 
         results, id_to_name, failed_ids = self.data_fetcher.crawl_websites(
-            ids, self.request_interval
+            ids, self.request_interval, max_workers=self.max_workers
         )
 
         # 转换为 NewsData 格式并保存到存储后端
         crawl_time = self.ctx.format_time()
         crawl_date = self.ctx.format_date()
         news_data = convert_crawl_results_to_news_data(
-            results, id_to_name, failed_ids, crawl_time, crawl_date
+            results, id_to_name, failed_ids, crawl_time, crawl_date,
+            unchanged_ids=self.data_fetcher.last_unchanged_ids,
         )
 
         # 保存到存储后端（SQLite）
@@ -694,6 +708,12 @@ class NewsAnalyzer:
             freshness_enabled = freshness_config.get("ENABLED", True)
             default_max_age_days = freshness_config.get("MAX_AGE_DAYS", 3)
 
+            # HTTP 条件请求缓存（跨运行保存 ETag/Last-Modified 和解析结果）
+            rss_cache_path = None
+            if rss_config.get("HTTP_CACHE", True):
+                data_dir = self.ctx.config["STORAGE"]["LOCAL"]["DATA_DIR"]
+                rss_cache_path = str(Path(data_dir) / ".cache" / "rss_http.json")
+
             fetcher = RSSFetcher(
                 feeds=feeds,
                 request_interval=rss_config.get("REQUEST_INTERVAL", 2000),
@@ -703,6 +723,10 @@ class NewsAnalyzer:
                 timezone=timezone,
                 freshness_enabled=freshness_enabled,
                 default_max_age_days=default_max_age_days,
+                max_workers=rss_config.get("MAX_WORKERS", 4),
+                max_per_host=rss_config.get("MAX_PER_HOST", 1),
+                cache_path=rss_cache_path,
+                parse_workers=rss_config.get("PARSE_WORKERS", 0),
             )
 
             # 抓取数据
@@ -836,12 +860,19 @@ class NewsAnalyzer:
 
         else:
             # daily 模式：统计=当天所有条目
-            all_data = self.storage_manager.get_rss_data(rss_data.date)
-            if not all_data:
+            # 按 Feed 流式读取，直接转换为列表，不保留完整的 RSSData
+            all_id_to_name = {}
+
+            def iter_feeds():
+                for feed_id, feed_name, rows in self.storage_manager.iter_rss_rows(rss_data.date):
+                    all_id_to_name[feed_id] = feed_name
+                    yield feed_id, rows
+
+            all_items_list = self._convert_rss_items_to_list(iter_feeds(), all_id_to_name)
+            if not all_id_to_name:
                 print("[RSS] 当日汇总模式：没有 RSS 数据")
                 return None, None
 
-            all_items_list = self._convert_rss_items_to_list(all_data.items, all_data.id_to_name)
             rss_stats, total = count_rss_frequency(
                 rss_items=all_items_list,
                 word_groups=word_groups,
@@ -875,8 +906,13 @@ class NewsAnalyzer:
 
         return rss_stats, rss_new_stats
 
-    def _convert_rss_items_to_list(self, items_dict: Dict, id_to_name: Dict) -> List[Dict]:
-        """将 RSS 条目字典转换为列表格式，并应用新鲜度过滤（用于推送）"""
+    def _convert_rss_items_to_list(self, items_dict, id_to_name: Dict) -> List[Dict]:
+        """
+        将 RSS 条目转换为列表格式，并应用新鲜度过滤（用于推送）
+
+        items_dict 可以是 {feed_id: [RSSItem]} 字典，也可以是 (feed_id, 条目列表) 的迭代器
+        （条目只需具备 title/url/published_at/summary/author 属性，如 RSSRow）
+        """
         rss_items = []
         filtered_count = 0
 
@@ -898,7 +934,8 @@ class NewsAnalyzer:
                 except (ValueError, TypeError):
                     pass
 
-        for feed_id, items in items_dict.items():
+        feeds = items_dict.items() if isinstance(items_dict, dict) else items_dict
+        for feed_id, items in feeds:
             # 确定此 feed 的 max_age_days
             max_days = feed_max_age_map.get(feed_id)
             if max_days is None:
@@ -932,12 +969,9 @@ class NewsAnalyzer:
         try:
             word_groups, filter_words, global_filters = self.ctx.load_frequency_words()
             if word_groups or filter_words or global_filters:
-                from trendradar.core.frequency import matches_word_groups
-                filtered_items = []
-                for item in rss_items:
-                    title = item.get("title", "")
-                    if matches_word_groups(title, word_groups, filter_words, global_filters):
-                        filtered_items.append(item)
+                from trendradar.core.matcher import get_keyword_matcher
+                matcher = get_keyword_matcher(word_groups, filter_words, global_filters)
+                filtered_items = [item for item in rss_items if matcher.matches(item.get("title", ""))]
 
                 original_count = len(rss_items)
                 rss_items = filtered_items
@@ -18,7 +18,7 @@ from trendradar.utils.time import (
 )
 from trendradar.core import (
     load_frequency_words,
-    matches_word_groups,
+    get_keyword_matcher,
     save_titles_to_file,
     read_all_today_titles,
     detect_latest_new_titles,
@@ -164,8 +164,12 @@ class AppContext:
                     "secret_access_key": remote_config.get("SECRET_ACCESS_KEY", ""),
                     "endpoint_url": remote_config.get("ENDPOINT_URL", ""),
                     "region": remote_config.get("REGION", ""),
+                    "sync_mode": remote_config.get("SYNC_MODE", "full"),
+                    "compact_every": remote_config.get("COMPACT_EVERY", 12),
+                    "transfer_workers": remote_config.get("TRANSFER_WORKERS", 4),
                 },
                 local_retention_days=local_config.get("RETENTION_DAYS", 0),
+                archive_enabled=local_config.get("ARCHIVE", False),
                 remote_retention_days=remote_config.get("RETENTION_DAYS", 0),
                 pull_enabled=pull_config.get("ENABLED", False),
                 pull_days=pull_config.get("DAYS", 7),
@@ -217,8 +221,8 @@ class AppContext:
         filter_words: List[str],
         global_filters: Optional[List[str]] = None,
     ) -> bool:
-        """检查标题是否匹配词组规则"""
-        return matches_word_groups(title, word_groups, filter_words, global_filters)
+        """检查标题是否匹配词组规则（使用缓存的编译后匹配器）"""
+        return get_keyword_matcher(word_groups, filter_words, global_filters).matches(title)
 
     # === 统计分析 ===
 
@@ -11,6 +11,9 @@ from trendradar.core.config import (
 )
 from trendradar.core.loader import load_config
 from trendradar.core.frequency import load_frequency_words, matches_word_groups
+from trendradar.core.matcher import KeywordMatcher, get_keyword_matcher
+from trendradar.core.similarity import MinHasher, LSHIndex, cluster_similar
+from trendradar.core.dedup import StoryIndex, merge_duplicate_items
 from trendradar.core.data import (
     save_titles_to_file,
     read_all_today_titles_from_storage,
@@ -34,6 +37,13 @@ __all__ = [
     "load_config",
     "load_frequency_words",
     "matches_word_groups",
+    "KeywordMatcher",
+    "get_keyword_matcher",
+    "MinHasher",
+    "LSHIndex",
+    "cluster_similar",
+    "StoryIndex",
+    "merge_duplicate_items",
     # 数据处理
     "save_titles_to_file",
     "read_all_today_titles_from_storage",
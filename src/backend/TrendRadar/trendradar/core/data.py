@@ -10,6 +10,7 @@
 Author: TrendRadar Team
 """
 
+from dataclasses import replace
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Callable
 
@@ -98,48 +99,35 @@ def read_all_today_titles_from_storage(
         Tuple[Dict, Dict, Dict]: (all_results, id_to_name, title_info)
     """
     try:
-        news_data = storage_manager.get_today_all_data()
-
-        if not news_data or not news_data.items:
-            return {}, {}, {}
-
         all_results = {}
         final_id_to_name = {}
         title_info = {}
 
-        for source_id, news_list in news_data.items.items():
-            # 按平台过滤
-            if current_platform_ids is not None and source_id not in current_platform_ids:
-                continue
-
-            # 获取来源名称
-            source_name = news_data.id_to_name.get(source_id, source_id)
+        # 按平台流式读取，不在内存中同时保留整天的 NewsData
+        for source_id, source_name, rows in storage_manager.iter_news_rows(
+            platform_ids=current_platform_ids
+        ):
             final_id_to_name[source_id] = source_name
+            source_results = all_results.setdefault(source_id, {})
+            source_info = title_info.setdefault(source_id, {})
 
-            if source_id not in all_results:
-                all_results[source_id] = {}
-                title_info[source_id] = {}
+            for row in rows:
+                url = row.url or ""
+                mobile_url = row.mobile_url or ""
 
-            for item in news_list:
-                title = item.title
-                ranks = getattr(item, 'ranks', [item.rank])
-                first_time = getattr(item, 'first_time', item.crawl_time)
-                last_time = getattr(item, 'last_time', item.crawl_time)
-                count = getattr(item, 'count', 1)
-
-                all_results[source_id][title] = {
-                    "ranks": ranks,
-                    "url": item.url or "",
-                    "mobileUrl": item.mobile_url or "",
+                source_results[row.title] = {
+                    "ranks": row.ranks,
+                    "url": url,
+                    "mobileUrl": mobile_url,
                 }
 
-                title_info[source_id][title] = {
-                    "first_time": first_time,
-                    "last_time": last_time,
-                    "count": count,
-                    "ranks": ranks,
-                    "url": item.url or "",
-                    "mobileUrl": item.mobile_url or "",
+                source_info[row.title] = {
+                    "first_time": row.first_time,
+                    "last_time": row.last_time,
+                    "count": row.count,
+                    "ranks": row.ranks,
+                    "url": url,
+                    "mobileUrl": mobile_url,
                 }
 
         return all_results, final_id_to_name, title_info
@@ -199,20 +187,13 @@ def detect_latest_new_titles_from_storage(
         if not latest_data or not latest_data.items:
             return {}
 
-        # 获取所有历史数据
-        all_data = storage_manager.get_today_all_data()
-        if not all_data or not all_data.items:
-            # 没有历史数据（第一次抓取），不应该有"新增"标题
-            return {}
-
-        # 获取最新批次时间
-        latest_time = latest_data.crawl_time
-
         # 步骤1：收集最新批次的标题（last_crawl_time = latest_time 的标题）
         latest_titles = {}
+        latest_items = {}
         for source_id, news_list in latest_data.items.items():
             if current_platform_ids is not None and source_id not in current_platform_ids:
                 continue
+            latest_items[source_id] = news_list
             latest_titles[source_id] = {}
             for item in news_list:
                 latest_titles[source_id][item.title] = {
@@ -221,35 +202,23 @@ def detect_latest_new_titles_from_storage(
                     "mobileUrl": item.mobile_url or "",
                 }
 
-        # 步骤2：收集历史标题
+        # 步骤2：由存储后端按最新批次的 (平台, 标题) 增量查询历史标题
         # 关键逻辑：一个标题只要其 first_crawl_time < latest_time，就是历史标题
         # 这样即使同一标题有多条记录（URL 不同），只要任何一条是历史的，该标题就算历史
-        historical_titles = {}
-        for source_id, news_list in all_data.items.items():
-            if current_platform_ids is not None and source_id not in current_platform_ids:
-                continue
-
-            historical_titles[source_id] = set()
-            for item in news_list:
-                first_time = getattr(item, 'first_time', item.crawl_time)
-                # 如果该记录的首次出现时间早于最新批次，则该标题是历史标题
-                if first_time < latest_time:
-                    historical_titles[source_id].add(item.title)
-
-        # 检查是否是当天第一次抓取（没有任何历史标题）
-        # 如果所有平台的历史标题集合都为空，说明只有一个抓取批次，不应该有"新增"标题
-        has_historical_data = any(len(titles) > 0 for titles in historical_titles.values())
-        if not has_historical_data:
-            return {}
+        # 如果这些平台都没有早于最新批次的记录（当天第一次抓取），不应该有"新增"标题
+        new_items = storage_manager.detect_new_titles(
+            replace(latest_data, items=latest_items),
+            platform_ids=current_platform_ids,
+        )
 
         # 步骤3：找出新增标题 = 最新批次标题 - 历史标题
         new_titles = {}
         for source_id, source_latest_titles in latest_titles.items():
-            historical_set = historical_titles.get(source_id, set())
+            source_new = new_items.get(source_id, {})
             source_new_titles = {}
 
             for title, title_data in source_latest_titles.items():
-                if title not in historical_set:
+                if title in source_new:
                     source_new_titles[title] = title_data
 
             if source_new_titles:
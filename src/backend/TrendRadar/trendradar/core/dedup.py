@@ -0,0 +1,282 @@
+# coding=utf-8
+"""
+跨来源资讯去重
+
+同一条新闻会被多个来源（Cointelegraph、CoinDesk、ChainCatcher、ME News 等）同时报道，
+直接拼接后在报告和推送中重复出现。这里在收集之后、生成报告之前做两步去重：
+
+1. 本次抓取内去重：标准化 URL 相同，或标题近似（similarity.cluster_similar）的条目
+   合并为一条，保留最先出现的条目作为代表，并记录所有来源
+2. 跨运行去重：StoryIndex 保存最近推送过的 URL 指纹与标题，
+   命中的条目视为已推送过，从推送内容中去掉
+
+StoryIndex 只保存 URL 指纹、规范化标题和时间，MinHash 签名在加载时重新计算，
+修改签名参数不会使已保存的索引失效。
+"""
+
+import json
+import re
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+from urllib.parse import urlparse
+
+from trendradar.core.similarity import LSHIndex, MinHasher, cluster_similar, lsh_params, sequence_similarity
+from trendradar.utils.url import normalize_url
+
+
+# 默认标题相似度阈值与索引保留时长
+DEFAULT_SIMILARITY_THRESHOLD = 0.7
+DEFAULT_RETENTION_HOURS = 48
+
+# 索引文件格式版本
+_INDEX_VERSION = 1
+
+# 标题规范化时去掉的字符（空白与常见中英文标点）
+_TITLE_NOISE = re.compile(r"[\s\W_]+", re.UNICODE)
+
+
+def url_key(url: str) -> str:
+    """
+    URL 指纹：在 normalize_url 基础上忽略协议、www 前缀、主机名大小写和末尾斜杠
+
+    Args:
+        url: 原始 URL
+
+    Returns:
+        指纹字符串（URL 为空时为空字符串）
+    """
+    url = normalize_url((url or "").strip())
+    if not url:
+        return ""
+    try:
+        parsed = urlparse(url)
+    except ValueError:
+        return url
+    if not parsed.netloc:
+        return url
+    host = parsed.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    key = host + parsed.path.rstrip("/")
+    if parsed.query:
+        key += "?" + parsed.query
+    return key
+
+
+def normalize_title(title: str) -> str:
+    """
+    规范化标题：小写并去掉空白与标点，用于相似度比较
+
+    Args:
+        title: 原始标题
+
+    Returns:
+        规范化后的标题
+    """
+    return _TITLE_NOISE.sub("", str(title or "").lower())
+
+
+def _story_sources(item: Dict) -> List[Dict]:
+    """条目自身的来源列表（已合并过的条目沿用其 sources）"""
+    if item.get("sources"):
+        return list(item["sources"])
+    return [{
+        "source": item.get("source", ""),
+        "source_id": item.get("source_id", ""),
+        "url": item.get("url", ""),
+        "time": item.get("time", ""),
+        "type": item.get("type", ""),
+    }]
+
+
+def merge_duplicate_items(
+    items: List[Dict],
+    threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+) -> List[Dict]:
+    """
+    合并同一批条目中的重复资讯
+
+    标准化 URL 相同或规范化标题相似度 ≥ threshold 的条目合并为一条：
+    保留最先出现的条目（调用方已按时间倒序排列时即最新的一条）的字段，
+    并增加 sources 字段列出所有来源（按出现顺序，同一来源只保留一次）。
+
+    Args:
+        items: 条目列表，每项至少包含 title、url、source
+        threshold: 标题相似度阈值
+
+    Returns:
+        合并后的条目列表（顺序与每组第一条的原始顺序一致）
+    """
+    if not items:
+        return []
+
+    # 第一步：URL 指纹相同的条目归为一组
+    url_groups: List[List[int]] = []
+    group_of_url: Dict[str, int] = {}
+    for i, item in enumerate(items):
+        key = url_key(item.get("url", ""))
+        if key and key in group_of_url:
+            url_groups[group_of_url[key]].append(i)
+            continue
+        if key:
+            group_of_url[key] = len(url_groups)
+        url_groups.append([i])
+
+    # 第二步：各组代表的标题做近似聚类
+    titles = [normalize_title(items[group[0]].get("title", "")) for group in url_groups]
+    merged = []
+    for cluster in cluster_similar(titles, threshold):
+        members = sorted(i for index, _ in cluster for i in url_groups[index])
+        story = dict(items[members[0]])
+
+        sources = []
+        seen_sources: Set[str] = set()
+        for i in members:
+            for source in _story_sources(items[i]):
+                name = source.get("source_id") or source.get("source", "")
+                if name in seen_sources:
+                    continue
+                seen_sources.add(name)
+                sources.append(source)
+        story["sources"] = sources
+        merged.append((members[0], story))
+
+    merged.sort(key=lambda pair: pair[0])
+    return [story for _, story in merged]
+
+
+class StoryIndex:
+    """
+    已推送资讯的滚动指纹索引
+
+    保存最近 retention_hours 内推送过的资讯（URL 指纹 + 规范化标题），
+    用于在后续运行中识别重复推送。索引文件为 JSON，写入时先写临时文件再替换。
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        retention_hours: int = DEFAULT_RETENTION_HOURS,
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        now: Optional[datetime] = None,
+    ):
+        """
+        Args:
+            path: 索引文件路径（不设置时只在进程内生效）
+            retention_hours: 保留时长（小时），更早的记录加载时丢弃
+            threshold: 标题相似度阈值
+            now: 当前时间（默认 datetime.now()）
+        """
+        self.path = Path(path) if path else None
+        self.retention_hours = retention_hours
+        self.threshold = threshold
+        self.now = now or datetime.now()
+
+        bands, rows = lsh_params(threshold)
+        self._hasher = MinHasher(num_perm=bands * rows)
+        self._lsh = LSHIndex(bands, rows)
+        self._entries: List[Dict] = []
+        self._urls: Set[str] = set()
+        self._lock = threading.Lock()
+
+        self._add_entries(self._load())
+
+    def _load(self) -> List[Dict]:
+        """从索引文件加载未过期的记录"""
+        if not self.path or not self.path.exists():
+            return []
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"[去重] 加载资讯索引失败: {e}")
+            return []
+
+        if data.get("version") != _INDEX_VERSION:
+            return []
+        cutoff = (self.now - timedelta(hours=self.retention_hours)).isoformat(timespec="seconds")
+        return [e for e in data.get("entries", []) if e.get("seen_at", "") >= cutoff]
+
+    def _add_entries(self, entries: List[Dict]) -> None:
+        signatures = self._hasher.signatures([e.get("title", "") for e in entries])
+        for entry, signature in zip(entries, signatures):
+            position = len(self._entries)
+            self._entries.append(entry)
+            if entry.get("url"):
+                self._urls.add(entry["url"])
+            if entry.get("title"):
+                self._lsh.add(position, signature)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def contains(self, item: Dict) -> bool:
+        """
+        判断条目（或其任一来源）是否已推送过
+
+        Args:
+            item: 条目，可包含 sources 字段
+
+        Returns:
+            URL 指纹命中或标题与已推送标题相似度 ≥ threshold 时为 True
+        """
+        with self._lock:
+            for source in _story_sources(item):
+                key = url_key(source.get("url", ""))
+                if key and key in self._urls:
+                    return True
+
+            title = normalize_title(item.get("title", ""))
+            if not title:
+                return False
+            for position in sorted(self._lsh.query(self._hasher.signature(title))):
+                if sequence_similarity(title, self._entries[position]["title"], self.threshold) is not None:
+                    return True
+            return False
+
+    def filter_new(self, items: List[Dict]) -> List[Dict]:
+        """
+        过滤掉已推送过的条目
+
+        Args:
+            items: 条目列表
+
+        Returns:
+            未推送过的条目（保持原顺序）
+        """
+        return [item for item in items if not self.contains(item)]
+
+    def add(self, items: List[Dict]) -> None:
+        """
+        记录已推送的条目（需调用 save() 写入文件）
+
+        Args:
+            items: 条目列表，可包含 sources 字段
+        """
+        seen_at = self.now.isoformat(timespec="seconds")
+        entries = []
+        for item in items:
+            title = normalize_title(item.get("title", ""))
+            for source in _story_sources(item):
+                entries.append({"url": url_key(source.get("url", "")), "title": title, "seen_at": seen_at})
+                # 标题只需要索引一次
+                title = ""
+        with self._lock:
+            self._add_entries(entries)
+
+    def save(self) -> None:
+        """保存索引到文件"""
+        if not self.path:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self._lock:
+                snapshot = {"version": _INDEX_VERSION, "entries": list(self._entries)}
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f, ensure_ascii=False)
+            tmp_path.replace(self.path)
+        except Exception as e:
+            print(f"[去重] 保存资讯索引失败: {e}")
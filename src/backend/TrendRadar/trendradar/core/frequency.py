@@ -15,9 +15,15 @@
 import os
 import re
 from pathlib import Path
+from threading import Lock
 from typing import Dict, List, Tuple, Optional, Union
 
 
+# 解析结果缓存：{绝对路径: ((mtime_ns, size), (词组列表, 过滤词, 全局过滤词))}
+_frequency_cache: Dict[str, Tuple[Tuple[int, int], Tuple[List[Dict], List[str], List[str]]]] = {}
+_frequency_cache_lock = Lock()
+
+
 def _parse_word(word: str) -> Dict:
     """
     解析单个词，识别是否为正则表达式，支持显示名称
@@ -105,6 +111,9 @@ def load_frequency_words(
     - !词：过滤词，匹配则排除
     - @数字：该词组最多显示的条数
 
+    解析结果按文件路径缓存在进程内，文件的修改时间或大小变化时自动重新加载。
+    同一份配置的调用方拿到的是同一组对象（可据此复用编译后的匹配器），调用方不应修改。
+
     Args:
         frequency_file: 频率词配置文件路径，默认从环境变量 FREQUENCY_WORDS_PATH 获取或使用 config/frequency_words.txt
 
@@ -119,13 +128,39 @@ def load_frequency_words(
             "FREQUENCY_WORDS_PATH", "config/frequency_words.txt"
         )
 
-    frequency_path = Path(frequency_file)
-    if not frequency_path.exists():
+    frequency_path = Path(frequency_file).resolve()
+    try:
+        stat = frequency_path.stat()
+    except OSError:
         raise FileNotFoundError(f"频率词文件 {frequency_file} 不存在")
 
+    # 文件未变化（修改时间和大小相同）时直接返回缓存的解析结果
+    cache_key = str(frequency_path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    with _frequency_cache_lock:
+        cached = _frequency_cache.get(cache_key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
     with open(frequency_path, "r", encoding="utf-8") as f:
         content = f.read()
 
+    result = _parse_frequency_words(content)
+    with _frequency_cache_lock:
+        _frequency_cache[cache_key] = (signature, result)
+    return result
+
+
+def _parse_frequency_words(content: str) -> Tuple[List[Dict], List[str], List[str]]:
+    """
+    解析频率词配置内容
+
+    Args:
+        content: 配置文件内容
+
+    Returns:
+        (词组列表, 词组内过滤词, 全局过滤词)
+    """
     word_groups = [group.strip() for group in content.split("\n\n") if group.strip()]
 
     processed_groups = []
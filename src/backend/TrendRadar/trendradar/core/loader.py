@@ -56,6 +56,9 @@ def _load_crawler_config(config_data: Dict) -> Dict:
     enable_crawler_env = _get_env_bool("ENABLE_CRAWLER")
     return {
         "REQUEST_INTERVAL": crawler_config.get("request_interval", 100),
+        "MAX_WORKERS": crawler_config.get("max_workers", 4),
+        "POOL_SIZE": crawler_config.get("pool_size", 10),
+        "HTTP_CACHE": crawler_config.get("http_cache", True),
         "USE_PROXY": crawler_config.get("use_proxy", False),
         "DEFAULT_PROXY": crawler_config.get("default_proxy", ""),
         "ENABLE_CRAWLER": enable_crawler_env if enable_crawler_env is not None else crawler_config.get("enabled", True),
@@ -100,6 +103,7 @@ def _load_notification_config(config_data: Dict) -> Dict:
         "BATCH_SEND_INTERVAL": advanced.get("batch_send_interval", 1.0),
         "FEISHU_MESSAGE_SEPARATOR": advanced.get("feishu_message_separator", "---"),
         "MAX_ACCOUNTS_PER_CHANNEL": _get_env_int("MAX_ACCOUNTS_PER_CHANNEL") or advanced.get("max_accounts_per_channel", 3),
+        "NOTIFICATION_MAX_WORKERS": _get_env_int("NOTIFICATION_MAX_WORKERS") or advanced.get("notification_max_workers", 8),
     }
 
 
@@ -163,6 +167,10 @@ def _load_rss_config(config_data: Dict) -> Dict:
         "TIMEOUT": advanced_rss.get("timeout", 15),
         "USE_PROXY": advanced_rss.get("use_proxy", False),
         "PROXY_URL": rss_proxy_url,
+        "MAX_WORKERS": advanced_rss.get("max_workers", 4),
+        "MAX_PER_HOST": advanced_rss.get("max_per_host", 1),
+        "PARSE_WORKERS": advanced_rss.get("parse_workers", 0),
+        "HTTP_CACHE": advanced_rss.get("http_cache", True),
         "FEEDS": rss.get("feeds", []),
         "FRESHNESS_FILTER": {
             "ENABLED": freshness_filter.get("enabled", True),  # 默认启用
@@ -183,6 +191,7 @@ def _load_storage_config(config_data: Dict) -> Dict:
     pull = storage.get("pull", {})
 
     txt_enabled_env = _get_env_bool("STORAGE_TXT_ENABLED")
+    local_archive_env = _get_env_bool("LOCAL_ARCHIVE")
     html_enabled_env = _get_env_bool("STORAGE_HTML_ENABLED")
     pull_enabled_env = _get_env_bool("PULL_ENABLED")
 
@@ -196,6 +205,7 @@ def _load_storage_config(config_data: Dict) -> Dict:
         "LOCAL": {
             "DATA_DIR": local.get("data_dir", "output"),
             "RETENTION_DAYS": _get_env_int("LOCAL_RETENTION_DAYS") or local.get("retention_days", 0),
+            "ARCHIVE": local_archive_env if local_archive_env is not None else local.get("archive", False),
         },
         "REMOTE": {
             "ENDPOINT_URL": _get_env_str("S3_ENDPOINT_URL") or remote.get("endpoint_url", ""),
@@ -204,6 +214,9 @@ def _load_storage_config(config_data: Dict) -> Dict:
             "SECRET_ACCESS_KEY": _get_env_str("S3_SECRET_ACCESS_KEY") or remote.get("secret_access_key", ""),
             "REGION": _get_env_str("S3_REGION") or remote.get("region", ""),
             "RETENTION_DAYS": _get_env_int("REMOTE_RETENTION_DAYS") or remote.get("retention_days", 0),
+            "SYNC_MODE": _get_env_str("REMOTE_SYNC_MODE") or remote.get("sync_mode", "full"),
+            "COMPACT_EVERY": _get_env_int("REMOTE_COMPACT_EVERY") or remote.get("compact_every", 12),
+            "TRANSFER_WORKERS": _get_env_int("REMOTE_TRANSFER_WORKERS") or remote.get("transfer_workers", 4),
         },
         "PULL": {
             "ENABLED": pull_enabled_env if pull_enabled_env is not None else pull.get("enabled", False),
@@ -0,0 +1,366 @@
+# coding=utf-8
+"""
+编译后的关键词匹配器
+
+matches_word_groups 对每个标题逐个词组、逐个词做子串/正则查找，
+统计时还要再扫描一遍词组以确定命中的词组。KeywordMatcher 在加载频率词后构建一次：
+
+- 所有普通词（小写）放入一个 Aho-Corasick 自动机，一次扫描找出标题中出现的全部普通词
+- 形如 /华为|鸿蒙|\\bDJI\\b/ 的正则拆成字面量因子一并放入自动机，只有因子出现时才执行该正则
+- 其余正则合并为一个交替表达式作为预筛选，标题不命中时跳过逐个正则匹配
+- 自动机前有一个合并的预筛选表达式，绝大多数标题不含任何关键词，直接走快速路径
+- 词组条件预先转换为词 ID 集合，一次判断返回第一个命中的词组序号
+
+匹配语义与 matches_word_groups / _word_matches 完全一致
+（普通词：小写子串；正则：在小写标题上 search，忽略大小写）。
+"""
+
+import re
+from collections import OrderedDict, deque
+from threading import Lock
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Union
+
+
+# 含反向引用的正则不能安全地并入交替表达式（分组编号会变化）
+_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=")
+
+# 除 | 和 \b 外的正则元字符
+_REGEX_META = re.compile(r"[\\\[\](){}*+?.^$]")
+
+# 忽略大小写时能匹配 ASCII 字母、但小写后不含该字母的字符（ı -> i，ſ -> s）
+_IGNORECASE_FOLD = str.maketrans({"\u0131": "i", "\u017f": "s"})
+
+# 编译结果缓存的最大条目数
+MATCHER_CACHE_SIZE = 8
+
+
+class AhoCorasick:
+    """
+    Aho-Corasick 多模式子串匹配自动机
+
+    一次线性扫描找出文本中出现的所有模式（包括相互重叠的模式）。
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        """
+        构建自动机
+
+        Args:
+            patterns: 模式串列表，模式 ID 为其在列表中的下标（不支持空串）
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[int, ...]] = [()]
+
+        for pattern_id, pattern in enumerate(patterns):
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(())
+                state = next_state
+            self._output[state] += (pattern_id,)
+
+        # 广度优先计算失败指针，并把失败状态的输出合并到当前状态
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(char, 0)
+                self._fail[next_state] = fail
+                self._output[next_state] += self._output[fail]
+
+    def find_all(self, text: str) -> Set[int]:
+        """
+        查找文本中出现的所有模式
+
+        Returns:
+            出现的模式 ID 集合
+        """
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        found: Set[int] = set()
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found.update(output[state])
+        return found
+
+
+def _literal_factors(pattern: str) -> Optional[List[str]]:
+    """
+    提取正则的字面量因子：正则能命中时，小写标题中必然包含其中至少一个因子
+
+    只处理由 | 连接的纯字面量（可带 \\b）且有大小写的字母均为 ASCII 的正则，其余返回 None。
+    """
+    factors = []
+    for alternative in pattern.replace("\\b", "").split("|"):
+        if not alternative or _REGEX_META.search(alternative):
+            return None
+        if any(not char.isascii() and char.lower() != char.upper() for char in alternative):
+            return None
+        factors.append(alternative.lower())
+    return factors
+
+
+def _combine(patterns: List[str], flags: int = 0) -> Optional[re.Pattern]:
+    """把多个表达式合并为一个交替表达式（用于"是否有任意一个命中"的预筛选）"""
+    if not patterns:
+        return None
+    try:
+        return re.compile("|".join(f"(?:{p})" for p in patterns), flags)
+    except re.error:
+        return None
+
+
+class KeywordMatcher:
+    """
+    编译后的频率词匹配器
+
+    用法：
+        matcher = KeywordMatcher(word_groups, filter_words, global_filters)
+        matcher.matches(title)       # 等价于 matches_word_groups(title, ...)
+        matcher.match_group(title)   # 第一个命中的词组在 word_groups 中的序号，未命中返回 None
+    """
+
+    def __init__(
+        self,
+        word_groups: List[Dict],
+        filter_words: List[Union[str, Dict]],
+        global_filters: Optional[List[str]] = None,
+    ):
+        """
+        编译词组规则
+
+        Args:
+            word_groups: 词组列表（load_frequency_words 的返回值）
+            filter_words: 过滤词列表（字符串或字典）
+            global_filters: 全局过滤词列表
+        """
+        self.word_groups = word_groups
+        self._term_ids: Dict[Tuple[str, str], int] = {}
+        self._literals: List[Tuple[int, str]] = []
+        self._regexes: List[Tuple[int, re.Pattern]] = []
+
+        self._filter_ids = frozenset(self._term(word) for word in filter_words)
+        self._groups: List[Tuple[FrozenSet[int], FrozenSet[int]]] = [
+            (
+                frozenset(self._term(word) for word in group["required"]),
+                frozenset(self._term(word) for word in group["normal"]),
+            )
+            for group in word_groups
+        ]
+
+        # 没有必须词和普通词的词组匹配所有标题（如"全部新闻"）
+        self._catch_all = next(
+            (i for i, (required, normal) in enumerate(self._groups) if not required and not normal),
+            None,
+        )
+
+        # 普通词：空串总是命中，其余放入自动机
+        self._always: Set[int] = {term_id for term_id, word in self._literals if not word}
+        literals = [(term_id, word) for term_id, word in self._literals if word]
+        self._literal_ids = [term_id for term_id, _ in literals]
+
+        # 可拆成字面量因子的正则：因子与普通词共用自动机，因子出现时才执行该正则
+        self._factored_regexes: Dict[int, re.Pattern] = {}
+        factor_owners: Dict[str, List[int]] = {}
+        remaining = []
+        for term_id, pattern in self._regexes:
+            factors = _literal_factors(pattern.pattern)
+            if factors is None:
+                remaining.append((term_id, pattern))
+                continue
+            self._factored_regexes[term_id] = pattern
+            for factor in factors:
+                factor_owners.setdefault(factor, []).append(term_id)
+        self._factor_owners = list(factor_owners.values())
+
+        patterns = [word for _, word in literals] + list(factor_owners)
+        self._has_patterns = bool(patterns)
+        self._automaton = AhoCorasick(patterns)
+        self._literal_prefilter = _combine([re.escape(word) for word in patterns])
+
+        # 其余正则：可合并的放入预筛选表达式，含反向引用的每次单独匹配
+        foldable = [(term_id, p) for term_id, p in remaining if not _BACKREFERENCE.search(p.pattern)]
+        self._regex_prefilter = _combine([p.pattern for _, p in foldable], re.IGNORECASE)
+        if self._regex_prefilter is None:
+            foldable = []
+        folded = {term_id for term_id, _ in foldable}
+        self._folded_regexes = foldable
+        self._unfolded_regexes = [(term_id, p) for term_id, p in remaining if term_id not in folded]
+
+        # 全局过滤词：只需判断是否命中任意一个
+        self._global_words = [word.lower() for word in (global_filters or [])]
+        self._global_prefilter = _combine([re.escape(word) for word in self._global_words])
+
+    def _term(self, word_config: Union[str, Dict]) -> int:
+        """登记一个词，返回词 ID（相同的词共用一个 ID）"""
+        if isinstance(word_config, str):
+            key = ("literal", word_config.lower())
+        elif word_config.get("is_regex") and word_config.get("pattern"):
+            key = ("regex", word_config["pattern"].pattern)
+        else:
+            key = ("literal", word_config["word"].lower())
+
+        term_id = self._term_ids.get(key)
+        if term_id is None:
+            term_id = len(self._term_ids)
+            self._term_ids[key] = term_id
+            if key[0] == "literal":
+                self._literals.append((term_id, key[1]))
+            else:
+                self._regexes.append((term_id, word_config["pattern"]))
+        return term_id
+
+    def _matched_terms(self, title_lower: str) -> Set[int]:
+        """找出标题中命中的全部词 ID"""
+        matched = set(self._always)
+
+        found: Set[int] = set()
+        if self._has_patterns and (
+            self._literal_prefilter is None or self._literal_prefilter.search(title_lower)
+        ):
+            found = self._automaton.find_all(title_lower)
+
+        literal_ids = self._literal_ids
+        literal_count = len(literal_ids)
+        candidates: Set[int] = set()
+        for pattern_id in found:
+            if pattern_id < literal_count:
+                matched.add(literal_ids[pattern_id])
+            else:
+                candidates.update(self._factor_owners[pattern_id - literal_count])
+
+        # 正则忽略大小写时 i/s 还能匹配 ı/ſ，这类标题换成 ASCII 字母后再找一次因子
+        if self._factor_owners and ("\u0131" in title_lower or "\u017f" in title_lower):
+            for pattern_id in self._automaton.find_all(title_lower.translate(_IGNORECASE_FOLD)):
+                if pattern_id >= literal_count:
+                    candidates.update(self._factor_owners[pattern_id - literal_count])
+
+        if candidates:
+            factored = self._factored_regexes
+            matched.update(term_id for term_id in candidates if factored[term_id].search(title_lower))
+
+        if self._regex_prefilter is not None and self._regex_prefilter.search(title_lower):
+            matched.update(term_id for term_id, p in self._folded_regexes if p.search(title_lower))
+        for term_id, pattern in self._unfolded_regexes:
+            if pattern.search(title_lower):
+                matched.add(term_id)
+
+        return matched
+
+    def _first_group(self, matched: Set[int]) -> Optional[int]:
+        """返回第一个条件满足的词组序号"""
+        if not matched:
+            return self._catch_all
+        for index, (required, normal) in enumerate(self._groups):
+            if required and not required <= matched:
+                continue
+            if normal and normal.isdisjoint(matched):
+                continue
+            return index
+        return None
+
+    def _evaluate(self, title) -> Tuple[bool, Optional[int]]:
+        """
+        计算 (是否匹配, 命中的词组序号)
+
+        与 matches_word_groups 相同：全局过滤优先，没有词组时匹配所有标题，
+        其次是过滤词，最后是词组条件。
+        """
+        # 防御性类型检查：确保 title 是有效字符串
+        if not isinstance(title, str):
+            title = str(title) if title is not None else ""
+        if not title.strip():
+            return False, None
+
+        title_lower = title.lower()
+
+        if self._global_words:
+            if self._global_prefilter is not None:
+                if self._global_prefilter.search(title_lower):
+                    return False, None
+            elif any(word in title_lower for word in self._global_words):
+                return False, None
+
+        if not self.word_groups:
+            return True, None
+
+        # 第一个词组匹配所有标题且没有过滤词时（如"全部新闻"），无需查找关键词
+        if self._catch_all == 0 and not self._filter_ids:
+            return True, 0
+
+        matched = self._matched_terms(title_lower)
+        if not self._filter_ids.isdisjoint(matched):
+            return False, None
+
+        group_index = self._first_group(matched)
+        return group_index is not None, group_index
+
+    def matches(self, title: str) -> bool:
+        """检查标题是否匹配词组规则（等价于 matches_word_groups）"""
+        return self._evaluate(title)[0]
+
+    def match_group(self, title: str) -> Optional[int]:
+        """
+        返回标题命中的第一个词组序号
+
+        Returns:
+            word_groups 中的下标；被过滤、未命中或没有配置词组时返回 None
+        """
+        return self._evaluate(title)[1]
+
+
+# {(id(word_groups), id(filter_words), id(global_filters)): (规则对象, 匹配器)}
+# 同时持有规则对象的引用，保证缓存期间 id 不会被复用
+_matcher_cache: "OrderedDict[Tuple[int, int, int], Tuple[tuple, KeywordMatcher]]" = OrderedDict()
+_matcher_cache_lock = Lock()
+
+
+def get_keyword_matcher(
+    word_groups: List[Dict],
+    filter_words: List[Union[str, Dict]],
+    global_filters: Optional[List[str]] = None,
+) -> KeywordMatcher:
+    """
+    获取词组规则对应的编译后匹配器
+
+    load_frequency_words 对未变化的配置文件返回同一组对象，
+    因此同一份配置在进程内只编译一次；配置文件变化后返回新的对象，自然重新编译。
+
+    Args:
+        word_groups: 词组列表
+        filter_words: 过滤词列表
+        global_filters: 全局过滤词列表
+
+    Returns:
+        KeywordMatcher 实例
+    """
+    rules = (word_groups, filter_words, global_filters)
+    key = (id(word_groups), id(filter_words), id(global_filters))
+    with _matcher_cache_lock:
+        cached = _matcher_cache.get(key)
+        if cached is not None:
+            _matcher_cache.move_to_end(key)
+            return cached[1]
+
+    matcher = KeywordMatcher(word_groups, filter_words, global_filters)
+    with _matcher_cache_lock:
+        _matcher_cache[key] = (rules, matcher)
+        _matcher_cache.move_to_end(key)
+        while len(_matcher_cache) > MATCHER_CACHE_SIZE:
+            _matcher_cache.popitem(last=False)
+    return matcher
@@ -0,0 +1,148 @@
+# coding=utf-8
+"""
+向量化权重计算
+
+count_word_frequency 对每个匹配标题调用 calculate_news_weight（Python 循环遍历排名列表）
+后再按组排序。这里把当天全部匹配标题组织为列式数据：
+
+- groups: 每行所属的词组序号
+- rank_values / rank_offsets: 所有排名列表首尾相接，第 i 行为 rank_values[rank_offsets[i]:rank_offsets[i + 1]]
+- counts: 出现次数
+
+用 NumPy 一次算出全部行的权重与最小排名，再一次稳定排序得到每个词组内的顺序。
+计算顺序与 calculate_news_weight 完全相同（同样的整数求和与浮点运算次序），
+排序结果与逐组 sorted() 一致。
+
+依赖 numpy（可选，pip install "trendradar[speedups]"）：未安装或数据不适合向量化时返回 None，
+由调用方使用 Python 实现。
+"""
+
+from typing import Dict, List, Optional
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+
+# 行数少于该值时 NumPy 的固定开销大于收益
+VECTORIZE_MIN_ROWS = 64
+
+
+class TitleColumns:
+    """匹配标题的列式数据（按追加顺序编号）"""
+
+    def __init__(self):
+        self.groups: List[int] = []
+        self.rank_values: List[int] = []
+        self.rank_offsets: List[int] = [0]
+        self.counts: List[int] = []
+
+    def append(self, group: int, ranks: List[int], count: int) -> None:
+        """
+        追加一行
+
+        Args:
+            group: 词组序号
+            ranks: 排名列表
+            count: 出现次数
+        """
+        self.groups.append(group)
+        self.rank_values.extend(ranks)
+        self.rank_offsets.append(len(self.rank_values))
+        self.counts.append(count)
+
+    def __len__(self) -> int:
+        return len(self.groups)
+
+
+def _int_array(values: List) -> Optional["np.ndarray"]:
+    """转换为 int64 数组，含非整数值时返回 None（避免静默截断）"""
+    array = np.asarray(values)
+    if array.dtype.kind not in "iu":
+        return None
+    return array.astype(np.int64, copy=False)
+
+
+def compute_weights(
+    columns: TitleColumns,
+    rank_threshold: int,
+    weight_config: Dict,
+) -> Optional[tuple]:
+    """
+    计算所有行的权重与最小排名
+
+    Args:
+        columns: 列式数据
+        rank_threshold: 排名阈值
+        weight_config: 权重配置 {RANK_WEIGHT, FREQUENCY_WEIGHT, HOTNESS_WEIGHT}
+
+    Returns:
+        (权重数组, 最小排名数组)，无法向量化时返回 None
+    """
+    if not HAS_NUMPY or not columns.groups:
+        return None
+
+    ranks = _int_array(columns.rank_values)
+    counts = _int_array(columns.counts)
+    if ranks is None or counts is None:
+        return None
+    offsets = np.asarray(columns.rank_offsets, dtype=np.int64)
+    lengths = np.diff(offsets)
+    # 空排名列表（权重为 0）不常见，交给 Python 实现
+    if not lengths.all():
+        return None
+    starts = offsets[:-1]
+
+    # 排名权重：Σ(11 - min(rank, 10)) / 出现次数
+    rank_weight = np.add.reduceat(11 - np.minimum(ranks, 10), starts) / lengths
+
+    # 频次权重：min(出现次数, 10) × 10
+    frequency_weight = np.minimum(counts, 10) * 10
+
+    # 热度加成：高排名次数 / 总出现次数 × 100
+    high_rank_count = np.add.reduceat((ranks <= rank_threshold).astype(np.int64), starts)
+    hotness_weight = (high_rank_count / lengths) * 100
+
+    weights = (
+        rank_weight * weight_config["RANK_WEIGHT"]
+        + frequency_weight * weight_config["FREQUENCY_WEIGHT"]
+        + hotness_weight * weight_config["HOTNESS_WEIGHT"]
+    )
+    return weights, np.minimum.reduceat(ranks, starts)
+
+
+def sort_groups(
+    columns: TitleColumns,
+    group_count: int,
+    rank_threshold: int,
+    weight_config: Dict,
+) -> Optional[List[List[int]]]:
+    """
+    按 (-权重, 最小排名, -出现次数) 对每个词组内的行排序（相同键保持追加顺序）
+
+    Args:
+        columns: 列式数据
+        group_count: 词组数量
+        rank_threshold: 排名阈值
+        weight_config: 权重配置
+
+    Returns:
+        每个词组排序后的行号列表，无法向量化或行数过少时返回 None
+    """
+    if len(columns) < VECTORIZE_MIN_ROWS:
+        return None
+    computed = compute_weights(columns, rank_threshold, weight_config)
+    if computed is None:
+        return None
+    weights, min_ranks = computed
+
+    groups = np.asarray(columns.groups, dtype=np.int64)
+    counts = np.asarray(columns.counts, dtype=np.int64)
+    # lexsort 以最后一个键为主键，且为稳定排序
+    order = np.lexsort((-counts, min_ranks, -weights, groups))
+    bounds = np.searchsorted(groups[order], np.arange(group_count + 1))
+    order = order.tolist()
+    return [order[bounds[g]:bounds[g + 1]] for g in range(group_count)]
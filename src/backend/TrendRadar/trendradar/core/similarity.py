@@ -0,0 +1,263 @@
+# coding=utf-8
+"""
+近似重复标题检测
+
+两两比较标题（difflib.SequenceMatcher）的复杂度为 O(n²)，几千条标题就需要数十秒。
+这里用 MinHash + LSH 分桶先找出候选对，只对候选对计算精确相似度：
+
+- 标题小写后按字符 n-gram 切片（中文没有空格分词，字符 n-gram 对中英文混排都适用）
+- MinHash 签名：对每个切片的 CRC32 做 num_perm 次 (a·h + b) mod p 取最小值，
+  两个标题签名相同位置相等的概率等于切片集合的 Jaccard 相似度
+- LSH：签名分成 bands 段，任意一段完全相同即为候选对，候选对数量与重复程度成正比，
+  不再与标题数平方成正比
+- 精确打分仍使用 SequenceMatcher.ratio()，先用 real_quick_ratio / quick_ratio 上界快速排除
+
+分段参数按相似度阈值选择：ratio ≥ t 时切片集合的 Jaccard 大致不低于 t/(2-t)，
+LSH 的命中阈值再留出余量以保证召回。LSH 是概率方法：模板化的短标题
+（如"X 将解锁 N 万枚代币"）ratio 可以很高而切片重合很少，这类对可能不会成为候选，
+聚合结果与两两比较可能有个别差异。
+
+签名只依赖标题内容（CRC32 与固定种子），可以跨进程持久化比较。
+依赖 numpy（可选，pip install "trendradar[speedups]"）：批量计算签名时使用，未安装时逐条计算，结果相同。
+"""
+
+import random
+import zlib
+from difflib import SequenceMatcher
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Sequence, Set, Tuple
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+
+# 大于 2^32 的素数：CRC32 取值范围内的线性哈希 (a·h + b) mod p 不会溢出 uint64
+_MERSENNE_LIKE_PRIME = 4294967311
+_MAX_HASH = (1 << 32) - 1
+
+# 默认签名长度与切片长度
+DEFAULT_NUM_PERM = 128
+DEFAULT_NGRAM = 2
+
+# 文本数不超过该值时直接逐对比较（结果精确，签名与分桶的开销不划算）
+EXHAUSTIVE_MAX_TEXTS = 200
+
+
+def shingles(text: str, ngram: int = DEFAULT_NGRAM) -> Set[str]:
+    """
+    字符 n-gram 切片（小写，去掉空白）
+
+    Args:
+        text: 文本
+        ngram: 切片长度
+
+    Returns:
+        切片集合（文本短于 ngram 时为整个文本）
+    """
+    text = "".join(str(text).lower().split())
+    if len(text) <= ngram:
+        return {text} if text else set()
+    return {text[i:i + ngram] for i in range(len(text) - ngram + 1)}
+
+
+def lsh_params(threshold: float, num_perm: int = DEFAULT_NUM_PERM) -> Tuple[int, int]:
+    """
+    根据 SequenceMatcher 相似度阈值选择 LSH 分段参数
+
+    Args:
+        threshold: 相似度阈值（0-1）
+        num_perm: 签名长度
+
+    Returns:
+        (bands, rows)，bands × rows ≤ num_perm
+    """
+    threshold = min(max(threshold, 0.0), 1.0)
+    # ratio ≥ t 时 Jaccard 约 ≥ t/(2-t)，切片边界与分散匹配会再降低一些，留出 40% 余量
+    target = 0.6 * threshold / (2 - threshold)
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        # S 曲线拐点 (1/b)^(1/r)：该 Jaccard 下成为候选对的概率约为 1 - 1/e
+        if (1 / bands) ** (1 / rows) > target:
+            break
+        best = (bands, rows)
+    return best
+
+
+class MinHasher:
+    """MinHash 签名计算（固定种子，签名可跨进程比较）"""
+
+    def __init__(self, num_perm: int = DEFAULT_NUM_PERM, ngram: int = DEFAULT_NGRAM, seed: int = 1):
+        """
+        Args:
+            num_perm: 签名长度（哈希函数个数）
+            ngram: 字符切片长度
+            seed: 哈希参数的随机种子
+        """
+        self.num_perm = num_perm
+        self.ngram = ngram
+        rng = random.Random(seed)
+        self._a = [rng.randrange(1, 1 << 31) for _ in range(num_perm)]
+        self._b = [rng.randrange(0, _MERSENNE_LIKE_PRIME) for _ in range(num_perm)]
+
+    def _hashes(self, text: str) -> List[int]:
+        return [zlib.crc32(s.encode("utf-8")) for s in shingles(text, self.ngram)]
+
+    def signature(self, text: str) -> Tuple[int, ...]:
+        """
+        计算单个文本的签名
+
+        Returns:
+            长度为 num_perm 的整数元组（空文本每个位置为最大值）
+        """
+        hashes = self._hashes(text)
+        if not hashes:
+            return (_MAX_HASH + 1,) * self.num_perm
+        p = _MERSENNE_LIKE_PRIME
+        return tuple(
+            min((a * h + b) % p for h in hashes)
+            for a, b in zip(self._a, self._b)
+        )
+
+    def signatures(self, texts: Sequence[str]) -> List[Tuple[int, ...]]:
+        """
+        批量计算签名（安装 numpy 时向量化计算）
+
+        Returns:
+            与 texts 顺序一致的签名列表
+        """
+        if not HAS_NUMPY or not texts:
+            return [self.signature(text) for text in texts]
+
+        per_text = [self._hashes(text) for text in texts]
+        lengths = np.fromiter((len(h) for h in per_text), dtype=np.int64, count=len(per_text))
+        nonempty = lengths > 0
+        if not nonempty.any():
+            return [self.signature(text) for text in texts]
+
+        flat = np.fromiter(
+            (h for hashes in per_text for h in hashes), dtype=np.uint64, count=int(lengths.sum())
+        )
+        starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))[nonempty]
+
+        result = np.full((len(texts), self.num_perm), _MAX_HASH + 1, dtype=np.uint64)
+        p = np.uint64(_MERSENNE_LIKE_PRIME)
+        for i, (a, b) in enumerate(zip(self._a, self._b)):
+            values = (flat * np.uint64(a) + np.uint64(b)) % p
+            result[nonempty, i] = np.minimum.reduceat(values, starts)
+        return [tuple(row) for row in result.tolist()]
+
+
+class LSHIndex:
+    """MinHash 签名的 LSH 分桶索引"""
+
+    def __init__(self, bands: int, rows: int):
+        """
+        Args:
+            bands: 分段数
+            rows: 每段包含的签名位数
+        """
+        self.bands = bands
+        self.rows = rows
+        self._buckets: List[Dict[Tuple[int, ...], List[Hashable]]] = [{} for _ in range(bands)]
+
+    def _band_keys(self, signature: Sequence[int]) -> Iterable[Tuple[int, Tuple[int, ...]]]:
+        rows = self.rows
+        for band in range(self.bands):
+            yield band, tuple(signature[band * rows:(band + 1) * rows])
+
+    def add(self, key: Hashable, signature: Sequence[int]) -> None:
+        """加入一个签名"""
+        for band, band_key in self._band_keys(signature):
+            self._buckets[band].setdefault(band_key, []).append(key)
+
+    def remove(self, key: Hashable, signature: Sequence[int]) -> None:
+        """移除一个签名（需传入加入时的签名）"""
+        for band, band_key in self._band_keys(signature):
+            bucket = self._buckets[band].get(band_key)
+            if bucket and key in bucket:
+                bucket.remove(key)
+                if not bucket:
+                    del self._buckets[band][band_key]
+
+    def query(self, signature: Sequence[int]) -> Set[Hashable]:
+        """返回与签名至少有一段相同的所有键"""
+        result: Set[Hashable] = set()
+        for band, band_key in self._band_keys(signature):
+            bucket = self._buckets[band].get(band_key)
+            if bucket:
+                result.update(bucket)
+        return result
+
+
+def sequence_similarity(text1: str, text2: str, threshold: float = 0.0) -> Optional[float]:
+    """
+    SequenceMatcher 相似度，低于阈值时返回 None
+
+    先用 real_quick_ratio / quick_ratio（ratio 的上界）排除，结果与直接计算 ratio() 相同。
+    """
+    matcher = SequenceMatcher(None, text1, text2)
+    if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+        return None
+    ratio = matcher.ratio()
+    return ratio if ratio >= threshold else None
+
+
+def cluster_similar(
+    texts: Sequence[str],
+    threshold: float,
+    similarity: Callable[[str, str, float], Optional[float]] = sequence_similarity,
+    num_perm: int = DEFAULT_NUM_PERM,
+    ngram: int = DEFAULT_NGRAM,
+) -> List[List[Tuple[int, float]]]:
+    """
+    贪心聚类：按顺序取尚未归组的文本作为代表，把之后与代表相似度 ≥ threshold 的文本并入该组
+
+    与逐对比较的贪心聚合顺序相同，文本数超过 EXHAUSTIVE_MAX_TEXTS 时候选对由 LSH 给出。
+
+    Args:
+        texts: 文本列表（调用方决定顺序，如按权重降序）
+        threshold: 相似度阈值
+        similarity: 精确相似度函数 (代表, 候选, 阈值) -> 相似度或 None
+        num_perm: 签名长度
+        ngram: 切片长度
+
+    Returns:
+        组列表，每组为 [(下标, 与代表的相似度), ...]，第一个元素是代表（相似度 1.0），
+        其余按下标升序
+    """
+    if not texts:
+        return []
+
+    if len(texts) <= EXHAUSTIVE_MAX_TEXTS:
+        def candidates(i: int) -> Iterable[int]:
+            return range(i + 1, len(texts))
+    else:
+        bands, rows = lsh_params(threshold, num_perm)
+        signatures = MinHasher(num_perm=bands * rows, ngram=ngram).signatures(texts)
+        index = LSHIndex(bands, rows)
+        for i, signature in enumerate(signatures):
+            index.add(i, signature)
+
+        def candidates(i: int) -> Iterable[int]:
+            return sorted(index.query(signatures[i]))
+
+    used = [False] * len(texts)
+    groups = []
+    for i, text in enumerate(texts):
+        if used[i]:
+            continue
+        used[i] = True
+        group = [(i, 1.0)]
+        for j in candidates(i):
+            if used[j]:
+                continue
+            score = similarity(text, texts[j], threshold)
+            if score is not None and score >= threshold:
+                used[j] = True
+                group.append((j, score))
+        groups.append(group)
+    return groups
@@ -4,17 +4,25 @@
 
 负责从 NewsNow API 抓取新闻数据，支持：
 - 单个平台数据获取
-- 批量平台数据爬取
+- 批量平台数据爬取（支持线程池并发 + 全局限速）
 - 自动重试机制
 - 代理支持
+- 连接池复用（keep-alive）与 HTTP 条件请求（ETag / Last-Modified）
 """
 
+import hashlib
 import json
 import random
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from trendradar.utils.ratelimit import RateLimiter
 
 
 class DataFetcher:
@@ -36,6 +44,8 @@ class DataFetcher:
         self,
         proxy_url: Optional[str] = None,
         api_url: Optional[str] = None,
+        pool_size: int = 10,
+        cache_path: Optional[str] = None,
     ):
         """
         初始化数据获取器
@@ -43,16 +53,64 @@ class DataFetcher:
         Args:
             proxy_url: 代理服务器 URL（可选）
             api_url: API 基础 URL（可选，默认使用 DEFAULT_API_URL）
+            pool_size: 连接池大小（同一主机最多保持的 keep-alive 连接数）
+            cache_path: HTTP 缓存文件路径（可选，保存 ETag/Last-Modified 和响应体，
+                        用于跨进程的条件请求；不设置时只在进程内缓存）
         """
         self.proxy_url = proxy_url
         self.api_url = api_url or self.DEFAULT_API_URL
 
+        # 共享会话：复用 TCP/TLS 连接
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(1, pool_size))
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update(self.DEFAULT_HEADERS)
+
+        # HTTP 缓存：{平台ID: {etag, last_modified, hash, body}}
+        self.cache_path = Path(cache_path) if cache_path else None
+        self._http_cache: Dict[str, Dict[str, str]] = self._load_http_cache()
+        # 已解析结果缓存：{平台ID: (响应哈希, 解析结果)}
+        self._parsed_cache: Dict[str, Tuple[str, Dict]] = {}
+        self._unchanged_ids: set = set()
+        self._cache_lock = threading.Lock()
+
+        # 最近一次 crawl_websites 中响应未变化的平台（按配置顺序）
+        self.last_unchanged_ids: List[str] = []
+
+    def _load_http_cache(self) -> Dict[str, Dict[str, str]]:
+        """从缓存文件加载 HTTP 缓存"""
+        if not self.cache_path or not self.cache_path.exists():
+            return {}
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"加载 HTTP 缓存失败: {e}")
+            return {}
+
+    def _save_http_cache(self) -> None:
+        """保存 HTTP 缓存到文件"""
+        if not self.cache_path:
+            return
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with self._cache_lock:
+                snapshot = dict(self._http_cache)
+            tmp_path = self.cache_path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f, ensure_ascii=False)
+            tmp_path.replace(self.cache_path)
+        except Exception as e:
+            print(f"保存 HTTP 缓存失败: {e}")
+
     def fetch_data(
         self,
         id_info: Union[str, Tuple[str, str]],
         max_retries: int = 2,
         min_retry_wait: int = 3,
         max_retry_wait: int = 5,
+        rate_limiter: Optional[RateLimiter] = None,
     ) -> Tuple[Optional[str], str, str]:
         """
         获取指定ID数据，支持重试
@@ -62,9 +120,13 @@ class DataFetcher:
             max_retries: 最大重试次数
             min_retry_wait: 最小重试等待时间（秒）
             max_retry_wait: 最大重试等待时间（秒）
+            rate_limiter: 请求限速器（可选，每次请求前获取许可）
 
         Returns:
             (响应文本, 平台ID, 别名) 元组，失败时响应文本为 None
+
+        有缓存时发送条件请求：服务端返回 304，或响应体哈希与缓存一致时，
+        直接返回缓存的响应文本并将平台记为"未变化"（跳过 JSON 校验）。
         """
         if isinstance(id_info, tuple):
             id_value, alias = id_info
@@ -78,24 +140,57 @@ class DataFetcher:
         if self.proxy_url:
             proxies = {"http": self.proxy_url, "https": self.proxy_url}
 
+        with self._cache_lock:
+            cached = self._http_cache.get(id_value)
+
+        # 条件请求头
+        headers = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
         retries = 0
         while retries <= max_retries:
             try:
-                response = requests.get(
+                if rate_limiter:
+                    rate_limiter.acquire()
+                response = self.session.get(
                     url,
                     proxies=proxies,
-                    headers=self.DEFAULT_HEADERS,
+                    headers=headers,
                     timeout=10,
                 )
+
+                if response.status_code == 304 and cached:
+                    self._unchanged_ids.add(id_value)
+                    print(f"获取 {id_value} 成功（未变化）")
+                    return cached["body"], id_value, alias
+
                 response.raise_for_status()
 
                 data_text = response.text
+                body_hash = hashlib.md5(data_text.encode("utf-8")).hexdigest()
+                if cached and cached.get("hash") == body_hash:
+                    self._unchanged_ids.add(id_value)
+                    print(f"获取 {id_value} 成功（未变化）")
+                    return data_text, id_value, alias
+
                 data_json = json.loads(data_text)
 
                 status = data_json.get("status", "未知")
                 if status not in ["success", "cache"]:
                     raise ValueError(f"响应状态异常: {status}")
 
+                with self._cache_lock:
+                    self._http_cache[id_value] = {
+                        "etag": response.headers.get("ETag", ""),
+                        "last_modified": response.headers.get("Last-Modified", ""),
+                        "hash": body_hash,
+                        "body": data_text,
+                    }
+
                 status_info = "最新数据" if status == "success" else "缓存数据"
                 print(f"获取 {id_value} 成功（{status_info}）")
                 return data_text, id_value, alias
@@ -114,71 +209,125 @@ class DataFetcher:
 
         return None, id_value, alias
 
+    def _parse_response(self, id_value: str, response: str) -> Optional[Dict]:
+        """
+        解析 NewsNow 响应为 {标题: {ranks, url, mobileUrl}}
+
+        Args:
+            id_value: 平台ID
+            response: 响应文本
+
+        Returns:
+            解析结果，失败时返回 None
+        """
+        try:
+            data = json.loads(response)
+            titles: Dict[str, Dict] = {}
+
+            for index, item in enumerate(data.get("items", []), 1):
+                title = item.get("title")
+                # 跳过无效标题（None、float、空字符串）
+                if title is None or isinstance(title, float) or not str(title).strip():
+                    continue
+                title = str(title).strip()
+                url = item.get("url", "")
+                mobile_url = item.get("mobileUrl", "")
+
+                if title in titles:
+                    titles[title]["ranks"].append(index)
+                else:
+                    titles[title] = {
+                        "ranks": [index],
+                        "url": url,
+                        "mobileUrl": mobile_url,
+                    }
+            return titles
+        except json.JSONDecodeError:
+            print(f"解析 {id_value} 响应失败")
+        except Exception as e:
+            print(f"处理 {id_value} 数据出错: {e}")
+        return None
+
     def crawl_websites(
         self,
         ids_list: List[Union[str, Tuple[str, str]]],
         request_interval: int = 100,
+        max_workers: int = 1,
     ) -> Tuple[Dict, Dict, List]:
         """
         爬取多个网站数据
 
+        max_workers > 1 时使用线程池并发抓取。请求间隔由全局限速器统一控制，
+        任意两次请求（包括重试）的发出时间仍至少相隔 request_interval，
+        并发只用于重叠网络等待和重试退避。结果按 ids_list 的顺序返回。
+
         Args:
             ids_list: 平台ID列表，每个元素可以是字符串或 (平台ID, 别名) 元组
             request_interval: 请求间隔（毫秒）
+            max_workers: 最大并发数（1 表示串行抓取）
 
         Returns:
             (结果字典, ID到名称的映射, 失败ID列表) 元组
         """
-        results = {}
         id_to_name = {}
-        failed_ids = []
-
-        for i, id_info in enumerate(ids_list):
+        id_values = []
+        for id_info in ids_list:
             if isinstance(id_info, tuple):
                 id_value, name = id_info
             else:
                 id_value = id_info
                 name = id_value
-
             id_to_name[id_value] = name
-            response, _, _ = self.fetch_data(id_info)
-
-            if response:
-                try:
-                    data = json.loads(response)
-                    results[id_value] = {}
-
-                    for index, item in enumerate(data.get("items", []), 1):
-                        title = item.get("title")
-                        # 跳过无效标题（None、float、空字符串）
-                        if title is None or isinstance(title, float) or not str(title).strip():
-                            continue
-                        title = str(title).strip()
-                        url = item.get("url", "")
-                        mobile_url = item.get("mobileUrl", "")
-
-                        if title in results[id_value]:
-                            results[id_value][title]["ranks"].append(index)
-                        else:
-                            results[id_value][title] = {
-                                "ranks": [index],
-                                "url": url,
-                                "mobileUrl": mobile_url,
-                            }
-                except json.JSONDecodeError:
-                    print(f"解析 {id_value} 响应失败")
-                    failed_ids.append(id_value)
-                except Exception as e:
-                    print(f"处理 {id_value} 数据出错: {e}")
-                    failed_ids.append(id_value)
+            id_values.append(id_value)
+
+        rate_limiter = RateLimiter(request_interval, jitter_ms=(-10, 20), min_interval_ms=50)
+
+        self._unchanged_ids = set()
+
+        def crawl_one(id_info: Union[str, Tuple[str, str]]) -> Optional[Dict]:
+            response, id_value, _ = self.fetch_data(id_info, rate_limiter=rate_limiter)
+            if not response:
+                return None
+
+            # 响应未变化时复用上次的解析结果，跳过 JSON 解析
+            body_hash = self._http_cache.get(id_value, {}).get("hash", "")
+            parsed = self._parsed_cache.get(id_value)
+            if id_value in self._unchanged_ids and parsed and parsed[0] == body_hash:
+                titles = parsed[1]
             else:
+                titles = self._parse_response(id_value, response)
+                if titles is None:
+                    return None
+                self._parsed_cache[id_value] = (body_hash, titles)
+
+            # 返回副本，避免调用方修改缓存中的排名列表
+            return {
+                title: {**info, "ranks": list(info["ranks"])}
+                for title, info in titles.items()
+            }
+
+        if max_workers > 1 and len(ids_list) > 1:
+            workers = min(max_workers, len(ids_list))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="crawler") as executor:
+                outcomes = list(executor.map(crawl_one, ids_list))
+        else:
+            outcomes = [crawl_one(id_info) for id_info in ids_list]
+
+        # 按配置顺序汇总结果
+        results = {}
+        failed_ids = []
+        for id_value, titles in zip(id_values, outcomes):
+            if titles is None:
                 failed_ids.append(id_value)
+            else:
+                results[id_value] = titles
 
-            # 请求间隔（除了最后一个）
-            if i < len(ids_list) - 1:
-                actual_interval = request_interval + random.randint(-10, 20)
-                actual_interval = max(50, actual_interval)
-                time.sleep(actual_interval / 1000)
+        self.last_unchanged_ids = [
+            id_value for id_value in results if id_value in self._unchanged_ids
+        ]
+        self._save_http_cache()
 
+        if self.last_unchanged_ids:
+            print(f"响应未变化: {self.last_unchanged_ids}")
         print(f"成功: {list(results.keys())}, 失败: {failed_ids}")
         return results, id_to_name, failed_ids
@@ -0,0 +1,173 @@
+# coding=utf-8
+"""
+解析阶段
+
+RSS（feedparser）与 Web3 页面（lxml / BeautifulSoup）的解析是 CPU 密集的，
+原先在抓取线程内紧接着网络请求执行：解析大的 Feed（如全文输出的 Substack Feed）时
+占用 GIL，其他抓取线程的请求也随之变慢。
+
+ParseStage 把解析放到进程池执行：抓取线程只负责网络请求，拿到响应内容后提交解析任务，
+解析与后续源的抓取同时进行。
+
+- 进程池懒加载，spawn 方式启动（避免在多线程进程中 fork），shutdown 后再次提交时重建
+- 小于 min_bytes 的内容直接在当前线程解析（进程间传输的开销大于解析本身）
+- 工作进程异常退出时，改为在当前线程解析，之后不再使用进程池
+- max_workers 为 0 时全部在当前线程解析（与原有行为一致）；进程数不超过 CPU 核数 - 1，
+  单核机器上进程池没有收益（启动与传输反而更慢），同样在当前线程解析
+
+解析函数需为模块级函数（可被 pickle），工作进程内的解析器实例按需创建、进程内复用。
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+# 小于该字符数的内容在当前线程解析
+DEFAULT_MIN_BYTES = 32 * 1024
+
+
+# 工作进程内的解析器实例
+_rss_parser = None
+_web3_crawlers: Dict[str, Any] = {}
+
+
+def parse_feed(content: str, feed_url: str = "") -> List[Any]:
+    """
+    解析 RSS/Atom/JSON Feed 内容（可在工作进程中执行）
+
+    Args:
+        content: Feed 内容
+        feed_url: Feed URL（用于错误提示）
+
+    Returns:
+        ParsedRSSItem 列表
+    """
+    global _rss_parser
+    if _rss_parser is None:
+        from trendradar.crawler.rss.parser import RSSParser
+        _rss_parser = RSSParser()
+    return _rss_parser.parse(content, feed_url)
+
+
+def parse_web3_html(
+    html_content: str, source_id: str, max_items: int, scan: Optional[Any] = None
+) -> Tuple[List[Any], Any]:
+    """
+    解析 Web3 站点页面 HTML（可在工作进程中执行）
+
+    Args:
+        html_content: 页面 HTML
+        source_id: 爬虫的数据源 ID（chaincatcher、menews）
+        max_items: 最大条目数
+        scan: 增量抓取的水位扫描
+
+    Returns:
+        (ParsedWeb3Item 列表, 扫描结束后的水位扫描) 元组
+    """
+    crawler = _web3_crawlers.get(source_id)
+    if crawler is None:
+        if source_id == "chaincatcher":
+            from trendradar.crawler.web3.chaincatcher import ChainCatcherCrawler
+            crawler = ChainCatcherCrawler()
+        elif source_id == "menews":
+            from trendradar.crawler.web3.menews import MeNewsCrawler
+            crawler = MeNewsCrawler()
+        else:
+            raise ValueError(f"未知的爬虫类型: {source_id}")
+        _web3_crawlers[source_id] = crawler
+    return crawler.parse_html(html_content, max_items, scan), scan
+
+
+class ParseStage:
+    """解析阶段（进程池）"""
+
+    def __init__(self, max_workers: int = 0, min_bytes: int = DEFAULT_MIN_BYTES, name: str = "解析"):
+        """
+        Args:
+            max_workers: 解析进程数，0 表示在当前线程解析（不超过 CPU 核数 - 1）
+            min_bytes: 内容小于该字符数时在当前线程解析
+            name: 日志前缀
+        """
+        self.max_workers = max(0, min(max_workers, (os.cpu_count() or 1) - 1))
+        self.min_bytes = min_bytes
+        self.name = name
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._broken = False
+        self._lock = threading.Lock()
+
+    def _process_pool(self) -> Optional[ProcessPoolExecutor]:
+        """懒加载进程池"""
+        if self.max_workers <= 0 or self._broken:
+            return None
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._pool
+
+    def _disable(self, error: BaseException) -> None:
+        """工作进程异常退出：之后改为在当前线程解析"""
+        with self._lock:
+            if not self._broken:
+                print(f"[{self.name}] 解析进程池不可用，改为在当前线程解析: {error}")
+            self._broken = True
+
+    def submit(self, func: Callable, content: str, *args) -> Future:
+        """
+        提交解析任务
+
+        Args:
+            func: 模块级解析函数，第一个参数为待解析的内容
+            content: 待解析的内容
+            *args: 其余参数
+
+        Returns:
+            解析结果的 Future（在当前线程解析时已完成）
+        """
+        pool = self._process_pool() if content and len(content) >= self.min_bytes else None
+        if pool is not None:
+            try:
+                return pool.submit(func, content, *args)
+            except (BrokenProcessPool, RuntimeError) as e:
+                self._disable(e)
+
+        future: Future = Future()
+        try:
+            future.set_result(func(content, *args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def result(self, future: Future, func: Callable, content: str, *args) -> Any:
+        """
+        获取解析结果；工作进程异常退出时改为在当前线程重新解析
+
+        Args:
+            future: submit 返回的 Future
+            func, content, *args: 与 submit 相同
+
+        Returns:
+            解析结果（解析函数抛出的异常原样抛出）
+        """
+        try:
+            return future.result()
+        except BrokenProcessPool as e:
+            self._disable(e)
+            return func(content, *args)
+
+    def run(self, func: Callable, content: str, *args) -> Any:
+        """提交解析任务并等待结果"""
+        return self.result(self.submit(func, content, *args), func, content, *args)
+
+    def shutdown(self) -> None:
+        """关闭进程池（再次提交时重建）"""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
@@ -3,18 +3,28 @@
 RSS 抓取器
 
 负责从配置的 RSS 源抓取数据并转换为标准格式
+
+- 支持线程池并行抓取，按主机限制并发数和请求间隔
+- 支持 HTTP 条件请求（ETag / Last-Modified），304 或内容哈希未变化时跳过解析
+- 支持解析进程池：抓取线程只负责网络请求，响应内容交给解析阶段在进程池解析，
+  解析与其他源的抓取同时进行
 """
 
-import time
-import random
-from dataclasses import dataclass
+import hashlib
+import json
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple, Callable
+from pathlib import Path
+from typing import Any, List, Dict, Optional, Tuple, Callable
 
 import requests
 
 from .parser import RSSParser, ParsedRSSItem
+from trendradar.crawler.parsing import ParseStage, parse_feed
 from trendradar.storage.base import RSSItem, RSSData
+from trendradar.utils.ratelimit import HostRateLimiter
 from trendradar.utils.time import get_configured_time, is_within_days, DEFAULT_TIMEZONE
 
 
@@ -42,19 +52,28 @@ class RSSFetcher:
         timezone: str = DEFAULT_TIMEZONE,
         freshness_enabled: bool = True,
         default_max_age_days: int = 3,
+        max_workers: int = 1,
+        max_per_host: int = 1,
+        cache_path: Optional[str] = None,
+        parse_workers: int = 0,
     ):
         """
         初始化抓取器
 
         Args:
             feeds: RSS 源配置列表
-            request_interval: 请求间隔（毫秒）
+            request_interval: 同一主机的请求间隔（毫秒）
             timeout: 请求超时（秒）
             use_proxy: 是否使用代理
             proxy_url: 代理 URL
             timezone: 时区配置（如 'Asia/Shanghai'）
             freshness_enabled: 是否启用新鲜度过滤
             default_max_age_days: 默认最大文章年龄（天）
+            max_workers: 并行抓取的线程数（1 表示串行）
+            max_per_host: 单个主机的最大并发请求数
+            cache_path: HTTP 缓存文件路径（可选，保存每个源的 ETag/Last-Modified、
+                        内容哈希和解析结果；不设置时只在进程内缓存）
+            parse_workers: 解析进程数（0 表示在抓取线程内解析）
         """
         self.feeds = [f for f in feeds if f.enabled]
         self.request_interval = request_interval
@@ -64,9 +83,21 @@ class RSSFetcher:
         self.timezone = timezone
         self.freshness_enabled = freshness_enabled
         self.default_max_age_days = default_max_age_days
+        self.max_workers = max_workers
 
         self.parser = RSSParser()
+        self.parse_stage = ParseStage(parse_workers, name="RSS")
         self.session = self._create_session()
+        self.host_limiter = HostRateLimiter(
+            request_interval,
+            jitter_ms=(-int(request_interval * 0.2), int(request_interval * 0.2)),
+            max_per_host=max_per_host,
+        )
+
+        # HTTP 缓存：{feed_id: {url, etag, last_modified, hash, items}}
+        self.cache_path = Path(cache_path) if cache_path else None
+        self._http_cache: Dict[str, Dict] = self._load_http_cache()
+        self._cache_lock = threading.Lock()
 
     def _create_session(self) -> requests.Session:
         """创建请求会话"""
@@ -85,6 +116,107 @@ class RSSFetcher:
 
         return session
 
+    def _load_http_cache(self) -> Dict[str, Dict]:
+        """从缓存文件加载 HTTP 缓存"""
+        if not self.cache_path or not self.cache_path.exists():
+            return {}
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"[RSS] 加载 HTTP 缓存失败: {e}")
+            return {}
+
+    def _save_http_cache(self) -> None:
+        """保存 HTTP 缓存到文件"""
+        if not self.cache_path:
+            return
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with self._cache_lock:
+                snapshot = dict(self._http_cache)
+            tmp_path = self.cache_path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f, ensure_ascii=False)
+            tmp_path.replace(self.cache_path)
+        except Exception as e:
+            print(f"[RSS] 保存 HTTP 缓存失败: {e}")
+
+    def _request_feed(
+        self, feed: RSSFeedConfig
+    ) -> Tuple[Optional[List[ParsedRSSItem]], Optional[str], Optional[Dict[str, Any]]]:
+        """
+        请求单个 RSS 源（带条件请求，不解析）
+
+        服务端返回 304，或响应内容哈希与缓存一致时，直接返回缓存的解析结果。
+
+        Args:
+            feed: RSS 源配置
+
+        Returns:
+            (缓存的解析结果, 待解析的内容, 缓存条目) 元组：
+            内容未变化时为 (条目列表, None, None)，否则为 (None, 响应内容, 不含解析结果的缓存条目)
+        """
+        with self._cache_lock:
+            cached = self._http_cache.get(feed.id)
+        if cached and cached.get("url") != feed.url:
+            cached = None
+
+        headers = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        with self.host_limiter.limit(feed.url):
+            response = self.session.get(feed.url, timeout=self.timeout, headers=headers)
+
+        if response.status_code == 304 and cached:
+            print(f"[RSS] {feed.name}: 未变化（304）")
+            return [ParsedRSSItem(**item) for item in cached["items"]], None, None
+
+        response.raise_for_status()
+
+        content_hash = hashlib.md5(response.content).hexdigest()
+        if cached and cached.get("hash") == content_hash:
+            print(f"[RSS] {feed.name}: 内容未变化")
+            return [ParsedRSSItem(**item) for item in cached["items"]], None, None
+
+        entry = {
+            "url": feed.url,
+            "etag": response.headers.get("ETag", ""),
+            "last_modified": response.headers.get("Last-Modified", ""),
+            "hash": content_hash,
+        }
+        return None, response.text, entry
+
+    def _store_parsed(self, feed: RSSFeedConfig, entry: Dict[str, Any], parsed_items: List[ParsedRSSItem]) -> None:
+        """保存解析结果到 HTTP 缓存"""
+        with self._cache_lock:
+            self._http_cache[feed.id] = dict(entry, items=[asdict(item) for item in parsed_items])
+
+    def _fetch_parsed_items(self, feed: RSSFeedConfig) -> List[ParsedRSSItem]:
+        """
+        请求并解析单个 RSS 源（带条件请求）
+
+        服务端返回 304，或响应内容哈希与缓存一致时，直接复用缓存的解析结果，
+        不调用 RSSParser.parse。
+
+        Args:
+            feed: RSS 源配置
+
+        Returns:
+            解析后的条目列表
+        """
+        cached_items, content, entry = self._request_feed(feed)
+        if content is None:
+            return cached_items
+
+        parsed_items = self.parse_stage.run(parse_feed, content, feed.url)
+        self._store_parsed(feed, entry, parsed_items)
+        return parsed_items
+
     def _filter_by_freshness(
         self,
         items: List[RSSItem],
@@ -127,6 +259,60 @@ class RSSFetcher:
         filtered_count = len(items) - len(filtered)
         return filtered, filtered_count
 
+    def _build_items(self, feed: RSSFeedConfig, parsed_items: List[ParsedRSSItem]) -> List[RSSItem]:
+        """
+        转换解析结果为 RSSItem
+
+        Args:
+            feed: RSS 源配置
+            parsed_items: 解析后的条目列表
+
+        Returns:
+            条目列表
+        """
+        # 限制条目数量（0=不限制）
+        if feed.max_items > 0:
+            parsed_items = parsed_items[:feed.max_items]
+
+        # 转换为 RSSItem（使用配置的时区）
+        now = get_configured_time(self.timezone)
+        crawl_time = now.strftime("%H:%M")
+        items = []
+
+        for parsed in parsed_items:
+            item = RSSItem(
+                title=parsed.title,
+                feed_id=feed.id,
+                feed_name=feed.name,
+                url=parsed.url,
+                published_at=parsed.published_at or "",
+                summary=parsed.summary or "",
+                author=parsed.author or "",
+                crawl_time=crawl_time,
+                first_time=crawl_time,
+                last_time=crawl_time,
+                count=1,
+            )
+            items.append(item)
+
+        # 注意：新鲜度过滤已移至推送阶段（_convert_rss_items_to_list）
+        # 这样所有文章都会存入数据库，但旧文章不会推送
+        print(f"[RSS] {feed.name}: 获取 {len(items)} 条")
+        return items
+
+    def _describe_error(self, feed: RSSFeedConfig, e: Exception) -> str:
+        """生成并输出抓取失败的错误信息"""
+        if isinstance(e, requests.Timeout):
+            error = f"请求超时 ({self.timeout}s)"
+        elif isinstance(e, requests.RequestException):
+            error = f"请求失败: {e}"
+        elif isinstance(e, ValueError):
+            error = f"解析失败: {e}"
+        else:
+            error = f"未知错误: {e}"
+        print(f"[RSS] {feed.name}: {error}")
+        return error
+
     def fetch_feed(self, feed: RSSFeedConfig) -> Tuple[List[RSSItem], Optional[str]]:
         """
         抓取单个 RSS 源
@@ -138,60 +324,57 @@ class RSSFetcher:
             (条目列表, 错误信息) 元组
         """
         try:
-            response = self.session.get(feed.url, timeout=self.timeout)
-            response.raise_for_status()
-
-            parsed_items = self.parser.parse(response.text, feed.url)
-
-            # 限制条目数量（0=不限制）
-            if feed.max_items > 0:
-                parsed_items = parsed_items[:feed.max_items]
-
-            # 转换为 RSSItem（使用配置的时区）
-            now = get_configured_time(self.timezone)
-            crawl_time = now.strftime("%H:%M")
-            items = []
-
-            for parsed in parsed_items:
-                item = RSSItem(
-                    title=parsed.title,
-                    feed_id=feed.id,
-                    feed_name=feed.name,
-                    url=parsed.url,
-                    published_at=parsed.published_at or "",
-                    summary=parsed.summary or "",
-                    author=parsed.author or "",
-                    crawl_time=crawl_time,
-                    first_time=crawl_time,
-                    last_time=crawl_time,
-                    count=1,
-                )
-                items.append(item)
-
-            # 注意：新鲜度过滤已移至推送阶段（_convert_rss_items_to_list）
-            # 这样所有文章都会存入数据库，但旧文章不会推送
-            print(f"[RSS] {feed.name}: 获取 {len(items)} 条")
-            return items, None
-
-        except requests.Timeout:
-            error = f"请求超时 ({self.timeout}s)"
-            print(f"[RSS] {feed.name}: {error}")
-            return [], error
+            parsed_items = self._fetch_parsed_items(feed)
+            return self._build_items(feed, parsed_items), None
+        except Exception as e:
+            return [], self._describe_error(feed, e)
 
-        except requests.RequestException as e:
-            error = f"请求失败: {e}"
-            print(f"[RSS] {feed.name}: {error}")
-            return [], error
+    def _fetch_all_pipelined(self) -> List[Tuple[List[RSSItem], Optional[str]]]:
+        """
+        抓取与解析流水线
 
-        except ValueError as e:
-            error = f"解析失败: {e}"
-            print(f"[RSS] {feed.name}: {error}")
-            return [], error
+        抓取线程只负责网络请求；每个源的请求完成后，响应内容立即提交到解析阶段，
+        在进程池中解析，同时其他源的请求继续进行。
 
-        except Exception as e:
-            error = f"未知错误: {e}"
-            print(f"[RSS] {feed.name}: {error}")
-            return [], error
+        Returns:
+            按配置顺序排列的 (条目列表, 错误信息) 列表
+        """
+        outcomes: List[Optional[Tuple[List[RSSItem], Optional[str]]]] = [None] * len(self.feeds)
+        parsing: Dict[Future, Tuple[int, str, Dict[str, Any]]] = {}
+
+        workers = max(1, min(self.max_workers, len(self.feeds)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="rss") as executor:
+            requests_by_future = {
+                executor.submit(self._request_feed, feed): index
+                for index, feed in enumerate(self.feeds)
+            }
+
+            # 请求完成的顺序即提交解析的顺序
+            for future in as_completed(requests_by_future):
+                index = requests_by_future[future]
+                feed = self.feeds[index]
+                try:
+                    cached_items, content, entry = future.result()
+                except Exception as e:
+                    outcomes[index] = ([], self._describe_error(feed, e))
+                    continue
+
+                if content is None:
+                    outcomes[index] = (self._build_items(feed, cached_items), None)
+                else:
+                    parsing[self.parse_stage.submit(parse_feed, content, feed.url)] = (index, content, entry)
+
+        for future in as_completed(parsing):
+            index, content, entry = parsing[future]
+            feed = self.feeds[index]
+            try:
+                parsed_items = self.parse_stage.result(future, parse_feed, content, feed.url)
+                self._store_parsed(feed, entry, parsed_items)
+                outcomes[index] = (self._build_items(feed, parsed_items), None)
+            except Exception as e:
+                outcomes[index] = ([], self._describe_error(feed, e))
+
+        return outcomes
 
     def fetch_all(self) -> RSSData:
         """
@@ -211,15 +394,22 @@ class RSSFetcher:
 
         print(f"[RSS] 开始抓取 {len(self.feeds)} 个 RSS 源...")
 
-        for i, feed in enumerate(self.feeds):
-            # 请求间隔（带随机波动）
-            if i > 0:
-                interval = self.request_interval / 1000
-                jitter = random.uniform(-0.2, 0.2) * interval
-                time.sleep(interval + jitter)
+        # 并行抓取：同一主机的请求间隔和并发数由 host_limiter 控制
+        try:
+            if self.parse_stage.max_workers > 0 and len(self.feeds) > 1:
+                outcomes = self._fetch_all_pipelined()
+            elif self.max_workers > 1 and len(self.feeds) > 1:
+                workers = min(self.max_workers, len(self.feeds))
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="rss") as executor:
+                    outcomes = list(executor.map(self.fetch_feed, self.feeds))
+            else:
+                outcomes = [self.fetch_feed(feed) for feed in self.feeds]
+        finally:
+            self.parse_stage.shutdown()
 
-            items, error = self.fetch_feed(feed)
+        self._save_http_cache()
 
+        for feed, (items, error) in zip(self.feeds, outcomes):
             id_to_name[feed.id] = feed.name
 
             if error:
@@ -248,6 +438,10 @@ class RSSFetcher:
                 {
                     "enabled": true,
                     "request_interval": 2000,
+                    "max_workers": 4,
+                    "max_per_host": 1,
+                    "cache_path": "output/.cache/rss_http.json",
+                    "parse_workers": 0,
                     "freshness_filter": {
                         "enabled": true,
                         "max_age_days": 3
@@ -302,4 +496,8 @@ class RSSFetcher:
             timezone=config.get("timezone", DEFAULT_TIMEZONE),
             freshness_enabled=freshness_enabled,
             default_max_age_days=default_max_age_days,
+            max_workers=config.get("max_workers", 1),
+            max_per_host=config.get("max_per_host", 1),
+            cache_path=config.get("cache_path"),
+            parse_workers=config.get("parse_workers", 0),
         )
@@ -10,10 +10,37 @@ ChainCatcher 是中文区块链资讯平台，提供实时快讯和深度文章
 """
 
 import re
+from collections import deque
 from datetime import datetime
-from typing import List, Optional, Dict, Any
-
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+from .extract import (
+    HAS_LXML,
+    HtmlStream,
+    class_contains,
+    compile_xpath,
+    element_text,
+    first,
+    has_class,
+)
 from .fetcher import Web3Crawler, ParsedWeb3Item
+from .watermark import Watermark, WatermarkScan
+
+
+if HAS_LXML:
+    # h3 所在的最近一层容器（等价于 find_parent(['div', 'article', 'li', 'a'])）
+    _H3_CONTAINER = compile_xpath("ancestor::*[self::div or self::article or self::li or self::a][1]")
+    _ANCESTOR_LINK = compile_xpath("ancestor::a[1]")
+    _FIRST_LINK = compile_xpath("(.//a[@href])[1]")
+    _SUMMARY_CANDIDATES = compile_xpath(".//*[self::p or self::div or self::span]")
+    # [class*="news"], [class*="flash"], [class*="item"]
+    _NEWS_CONTAINERS = compile_xpath(
+        f'//*[{class_contains("news")} or {class_contains("flash")} or {class_contains("item")}]'
+    )
+    # h3, h4, .title, a
+    _CONTAINER_TITLE = compile_xpath(
+        f'(.//*[self::h3 or self::h4 or self::a or {has_class("title")}])[1]'
+    )
 
 
 class ChainCatcherCrawler(Web3Crawler):
@@ -23,6 +50,22 @@ class ChainCatcherCrawler(Web3Crawler):
     BASE_URL = "https://www.chaincatcher.com"
     NEWS_URL = "https://www.chaincatcher.com/news"
 
+    # 导航类标题
+    NAV_TITLES = frozenset(['区块链快讯', '最新快讯', '精选事件', '快讯'])
+
+    # 容器文本中的时间（按顺序尝试）
+    TIME_PATTERNS = [
+        re.compile(r'\d{2}-\d{2}\s+\d{2}:\d{2}'),  # 01-07 16:50
+        re.compile(r'\d{4}-\d{2}-\d{2}'),  # 2026-01-07
+        re.compile(r'\d{2}:\d{2}'),  # 16:50
+    ]
+
+    # _parse_time_string 识别的格式
+    _MONTH_DAY_TIME = re.compile(r'\d{2}-\d{2}\s+\d{2}:\d{2}')
+    _DATE = re.compile(r'\d{4}-\d{2}-\d{2}')
+    _DATE_TIME = re.compile(r'\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}')
+    _TIME_ONLY = re.compile(r'^\d{2}:\d{2}$')
+
     @property
     def source_id(self) -> str:
         return "chaincatcher"
@@ -31,12 +74,13 @@ class ChainCatcherCrawler(Web3Crawler):
     def source_name(self) -> str:
         return "ChainCatcher 链捕手"
 
-    def crawl(self, max_items: int = 50) -> List[ParsedWeb3Item]:
+    def crawl(self, max_items: int = 50, watermark: Optional[Watermark] = None) -> List[ParsedWeb3Item]:
         """
         抓取 ChainCatcher 快讯
 
         Args:
             max_items: 最大条目数
+            watermark: 增量抓取水位
 
         Returns:
             解析后的新闻条目列表
@@ -44,17 +88,18 @@ class ChainCatcherCrawler(Web3Crawler):
         items = []
 
         # 主要使用 HTML 解析方式
-        html_items = self._crawl_by_html(max_items)
+        html_items = self._crawl_by_html(max_items, watermark)
         items.extend(html_items)
 
         return items[:max_items]
 
-    def _crawl_by_html(self, max_items: int = 50) -> List[ParsedWeb3Item]:
+    def _crawl_by_html(self, max_items: int = 50, watermark: Optional[Watermark] = None) -> List[ParsedWeb3Item]:
         """
         通过 HTML 页面抓取
 
         Args:
             max_items: 最大条目数
+            watermark: 增量抓取水位
 
         Returns:
             解析后的新闻条目列表
@@ -69,152 +114,300 @@ class ChainCatcherCrawler(Web3Crawler):
                 print("[ChainCatcher] 获取 HTML 页面失败")
                 return items
 
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html_content, 'html.parser')
+            scan = watermark.scan() if watermark is not None else None
+            items, scan = self.parse_page(html_content, max_items, scan)
+            if scan is not None and scan.reached:
+                print(f"[ChainCatcher] 从 HTML 解析获取 {len(items)} 条新快讯（已到达上次抓取位置）")
+            else:
+                print(f"[ChainCatcher] 从 HTML 解析获取 {len(items)} 条新闻")
+
+        except Exception as e:
+            print(f"[ChainCatcher] HTML 抓取失败: {e}")
+            import traceback
+            traceback.print_exc()
+
+        return items
+
+    def parse_html(
+        self, html_content: str, max_items: int = 50, scan: Optional[WatermarkScan] = None
+    ) -> List[ParsedWeb3Item]:
+        """
+        解析快讯页面 HTML
+
+        方法1: 快讯标题通常在 h3 标签中，从 h3 所在的容器元素提取链接、时间和摘要；
+        方法2: 条目不足时，从 class 含 news/flash/item 的容器补充。
+        已安装 lxml 时增量解析，取够 max_items 条或到达水位即停止；否则使用 BeautifulSoup。
+
+        Args:
+            html_content: 页面 HTML
+            max_items: 最大条目数
+            scan: 增量抓取的水位扫描（跳过已抓取过的快讯，到达水位后不再解析）
+
+        Returns:
+            解析后的新闻条目列表
+        """
+        if HAS_LXML:
+            return self._parse_html_lxml(html_content, max_items, scan)
+        return self._parse_html_soup(html_content, max_items, scan)
+
+    def _clean_title(self, text: str) -> Optional[str]:
+        """清理标题，过滤无效标题与导航类标题"""
+        # 清理标题中的无关后缀
+        title_text = self.clean_text(text).replace('微信扫码', '').strip()
+
+        # 过滤无效标题
+        if not title_text or len(title_text) < 5:
+            return None
+
+        # 跳过导航类标题
+        if title_text in self.NAV_TITLES:
+            return None
+
+        return title_text
+
+    def _find_time(self, text: str) -> Optional[str]:
+        """从容器文本中查找时间"""
+        for pattern in self.TIME_PATTERNS:
+            match = pattern.search(text)
+            if match:
+                published_at = self._parse_time_string(match.group())
+                if published_at:
+                    return published_at
+        return None
 
-            # 方法1: 查找快讯列表中的 h3 标题元素
-            # 根据实际 HTML 结构，快讯标题通常在 h3 标签中
-            news_titles = soup.find_all('h3')
+    def _summary_of(self, text: str, title_text: str) -> Optional[str]:
+        """判断文本是否可作为摘要（摘要通常以 "ChainCatcher 消息" 开头）"""
+        text = self.clean_text(text)
+        if text and len(text) > 20 and text != title_text:
+            if 'ChainCatcher' in text or len(text) > 50:
+                return text[:500] + "..." if len(text) > 500 else text
+        return None
 
-            for h3 in news_titles[:max_items * 2]:  # 获取更多以便过滤
+    def _append_item(
+        self,
+        items: List[ParsedWeb3Item],
+        seen: Set[str],
+        scan: Optional[WatermarkScan],
+        title_text: str,
+        url: str,
+        published_at: Optional[str] = None,
+        summary: Optional[str] = None,
+    ) -> None:
+        """添加条目（跳过重复条目与已抓取过的条目）"""
+        guid = self.generate_guid(url or title_text, title_text)
+
+        # 检查是否重复
+        if guid in seen:
+            return
+        seen.add(guid)
+
+        if scan is not None and not scan.accept(guid, published_at):
+            return
+
+        items.append(ParsedWeb3Item(
+            title=title_text,
+            url=url,
+            published_at=published_at,
+            summary=summary,
+            author="ChainCatcher",
+            guid=guid,
+        ))
+
+    def _parse_html_lxml(
+        self, html_content: str, max_items: int, scan: Optional[WatermarkScan] = None
+    ) -> List[ParsedWeb3Item]:
+        """使用 lxml 增量解析"""
+        items: List[ParsedWeb3Item] = []
+        seen: Set[str] = set()
+
+        # 方法1: h3 闭合时记录它的容器，容器闭合（内容完整）后按文档顺序处理
+        stream = HtmlStream(html_content)
+        pending: Deque[Tuple[Any, Any]] = deque()
+        open_containers: Set[Any] = set()
+        candidates = 0
+
+        for element in stream:
+            if element.tag == 'h3':
+                if candidates < max_items * 2:  # 获取更多以便过滤
+                    candidates += 1
+                    container = first(_H3_CONTAINER, element)
+                    if container is not None:
+                        open_containers.add(container)
+                    pending.append((element, container))
+            elif element in open_containers:
+                open_containers.discard(element)
+
+            while pending and pending[0][1] not in open_containers:
+                h3, container = pending.popleft()
                 try:
-                    title_text = self.clean_text(h3.get_text())
+                    self._parse_h3_lxml(h3, container, items, seen, scan)
+                except Exception:
+                    continue
 
-                    # 清理标题中的无关后缀
-                    title_text = title_text.replace('微信扫码', '').strip()
+                if len(items) >= max_items or (scan is not None and scan.reached):
+                    # 已取够条目或到达上次抓取的位置，不再解析页面剩余部分
+                    return items
 
-                    # 过滤无效标题
-                    if not title_text or len(title_text) < 5:
-                        continue
+        # 方法2: 如果上面没有找到足够的内容，尝试其他选择器
+        root = stream.root()
+        if root is None:
+            return items
 
-                    # 跳过导航类标题
-                    if title_text in ['区块链快讯', '最新快讯', '精选事件', '快讯']:
-                        continue
+        for container in _NEWS_CONTAINERS(root):
+            if len(items) >= max_items:
+                break
 
-                    # 查找父元素中的链接
-                    parent = h3.find_parent(['div', 'article', 'li', 'a'])
-                    url = ""
+            try:
+                # 提取标题
+                title_elem = first(_CONTAINER_TITLE, container)
+                if title_elem is None:
+                    continue
 
-                    # 查找链接
-                    if parent:
-                        link_elem = parent.find('a', href=True)
-                        if link_elem:
-                            href = link_elem.get('href', '')
-                            url = self._build_url(href)
+                title_text = self._clean_title(element_text(title_elem))
+                if not title_text:
+                    continue
 
-                    # 如果 h3 本身在 a 标签内
-                    if not url:
-                        parent_a = h3.find_parent('a')
-                        if parent_a:
-                            url = self._build_url(parent_a.get('href', ''))
+                # 提取链接
+                link_elem = first(_FIRST_LINK, container)
+                url = self._build_url(link_elem.get('href', '')) if link_elem is not None else ""
+
+                self._append_item(items, seen, scan, title_text, url)
+
+            except Exception:
+                continue
+
+            if scan is not None and scan.reached:
+                break
+
+        return items
+
+    def _parse_h3_lxml(
+        self,
+        h3: Any,
+        container: Any,
+        items: List[ParsedWeb3Item],
+        seen: Set[str],
+        scan: Optional[WatermarkScan],
+    ) -> None:
+        """从 h3 及其容器元素解析一条快讯"""
+        title_text = self._clean_title(element_text(h3))
+        if not title_text:
+            return
+
+        # 查找容器中的链接
+        url = ""
+        if container is not None:
+            link_elem = first(_FIRST_LINK, container)
+            if link_elem is not None:
+                url = self._build_url(link_elem.get('href', ''))
+
+        # 如果 h3 本身在 a 标签内
+        if not url:
+            parent_a = first(_ANCESTOR_LINK, h3)
+            if parent_a is not None:
+                url = self._build_url(parent_a.get('href', ''))
+
+        published_at = None
+        summary = None
+        if container is not None:
+            # 查找时间信息
+            published_at = self._find_time(element_text(container))
+
+            # 提取摘要 - 查找标题后的内容段落
+            for elem in _SUMMARY_CANDIDATES(container):
+                summary = self._summary_of(element_text(elem), title_text)
+                if summary:
+                    break
+
+        self._append_item(items, seen, scan, title_text, url, published_at, summary)
+
+    def _parse_html_soup(
+        self, html_content: str, max_items: int, scan: Optional[WatermarkScan] = None
+    ) -> List[ParsedWeb3Item]:
+        """使用 BeautifulSoup 解析（未安装 lxml 时）"""
+        from bs4 import BeautifulSoup
+        soup = BeautifulSoup(html_content, 'html.parser')
+
+        items: List[ParsedWeb3Item] = []
+        seen: Set[str] = set()
+
+        # 方法1: 查找快讯列表中的 h3 标题元素
+        news_titles = soup.find_all('h3')
+
+        for h3 in news_titles[:max_items * 2]:  # 获取更多以便过滤
+            try:
+                title_text = self._clean_title(h3.get_text())
+                if not title_text:
+                    continue
 
+                # 查找父元素中的链接
+                parent = h3.find_parent(['div', 'article', 'li', 'a'])
+                url = ""
+
+                # 查找链接
+                if parent:
+                    link_elem = parent.find('a', href=True)
+                    if link_elem:
+                        url = self._build_url(link_elem.get('href', ''))
+
+                # 如果 h3 本身在 a 标签内
+                if not url:
+                    parent_a = h3.find_parent('a')
+                    if parent_a:
+                        url = self._build_url(parent_a.get('href', ''))
+
+                published_at = None
+                summary = None
+                if parent:
                     # 查找时间信息
-                    published_at = None
-                    if parent:
-                        # 查找包含时间的元素
-                        time_patterns = [
-                            r'\d{2}-\d{2}\s+\d{2}:\d{2}',  # 01-07 16:50
-                            r'\d{4}-\d{2}-\d{2}',  # 2026-01-07
-                            r'\d{2}:\d{2}',  # 16:50
-                        ]
-
-                        parent_text = parent.get_text()
-                        for pattern in time_patterns:
-                            match = re.search(pattern, parent_text)
-                            if match:
-                                time_str = match.group()
-                                published_at = self._parse_time_string(time_str)
-                                if published_at:
-                                    break
+                    published_at = self._find_time(parent.get_text())
 
                     # 提取摘要 - 查找标题后的内容段落
-                    summary = None
-                    if parent:
-                        # 查找可能的摘要元素
-                        for elem in parent.find_all(['p', 'div', 'span']):
-                            text = self.clean_text(elem.get_text())
-                            # 摘要通常以 "ChainCatcher 消息" 开头
-                            if text and len(text) > 20 and text != title_text:
-                                if 'ChainCatcher' in text or len(text) > 50:
-                                    summary = text[:500] + "..." if len(text) > 500 else text
-                                    break
-
-                    guid = self.generate_guid(url or title_text, title_text)
-
-                    # 检查是否重复
-                    if any(item.guid == guid for item in items):
-                        continue
+                    for elem in parent.find_all(['p', 'div', 'span']):
+                        summary = self._summary_of(elem.get_text(), title_text)
+                        if summary:
+                            break
 
-                    items.append(ParsedWeb3Item(
-                        title=title_text,
-                        url=url,
-                        published_at=published_at,
-                        summary=summary,
-                        author="ChainCatcher",
-                        guid=guid,
-                    ))
+                self._append_item(items, seen, scan, title_text, url, published_at, summary)
 
-                    if len(items) >= max_items:
-                        break
+                if len(items) >= max_items or (scan is not None and scan.reached):
+                    break
 
-                except Exception as e:
-                    continue
+            except Exception:
+                continue
+
+        # 方法2: 如果上面没有找到足够的内容，尝试其他选择器
+        if len(items) < max_items and not (scan is not None and scan.reached):
+            # 查找所有可能的新闻容器
+            containers = soup.select('[class*="news"], [class*="flash"], [class*="item"]')
+
+            for container in containers:
+                if len(items) >= max_items:
+                    break
 
-            # 方法2: 如果上面没有找到足够的内容，尝试其他选择器
-            if len(items) < max_items:
-                # 查找所有可能的新闻容器
-                containers = soup.select('[class*="news"], [class*="flash"], [class*="item"]')
-
-                for container in containers:
-                    if len(items) >= max_items:
-                        break
-
-                    try:
-                        # 提取标题
-                        title_elem = container.select_one('h3, h4, .title, a')
-                        if not title_elem:
-                            continue
-
-                        title_text = self.clean_text(title_elem.get_text())
-                        # 清理标题中的无关后缀
-                        title_text = title_text.replace('微信扫码', '').strip()
-                        if not title_text or len(title_text) < 5:
-                            continue
-
-                        # 跳过导航类标题
-                        if title_text in ['区块链快讯', '最新快讯', '精选事件', '快讯']:
-                            continue
-
-                        # 提取链接
-                        link_elem = container.select_one('a[href]')
-                        url = ""
-                        if link_elem:
-                            url = self._build_url(link_elem.get('href', ''))
-
-                        guid = self.generate_guid(url or title_text, title_text)
-
-                        # 检查是否重复
-                        if any(item.guid == guid for item in items):
-                            continue
-
-                        items.append(ParsedWeb3Item(
-                            title=title_text,
-                            url=url,
-                            published_at=None,
-                            summary=None,
-                            author="ChainCatcher",
-                            guid=guid,
-                        ))
-
-                    except Exception:
+                try:
+                    # 提取标题
+                    title_elem = container.select_one('h3, h4, .title, a')
+                    if not title_elem:
                         continue
 
-            print(f"[ChainCatcher] 从 HTML 解析获取 {len(items)} 条新闻")
+                    title_text = self._clean_title(title_elem.get_text())
+                    if not title_text:
+                        continue
 
-        except Exception as e:
-            print(f"[ChainCatcher] HTML 抓取失败: {e}")
-            import traceback
-            traceback.print_exc()
+                    # 提取链接
+                    link_elem = container.select_one('a[href]')
+                    url = ""
+                    if link_elem:
+                        url = self._build_url(link_elem.get('href', ''))
+
+                    self._append_item(items, seen, scan, title_text, url)
+
+                except Exception:
+                    continue
+
+                if scan is not None and scan.reached:
+                    break
 
         return items
 
@@ -256,22 +449,22 @@ class ChainCatcherCrawler(Web3Crawler):
             now = datetime.now()
 
             # 格式: 01-07 16:50
-            if re.match(r'\d{2}-\d{2}\s+\d{2}:\d{2}', time_str):
+            if self._MONTH_DAY_TIME.match(time_str):
                 dt = datetime.strptime(f"{now.year}-{time_str}", "%Y-%m-%d %H:%M")
                 return dt.isoformat()
 
             # 格式: 2026-01-07
-            if re.match(r'\d{4}-\d{2}-\d{2}', time_str):
+            if self._DATE.match(time_str):
                 dt = datetime.strptime(time_str, "%Y-%m-%d")
                 return dt.isoformat()
 
             # 格式: 2026-01-07 16:50
-            if re.match(r'\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}', time_str):
+            if self._DATE_TIME.match(time_str):
                 dt = datetime.strptime(time_str, "%Y-%m-%d %H:%M")
                 return dt.isoformat()
 
             # 格式: 16:50 (只有时间，使用今天日期)
-            if re.match(r'^\d{2}:\d{2}$', time_str):
+            if self._TIME_ONLY.match(time_str):
                 dt = datetime.strptime(f"{now.strftime('%Y-%m-%d')} {time_str}", "%Y-%m-%d %H:%M")
                 return dt.isoformat()
 
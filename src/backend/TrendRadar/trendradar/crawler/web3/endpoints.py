@@ -0,0 +1,116 @@
+# coding=utf-8
+"""
+Web3 爬虫接口端点记忆
+
+部分站点（如 ME News）的 API 地址经常变动，爬虫需要依次尝试多个候选端点。
+EndpointMemory 记录每组候选中上次返回有效数据的端点（下次优先尝试），
+并对连续失败的端点熔断：连续失败 failure_threshold 次后在 cooldown_seconds 内跳过，
+冷却结束后允许再试一次，成功即恢复，失败则重新熔断。
+
+状态可保存到 JSON 文件，跨进程运行保留：
+    {
+        "preferred": {"news": "https://www.me.news/api/news/list"},
+        "endpoints": {"https://...": {"failures": 3, "open_until": 1767225600.0}}
+    }
+"""
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+
+class EndpointMemory:
+    """接口端点记忆（优先端点 + 熔断器）"""
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        failure_threshold: int = 3,
+        cooldown_seconds: float = 1800,
+    ):
+        """
+        初始化端点记忆
+
+        Args:
+            path: 状态文件路径（不设置时只在进程内记忆）
+            failure_threshold: 连续失败多少次后熔断
+            cooldown_seconds: 熔断冷却时间（秒）
+        """
+        self.path = Path(path) if path else None
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown_seconds = cooldown_seconds
+        self._lock = threading.Lock()
+        self._preferred: Dict[str, str] = {}
+        self._endpoints: Dict[str, Dict[str, float]] = {}
+        self._load()
+
+    def _load(self) -> None:
+        """从状态文件加载"""
+        if not self.path or not self.path.exists():
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            self._preferred = dict(state.get("preferred", {}))
+            self._endpoints = dict(state.get("endpoints", {}))
+        except Exception as e:
+            print(f"[Web3] 加载端点记忆失败: {e}")
+
+    def save(self) -> None:
+        """保存状态到文件"""
+        if not self.path:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self._lock:
+                state = {"preferred": dict(self._preferred), "endpoints": dict(self._endpoints)}
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f, ensure_ascii=False, indent=2)
+            tmp_path.replace(self.path)
+        except Exception as e:
+            print(f"[Web3] 保存端点记忆失败: {e}")
+
+    def is_open(self, url: str) -> bool:
+        """端点是否处于熔断冷却期"""
+        with self._lock:
+            state = self._endpoints.get(url)
+            return bool(state) and state.get("open_until", 0) > time.time()
+
+    def preferred(self, group: str) -> Optional[str]:
+        """获取一组候选中上次成功的端点"""
+        with self._lock:
+            return self._preferred.get(group)
+
+    def order(self, group: str, candidates: List[str]) -> List[str]:
+        """
+        排列候选端点：上次成功的端点在前，跳过熔断中的端点
+
+        Args:
+            group: 候选组名（如 "news"、"flash"）
+            candidates: 按配置顺序排列的候选端点
+
+        Returns:
+            可尝试的端点列表
+        """
+        preferred = self.preferred(group)
+        ordered = sorted(candidates, key=lambda url: url != preferred)
+        return [url for url in ordered if not self.is_open(url)]
+
+    def record_success(self, group: str, url: str) -> None:
+        """记录端点返回了有效数据"""
+        with self._lock:
+            self._preferred[group] = url
+            self._endpoints.pop(url, None)
+
+    def record_failure(self, url: str) -> None:
+        """记录端点请求失败或数据无效，连续失败达到阈值时熔断"""
+        with self._lock:
+            state = self._endpoints.setdefault(url, {"failures": 0, "open_until": 0})
+            state["failures"] = state.get("failures", 0) + 1
+            if state["failures"] >= self.failure_threshold:
+                state["open_until"] = time.time() + self.cooldown_seconds
+                print(f"[Web3] {url} 连续失败 {state['failures']} 次，"
+                      f"{self.cooldown_seconds / 60:.0f} 分钟内跳过")
@@ -0,0 +1,156 @@
+# coding=utf-8
+"""
+Web3 爬虫 HTML 提取引擎
+
+ChainCatcher / ME News 的 HTML 抓取原先用 BeautifulSoup(html.parser) 构建完整的文档树，
+再对每个候选元素做 find_all / find_parent / select 查找。这里改用 lxml：
+
+- 选择器预编译为 XPath（CSS 选择器按 soupsieve 的语义改写，结果同样按文档顺序）
+- element_text 与 BeautifulSoup 的 get_text() 一致（不含注释、script、style 中的文字）
+- HtmlStream 增量解析：按文档顺序产出已闭合的元素，调用方取够条目后即可停止解析，
+  不再解析页面剩余部分
+
+依赖 lxml（可选）：未安装时 HAS_LXML 为 False，由爬虫使用 BeautifulSoup 实现。
+"""
+
+from typing import Any, Iterator, List, Optional
+
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+    HAS_LXML = True
+except ImportError:
+    etree = None
+    lxml_html = None
+    HAS_LXML = False
+
+
+# 增量解析每次送入解析器的字符数
+STREAM_CHUNK_SIZE = 16 * 1024
+
+
+def has_class(name: str) -> str:
+    """CSS `.name` 对应的 XPath 条件（class 属性包含该类名）"""
+    return f'contains(concat(" ", normalize-space(@class), " "), " {name} ")'
+
+
+def class_contains(text: str) -> str:
+    """CSS `[class*="text"]` 对应的 XPath 条件（class 属性包含该子串）"""
+    return f'contains(@class, "{text}")'
+
+
+def compile_xpath(expression: str) -> Any:
+    """预编译 XPath（返回普通字符串，不生成 smart string）"""
+    return etree.XPath(expression, smart_strings=False)
+
+
+if HAS_LXML:
+    _TEXT_NODES = compile_xpath(".//text()[not(parent::script or parent::style)]")
+
+
+def element_text(element: Any) -> str:
+    """
+    元素的文本内容（等价于 BeautifulSoup 的 get_text()）
+
+    Args:
+        element: lxml 元素
+
+    Returns:
+        所有后代文本节点按文档顺序拼接的字符串
+    """
+    return "".join(_TEXT_NODES(element))
+
+
+def first(xpath: Any, element: Any) -> Optional[Any]:
+    """XPath 的第一个结果（没有结果时返回 None）"""
+    found = xpath(element)
+    return found[0] if found else None
+
+
+def parse_document(html_content: str) -> Optional[Any]:
+    """
+    完整解析 HTML 文档
+
+    Args:
+        html_content: HTML 文本
+
+    Returns:
+        文档根元素，内容为空或无法解析时返回 None
+    """
+    if not html_content or not html_content.strip():
+        return None
+    try:
+        return lxml_html.document_fromstring(html_content)
+    except (etree.ParserError, ValueError):
+        return None
+
+
+class HtmlStream:
+    """
+    增量 HTML 解析
+
+    迭代时分块送入 lxml 的 HTMLPullParser，按文档顺序产出已闭合（end 事件）的元素。
+    产出某个元素时，它的全部后代都已解析完毕，祖先元素已存在但尚未闭合。
+    停止迭代即停止解析；需要完整文档时调用 root()。
+    """
+
+    def __init__(self, html_content: str, chunk_size: int = STREAM_CHUNK_SIZE):
+        """
+        Args:
+            html_content: HTML 文本
+            chunk_size: 每次送入解析器的字符数
+        """
+        self.html_content = html_content or ""
+        self.chunk_size = chunk_size
+        self._parser = etree.HTMLPullParser(events=("end",))
+        self._position = 0
+        self._closed = False
+        self._root = None
+
+    def __iter__(self) -> Iterator[Any]:
+        while self._position < len(self.html_content):
+            chunk = self.html_content[self._position:self._position + self.chunk_size]
+            self._position += len(chunk)
+            self._parser.feed(chunk)
+            for _, element in self._parser.read_events():
+                yield element
+
+        if not self._closed:
+            self._close()
+            for _, element in self._parser.read_events():
+                yield element
+
+    def _close(self) -> None:
+        self._closed = True
+        try:
+            self._root = self._parser.close()
+        except etree.XMLSyntaxError:
+            self._root = None
+
+    def root(self) -> Optional[Any]:
+        """解析剩余内容并返回文档根元素（内容为空时返回 None）"""
+        if not self._closed:
+            if self._position < len(self.html_content):
+                self._parser.feed(self.html_content[self._position:])
+                self._position = len(self.html_content)
+            self._close()
+        return self._root
+
+
+def first_matching(xpaths: List[Any], root: Any, min_count: int = 0) -> List[Any]:
+    """
+    依次尝试多个选择器，返回第一个匹配数量超过 min_count 的结果
+
+    Args:
+        xpaths: 预编译的 XPath 列表
+        root: 文档根元素
+        min_count: 匹配数量需要超过的值
+
+    Returns:
+        匹配的元素列表，均不满足时返回空列表
+    """
+    for xpath in xpaths:
+        found = xpath(root)
+        if found and len(found) > min_count:
+            return found
+    return []
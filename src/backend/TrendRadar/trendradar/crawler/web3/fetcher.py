@@ -10,17 +10,24 @@ Web3 信息源爬虫抓取器
 import time
 import random
 import hashlib
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple, Any
+from pathlib import Path
+from typing import List, Dict, Iterable, Optional, Tuple, Any
 
 import requests
 from bs4 import BeautifulSoup
 
+from trendradar.crawler.parsing import ParseStage, parse_web3_html
 from trendradar.storage.base import RSSItem, RSSData
+from trendradar.utils.ratelimit import HostRateLimiter
 from trendradar.utils.time import get_configured_time, is_within_days, DEFAULT_TIMEZONE
 
+from .watermark import Watermark, WatermarkScan, WatermarkStore
+
 
 @dataclass
 class Web3FeedConfig:
@@ -80,6 +87,9 @@ class Web3Crawler(ABC):
         self.max_retries = max_retries
         self.session = self._create_session()
 
+        # 解析阶段（由 Web3Fetcher 设置，不设置时在当前线程解析）
+        self.parse_stage: Optional[ParseStage] = None
+
     def _create_session(self) -> requests.Session:
         """创建请求会话"""
         session = requests.Session()
@@ -119,18 +129,22 @@ class Web3Crawler(ABC):
                     return None
         return None
 
-    def fetch_json(self, url: str, params: Optional[Dict] = None) -> Optional[Dict]:
+    def fetch_json(
+        self, url: str, params: Optional[Dict] = None, max_retries: Optional[int] = None
+    ) -> Optional[Dict]:
         """
         获取 JSON 数据
 
         Args:
             url: API URL
             params: 请求参数
+            max_retries: 最大尝试次数（默认使用 self.max_retries）
 
         Returns:
             JSON 数据，失败返回 None
         """
-        for attempt in range(self.max_retries):
+        max_retries = max_retries or self.max_retries
+        for attempt in range(max_retries):
             try:
                 headers = self.DEFAULT_HEADERS.copy()
                 headers["Accept"] = "application/json"
@@ -144,7 +158,7 @@ class Web3Crawler(ABC):
                 response.raise_for_status()
                 return response.json()
             except (requests.RequestException, ValueError) as e:
-                if attempt < self.max_retries - 1:
+                if attempt < max_retries - 1:
                     wait_time = (attempt + 1) * 2 + random.uniform(0, 1)
                     print(f"[Web3] JSON 请求失败: {e}, {wait_time:.1f}秒后重试...")
                     time.sleep(wait_time)
@@ -154,18 +168,54 @@ class Web3Crawler(ABC):
         return None
 
     @abstractmethod
-    def crawl(self, max_items: int = 50) -> List[ParsedWeb3Item]:
+    def crawl(self, max_items: int = 50, watermark: Optional[Watermark] = None) -> List[ParsedWeb3Item]:
         """
         抓取新闻列表
 
         Args:
             max_items: 最大条目数
+            watermark: 增量抓取水位，设置时跳过已抓取过的条目，到达水位后停止翻页与解析
+
+        Returns:
+            解析后的新闻条目列表
+        """
+        pass
+
+    @abstractmethod
+    def parse_html(
+        self, html_content: str, max_items: int = 50, scan: Optional[WatermarkScan] = None
+    ) -> List[ParsedWeb3Item]:
+        """
+        解析页面 HTML
+
+        Args:
+            html_content: 页面 HTML
+            max_items: 最大条目数
+            scan: 增量抓取的水位扫描
 
         Returns:
             解析后的新闻条目列表
         """
         pass
 
+    def parse_page(
+        self, html_content: str, max_items: int = 50, scan: Optional[WatermarkScan] = None
+    ) -> Tuple[List[ParsedWeb3Item], Optional[WatermarkScan]]:
+        """
+        解析页面 HTML（设置了解析阶段时交给解析进程，抓取线程不执行解析）
+
+        Args:
+            html_content: 页面 HTML
+            max_items: 最大条目数
+            scan: 增量抓取的水位扫描
+
+        Returns:
+            (解析后的新闻条目列表, 扫描结束后的水位扫描) 元组
+        """
+        if self.parse_stage is None:
+            return self.parse_html(html_content, max_items, scan), scan
+        return self.parse_stage.run(parse_web3_html, html_content, self.source_id, max_items, scan)
+
     @property
     @abstractmethod
     def source_id(self) -> str:
@@ -200,7 +250,17 @@ class Web3Crawler(ABC):
 
 
 class Web3Fetcher:
-    """Web3 信息源抓取器"""
+    """
+    Web3 信息源抓取器
+
+    不同站点的信息源并行抓取；同一站点（按信息源 URL 的主机名区分）的信息源
+    由 host_limiter 控制，彼此之间仍遵守 request_interval。
+
+    启用增量抓取时，每个信息源记录已抓取条目的水位（WatermarkStore），
+    之后的抓取只输出新条目，到达水位即停止翻页与解析。
+    抓取到的条目先作为待提交的水位保留，调用方在条目处理完成（如推送成功）后
+    调用 commit_watermarks() 才写入水位；未提交的条目下次抓取时会再次输出。
+    """
 
     def __init__(
         self,
@@ -212,19 +272,29 @@ class Web3Fetcher:
         timezone: str = DEFAULT_TIMEZONE,
         freshness_enabled: bool = True,
         default_max_age_days: int = 3,
+        max_workers: int = 4,
+        max_per_host: int = 1,
+        cache_dir: Optional[str] = None,
+        incremental: bool = True,
+        parse_workers: int = 0,
     ):
         """
         初始化抓取器
 
         Args:
             feeds: Web3 源配置列表
-            request_interval: 请求间隔（毫秒）
+            request_interval: 同一站点的请求间隔（毫秒）
             timeout: 请求超时（秒）
             use_proxy: 是否使用代理
             proxy_url: 代理 URL
             timezone: 时区配置
             freshness_enabled: 是否启用新鲜度过滤
             default_max_age_days: 默认最大文章年龄（天）
+            max_workers: 并行抓取的线程数（1 表示串行）
+            max_per_host: 同一站点的最大并发抓取数
+            cache_dir: 爬虫状态目录（如 ME News 的端点记忆、增量抓取水位），不设置时只在进程内保留
+            incremental: 是否增量抓取（只输出上次抓取之后的新条目）
+            parse_workers: 页面解析进程数（0 表示在抓取线程内解析）
         """
         self.feeds = [f for f in feeds if f.enabled]
         self.request_interval = request_interval
@@ -234,9 +304,31 @@ class Web3Fetcher:
         self.timezone = timezone
         self.freshness_enabled = freshness_enabled
         self.default_max_age_days = default_max_age_days
+        self.max_workers = max_workers
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.incremental = incremental
+
+        # 增量抓取水位
+        self.watermarks: Optional[WatermarkStore] = None
+        if incremental:
+            self.watermarks = WatermarkStore(self.cache_dir / "watermarks.json" if self.cache_dir else None)
+        # 待提交的水位：信息源 ID -> 本次抓取到的条目
+        self._pending_watermarks: Dict[str, List[ParsedWeb3Item]] = {}
+        self._pending_lock = threading.Lock()
+
+        # 同一站点的信息源之间保持请求间隔（原有的 ±0.5 秒随机抖动）
+        self.host_limiter = HostRateLimiter(
+            request_interval,
+            jitter_ms=(-500, 500),
+            max_per_host=max_per_host,
+        )
+
+        # 页面解析阶段
+        self.parse_stage = ParseStage(parse_workers, name="Web3")
 
         # 爬虫实例缓存
         self._crawlers: Dict[str, Web3Crawler] = {}
+        self._crawlers_lock = threading.Lock()
 
     def _get_crawler(self, crawler_type: str) -> Optional[Web3Crawler]:
         """
@@ -248,9 +340,16 @@ class Web3Fetcher:
         Returns:
             爬虫实例
         """
-        if crawler_type in self._crawlers:
+        with self._crawlers_lock:
+            if crawler_type not in self._crawlers:
+                crawler = self._create_crawler(crawler_type)
+                if not crawler:
+                    return None
+                self._crawlers[crawler_type] = crawler
             return self._crawlers[crawler_type]
 
+    def _create_crawler(self, crawler_type: str) -> Optional[Web3Crawler]:
+        """创建爬虫实例"""
         crawler = None
 
         if crawler_type == "chaincatcher":
@@ -261,16 +360,18 @@ class Web3Fetcher:
                 proxy_url=self.proxy_url,
             )
         elif crawler_type == "menews":
+            from .endpoints import EndpointMemory
             from .menews import MeNewsCrawler
+            state_path = self.cache_dir / "menews_endpoints.json" if self.cache_dir else None
             crawler = MeNewsCrawler(
                 timeout=self.timeout,
                 use_proxy=self.use_proxy,
                 proxy_url=self.proxy_url,
+                endpoint_memory=EndpointMemory(state_path),
             )
 
-        if crawler:
-            self._crawlers[crawler_type] = crawler
-
+        if crawler and self.parse_stage.max_workers > 0:
+            crawler.parse_stage = self.parse_stage
         return crawler
 
     def fetch_feed(self, feed: Web3FeedConfig) -> Tuple[List[RSSItem], Optional[str]]:
@@ -288,7 +389,12 @@ class Web3Fetcher:
             if not crawler:
                 return [], f"未知的爬虫类型: {feed.crawler_type}"
 
-            parsed_items = crawler.crawl(max_items=feed.max_items)
+            watermark = self.watermarks.get(feed.id) if self.watermarks else None
+            with self.host_limiter.limit(feed.url or feed.crawler_type):
+                parsed_items = crawler.crawl(max_items=feed.max_items, watermark=watermark)
+            if self.watermarks:
+                with self._pending_lock:
+                    self._pending_watermarks[feed.id] = parsed_items
 
             # 转换为 RSSItem
             now = get_configured_time(self.timezone)
@@ -311,7 +417,10 @@ class Web3Fetcher:
                 )
                 items.append(item)
 
-            print(f"[Web3] {feed.name}: 获取 {len(items)} 条")
+            if watermark is not None and not watermark.is_empty:
+                print(f"[Web3] {feed.name}: 获取 {len(items)} 条新条目")
+            else:
+                print(f"[Web3] {feed.name}: 获取 {len(items)} 条")
             return items, None
 
         except Exception as e:
@@ -337,15 +446,19 @@ class Web3Fetcher:
 
         print(f"[Web3] 开始抓取 {len(self.feeds)} 个 Web3 信息源...")
 
-        for i, feed in enumerate(self.feeds):
-            # 请求间隔
-            if i > 0:
-                interval = self.request_interval / 1000
-                jitter = random.uniform(-0.5, 0.5)
-                time.sleep(interval + jitter)
-
-            items, error = self.fetch_feed(feed)
+        # 并行抓取：同一站点的请求间隔和并发数由 host_limiter 控制
+        try:
+            if self.max_workers > 1 and len(self.feeds) > 1:
+                workers = min(self.max_workers, len(self.feeds))
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="web3") as executor:
+                    outcomes = list(executor.map(self.fetch_feed, self.feeds))
+            else:
+                outcomes = [self.fetch_feed(feed) for feed in self.feeds]
+        finally:
+            self.parse_stage.shutdown()
 
+        # 按配置顺序汇总结果
+        for feed, (items, error) in zip(self.feeds, outcomes):
             id_to_name[feed.id] = feed.name
 
             if error:
@@ -364,6 +477,41 @@ class Web3Fetcher:
             failed_ids=failed_ids,
         )
 
+    def commit_watermarks(self, handled: Optional[Iterable[Tuple[str, str]]] = None) -> None:
+        """
+        提交本次抓取的水位并保存
+
+        应在抓取到的条目处理完成（如推送成功）后调用；不调用时水位不变，
+        下次抓取会再次输出这些条目。
+
+        指定 handled 时只提交已处理的条目：每个信息源按列表顺序（最新在前）
+        只提交最后一个未处理条目之后的条目，否则下次抓取会在到达水位后停止，
+        漏掉未处理的条目。未提交的已处理条目下次会再次输出，由调用方去重。
+
+        Args:
+            handled: 已处理条目的 (信息源 ID, URL) 集合，为 None 时提交全部条目
+        """
+        if not self.watermarks:
+            return
+        with self._pending_lock:
+            pending, self._pending_watermarks = self._pending_watermarks, {}
+        if not pending:
+            return
+        handled_keys = set(handled) if handled is not None else None
+        for source_id, items in pending.items():
+            if handled_keys is not None:
+                for i in range(len(items) - 1, -1, -1):
+                    if (source_id, items[i].url) not in handled_keys:
+                        items = items[i + 1:]
+                        break
+            self.watermarks.update(source_id, items)
+        self.watermarks.save()
+
+    def discard_watermarks(self) -> None:
+        """丢弃本次抓取的待提交水位"""
+        with self._pending_lock:
+            self._pending_watermarks.clear()
+
     @classmethod
     def from_config(cls, config: Dict) -> "Web3Fetcher":
         """
@@ -412,4 +560,9 @@ class Web3Fetcher:
             timezone=config.get("timezone", DEFAULT_TIMEZONE),
             freshness_enabled=freshness_enabled,
             default_max_age_days=default_max_age_days,
+            max_workers=config.get("max_workers", 4),
+            max_per_host=config.get("max_per_host", 1),
+            cache_dir=config.get("cache_dir"),
+            incremental=config.get("incremental", True),
+            parse_workers=config.get("parse_workers", 0),
         )
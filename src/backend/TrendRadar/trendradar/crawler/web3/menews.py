@@ -10,14 +10,63 @@ ME News (原 MetaEra) 是香港 Web3.0 媒体平台，提供区块链行业资
 """
 
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Optional, Dict, Any
-
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .endpoints import EndpointMemory
+from .extract import (
+    HAS_LXML,
+    class_contains,
+    compile_xpath,
+    element_text,
+    first,
+    first_matching,
+    has_class,
+    parse_document,
+)
 from .fetcher import Web3Crawler, ParsedWeb3Item
+from .watermark import Watermark, WatermarkScan
+
+
+if HAS_LXML:
+    # 新闻列表项选择器（按顺序尝试，与 BeautifulSoup 实现的 CSS 选择器一一对应）
+    _LIST_ITEMS = [
+        compile_xpath(f'//*[{has_class("news-item")}]'),        # .news-item
+        compile_xpath(f'//*[{has_class("article-item")}]'),     # .article-item
+        compile_xpath(f'//*[{class_contains("news-list")}]/*'),     # [class*="news-list"] > *
+        compile_xpath(f'//*[{class_contains("article-list")}]/*'),  # [class*="article-list"] > *
+        compile_xpath('//article'),                             # article
+        compile_xpath(f'//*[{has_class("card")}]'),             # .card
+        compile_xpath(f'//*[{class_contains("item")}]'),        # [class*="item"]
+    ]
+    # h1, h2, h3, h4, .title, [class*="title"], a[href]
+    _ITEM_TITLE = compile_xpath(
+        f'(.//*[self::h1 or self::h2 or self::h3 or self::h4 or {class_contains("title")}'
+        f' or (self::a and @href)])[1]'
+    )
+    # a[href]
+    _ITEM_LINK = compile_xpath('(.//a[@href])[1]')
+    # [class*="time"], [class*="date"], time, [datetime]
+    _ITEM_TIME = compile_xpath(
+        f'(.//*[{class_contains("time")} or {class_contains("date")} or self::time or @datetime])[1]'
+    )
+    # .summary, .desc, .description, .content, p
+    _ITEM_SUMMARY = compile_xpath(
+        f'(.//*[{has_class("summary")} or {has_class("desc")} or {has_class("description")}'
+        f' or {has_class("content")} or self::p])[1]'
+    )
 
 
 class MeNewsCrawler(Web3Crawler):
-    """ME News (MetaEra) 爬虫"""
+    """
+    ME News (MetaEra) 爬虫
+
+    API 地址经常变动，各组候选端点通过 EndpointMemory 记住上次可用的端点并优先请求，
+    其余候选端点并发请求，连续失败的端点熔断一段时间。
+
+    增量抓取（设置水位）时每页只请求 INCREMENTAL_PAGE_SIZE 条，未到达水位时继续翻页。
+    """
 
     # API 接口地址 (需要根据实际情况调整)
     NEWS_API_URL = "https://www.me.news/api/news/list"
@@ -32,6 +81,31 @@ class MeNewsCrawler(Web3Crawler):
     BASE_URL = "https://www.me.news"
     LEGACY_BASE_URL = "https://metaera.media"
 
+    # 增量抓取时的每页条数与最大页数
+    INCREMENTAL_PAGE_SIZE = 10
+    MAX_PAGES = 10
+
+    def __init__(
+        self,
+        timeout: int = 30,
+        use_proxy: bool = False,
+        proxy_url: str = "",
+        max_retries: int = 3,
+        endpoint_memory: Optional[EndpointMemory] = None,
+    ):
+        """
+        初始化爬虫
+
+        Args:
+            timeout: 请求超时（秒）
+            use_proxy: 是否使用代理
+            proxy_url: 代理 URL
+            max_retries: 最大重试次数（HTML 抓取使用，API 端点改为并发请求不重试）
+            endpoint_memory: 端点记忆（不设置时只在进程内记忆）
+        """
+        super().__init__(timeout=timeout, use_proxy=use_proxy, proxy_url=proxy_url, max_retries=max_retries)
+        self.endpoints = endpoint_memory or EndpointMemory()
+
     @property
     def source_id(self) -> str:
         return "menews"
@@ -40,188 +114,285 @@ class MeNewsCrawler(Web3Crawler):
     def source_name(self) -> str:
         return "ME News"
 
-    def crawl(self, max_items: int = 50) -> List[ParsedWeb3Item]:
+    def crawl(self, max_items: int = 50, watermark: Optional[Watermark] = None) -> List[ParsedWeb3Item]:
         """
         抓取 ME News 新闻
 
         Args:
             max_items: 最大条目数
+            watermark: 增量抓取水位
 
         Returns:
             解析后的新闻条目列表
         """
         items = []
 
-        # 1. 尝试从主 API 获取新闻
-        news_items = self._fetch_news(max_items)
-        items.extend(news_items)
+        # 1. 尝试从主 API 获取新闻（None 表示接口不可用，空列表表示没有新条目）
+        news_items = self._fetch_news(max_items, watermark)
 
         # 2. 如果主 API 失败，尝试备用 API
-        if not items:
+        if news_items is None:
             print("[MeNews] 主 API 无数据，尝试备用 API...")
-            news_items = self._fetch_news_legacy(max_items)
-            items.extend(news_items)
+            news_items = self._fetch_news_legacy(max_items, watermark)
 
         # 3. 如果 API 都失败，尝试 HTML 抓取
-        if not items:
+        if news_items is None:
             print("[MeNews] API 无数据，尝试 HTML 抓取...")
-            html_items = self.crawl_by_html(max_items)
-            items.extend(html_items)
+            news_items = self.crawl_by_html(max_items, watermark)
+        items.extend(news_items)
 
         # 4. 补充快讯数据
         if len(items) < max_items:
             remaining = max_items - len(items)
-            flash_items = self._fetch_flash(remaining)
+            flash_items = self._fetch_flash(remaining, watermark)
             items.extend(flash_items)
 
+        self.endpoints.save()
         return items[:max_items]
 
-    def _fetch_news(self, max_items: int = 50) -> List[ParsedWeb3Item]:
+    def _fetch_news(
+        self, max_items: int = 50, watermark: Optional[Watermark] = None
+    ) -> Optional[List[ParsedWeb3Item]]:
         """
         从主 API 获取新闻列表
 
         Args:
             max_items: 最大条目数
+            watermark: 增量抓取水位
 
         Returns:
-            新闻条目列表
+            新闻条目列表，所有端点都不可用时返回 None
         """
-        items = []
+        # 尝试多种 API 路径
+        api_urls = [
+            self.NEWS_API_URL,
+            f"{self.BASE_URL}/api/v1/news/list",
+            f"{self.BASE_URL}/api/v1/article/list",
+            f"{self.BASE_URL}/api/news",
+        ]
 
         try:
-            # 尝试多种 API 路径
-            api_urls = [
-                self.NEWS_API_URL,
-                f"{self.BASE_URL}/api/v1/news/list",
-                f"{self.BASE_URL}/api/v1/article/list",
-                f"{self.BASE_URL}/api/news",
-            ]
-
-            for api_url in api_urls:
-                params = {
-                    "page": 1,
-                    "pageSize": max_items,
-                    "size": max_items,
-                    "limit": max_items,
-                }
-
-                data = self.fetch_json(api_url, params=params)
-
-                if data and self._has_valid_data(data):
-                    news_list = self._extract_list_from_response(data)
-
-                    if news_list:
-                        for news in news_list:
-                            item = self._parse_news_item(news)
-                            if item:
-                                items.append(item)
-
-                            if len(items) >= max_items:
-                                break
-
-                        if items:
-                            print(f"[MeNews] 从 {api_url} 获取 {len(items)} 条新闻")
-                            break
-
+            items, api_url = self._fetch_pages(
+                "news", api_urls, ("pageSize", "size", "limit"), self._parse_news_item, max_items, watermark
+            )
+            if api_url:
+                print(f"[MeNews] 从 {api_url} 获取 {len(items)} 条新闻")
+            return items
         except Exception as e:
             print(f"[MeNews] 获取新闻失败: {e}")
+            return None
 
-        return items
-
-    def _fetch_news_legacy(self, max_items: int = 50) -> List[ParsedWeb3Item]:
+    def _fetch_news_legacy(
+        self, max_items: int = 50, watermark: Optional[Watermark] = None
+    ) -> Optional[List[ParsedWeb3Item]]:
         """
         从备用 API 获取新闻列表
 
         Args:
             max_items: 最大条目数
+            watermark: 增量抓取水位
 
         Returns:
-            新闻条目列表
+            新闻条目列表，所有端点都不可用时返回 None
         """
-        items = []
+        api_urls = [
+            self.LEGACY_NEWS_API,
+            self.LEGACY_FLASH_API,
+            f"{self.LEGACY_BASE_URL}/api/news/list",
+        ]
 
         try:
-            api_urls = [
-                self.LEGACY_NEWS_API,
-                self.LEGACY_FLASH_API,
-                f"{self.LEGACY_BASE_URL}/api/news/list",
-            ]
+            items, api_url = self._fetch_pages(
+                "legacy", api_urls, ("pageSize",), self._parse_news_item, max_items, watermark
+            )
+            if api_url:
+                print(f"[MeNews] 从备用 API {api_url} 获取 {len(items)} 条新闻")
+            return items
+        except Exception as e:
+            print(f"[MeNews] 备用 API 获取失败: {e}")
+            return None
 
-            for api_url in api_urls:
-                params = {
-                    "page": 1,
-                    "pageSize": max_items,
-                }
+    def _fetch_flash(self, max_items: int = 20, watermark: Optional[Watermark] = None) -> List[ParsedWeb3Item]:
+        """
+        获取快讯列表
 
-                data = self.fetch_json(api_url, params=params)
+        Args:
+            max_items: 最大条目数
+            watermark: 增量抓取水位
 
-                if data and self._has_valid_data(data):
-                    news_list = self._extract_list_from_response(data)
+        Returns:
+            快讯条目列表
+        """
+        api_urls = [
+            self.FLASH_API_URL,
+            f"{self.BASE_URL}/api/v1/flash/list",
+            f"{self.BASE_URL}/api/flash",
+        ]
+
+        try:
+            items, _ = self._fetch_pages(
+                "flash", api_urls, ("pageSize",), self._parse_flash_item, max_items, watermark
+            )
+            return items or []
+        except Exception as e:
+            print(f"[MeNews] 获取快讯失败: {e}")
+            return []
 
-                    if news_list:
-                        for news in news_list:
-                            item = self._parse_news_item(news)
-                            if item:
-                                items.append(item)
+    def _fetch_pages(
+        self,
+        group: str,
+        api_urls: List[str],
+        size_keys: Tuple[str, ...],
+        parse_func: Callable[[Dict[str, Any]], Optional[ParsedWeb3Item]],
+        max_items: int,
+        watermark: Optional[Watermark] = None,
+    ) -> Tuple[Optional[List[ParsedWeb3Item]], Optional[str]]:
+        """
+        分页获取一组候选端点的数据
 
-                            if len(items) >= max_items:
-                                break
+        未设置水位（或首次抓取）时只请求一页 max_items 条；
+        增量抓取时每页 INCREMENTAL_PAGE_SIZE 条，跳过已抓取过的条目，
+        到达水位、取够 max_items 条新条目或数据不足一页时停止翻页。
 
-                        if items:
-                            print(f"[MeNews] 从备用 API {api_url} 获取 {len(items)} 条新闻")
-                            break
+        Args:
+            group: 候选组名（端点记忆的键）
+            api_urls: 候选端点（按配置顺序）
+            size_keys: 每页条数的参数名
+            parse_func: 单条数据的解析函数
+            max_items: 最大条目数
+            watermark: 增量抓取水位
 
-        except Exception as e:
-            print(f"[MeNews] 备用 API 获取失败: {e}")
+        Returns:
+            (新条目列表, 返回数据的端点) 元组，所有端点都不可用时为 (None, None)
+        """
+        incremental = watermark is not None and not watermark.is_empty
+        page_size = min(max_items, self.INCREMENTAL_PAGE_SIZE) if incremental else max_items
+        scan = watermark.scan() if watermark is not None else None
+
+        def page_params(page: int) -> Dict[str, Any]:
+            params: Dict[str, Any] = {"page": page}
+            params.update({key: page_size for key in size_keys})
+            return params
+
+        page_items, api_url = self._fetch_from_endpoints(group, api_urls, page_params(1), parse_func, page_size)
+        if not api_url:
+            return None, None
+
+        items = self._take_new(page_items, scan)
+        page = 1
+        while (incremental and not scan.reached and len(items) < max_items
+               and len(page_items) >= page_size and page < self.MAX_PAGES):
+            page += 1
+            page_items = self._request_endpoint(api_url, page_params(page), parse_func, page_size)
+            if not page_items:
+                break
+            items.extend(self._take_new(page_items, scan))
+
+        if incremental:
+            print(f"[MeNews] {group}: 请求 {page} 页，{len(items)} 条新条目，跳过 {scan.skipped} 条已抓取条目")
+        return items[:max_items], api_url
+
+    @staticmethod
+    def _take_new(page_items: List[ParsedWeb3Item], scan: Optional[WatermarkScan]) -> List[ParsedWeb3Item]:
+        """按列表顺序取出新条目，到达水位后的条目不再处理"""
+        if scan is None:
+            return page_items
 
+        items = []
+        for item in page_items:
+            if scan.accept(item.guid, item.published_at):
+                items.append(item)
+            if scan.reached:
+                break
         return items
 
-    def _fetch_flash(self, max_items: int = 20) -> List[ParsedWeb3Item]:
+    def _request_endpoint(
+        self,
+        api_url: str,
+        params: Dict[str, Any],
+        parse_func: Callable[[Dict[str, Any]], Optional[ParsedWeb3Item]],
+        max_items: int,
+    ) -> List[ParsedWeb3Item]:
         """
-        获取快讯列表
-
-        Args:
-            max_items: 最大条目数
+        请求单个端点并解析（单次请求，不重试）
 
         Returns:
-            快讯条目列表
+            解析后的条目列表，请求失败或数据无效时为空列表
         """
+        data = self.fetch_json(api_url, params=params, max_retries=1)
+        if not data or not self._has_valid_data(data):
+            return []
+
         items = []
+        for entry in self._extract_list_from_response(data):
+            item = parse_func(entry)
+            if item:
+                items.append(item)
 
-        try:
-            api_urls = [
-                self.FLASH_API_URL,
-                f"{self.BASE_URL}/api/v1/flash/list",
-                f"{self.BASE_URL}/api/flash",
-            ]
+            if len(items) >= max_items:
+                break
+        return items
 
-            for api_url in api_urls:
-                params = {
-                    "page": 1,
-                    "pageSize": max_items,
-                }
+    def _fetch_from_endpoints(
+        self,
+        group: str,
+        api_urls: List[str],
+        params: Dict[str, Any],
+        parse_func: Callable[[Dict[str, Any]], Optional[ParsedWeb3Item]],
+        max_items: int,
+    ) -> Tuple[List[ParsedWeb3Item], Optional[str]]:
+        """
+        从一组候选端点获取数据
 
-                data = self.fetch_json(api_url, params=params)
+        先请求上次返回有效数据的端点；失败时并发请求其余候选端点，
+        采用最先返回有效数据的结果。熔断中的端点直接跳过。
 
-                if data and self._has_valid_data(data):
-                    flash_list = self._extract_list_from_response(data)
+        Args:
+            group: 候选组名（端点记忆的键）
+            api_urls: 候选端点（按配置顺序）
+            params: 请求参数
+            parse_func: 单条数据的解析函数
+            max_items: 最大条目数
 
-                    if flash_list:
-                        for flash in flash_list:
-                            item = self._parse_flash_item(flash)
-                            if item:
-                                items.append(item)
+        Returns:
+            (条目列表, 返回数据的端点) 元组，全部失败时为 ([], None)
+        """
+        candidates = self.endpoints.order(group, api_urls)
 
-                            if len(items) >= max_items:
-                                break
+        preferred = self.endpoints.preferred(group)
+        if candidates and candidates[0] == preferred:
+            items = self._request_endpoint(preferred, params, parse_func, max_items)
+            if items:
+                self.endpoints.record_success(group, preferred)
+                return items, preferred
+            self.endpoints.record_failure(preferred)
+            candidates = candidates[1:]
 
-                        if items:
-                            break
+        if not candidates:
+            return [], None
 
-        except Exception as e:
-            print(f"[MeNews] 获取快讯失败: {e}")
+        executor = ThreadPoolExecutor(max_workers=len(candidates), thread_name_prefix="menews")
+        try:
+            futures = {
+                executor.submit(self._request_endpoint, api_url, params, parse_func, max_items): api_url
+                for api_url in candidates
+            }
+            for future in as_completed(futures):
+                api_url = futures[future]
+                try:
+                    items = future.result()
+                except Exception:
+                    items = []
 
-        return items
+                if items:
+                    self.endpoints.record_success(group, api_url)
+                    return items, api_url
+                self.endpoints.record_failure(api_url)
+        finally:
+            # 已有结果时不等待其余请求
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return [], None
 
     def _has_valid_data(self, data: Dict[str, Any]) -> bool:
         """检查响应是否包含有效数据"""
@@ -529,7 +700,7 @@ class MeNewsCrawler(Web3Crawler):
 
         return None
 
-    def crawl_by_html(self, max_items: int = 50) -> List[ParsedWeb3Item]:
+    def crawl_by_html(self, max_items: int = 50, watermark: Optional[Watermark] = None) -> List[ParsedWeb3Item]:
         """
         通过 HTML 页面抓取（备用方法）
 
@@ -537,6 +708,7 @@ class MeNewsCrawler(Web3Crawler):
 
         Args:
             max_items: 最大条目数
+            watermark: 增量抓取水位
 
         Returns:
             解析后的新闻条目列表
@@ -562,86 +734,10 @@ class MeNewsCrawler(Web3Crawler):
                     print(f"[MeNews] {page_url} 需要 JavaScript 渲染")
                     continue
 
-                from bs4 import BeautifulSoup
-                soup = BeautifulSoup(html_content, 'html.parser')
-
-                # 查找新闻列表项
-                selectors = [
-                    '.news-item',
-                    '.article-item',
-                    '[class*="news-list"] > *',
-                    '[class*="article-list"] > *',
-                    'article',
-                    '.card',
-                    '[class*="item"]',
-                ]
-
-                news_items = []
-                for selector in selectors:
-                    found = soup.select(selector)
-                    if found and len(found) > 3:  # 至少找到3个条目才认为有效
-                        news_items = found
-                        break
-
-                for news_item in news_items[:max_items]:
-                    try:
-                        # 提取标题
-                        title_elem = news_item.select_one(
-                            'h1, h2, h3, h4, .title, [class*="title"], a[href]'
-                        )
-                        if not title_elem:
-                            continue
-
-                        title = self.clean_text(title_elem.get_text())
-                        if not title or len(title) < 5:
-                            continue
-
-                        # 提取链接
-                        link_elem = news_item.select_one('a[href]')
-                        url = ""
-                        if link_elem:
-                            href = link_elem.get('href', '')
-                            if href.startswith('/'):
-                                url = f"{self.BASE_URL}{href}"
-                            elif href.startswith('http'):
-                                url = href
-
-                        # 提取时间
-                        time_elem = news_item.select_one(
-                            '[class*="time"], [class*="date"], time, [datetime]'
-                        )
-                        published_at = None
-                        if time_elem:
-                            time_text = time_elem.get('datetime') or self.clean_text(
-                                time_elem.get_text()
-                            )
-                            published_at = self._convert_time(time_text)
-
-                        # 提取摘要
-                        summary_elem = news_item.select_one(
-                            '.summary, .desc, .description, .content, p'
-                        )
-                        summary = None
-                        if summary_elem:
-                            summary = self.clean_text(summary_elem.get_text())
-                            if summary and len(summary) > 500:
-                                summary = summary[:497] + "..."
-
-                        guid = self.generate_guid(url, title)
-
-                        items.append(ParsedWeb3Item(
-                            title=title,
-                            url=url,
-                            published_at=published_at,
-                            summary=summary,
-                            author="ME News",
-                            guid=guid,
-                        ))
-
-                    except Exception as e:
-                        continue
+                scan = watermark.scan() if watermark is not None else None
+                items, scan = self.parse_page(html_content, max_items, scan)
 
-                if items:
+                if items or (scan is not None and scan.skipped):
                     print(f"[MeNews] 从 HTML 抓取 {len(items)} 条新闻")
                     break
 
@@ -649,3 +745,176 @@ class MeNewsCrawler(Web3Crawler):
             print(f"[MeNews] HTML 抓取失败: {e}")
 
         return items
+
+    def parse_html(
+        self, html_content: str, max_items: int = 50, scan: Optional[WatermarkScan] = None
+    ) -> List[ParsedWeb3Item]:
+        """
+        解析新闻页面 HTML
+
+        依次尝试列表项选择器，取第一个匹配超过 3 个元素的选择器，再逐项提取标题、链接、时间和摘要。
+        已安装 lxml 时使用预编译的 XPath，否则使用 BeautifulSoup。
+
+        Args:
+            html_content: 页面 HTML
+            max_items: 最大条目数
+            scan: 增量抓取的水位扫描（跳过已抓取过的条目，到达水位后不再解析）
+
+        Returns:
+            解析后的新闻条目列表
+        """
+        if HAS_LXML:
+            return self._parse_html_lxml(html_content, max_items, scan)
+        return self._parse_html_soup(html_content, max_items, scan)
+
+    def _build_item(
+        self,
+        title_text: str,
+        href: str,
+        time_text: Optional[str],
+        summary_text: Optional[str],
+    ) -> Optional[ParsedWeb3Item]:
+        """由列表项中提取的文本构建条目（标题无效时返回 None）"""
+        title = self.clean_text(title_text)
+        if not title or len(title) < 5:
+            return None
+
+        # 链接
+        url = ""
+        if href.startswith('/'):
+            url = f"{self.BASE_URL}{href}"
+        elif href.startswith('http'):
+            url = href
+
+        # 时间
+        published_at = self._convert_time(time_text) if time_text is not None else None
+
+        # 摘要
+        summary = None
+        if summary_text is not None:
+            summary = self.clean_text(summary_text)
+            if summary and len(summary) > 500:
+                summary = summary[:497] + "..."
+
+        return ParsedWeb3Item(
+            title=title,
+            url=url,
+            published_at=published_at,
+            summary=summary,
+            author="ME News",
+            guid=self.generate_guid(url, title),
+        )
+
+    def _parse_html_lxml(
+        self, html_content: str, max_items: int, scan: Optional[WatermarkScan] = None
+    ) -> List[ParsedWeb3Item]:
+        """使用 lxml 解析"""
+        items = []
+
+        root = parse_document(html_content)
+        if root is None:
+            return items
+
+        # 查找新闻列表项（至少找到3个条目才认为有效）
+        news_items = first_matching(_LIST_ITEMS, root, min_count=3)
+
+        for news_item in news_items[:max_items]:
+            try:
+                # 提取标题
+                title_elem = first(_ITEM_TITLE, news_item)
+                if title_elem is None:
+                    continue
+
+                # 提取链接
+                link_elem = first(_ITEM_LINK, news_item)
+                href = link_elem.get('href', '') if link_elem is not None else ''
+
+                # 提取时间
+                time_elem = first(_ITEM_TIME, news_item)
+                time_text = None
+                if time_elem is not None:
+                    time_text = time_elem.get('datetime') or self.clean_text(element_text(time_elem))
+
+                # 提取摘要
+                summary_elem = first(_ITEM_SUMMARY, news_item)
+                summary_text = element_text(summary_elem) if summary_elem is not None else None
+
+                item = self._build_item(element_text(title_elem), href, time_text, summary_text)
+                if item and (scan is None or scan.accept(item.guid, item.published_at)):
+                    items.append(item)
+
+            except Exception:
+                continue
+
+            if scan is not None and scan.reached:
+                break
+
+        return items
+
+    def _parse_html_soup(
+        self, html_content: str, max_items: int, scan: Optional[WatermarkScan] = None
+    ) -> List[ParsedWeb3Item]:
+        """使用 BeautifulSoup 解析（未安装 lxml 时）"""
+        from bs4 import BeautifulSoup
+        soup = BeautifulSoup(html_content, 'html.parser')
+
+        items = []
+
+        # 查找新闻列表项
+        selectors = [
+            '.news-item',
+            '.article-item',
+            '[class*="news-list"] > *',
+            '[class*="article-list"] > *',
+            'article',
+            '.card',
+            '[class*="item"]',
+        ]
+
+        news_items = []
+        for selector in selectors:
+            found = soup.select(selector)
+            if found and len(found) > 3:  # 至少找到3个条目才认为有效
+                news_items = found
+                break
+
+        for news_item in news_items[:max_items]:
+            try:
+                # 提取标题
+                title_elem = news_item.select_one(
+                    'h1, h2, h3, h4, .title, [class*="title"], a[href]'
+                )
+                if not title_elem:
+                    continue
+
+                # 提取链接
+                link_elem = news_item.select_one('a[href]')
+                href = link_elem.get('href', '') if link_elem else ''
+
+                # 提取时间
+                time_elem = news_item.select_one(
+                    '[class*="time"], [class*="date"], time, [datetime]'
+                )
+                time_text = None
+                if time_elem:
+                    time_text = time_elem.get('datetime') or self.clean_text(
+                        time_elem.get_text()
+                    )
+
+                # 提取摘要
+                summary_elem = news_item.select_one(
+                    '.summary, .desc, .description, .content, p'
+                )
+                summary_text = summary_elem.get_text() if summary_elem else None
+
+                item = self._build_item(title_elem.get_text(), href, time_text, summary_text)
+                if item and (scan is None or scan.accept(item.guid, item.published_at)):
+                    items.append(item)
+
+            except Exception:
+                continue
+
+            if scan is not None and scan.reached:
+                break
+
+        return items
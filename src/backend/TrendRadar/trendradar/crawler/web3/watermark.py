@@ -0,0 +1,209 @@
+# coding=utf-8
+"""
+Web3 爬虫增量抓取水位
+
+每个信息源记录最近已抓取条目的 guid（generate_guid(url, title)）与最新发布时间。
+爬虫按列表顺序（最新在前）扫描条目：已抓取过的条目跳过，连续遇到 stop_after 条
+已抓取过（或发布时间早于水位）的条目即认为到达上次抓取的位置，停止翻页与解析。
+首次抓取（水位为空）时行为与全量抓取相同。
+
+状态可保存到 JSON 文件，跨进程运行保留：
+    {
+        "menews": {"guids": ["9f2c...", ...], "latest": 1767225600.0}
+    }
+"""
+
+import json
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Optional, Union
+
+
+# 每个信息源保留的 guid 数量
+DEFAULT_MAX_GUIDS = 500
+
+# 连续多少条已抓取过的条目视为到达水位（容忍置顶条目）
+DEFAULT_STOP_AFTER = 3
+
+# 发布时间晚于当前时间超过该值（秒）的条目不更新水位时间
+# （如 "12-31 23:50" 这类不带年份的时间在新年按当年解析，会落在未来）
+FUTURE_TOLERANCE = 3600
+
+
+def to_timestamp(published_at: Optional[str]) -> Optional[float]:
+    """
+    ISO 格式时间转换为时间戳（不带时区的按本地时间处理）
+
+    Args:
+        published_at: ISO 格式时间字符串
+
+    Returns:
+        时间戳，无法解析时返回 None
+    """
+    if not published_at:
+        return None
+    try:
+        return datetime.fromisoformat(published_at).timestamp()
+    except (ValueError, TypeError, OverflowError, OSError):
+        return None
+
+
+class Watermark:
+    """单个信息源的水位（只读快照）"""
+
+    def __init__(
+        self,
+        guids: Iterable[str] = (),
+        latest: Optional[float] = None,
+        stop_after: int = DEFAULT_STOP_AFTER,
+    ):
+        """
+        Args:
+            guids: 已抓取条目的 guid
+            latest: 已抓取条目的最新发布时间（时间戳）
+            stop_after: 连续多少条已抓取过的条目视为到达水位
+        """
+        self.guids: FrozenSet[str] = frozenset(guids)
+        self.latest = latest
+        self.stop_after = max(1, stop_after)
+
+    @property
+    def is_empty(self) -> bool:
+        """是否没有抓取记录（首次抓取）"""
+        return not self.guids and self.latest is None
+
+    def scan(self) -> "WatermarkScan":
+        """开始一次抓取的扫描"""
+        return WatermarkScan(self)
+
+
+class WatermarkScan:
+    """
+    一次抓取中的水位扫描
+
+    按列表顺序对每个条目调用 accept()，返回 False 的条目（已抓取过）不再输出；
+    reached 为 True 后应停止翻页与解析。
+    """
+
+    def __init__(self, watermark: Watermark):
+        self.watermark = watermark
+        self.reached = False
+        self.skipped = 0
+        self._run = 0
+
+    def accept(self, guid: Optional[str], published_at: Optional[str] = None) -> bool:
+        """
+        检查条目是否为新条目，并更新是否到达水位
+
+        Args:
+            guid: 条目 guid
+            published_at: 条目发布时间（ISO 格式）
+
+        Returns:
+            是否为新条目（未抓取过）
+        """
+        known = bool(guid) and guid in self.watermark.guids
+
+        # 发布时间早于水位的条目只作为到达水位的信号，仍然输出（可能是补发的条目）
+        older = False
+        if not known and self.watermark.latest is not None:
+            timestamp = to_timestamp(published_at)
+            older = timestamp is not None and timestamp < self.watermark.latest
+
+        if known or older:
+            self._run += 1
+            if self._run >= self.watermark.stop_after:
+                self.reached = True
+        else:
+            self._run = 0
+
+        if known:
+            self.skipped += 1
+        return not known
+
+
+class WatermarkStore:
+    """各信息源的水位存储"""
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        max_guids: int = DEFAULT_MAX_GUIDS,
+        stop_after: int = DEFAULT_STOP_AFTER,
+    ):
+        """
+        初始化水位存储
+
+        Args:
+            path: 状态文件路径（不设置时只在进程内记忆）
+            max_guids: 每个信息源保留的 guid 数量
+            stop_after: 连续多少条已抓取过的条目视为到达水位
+        """
+        self.path = Path(path) if path else None
+        self.max_guids = max(1, max_guids)
+        self.stop_after = stop_after
+        self._lock = threading.Lock()
+        self._sources: Dict[str, Dict] = {}
+        self._load()
+
+    def _load(self) -> None:
+        """从状态文件加载"""
+        if not self.path or not self.path.exists():
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self._sources = dict(json.load(f))
+        except Exception as e:
+            print(f"[Web3] 加载抓取水位失败: {e}")
+
+    def save(self) -> None:
+        """保存状态到文件"""
+        if not self.path:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self._lock:
+                state = {source_id: dict(source) for source_id, source in self._sources.items()}
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f, ensure_ascii=False, indent=2)
+            tmp_path.replace(self.path)
+        except Exception as e:
+            print(f"[Web3] 保存抓取水位失败: {e}")
+
+    def get(self, source_id: str) -> Watermark:
+        """获取信息源的水位快照"""
+        with self._lock:
+            source = self._sources.get(source_id, {})
+            return Watermark(source.get("guids", []), source.get("latest"), self.stop_after)
+
+    def update(self, source_id: str, items: List) -> None:
+        """
+        记录本次抓取到的条目（ParsedWeb3Item，按列表顺序）
+
+        Args:
+            source_id: 信息源 ID
+            items: 本次输出的新条目
+        """
+        new_guids = [item.guid for item in items if item.guid]
+        now = time.time()
+        timestamps = [
+            t for t in (to_timestamp(item.published_at) for item in items)
+            if t is not None and t <= now + FUTURE_TOLERANCE
+        ]
+        if not new_guids and not timestamps:
+            return
+
+        with self._lock:
+            source = self._sources.setdefault(source_id, {"guids": [], "latest": None})
+
+            # 新条目在前，超出数量时丢弃最早的记录
+            fresh = set(new_guids)
+            guids = new_guids + [guid for guid in source.get("guids", []) if guid not in fresh]
+            source["guids"] = guids[:self.max_guids]
+
+            if timestamps:
+                latest = source.get("latest")
+                source["latest"] = max(timestamps) if latest is None else max(latest, max(timestamps))
@@ -10,7 +10,9 @@
     results = dispatcher.dispatch_all(report_data, report_type, ...)
 """
 
-from typing import Any, Callable, Dict, List, Optional
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
 
 from trendradar.core.config import (
     get_account_at_index,
@@ -36,12 +38,54 @@ from .renderer import (
 )
 
 
+T = TypeVar("T")
+
+
+def run_in_lanes(calls: List[Tuple[str, Callable[[], T]]], max_workers: int) -> List[T]:
+    """
+    按通道（lane）并发执行调用
+
+    lane 相同的调用在同一个线程内按顺序执行（共享同一个限流对象的发送，
+    如同一渠道的各批次、同一 ntfy 服务器的多个 topic），不同 lane 之间并发执行。
+    调用抛出的异常在所有调用结束后向上传递。
+
+    Args:
+        calls: (lane, 无参调用) 列表
+        max_workers: 最大并发数（1 表示串行）
+
+    Returns:
+        各调用的返回值，顺序与 calls 一致
+    """
+    lanes: Dict[str, List[int]] = {}
+    for index, (lane, _) in enumerate(calls):
+        lanes.setdefault(lane, []).append(index)
+
+    results: List[Any] = [None] * len(calls)
+
+    def run_lane(indexes: List[int]) -> None:
+        for index in indexes:
+            results[index] = calls[index][1]()
+
+    if max_workers > 1 and len(lanes) > 1:
+        workers = min(max_workers, len(lanes))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="notify") as executor:
+            # list() 等待全部完成并传递异常
+            list(executor.map(run_lane, lanes.values()))
+    else:
+        for indexes in lanes.values():
+            run_lane(indexes)
+    return results
+
+
 class NotificationDispatcher:
     """
     统一的多账号通知调度器
 
     将多账号发送逻辑封装，提供简洁的 dispatch_all 接口。
     内部处理账号解析、数量限制、配对验证等逻辑。
+
+    各渠道、各账号并发发送：同一账号的分批消息仍按顺序发送并保留批次间隔，
+    共享限流的账号（同一 Telegram bot、同一 ntfy 服务器）串行发送。
     """
 
     def __init__(
@@ -62,6 +106,25 @@ class NotificationDispatcher:
         self.get_time_func = get_time_func
         self.split_content_func = split_content_func
         self.max_accounts = config.get("MAX_ACCOUNTS_PER_CHANNEL", 3)
+        self.max_workers = config.get("NOTIFICATION_MAX_WORKERS", 8)
+
+    def _dispatch(self, sends: List[Tuple[str, Callable[[], bool]]]) -> Dict[str, bool]:
+        """并发发送到各渠道，按渠道配置顺序返回结果"""
+        outcomes = run_in_lanes(sends, self.max_workers)
+        return {channel: result for (channel, _), result in zip(sends, outcomes)}
+
+    def _send_accounts(self, calls: List[Tuple[str, Callable[[], bool]]]) -> bool:
+        """
+        并发发送到多个账号
+
+        Args:
+            calls: (lane, 发送调用) 列表，lane 相同的账号串行发送
+
+        Returns:
+            bool: 任一账号发送成功则返回 True
+        """
+        results = run_in_lanes(calls, self.max_workers)
+        return any(results) if results else False
 
     def dispatch_all(
         self,
@@ -90,49 +153,49 @@ class NotificationDispatcher:
         Returns:
             Dict[str, bool]: 每个渠道的发送结果，key 为渠道名，value 为是否成功
         """
-        results = {}
+        sends: List[Tuple[str, Callable[[], bool]]] = []
 
         # 飞书
         if self.config.get("FEISHU_WEBHOOK_URL"):
-            results["feishu"] = self._send_feishu(
+            sends.append(("feishu", lambda: self._send_feishu(
                 report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items
-            )
+            )))
 
         # 钉钉
         if self.config.get("DINGTALK_WEBHOOK_URL"):
-            results["dingtalk"] = self._send_dingtalk(
+            sends.append(("dingtalk", lambda: self._send_dingtalk(
                 report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items
-            )
+            )))
 
         # 企业微信
         if self.config.get("WEWORK_WEBHOOK_URL"):
-            results["wework"] = self._send_wework(
+            sends.append(("wework", lambda: self._send_wework(
                 report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items
-            )
+            )))
 
         # Telegram（需要配对验证）
         if self.config.get("TELEGRAM_BOT_TOKEN") and self.config.get("TELEGRAM_CHAT_ID"):
-            results["telegram"] = self._send_telegram(
+            sends.append(("telegram", lambda: self._send_telegram(
                 report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items
-            )
+            )))
 
         # ntfy（需要配对验证）
         if self.config.get("NTFY_SERVER_URL") and self.config.get("NTFY_TOPIC"):
-            results["ntfy"] = self._send_ntfy(
+            sends.append(("ntfy", lambda: self._send_ntfy(
                 report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items
-            )
+            )))
 
         # Bark
         if self.config.get("BARK_URL"):
-            results["bark"] = self._send_bark(
+            sends.append(("bark", lambda: self._send_bark(
                 report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items
-            )
+            )))
 
         # Slack
         if self.config.get("SLACK_WEBHOOK_URL"):
-            results["slack"] = self._send_slack(
+            sends.append(("slack", lambda: self._send_slack(
                 report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items
-            )
+            )))
 
         # 邮件（保持原有逻辑，已支持多收件人）
         if (
@@ -140,9 +203,9 @@ class NotificationDispatcher:
             and self.config.get("EMAIL_PASSWORD")
             and self.config.get("EMAIL_TO")
         ):
-            results["email"] = self._send_email(report_type, html_file_path)
+            sends.append(("email", lambda: self._send_email(report_type, html_file_path)))
 
-        return results
+        return self._dispatch(sends)
 
     def _send_to_multi_accounts(
         self,
@@ -168,15 +231,15 @@ class NotificationDispatcher:
             return False
 
         accounts = limit_accounts(accounts, self.max_accounts, channel_name)
-        results = []
+        calls = []
 
         for i, account in enumerate(accounts):
             if account:
                 account_label = f"账号{i+1}" if len(accounts) > 1 else ""
-                result = send_func(account, account_label=account_label, **kwargs)
-                results.append(result)
+                # 每个账号是独立的 webhook/设备，各自限流，可并发发送
+                calls.append((account, functools.partial(send_func, account, account_label=account_label, **kwargs)))
 
-        return any(results) if results else False
+        return self._send_accounts(calls)
 
     def _send_feishu(
         self,
@@ -300,13 +363,15 @@ class NotificationDispatcher:
         telegram_tokens = limit_accounts(telegram_tokens, self.max_accounts, "Telegram")
         telegram_chat_ids = telegram_chat_ids[: len(telegram_tokens)]
 
-        results = []
+        calls = []
         for i in range(len(telegram_tokens)):
             token = telegram_tokens[i]
             chat_id = telegram_chat_ids[i]
             if token and chat_id:
                 account_label = f"账号{i+1}" if len(telegram_tokens) > 1 else ""
-                result = send_to_telegram(
+                # 同一个 bot 的多个 chat 共享限流，按 bot token 串行
+                calls.append((token, functools.partial(
+                    send_to_telegram,
                     bot_token=token,
                     chat_id=chat_id,
                     report_data=report_data,
@@ -320,10 +385,9 @@ class NotificationDispatcher:
                     split_content_func=self.split_content_func,
                     rss_items=rss_items,
                     rss_new_items=rss_new_items,
-                )
-                results.append(result)
+                )))
 
-        return any(results) if results else False
+        return self._send_accounts(calls)
 
     def _send_ntfy(
         self,
@@ -355,12 +419,14 @@ class NotificationDispatcher:
         if ntfy_tokens:
             ntfy_tokens = ntfy_tokens[: len(ntfy_topics)]
 
-        results = []
+        # 所有 topic 发往同一个服务器，共享服务器的限流（429 时会等待重试），因此串行发送
+        calls = []
         for i, topic in enumerate(ntfy_topics):
             if topic:
                 token = get_account_at_index(ntfy_tokens, i, "") if ntfy_tokens else ""
                 account_label = f"账号{i+1}" if len(ntfy_topics) > 1 else ""
-                result = send_to_ntfy(
+                calls.append((ntfy_server_url, functools.partial(
+                    send_to_ntfy,
                     server_url=ntfy_server_url,
                     topic=topic,
                     token=token,
@@ -374,10 +440,9 @@ class NotificationDispatcher:
                     split_content_func=self.split_content_func,
                     rss_items=rss_items,
                     rss_new_items=rss_new_items,
-                )
-                results.append(result)
+                )))
 
-        return any(results) if results else False
+        return self._send_accounts(calls)
 
     def _send_bark(
         self,
@@ -488,50 +553,50 @@ class NotificationDispatcher:
             print("[RSS通知] 没有 RSS 内容，跳过通知")
             return {}
 
-        results = {}
+        sends: List[Tuple[str, Callable[[], bool]]] = []
         report_type = "RSS 订阅更新"
 
         # 飞书
         if self.config.get("FEISHU_WEBHOOK_URL"):
-            results["feishu"] = self._send_rss_feishu(
+            sends.append(("feishu", lambda: self._send_rss_feishu(
                 rss_items, feeds_info, proxy_url
-            )
+            )))
 
         # 钉钉
         if self.config.get("DINGTALK_WEBHOOK_URL"):
-            results["dingtalk"] = self._send_rss_dingtalk(
+            sends.append(("dingtalk", lambda: self._send_rss_dingtalk(
                 rss_items, feeds_info, proxy_url
-            )
+            )))
 
         # 企业微信
         if self.config.get("WEWORK_WEBHOOK_URL"):
-            results["wework"] = self._send_rss_markdown(
+            sends.append(("wework", lambda: self._send_rss_markdown(
                 rss_items, feeds_info, proxy_url, "wework"
-            )
+            )))
 
         # Telegram
         if self.config.get("TELEGRAM_BOT_TOKEN") and self.config.get("TELEGRAM_CHAT_ID"):
-            results["telegram"] = self._send_rss_markdown(
+            sends.append(("telegram", lambda: self._send_rss_markdown(
                 rss_items, feeds_info, proxy_url, "telegram"
-            )
+            )))
 
         # ntfy
         if self.config.get("NTFY_SERVER_URL") and self.config.get("NTFY_TOPIC"):
-            results["ntfy"] = self._send_rss_markdown(
+            sends.append(("ntfy", lambda: self._send_rss_markdown(
                 rss_items, feeds_info, proxy_url, "ntfy"
-            )
+            )))
 
         # Bark
         if self.config.get("BARK_URL"):
-            results["bark"] = self._send_rss_markdown(
+            sends.append(("bark", lambda: self._send_rss_markdown(
                 rss_items, feeds_info, proxy_url, "bark"
-            )
+            )))
 
         # Slack
         if self.config.get("SLACK_WEBHOOK_URL"):
-            results["slack"] = self._send_rss_markdown(
+            sends.append(("slack", lambda: self._send_rss_markdown(
                 rss_items, feeds_info, proxy_url, "slack"
-            )
+            )))
 
         # 邮件
         if (
@@ -539,9 +604,9 @@ class NotificationDispatcher:
             and self.config.get("EMAIL_PASSWORD")
             and self.config.get("EMAIL_TO")
         ):
-            results["email"] = self._send_email(report_type, html_file_path)
+            sends.append(("email", lambda: self._send_email(report_type, html_file_path)))
 
-        return results
+        return self._dispatch(sends)
 
     def _send_rss_feishu(
         self,
@@ -561,12 +626,7 @@ class NotificationDispatcher:
         webhooks = parse_multi_account_config(self.config["FEISHU_WEBHOOK_URL"])
         webhooks = limit_accounts(webhooks, self.max_accounts, "飞书")
 
-        results = []
-        for i, webhook_url in enumerate(webhooks):
-            if not webhook_url:
-                continue
-
-            account_label = f"账号{i+1}" if len(webhooks) > 1 else ""
+        def send_account(webhook_url: str, account_label: str) -> bool:
             try:
                 # 分批发送
                 batches = self.split_content_func(
@@ -595,12 +655,20 @@ class NotificationDispatcher:
                     resp.raise_for_status()
 
                 print(f"✅ 飞书{account_label} RSS 通知发送成功")
-                results.append(True)
+                return True
             except Exception as e:
                 print(f"❌ 飞书{account_label} RSS 通知发送失败: {e}")
-                results.append(False)
+                return False
 
-        return any(results) if results else False
+        calls = []
+        for i, webhook_url in enumerate(webhooks):
+            if not webhook_url:
+                continue
+
+            account_label = f"账号{i+1}" if len(webhooks) > 1 else ""
+            calls.append((webhook_url, functools.partial(send_account, webhook_url, account_label)))
+
+        return self._send_accounts(calls)
 
     def _send_rss_dingtalk(
         self,
@@ -620,12 +688,7 @@ class NotificationDispatcher:
         webhooks = parse_multi_account_config(self.config["DINGTALK_WEBHOOK_URL"])
         webhooks = limit_accounts(webhooks, self.max_accounts, "钉钉")
 
-        results = []
-        for i, webhook_url in enumerate(webhooks):
-            if not webhook_url:
-                continue
-
-            account_label = f"账号{i+1}" if len(webhooks) > 1 else ""
+        def send_account(webhook_url: str, account_label: str) -> bool:
             try:
                 batches = self.split_content_func(
                     content, self.config.get("DINGTALK_BATCH_SIZE", 20000)
@@ -646,12 +709,20 @@ class NotificationDispatcher:
                     resp.raise_for_status()
 
                 print(f"✅ 钉钉{account_label} RSS 通知发送成功")
-                results.append(True)
+                return True
             except Exception as e:
                 print(f"❌ 钉钉{account_label} RSS 通知发送失败: {e}")
-                results.append(False)
+                return False
 
-        return any(results) if results else False
+        calls = []
+        for i, webhook_url in enumerate(webhooks):
+            if not webhook_url:
+                continue
+
+            account_label = f"账号{i+1}" if len(webhooks) > 1 else ""
+            calls.append((webhook_url, functools.partial(send_account, webhook_url, account_label)))
+
+        return self._send_accounts(calls)
 
     def _send_rss_markdown(
         self,
@@ -693,12 +764,7 @@ class NotificationDispatcher:
         webhooks = parse_multi_account_config(self.config["WEWORK_WEBHOOK_URL"])
         webhooks = limit_accounts(webhooks, self.max_accounts, "企业微信")
 
-        results = []
-        for i, webhook_url in enumerate(webhooks):
-            if not webhook_url:
-                continue
-
-            account_label = f"账号{i+1}" if len(webhooks) > 1 else ""
+        def send_account(webhook_url: str, account_label: str) -> bool:
             try:
                 batches = self.split_content_func(
                     content, self.config.get("MESSAGE_BATCH_SIZE", 4000)
@@ -715,12 +781,20 @@ class NotificationDispatcher:
                     resp.raise_for_status()
 
                 print(f"✅ 企业微信{account_label} RSS 通知发送成功")
-                results.append(True)
+                return True
             except Exception as e:
                 print(f"❌ 企业微信{account_label} RSS 通知发送失败: {e}")
-                results.append(False)
+                return False
 
-        return any(results) if results else False
+        calls = []
+        for i, webhook_url in enumerate(webhooks):
+            if not webhook_url:
+                continue
+
+            account_label = f"账号{i+1}" if len(webhooks) > 1 else ""
+            calls.append((webhook_url, functools.partial(send_account, webhook_url, account_label)))
+
+        return self._send_accounts(calls)
 
     def _send_rss_telegram(self, content: str, proxy_url: Optional[str]) -> bool:
         """发送 RSS 到 Telegram"""
@@ -732,15 +806,7 @@ class NotificationDispatcher:
         if not tokens or not chat_ids:
             return False
 
-        results = []
-        for i in range(min(len(tokens), len(chat_ids), self.max_accounts)):
-            token = tokens[i]
-            chat_id = chat_ids[i]
-
-            if not token or not chat_id:
-                continue
-
-            account_label = f"账号{i+1}" if len(tokens) > 1 else ""
+        def send_account(token: str, chat_id: str, account_label: str) -> bool:
             try:
                 batches = self.split_content_func(
                     content, self.config.get("MESSAGE_BATCH_SIZE", 4000)
@@ -759,12 +825,23 @@ class NotificationDispatcher:
                     resp.raise_for_status()
 
                 print(f"✅ Telegram{account_label} RSS 通知发送成功")
-                results.append(True)
+                return True
             except Exception as e:
                 print(f"❌ Telegram{account_label} RSS 通知发送失败: {e}")
-                results.append(False)
+                return False
 
-        return any(results) if results else False
+        calls = []
+        for i in range(min(len(tokens), len(chat_ids), self.max_accounts)):
+            token = tokens[i]
+            chat_id = chat_ids[i]
+
+            if not token or not chat_id:
+                continue
+
+            account_label = f"账号{i+1}" if len(tokens) > 1 else ""
+            calls.append((token, functools.partial(send_account, token, chat_id, account_label)))
+
+        return self._send_accounts(calls)
 
     def _send_rss_ntfy(self, content: str, proxy_url: Optional[str]) -> bool:
         """发送 RSS 到 ntfy"""
@@ -779,14 +856,7 @@ class NotificationDispatcher:
 
         topics = limit_accounts(topics, self.max_accounts, "ntfy")
 
-        results = []
-        for i, topic in enumerate(topics):
-            if not topic:
-                continue
-
-            token = tokens[i] if tokens and i < len(tokens) else ""
-            account_label = f"账号{i+1}" if len(topics) > 1 else ""
-
+        def send_account(topic: str, token: str, account_label: str) -> bool:
             try:
                 batches = self.split_content_func(content, 3800)
 
@@ -804,12 +874,21 @@ class NotificationDispatcher:
                     resp.raise_for_status()
 
                 print(f"✅ ntfy{account_label} RSS 通知发送成功")
-                results.append(True)
+                return True
             except Exception as e:
                 print(f"❌ ntfy{account_label} RSS 通知发送失败: {e}")
-                results.append(False)
+                return False
 
-        return any(results) if results else False
+        calls = []
+        for i, topic in enumerate(topics):
+            if not topic:
+                continue
+
+            token = tokens[i] if tokens and i < len(tokens) else ""
+            account_label = f"账号{i+1}" if len(topics) > 1 else ""
+            calls.append((server_url, functools.partial(send_account, topic, token, account_label)))
+
+        return self._send_accounts(calls)
 
     def _send_rss_bark(self, content: str, proxy_url: Optional[str]) -> bool:
         """发送 RSS 到 Bark"""
@@ -819,12 +898,7 @@ class NotificationDispatcher:
         urls = parse_multi_account_config(self.config["BARK_URL"])
         urls = limit_accounts(urls, self.max_accounts, "Bark")
 
-        results = []
-        for i, bark_url in enumerate(urls):
-            if not bark_url:
-                continue
-
-            account_label = f"账号{i+1}" if len(urls) > 1 else ""
+        def send_account(bark_url: str, account_label: str) -> bool:
             try:
                 batches = self.split_content_func(
                     content, self.config.get("BARK_BATCH_SIZE", 3600)
@@ -840,12 +914,20 @@ class NotificationDispatcher:
                     resp.raise_for_status()
 
                 print(f"✅ Bark{account_label} RSS 通知发送成功")
-                results.append(True)
+                return True
             except Exception as e:
                 print(f"❌ Bark{account_label} RSS 通知发送失败: {e}")
-                results.append(False)
+                return False
 
-        return any(results) if results else False
+        calls = []
+        for i, bark_url in enumerate(urls):
+            if not bark_url:
+                continue
+
+            account_label = f"账号{i+1}" if len(urls) > 1 else ""
+            calls.append((bark_url, functools.partial(send_account, bark_url, account_label)))
+
+        return self._send_accounts(calls)
 
     def _send_rss_slack(self, content: str, proxy_url: Optional[str]) -> bool:
         """发送 RSS 到 Slack"""
@@ -854,12 +936,7 @@ class NotificationDispatcher:
         webhooks = parse_multi_account_config(self.config["SLACK_WEBHOOK_URL"])
         webhooks = limit_accounts(webhooks, self.max_accounts, "Slack")
 
-        results = []
-        for i, webhook_url in enumerate(webhooks):
-            if not webhook_url:
-                continue
-
-            account_label = f"账号{i+1}" if len(webhooks) > 1 else ""
+        def send_account(webhook_url: str, account_label: str) -> bool:
             try:
                 batches = self.split_content_func(
                     content, self.config.get("SLACK_BATCH_SIZE", 4000)
@@ -883,9 +960,17 @@ class NotificationDispatcher:
                     resp.raise_for_status()
 
                 print(f"✅ Slack{account_label} RSS 通知发送成功")
-                results.append(True)
+                return True
             except Exception as e:
                 print(f"❌ Slack{account_label} RSS 通知发送失败: {e}")
-                results.append(False)
+                return False
 
-        return any(results) if results else False
+        calls = []
+        for i, webhook_url in enumerate(webhooks):
+            if not webhook_url:
+                continue
+
+            account_label = f"账号{i+1}" if len(webhooks) > 1 else ""
+            calls.append((webhook_url, functools.partial(send_account, webhook_url, account_label)))
+
+        return self._send_accounts(calls)
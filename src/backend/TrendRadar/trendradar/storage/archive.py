@@ -0,0 +1,517 @@
+# coding=utf-8
+"""
+历史归档 - 将已结束日期的 SQLite 数据压缩为按月分区的 Parquet 列式文件
+
+按日分库的结构适合抓取写入，但跨多日的分析查询（趋势、对比、生命周期）
+需要逐日打开数据库并全表读取。归档把已结束的日期（早于今天）合并到：
+
+    {data_dir}/archive/{db_type}/{YYYY-MM}.parquet          条目（每行一条新闻/RSS 条目）
+    {data_dir}/archive/{db_type}/{YYYY-MM}.crawls.parquet   抓取记录（时间戳）
+    {data_dir}/archive/{db_type}/manifest.json              已归档日期及源文件大小/修改时间
+
+读取方（HistoryArchive）按月加载并缓存，一个月的查询只读取一到两个文件；
+源数据库在归档后被修改（如从远程重新拉取）时，该日期回退为读取 SQLite，
+直到下次归档。当天的数据始终从 SQLite 读取。
+
+依赖 pyarrow（可选，pip install "trendradar[archive]"）：未安装时归档不可用，读取方全部回退为 SQLite。
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    pa = None
+    pc = None
+    pq = None
+    HAS_PYARROW = False
+
+
+DB_TYPES = ("news", "rss")
+
+DATE_FILE_PATTERN = re.compile(r"^(\d{4}-\d{2}-\d{2})\.db$")
+
+
+def _item_schema(db_type: str):
+    """条目表结构（取值与 SQLite 读取结果一致：空值已替换为默认值）"""
+    if db_type == "news":
+        return pa.schema([
+            ("date", pa.string()),
+            ("platform_id", pa.string()),
+            ("platform_name", pa.string()),
+            ("title", pa.string()),
+            ("ranks", pa.list_(pa.int32())),
+            ("url", pa.string()),
+            ("mobile_url", pa.string()),
+            ("first_time", pa.string()),
+            ("last_time", pa.string()),
+            ("count", pa.int32()),
+        ])
+    return pa.schema([
+        ("date", pa.string()),
+        ("feed_id", pa.string()),
+        ("feed_name", pa.string()),
+        ("title", pa.string()),
+        ("url", pa.string()),
+        ("published_at", pa.string()),
+        ("summary", pa.string()),
+        ("author", pa.string()),
+        ("first_time", pa.string()),
+        ("last_time", pa.string()),
+        ("count", pa.int32()),
+    ])
+
+
+def _crawl_schema():
+    return pa.schema([
+        ("date", pa.string()),
+        ("crawl_time", pa.string()),
+        ("created_at", pa.string()),
+    ])
+
+
+def _archive_dir(data_dir: Path, db_type: str) -> Path:
+    return Path(data_dir) / "archive" / db_type
+
+
+def _file_stat(path: Path) -> Optional[Dict[str, int]]:
+    """源文件标识（大小 + 修改时间），文件不存在时返回 None"""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _load_manifest(archive_dir: Path) -> Dict[str, Dict]:
+    path = archive_dir / "manifest.json"
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        print(f"[归档] 读取清单失败，将重新归档: {e}")
+        return {}
+
+
+def _write_atomic(path: Path, write) -> None:
+    """先写临时文件再替换，读取方不会看到写了一半的文件"""
+    tmp_path = path.with_name(path.name + ".tmp")
+    write(tmp_path)
+    os.replace(tmp_path, path)
+
+
+def _read_news_day(conn: sqlite3.Connection, date_str: str) -> Tuple[List[Dict], List[Dict]]:
+    """读取一天的热榜数据（与 MCP 解析服务的 SQLite 读取逻辑一致）"""
+    rows = conn.execute("""
+        SELECT n.id, n.platform_id, p.name as platform_name, n.title,
+               n.rank, n.url, n.mobile_url,
+               n.first_crawl_time, n.last_crawl_time, n.crawl_count
+        FROM news_items n
+        LEFT JOIN platforms p ON n.platform_id = p.id
+    """).fetchall()
+
+    rank_history: Dict[int, List[int]] = {}
+    for news_id, rank in conn.execute(
+        "SELECT news_item_id, rank FROM rank_history ORDER BY news_item_id, crawl_time"
+    ):
+        rank_history.setdefault(news_id, []).append(rank)
+
+    items = [{
+        "date": date_str,
+        "platform_id": row["platform_id"],
+        "platform_name": row["platform_name"] or row["platform_id"],
+        "title": row["title"],
+        "ranks": rank_history.get(row["id"], [row["rank"]]),
+        "url": row["url"] or "",
+        "mobile_url": row["mobile_url"] or "",
+        "first_time": row["first_crawl_time"] or "",
+        "last_time": row["last_crawl_time"] or "",
+        "count": row["crawl_count"] or 1,
+    } for row in rows]
+
+    crawls = [
+        {"date": date_str, "crawl_time": row["crawl_time"], "created_at": row["created_at"]}
+        for row in conn.execute("SELECT crawl_time, created_at FROM crawl_records ORDER BY crawl_time")
+    ]
+    return items, crawls
+
+
+def _read_rss_day(conn: sqlite3.Connection, date_str: str) -> Tuple[List[Dict], List[Dict]]:
+    """读取一天的 RSS 数据（与 MCP 解析服务的 SQLite 读取逻辑一致）"""
+    rows = conn.execute("""
+        SELECT i.feed_id, f.name as feed_name, i.title,
+               i.url, i.published_at, i.summary, i.author,
+               i.first_crawl_time, i.last_crawl_time, i.crawl_count
+        FROM rss_items i
+        LEFT JOIN rss_feeds f ON i.feed_id = f.id
+        ORDER BY i.published_at DESC
+    """).fetchall()
+
+    items = [{
+        "date": date_str,
+        "feed_id": row["feed_id"],
+        "feed_name": row["feed_name"] or row["feed_id"],
+        "title": row["title"],
+        "url": row["url"] or "",
+        "published_at": row["published_at"] or "",
+        "summary": row["summary"] or "",
+        "author": row["author"] or "",
+        "first_time": row["first_crawl_time"] or "",
+        "last_time": row["last_crawl_time"] or "",
+        "count": row["crawl_count"] or 1,
+    } for row in rows]
+
+    crawls = [
+        {"date": date_str, "crawl_time": row["crawl_time"], "created_at": row["created_at"]}
+        for row in conn.execute("SELECT crawl_time, created_at FROM rss_crawl_records ORDER BY crawl_time")
+    ]
+    return items, crawls
+
+
+def _read_day(db_path: Path, db_type: str, date_str: str) -> Optional[Tuple[List[Dict], List[Dict]]]:
+    """只读打开一天的数据库并读取全部条目，表不存在时返回 None"""
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    conn.row_factory = sqlite3.Row
+    try:
+        table = "news_items" if db_type == "news" else "rss_items"
+        if conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (table,)
+        ).fetchone() is None:
+            return None
+        if db_type == "news":
+            return _read_news_day(conn, date_str)
+        return _read_rss_day(conn, date_str)
+    finally:
+        conn.close()
+
+
+def _rewrite_month(path: Path, schema, new_rows: List[Dict], replace_dates: Iterable[str]) -> None:
+    """重写月份文件：保留未变更日期的数据，追加新归档日期的数据"""
+    tables = []
+    if path.exists():
+        existing = pq.read_table(path, schema=schema)
+        mask = pc.invert(pc.is_in(existing["date"], value_set=pa.array(sorted(replace_dates), pa.string())))
+        tables.append(existing.filter(mask))
+    tables.append(pa.Table.from_pylist(new_rows, schema=schema))
+    table = pa.concat_tables(tables).sort_by([("date", "ascending")])
+    _write_atomic(path, lambda tmp: pq.write_table(table, tmp, compression="zstd"))
+
+
+def compact_closed_days(
+    data_dir: str = "output",
+    before_date: Optional[str] = None,
+    db_types: Iterable[str] = DB_TYPES,
+) -> int:
+    """
+    将已结束日期的数据库归档到按月分区的 Parquet 文件
+
+    已归档且源文件未变化的日期会被跳过；源文件变化时重新归档该日期。
+    源数据库文件保留不动（仍由 retention_days 清理），归档只是读取优化的副本。
+
+    Args:
+        data_dir: 数据目录（包含 news/、rss/ 子目录）
+        before_date: 只归档早于该日期的数据（YYYY-MM-DD，默认今天）
+        db_types: 需要归档的数据库类型
+
+    Returns:
+        本次归档的日期数量
+    """
+    if not HAS_PYARROW:
+        print("[归档] 需要安装 pyarrow: pip install pyarrow（或 pip install \"trendradar[archive]\"）")
+        return 0
+
+    data_dir = Path(data_dir)
+    before_date = before_date or datetime.now().strftime("%Y-%m-%d")
+    archived = 0
+
+    for db_type in db_types:
+        db_dir = data_dir / db_type
+        if not db_dir.exists():
+            continue
+
+        archive_dir = _archive_dir(data_dir, db_type)
+        manifest = _load_manifest(archive_dir)
+
+        # 按月份收集需要（重新）归档的日期
+        pending: Dict[str, List[Tuple[str, Path, Dict[str, int]]]] = {}
+        for db_file in sorted(db_dir.glob("*.db")):
+            match = DATE_FILE_PATTERN.match(db_file.name)
+            if not match or match.group(1) >= before_date:
+                continue
+            date_str = match.group(1)
+            stat = _file_stat(db_file)
+            entry = manifest.get(date_str)
+            if stat is None or (entry and entry.get("size") == stat["size"]
+                                and entry.get("mtime_ns") == stat["mtime_ns"]):
+                continue
+            pending.setdefault(date_str[:7], []).append((date_str, db_file, stat))
+
+        if not pending:
+            continue
+        archive_dir.mkdir(parents=True, exist_ok=True)
+
+        for month, days in sorted(pending.items()):
+            items: List[Dict] = []
+            crawls: List[Dict] = []
+            done: Dict[str, Dict] = {}
+            for date_str, db_file, stat in days:
+                try:
+                    result = _read_day(db_file, db_type, date_str)
+                except sqlite3.Error as e:
+                    print(f"[归档] 读取失败，跳过 {db_file}: {e}")
+                    continue
+                if result is not None:
+                    items.extend(result[0])
+                    crawls.extend(result[1])
+                done[date_str] = {**stat, "rows": len(result[0]) if result else 0}
+
+            if not done:
+                continue
+            try:
+                _rewrite_month(archive_dir / f"{month}.parquet", _item_schema(db_type), items, done)
+                _rewrite_month(archive_dir / f"{month}.crawls.parquet", _crawl_schema(), crawls, done)
+            except Exception as e:
+                print(f"[归档] 写入 {db_type}/{month} 失败: {e}")
+                continue
+
+            manifest.update(done)
+            _write_atomic(
+                archive_dir / "manifest.json",
+                lambda tmp: tmp.write_text(json.dumps(manifest, indent=1, sort_keys=True), encoding="utf-8"),
+            )
+            archived += len(done)
+            print(f"[归档] {db_type}/{month}: 已归档 {len(done)} 天（{len(items)} 条）")
+
+    return archived
+
+
+def prune_archive(
+    data_dir: str = "output",
+    before_date: Optional[str] = None,
+    db_types: Iterable[str] = DB_TYPES,
+) -> int:
+    """
+    删除归档中早于指定日期的数据（与 retention_days 清理源数据库保持一致）
+
+    Args:
+        data_dir: 数据目录
+        before_date: 删除早于该日期的数据（YYYY-MM-DD）
+        db_types: 数据库类型
+
+    Returns:
+        删除的日期数量
+    """
+    if not HAS_PYARROW or not before_date:
+        return 0
+
+    data_dir = Path(data_dir)
+    removed = 0
+    for db_type in db_types:
+        archive_dir = _archive_dir(data_dir, db_type)
+        manifest = _load_manifest(archive_dir)
+        expired: Dict[str, List[str]] = {}
+        for date_str in manifest:
+            if date_str < before_date:
+                expired.setdefault(date_str[:7], []).append(date_str)
+
+        for month, dates in sorted(expired.items()):
+            paths = (
+                (archive_dir / f"{month}.parquet", _item_schema(db_type)),
+                (archive_dir / f"{month}.crawls.parquet", _crawl_schema()),
+            )
+            month_dates = [d for d in manifest if d[:7] == month]
+            try:
+                for path, schema in paths:
+                    if len(dates) == len(month_dates):
+                        path.unlink(missing_ok=True)
+                    elif path.exists():
+                        _rewrite_month(path, schema, [], dates)
+            except Exception as e:
+                print(f"[归档] 清理 {db_type}/{month} 失败: {e}")
+                continue
+            for date_str in dates:
+                manifest.pop(date_str, None)
+            removed += len(dates)
+
+        if expired:
+            _write_atomic(
+                archive_dir / "manifest.json",
+                lambda tmp: tmp.write_text(json.dumps(manifest, indent=1, sort_keys=True), encoding="utf-8"),
+            )
+    if removed:
+        print(f"[归档] 已清理 {removed} 天过期归档")
+    return removed
+
+
+class HistoryArchive:
+    """
+    历史归档读取器
+
+    按月加载 Parquet 文件并按日期分组缓存（LRU），
+    返回与 MCP 解析服务 SQLite 读取相同结构的 (all_titles, id_to_name, all_timestamps)。
+    """
+
+    def __init__(self, data_dir: str = "output", max_months: int = 3):
+        """
+        初始化归档读取器
+
+        Args:
+            data_dir: 数据目录（包含 archive/ 子目录）
+            max_months: 最多缓存的月份数
+        """
+        self.data_dir = Path(data_dir)
+        self.max_months = max(1, max_months)
+        self._lock = threading.Lock()
+        self._manifests: Dict[str, Tuple[Optional[int], Dict[str, Dict]]] = {}
+        self._months: "OrderedDict[str, Tuple[int, Dict[str, Tuple[Dict, Dict, Dict]]]]" = OrderedDict()
+
+    def _manifest(self, db_type: str) -> Dict[str, Dict]:
+        """读取清单（文件修改后重新加载）"""
+        archive_dir = _archive_dir(self.data_dir, db_type)
+        stat = _file_stat(archive_dir / "manifest.json")
+        mtime = stat["mtime_ns"] if stat else None
+        cached = self._manifests.get(db_type)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, _load_manifest(archive_dir) if stat else {})
+            self._manifests[db_type] = cached
+        return cached[1]
+
+    def dates(self, db_type: str = "news") -> List[str]:
+        """已归档的日期列表"""
+        if not HAS_PYARROW:
+            return []
+        with self._lock:
+            return sorted(self._manifest(db_type).keys())
+
+    def contains(self, date_str: str, db_type: str = "news") -> bool:
+        """
+        指定日期是否可从归档读取
+
+        源数据库仍存在且在归档后被修改时返回 False（由调用方读取 SQLite）。
+        """
+        if not HAS_PYARROW:
+            return False
+        with self._lock:
+            entry = self._manifest(db_type).get(date_str)
+        if entry is None:
+            return False
+        stat = _file_stat(self.data_dir / db_type / f"{date_str}.db")
+        return stat is None or (stat["size"] == entry.get("size") and stat["mtime_ns"] == entry.get("mtime_ns"))
+
+    def signature(self, date_str: str, db_type: str = "news") -> Optional[str]:
+        """
+        指定日期归档数据的签名（所在月份 Parquet 文件的大小和修改时间），用于判断派生数据是否过期
+
+        Returns:
+            签名字符串，月份文件不存在时返回 None
+        """
+        stat = _file_stat(_archive_dir(self.data_dir, db_type) / f"{date_str[:7]}.parquet")
+        if stat is None:
+            return None
+        return f"archive:{stat['size']}:{stat['mtime_ns']}"
+
+    def _load_month(self, db_type: str, month: str) -> Dict[str, Tuple[Dict, Dict, Dict]]:
+        """加载一个月的数据并按日期分组（调用方持有锁）"""
+        archive_dir = _archive_dir(self.data_dir, db_type)
+        items_path = archive_dir / f"{month}.parquet"
+        stat = _file_stat(items_path)
+        if stat is None:
+            return {}
+
+        key = f"{db_type}/{month}"
+        cached = self._months.get(key)
+        if cached is not None and cached[0] == stat["mtime_ns"]:
+            self._months.move_to_end(key)
+            return cached[1]
+
+        days: Dict[str, Tuple[Dict, Dict, Dict]] = {}
+        id_column, name_column = ("platform_id", "platform_name") if db_type == "news" else ("feed_id", "feed_name")
+        table = pq.read_table(items_path)
+        columns = {name: table.column(name).to_pylist() for name in table.column_names}
+        for i, date_str in enumerate(columns.pop("date")):
+            all_titles, id_to_name, _ = days.setdefault(date_str, ({}, {}, {}))
+            source_id = columns[id_column][i]
+            if source_id not in id_to_name:
+                id_to_name[source_id] = columns[name_column][i]
+            if db_type == "news":
+                info = {
+                    "ranks": columns["ranks"][i],
+                    "url": columns["url"][i],
+                    "mobileUrl": columns["mobile_url"][i],
+                    "first_time": columns["first_time"][i],
+                    "last_time": columns["last_time"][i],
+                    "count": columns["count"][i],
+                }
+            else:
+                info = {
+                    "url": columns["url"][i],
+                    "published_at": columns["published_at"][i],
+                    "summary": columns["summary"][i],
+                    "author": columns["author"][i],
+                    "first_time": columns["first_time"][i],
+                    "last_time": columns["last_time"][i],
+                    "count": columns["count"][i],
+                }
+            all_titles.setdefault(source_id, {})[columns["title"][i]] = info
+
+        crawls_path = archive_dir / f"{month}.crawls.parquet"
+        if crawls_path.exists():
+            crawls = pq.read_table(crawls_path).to_pydict()
+            for date_str, crawl_time, created_at in zip(crawls["date"], crawls["crawl_time"], crawls["created_at"]):
+                if date_str not in days:
+                    continue
+                try:
+                    ts = datetime.strptime(created_at, "%Y-%m-%d %H:%M:%S").timestamp()
+                except (ValueError, TypeError):
+                    ts = datetime.now().timestamp()
+                days[date_str][2][f"{crawl_time}.db"] = ts
+
+        self._months[key] = (stat["mtime_ns"], days)
+        while len(self._months) > self.max_months:
+            self._months.popitem(last=False)
+        return days
+
+    def read_day(
+        self,
+        date_str: str,
+        db_type: str = "news",
+        source_ids: Optional[List[str]] = None,
+    ) -> Optional[Tuple[Dict, Dict, Dict]]:
+        """
+        读取一天的归档数据
+
+        Args:
+            date_str: 日期字符串（YYYY-MM-DD）
+            db_type: 数据库类型 ("news" 或 "rss")
+            source_ids: 平台/Feed ID 列表，None 表示全部
+
+        Returns:
+            (all_titles, id_to_name, all_timestamps) 元组，无数据时返回 None
+        """
+        if not HAS_PYARROW:
+            return None
+        with self._lock:
+            day = self._load_month(db_type, date_str[:7]).get(date_str)
+        if day is None:
+            return None
+
+        all_titles, id_to_name, all_timestamps = day
+        if source_ids:
+            wanted = set(source_ids)
+            all_titles = {k: v for k, v in all_titles.items() if k in wanted}
+            id_to_name = {k: v for k, v in id_to_name.items() if k in wanted}
+        if not all_titles:
+            return None
+        return (dict(all_titles), dict(id_to_name), dict(all_timestamps))
@@ -7,7 +7,36 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+
+class NewsRow(NamedTuple):
+    """
+    紧凑的新闻行（流式读取使用）
+
+    只保留分析/报告需要的字段，平台 ID 和名称由迭代器按平台给出，
+    不再为每条新闻重复保存。
+    """
+    title: str
+    rank: int
+    url: str
+    mobile_url: str
+    ranks: List[int]
+    first_time: str
+    last_time: str
+    count: int
+
+
+class RSSRow(NamedTuple):
+    """紧凑的 RSS 行（流式读取使用），Feed ID 和名称由迭代器按 Feed 给出"""
+    title: str
+    url: str
+    published_at: str
+    summary: str
+    author: str
+    first_time: str
+    last_time: str
+    count: int
 
 
 @dataclass
@@ -179,6 +208,7 @@ class NewsData:
     - items: 按来源ID分组的新闻条目
     - id_to_name: 来源ID到名称的映射
     - failed_ids: 失败的来源ID列表
+    - unchanged_ids: 响应与上次抓取完全相同的来源ID列表（存储时可走快速路径）
     """
 
     date: str                                   # 日期
@@ -186,6 +216,7 @@ class NewsData:
     items: Dict[str, List[NewsItem]]            # 按来源分组的新闻
     id_to_name: Dict[str, str] = field(default_factory=dict)   # ID到名称映射
     failed_ids: List[str] = field(default_factory=list)        # 失败的ID
+    unchanged_ids: List[str] = field(default_factory=list)     # 未变化的ID
 
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典"""
@@ -327,6 +358,60 @@ class StorageBackend(ABC):
         """
         pass
 
+    def iter_news_rows(
+        self,
+        date: Optional[str] = None,
+        platform_ids: Optional[List[str]] = None,
+    ) -> Iterator[Tuple[str, str, List[NewsRow]]]:
+        """
+        按平台流式读取指定日期的所有新闻（与 get_today_all_data 内容一致）
+
+        每次只产出一个平台的数据，调用方处理完一个平台再读取下一个，
+        无需同时持有整天的 NewsData。默认实现基于 get_today_all_data，
+        SQLite 后端会覆盖为逐平台查询。
+
+        Args:
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+            platform_ids: 只读取这些平台，None 表示全部
+
+        Yields:
+            (平台 ID, 平台名称, 该平台的新闻行列表)
+        """
+        data = self.get_today_all_data(date)
+        if not data:
+            return
+        for source_id, news_list in data.items.items():
+            if platform_ids is not None and source_id not in platform_ids:
+                continue
+            yield source_id, data.id_to_name.get(source_id, source_id), [
+                NewsRow(item.title, item.rank, item.url, item.mobile_url, item.ranks,
+                        item.first_time, item.last_time, item.count)
+                for item in news_list
+            ]
+
+    def iter_rss_rows(self, date: Optional[str] = None) -> Iterator[Tuple[str, str, List[RSSRow]]]:
+        """
+        按 Feed 流式读取指定日期的所有 RSS 条目（与 get_rss_data 内容一致）
+
+        Feed 按其最新发布时间降序产出，Feed 内按发布时间降序。
+
+        Args:
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+
+        Yields:
+            (Feed ID, Feed 名称, 该 Feed 的条目行列表)
+        """
+        get_rss_data = getattr(self, "get_rss_data", None)
+        data = get_rss_data(date) if get_rss_data else None
+        if not data:
+            return
+        for feed_id, items in data.items.items():
+            yield feed_id, data.id_to_name.get(feed_id, feed_id), [
+                RSSRow(item.title, item.url, item.published_at, item.summary, item.author,
+                       item.first_time, item.last_time, item.count)
+                for item in items
+            ]
+
     @abstractmethod
     def get_latest_crawl_data(self, date: Optional[str] = None) -> Optional[NewsData]:
         """
@@ -341,12 +426,17 @@ class StorageBackend(ABC):
         pass
 
     @abstractmethod
-    def detect_new_titles(self, current_data: NewsData) -> Dict[str, Dict]:
+    def detect_new_titles(
+        self,
+        current_data: NewsData,
+        platform_ids: Optional[List[str]] = None,
+    ) -> Dict[str, Dict]:
         """
         检测新增的标题
 
         Args:
             current_data: 当前抓取的数据
+            platform_ids: 判断是否有历史数据时只考虑这些平台（None 表示全部）
 
         Returns:
             新增的标题数据，格式: {source_id: {title: title_data}}
@@ -466,6 +556,7 @@ def convert_crawl_results_to_news_data(
     failed_ids: List[str],
     crawl_time: str,
     crawl_date: str,
+    unchanged_ids: Optional[List[str]] = None,
 ) -> NewsData:
     """
     将爬虫结果转换为 NewsData 格式
@@ -476,6 +567,7 @@ def convert_crawl_results_to_news_data(
         failed_ids: 失败的来源ID
         crawl_time: 抓取时间（HH:MM）
         crawl_date: 抓取日期（YYYY-MM-DD）
+        unchanged_ids: 响应未变化的来源ID（可选）
 
     Returns:
         NewsData 对象
@@ -522,6 +614,7 @@ def convert_crawl_results_to_news_data(
         items=items,
         id_to_name=id_to_name,
         failed_ids=failed_ids,
+        unchanged_ids=list(unchanged_ids or []),
     )
 
 
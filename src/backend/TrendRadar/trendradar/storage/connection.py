@@ -0,0 +1,268 @@
+# coding=utf-8
+"""
+SQLite 连接缓存 - 按日期分库的 news/rss 数据库共用
+
+提供 SQLiteConnectionCache：
+- 按数据库文件缓存已打开的连接（LRU，超过上限时关闭最久未使用的连接）
+- 打开连接时统一设置 PRAGMA（WAL、synchronous、cache_size、mmap_size 等）
+- 建表脚本每个文件只执行一次（连接被淘汰后重新打开不再重复执行）
+- 文件被替换或删除时（inode 变化）自动重新打开
+- lease() 租用连接：租用期间连接被淘汰或被替换时推迟到最后一次归还后再关闭，
+  多线程共享读取连接时不会被其他线程关闭
+
+爬虫写入与 MCP 服务读取同一批文件时，WAL 模式让读写互不阻塞，
+读取方复用连接也省去了每次查询的建连开销。
+"""
+
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+
+# 写入方（抓取/存储后端）使用的 PRAGMA
+WRITER_PRAGMAS: Dict[str, Union[str, int]] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",      # WAL 下 NORMAL 已能保证一致性
+    "cache_size": -16000,         # 约 16MB 页缓存
+    "mmap_size": 67108864,        # 64MB 内存映射
+    "temp_store": "MEMORY",
+    "busy_timeout": 5000,
+}
+
+# 读取方（MCP 服务）使用的 PRAGMA：不修改日志模式，只读
+READER_PRAGMAS: Dict[str, Union[str, int]] = {
+    "query_only": "ON",
+    "cache_size": -16000,
+    "mmap_size": 67108864,
+    "temp_store": "MEMORY",
+    "busy_timeout": 5000,
+}
+
+
+def _file_id(path: str) -> Optional[Tuple[int, int]]:
+    """返回文件标识 (st_dev, st_ino)，文件不存在时返回 None"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_dev, stat.st_ino
+
+
+def file_signature(path: Union[str, Path]) -> Optional[str]:
+    """
+    数据库文件签名（主文件与 WAL 文件的大小和修改时间），用作数据变更令牌
+
+    写入方每次提交都会改变 WAL 文件（或检查点后的主文件），读取方只需 stat
+    即可判断缓存或索引等派生数据是否过期，不需要打开数据库。
+    空 WAL 文件与不存在等同：只读连接打开 WAL 模式数据库时会新建空的 -wal 文件，
+    不应视为数据变化。
+
+    Args:
+        path: 数据库文件路径
+
+    Returns:
+        签名字符串，文件不存在时返回 None
+    """
+    parts = []
+    for suffix in ("", "-wal"):
+        try:
+            stat = os.stat(f"{path}{suffix}")
+        except OSError:
+            if not suffix:
+                return None
+            parts.append("-")
+            continue
+        if suffix and not stat.st_size:
+            parts.append("-")
+            continue
+        parts.append(f"{stat.st_size}:{stat.st_mtime_ns}")
+    return "/".join(parts)
+
+
+class SQLiteConnectionCache:
+    """
+    SQLite 连接 LRU 缓存
+
+    以数据库文件路径为键（路径已包含日期和库类型，如 output/news/2025-12-28.db）。
+    连接以 check_same_thread=False 打开，可在线程间复用。
+
+    多个线程共享连接时应使用 lease()：get() 返回的连接可能被其他线程的
+    LRU 淘汰或文件替换关闭，租用中的连接则在全部归还后才关闭。
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 8,
+        pragmas: Optional[Dict[str, Union[str, int]]] = None,
+        row_factory: Optional[Callable] = sqlite3.Row,
+    ):
+        """
+        初始化连接缓存
+
+        Args:
+            max_connections: 最多同时保持打开的连接数
+            pragmas: 打开连接时执行的 PRAGMA（默认 WRITER_PRAGMAS）
+            row_factory: 连接的 row_factory
+        """
+        self.max_connections = max(1, max_connections)
+        self.pragmas = WRITER_PRAGMAS if pragmas is None else pragmas
+        self.row_factory = row_factory
+        self._lock = threading.RLock()
+        self._connections: "OrderedDict[str, Tuple[sqlite3.Connection, Optional[Tuple[int, int]]]]" = OrderedDict()
+        self._initialized: Set[str] = set()
+        # 租用计数（连接 -> 未归还的租用数）与已移出缓存、等待归还后关闭的连接
+        self._leases: Dict[sqlite3.Connection, int] = {}
+        self._retired: Set[sqlite3.Connection] = set()
+
+    def __contains__(self, db_path: Union[str, Path]) -> bool:
+        return str(db_path) in self._connections
+
+    def __len__(self) -> int:
+        return len(self._connections)
+
+    def _apply_pragmas(self, conn: sqlite3.Connection) -> None:
+        """设置连接 PRAGMA（失败时忽略，如只读文件无法切换 WAL）"""
+        for name, value in self.pragmas.items():
+            try:
+                conn.execute(f"PRAGMA {name}={value}")
+            except sqlite3.Error as e:
+                print(f"[存储] 设置 PRAGMA {name} 失败: {e}")
+
+    def get(
+        self,
+        db_path: Union[str, Path],
+        init: Optional[Callable[[sqlite3.Connection], None]] = None,
+        on_connect: Optional[Callable[[sqlite3.Connection], None]] = None,
+    ) -> sqlite3.Connection:
+        """
+        获取数据库连接（不存在或文件已被替换时打开新连接）
+
+        Args:
+            db_path: 数据库文件路径
+            init: 初始化回调（如建表），每个文件只执行一次；
+                  文件是新建的或被替换过时会再次执行
+            on_connect: 每次打开新连接时执行的回调（在 init 之后，如创建 TEMP 触发器）
+
+        Returns:
+            数据库连接
+        """
+        key = str(db_path)
+        with self._lock:
+            entry = self._connections.get(key)
+            if entry is not None:
+                conn, file_id = entry
+                if file_id is not None and _file_id(key) == file_id:
+                    self._connections.move_to_end(key)
+                    return conn
+                # 文件被删除或替换：关闭旧连接，重新初始化
+                self._close_entry(key)
+                self._initialized.discard(key)
+
+            existed = _file_id(key) is not None
+            conn = sqlite3.connect(key, check_same_thread=False)
+            if self.row_factory is not None:
+                conn.row_factory = self.row_factory
+            self._apply_pragmas(conn)
+
+            if init is not None and (key not in self._initialized or not existed):
+                init(conn)
+            self._initialized.add(key)
+            if on_connect is not None:
+                on_connect(conn)
+
+            self._connections[key] = (conn, _file_id(key))
+            while len(self._connections) > self.max_connections:
+                oldest = next(iter(self._connections))
+                self._close_entry(oldest)
+            return conn
+
+    @contextmanager
+    def lease(
+        self,
+        db_path: Union[str, Path],
+        init: Optional[Callable[[sqlite3.Connection], None]] = None,
+        on_connect: Optional[Callable[[sqlite3.Connection], None]] = None,
+    ) -> Iterator[sqlite3.Connection]:
+        """
+        租用数据库连接（with 语句内有效）
+
+        租用期间连接不会被关闭：被 LRU 淘汰、文件被替换或 close()/close_all()
+        时只移出缓存，最后一次归还时才关闭。
+
+        Args:
+            db_path: 数据库文件路径
+            init: 同 get()
+            on_connect: 同 get()
+
+        Yields:
+            数据库连接
+        """
+        with self._lock:
+            conn = self.get(db_path, init=init, on_connect=on_connect)
+            self._leases[conn] = self._leases.get(conn, 0) + 1
+        try:
+            yield conn
+        finally:
+            with self._lock:
+                remaining = self._leases[conn] - 1
+                if remaining:
+                    self._leases[conn] = remaining
+                else:
+                    del self._leases[conn]
+                    if conn in self._retired:
+                        self._retired.discard(conn)
+                        self._close_connection(conn)
+
+    @staticmethod
+    def _close_connection(conn: sqlite3.Connection) -> None:
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+    def _close_entry(self, key: str) -> None:
+        """关闭并移除指定连接（调用方持有锁；租用中的连接在归还后关闭）"""
+        entry = self._connections.pop(key, None)
+        if entry is None:
+            return
+        conn = entry[0]
+        if conn in self._leases:
+            self._retired.add(conn)
+        else:
+            self._close_connection(conn)
+
+    def close(self, db_path: Union[str, Path], forget: bool = False) -> bool:
+        """
+        关闭指定文件的连接
+
+        Args:
+            db_path: 数据库文件路径
+            forget: 是否同时清除"已初始化"标记（文件将被删除时使用）
+
+        Returns:
+            是否关闭了已打开的连接
+        """
+        key = str(db_path)
+        with self._lock:
+            was_open = key in self._connections
+            self._close_entry(key)
+            if forget:
+                self._initialized.discard(key)
+            return was_open
+
+    def close_all(self) -> List[str]:
+        """
+        关闭所有连接
+
+        Returns:
+            已关闭连接的文件路径列表
+        """
+        with self._lock:
+            keys = list(self._connections.keys())
+            for key in keys:
+                self._close_entry(key)
+            return keys
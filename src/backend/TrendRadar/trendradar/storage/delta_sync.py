@@ -0,0 +1,224 @@
+# coding=utf-8
+"""
+增量同步 - 远程存储的行级变更集（changeset）日志
+
+按日分库的 SQLite 文件每次抓取都会改写大部分页面（news_items 的抓取时间/次数、
+索引重排），按页或按块做差量几乎等于整文件传输。因此增量模式在行级别记录变更：
+
+- 打开连接时为所有业务表创建 TEMP 触发器，把被插入/更新/删除的 (表, rowid)
+  记入 temp._sync_changes
+- 每次提交后把变更行序列化为一个段（gzip JSON），上传到
+  {db_key}.segments/{seq:06d}.json.gz，体积与本次新增数据成正比
+- 读取方下载基础库 {db_key} 后按序号回放尚未应用的段
+- 段数达到阈值时上传整库作为新的基础库（压缩），并删除已合并的段
+
+同步进度记录在库内的 _sync_meta 表（seq: 已应用的最大段号，base_seq: 基础库包含的段号），
+该表及其他 _sync_ 前缀的表不参与变更跟踪。
+"""
+
+import base64
+import gzip
+import json
+import re
+import sqlite3
+from typing import Dict, List, Optional, Tuple
+
+
+# 同步内部表前缀（不参与变更跟踪）
+SYNC_TABLE_PREFIX = "_sync_"
+
+# 段对象键格式
+SEGMENT_KEY_PATTERN = re.compile(r"\.segments/(\d+)\.json\.gz$")
+
+
+def segment_prefix(db_key: str) -> str:
+    """段对象前缀，如 news/2025-12-28.db.segments/"""
+    return f"{db_key}.segments/"
+
+
+def segment_key(db_key: str, seq: int) -> str:
+    """段对象键，如 news/2025-12-28.db.segments/000003.json.gz"""
+    return f"{segment_prefix(db_key)}{seq:06d}.json.gz"
+
+
+def parse_segment_seq(key: str) -> Optional[int]:
+    """从段对象键解析段号，不是段对象时返回 None"""
+    match = SEGMENT_KEY_PATTERN.search(key)
+    return int(match.group(1)) if match else None
+
+
+def _user_tables(conn: sqlite3.Connection) -> List[str]:
+    """列出需要跟踪的业务表"""
+    rows = conn.execute("""
+        SELECT name FROM sqlite_master
+        WHERE type = 'table' AND name NOT LIKE 'sqlite_%'
+        ORDER BY name
+    """).fetchall()
+    return [row[0] for row in rows if not row[0].startswith(SYNC_TABLE_PREFIX)]
+
+
+def _ensure_meta(conn: sqlite3.Connection) -> None:
+    """创建同步进度表"""
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS {SYNC_TABLE_PREFIX}meta (
+            key TEXT PRIMARY KEY,
+            value INTEGER NOT NULL
+        )
+    """)
+
+
+def get_sync_seq(conn: sqlite3.Connection) -> Tuple[int, int]:
+    """
+    读取同步进度
+
+    Returns:
+        (已应用的最大段号, 基础库包含的段号)
+    """
+    _ensure_meta(conn)
+    meta = dict(conn.execute(f"SELECT key, value FROM {SYNC_TABLE_PREFIX}meta").fetchall())
+    return meta.get("seq", 0), meta.get("base_seq", 0)
+
+
+def set_sync_seq(conn: sqlite3.Connection, seq: int, base_seq: Optional[int] = None) -> None:
+    """写入同步进度（调用方负责提交）"""
+    _ensure_meta(conn)
+    values = [("seq", seq)]
+    if base_seq is not None:
+        values.append(("base_seq", base_seq))
+    conn.executemany(
+        f"INSERT OR REPLACE INTO {SYNC_TABLE_PREFIX}meta (key, value) VALUES (?, ?)",
+        values,
+    )
+
+
+def enable_change_tracking(conn: sqlite3.Connection) -> None:
+    """
+    为连接开启变更跟踪（TEMP 触发器只对当前连接生效，每次打开连接都需调用）
+
+    Args:
+        conn: 已完成建表的数据库连接
+    """
+    _ensure_meta(conn)
+    conn.execute(f"""
+        CREATE TEMP TABLE IF NOT EXISTS {SYNC_TABLE_PREFIX}changes (
+            tbl TEXT NOT NULL,
+            rid INTEGER NOT NULL,
+            PRIMARY KEY (tbl, rid)
+        )
+    """)
+    changes = f"{SYNC_TABLE_PREFIX}changes"
+    for table in _user_tables(conn):
+        # 触发器内的 OR IGNORE 会被外层语句的冲突策略覆盖，这里用 NOT EXISTS 去重
+        def log(rowid: str) -> str:
+            return (
+                f"INSERT INTO {changes} (tbl, rid) SELECT '{table}', {rowid} "
+                f"WHERE NOT EXISTS (SELECT 1 FROM {changes} WHERE tbl = '{table}' AND rid = {rowid});"
+            )
+        conn.executescript(f"""
+            CREATE TEMP TRIGGER IF NOT EXISTS {SYNC_TABLE_PREFIX}ins_{table}
+            AFTER INSERT ON main.{table} BEGIN {log("NEW.rowid")} END;
+            CREATE TEMP TRIGGER IF NOT EXISTS {SYNC_TABLE_PREFIX}upd_{table}
+            AFTER UPDATE ON main.{table} BEGIN {log("OLD.rowid")} {log("NEW.rowid")} END;
+            CREATE TEMP TRIGGER IF NOT EXISTS {SYNC_TABLE_PREFIX}del_{table}
+            AFTER DELETE ON main.{table} BEGIN {log("OLD.rowid")} END;
+        """)
+    conn.commit()
+
+
+def has_changes(conn: sqlite3.Connection) -> bool:
+    """是否有尚未同步的变更"""
+    row = conn.execute(f"SELECT 1 FROM temp.{SYNC_TABLE_PREFIX}changes LIMIT 1").fetchone()
+    return row is not None
+
+
+def clear_changes(conn: sqlite3.Connection) -> None:
+    """清空变更记录（调用方负责提交）"""
+    conn.execute(f"DELETE FROM temp.{SYNC_TABLE_PREFIX}changes")
+
+
+def _encode_value(value):
+    """BLOB 以 base64 编码，其余类型 JSON 可直接表示"""
+    if isinstance(value, bytes):
+        return {"$b64": base64.b64encode(value).decode("ascii")}
+    return value
+
+
+def _decode_value(value):
+    if isinstance(value, dict) and "$b64" in value:
+        return base64.b64decode(value["$b64"])
+    return value
+
+
+def collect_changeset(conn: sqlite3.Connection) -> Optional[Dict]:
+    """
+    读取变更行的当前内容，生成变更集
+
+    Returns:
+        {"tables": {表名: {"columns": [...], "upsert": [[rowid, ...]], "delete": [rowid]}}}，
+        没有变更时返回 None
+    """
+    changed: Dict[str, List[int]] = {}
+    for tbl, rid in conn.execute(
+        f"SELECT tbl, rid FROM temp.{SYNC_TABLE_PREFIX}changes ORDER BY tbl, rid"
+    ):
+        changed.setdefault(tbl, []).append(rid)
+    if not changed:
+        return None
+
+    tables = {}
+    for table, rowids in changed.items():
+        columns = [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+        select_cols = ", ".join(["rowid"] + columns)
+        present: Dict[int, list] = {}
+        for i in range(0, len(rowids), 900):
+            chunk = rowids[i:i + 900]
+            placeholders = ",".join("?" * len(chunk))
+            for row in conn.execute(
+                f"SELECT {select_cols} FROM {table} WHERE rowid IN ({placeholders})", chunk
+            ):
+                present[row[0]] = [_encode_value(v) for v in row]
+        tables[table] = {
+            "columns": columns,
+            "upsert": [present[rid] for rid in rowids if rid in present],
+            "delete": [rid for rid in rowids if rid not in present],
+        }
+    return {"version": 1, "tables": tables}
+
+
+def apply_changeset(conn: sqlite3.Connection, changeset: Dict) -> int:
+    """
+    回放变更集（调用方负责提交）
+
+    先删除再按 rowid 覆盖写入；变更集包含的是源库中这些行的最终内容，
+    因此回放后这些行与源库一致。
+
+    Returns:
+        写入/删除的行数
+    """
+    count = 0
+    for table, change in changeset.get("tables", {}).items():
+        if change["delete"]:
+            conn.executemany(
+                f"DELETE FROM {table} WHERE rowid = ?",
+                [(rid,) for rid in change["delete"]],
+            )
+            count += len(change["delete"])
+        if change["upsert"]:
+            columns = ", ".join(["rowid"] + change["columns"])
+            placeholders = ",".join("?" * (len(change["columns"]) + 1))
+            conn.executemany(
+                f"INSERT OR REPLACE INTO {table} ({columns}) VALUES ({placeholders})",
+                [[_decode_value(v) for v in row] for row in change["upsert"]],
+            )
+            count += len(change["upsert"])
+    return count
+
+
+def encode_changeset(changeset: Dict) -> bytes:
+    """序列化变更集（gzip JSON）"""
+    return gzip.compress(json.dumps(changeset, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+
+def decode_changeset(data: bytes) -> Dict:
+    """反序列化变更集"""
+    return json.loads(gzip.decompress(data).decode("utf-8"))
@@ -11,15 +11,29 @@ import pytz
 import re
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
-
-from trendradar.storage.base import StorageBackend, NewsItem, NewsData, RSSItem, RSSData
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from trendradar.storage.base import StorageBackend, NewsItem, NewsData, NewsRow, RSSItem, RSSData, RSSRow
+from trendradar.storage.connection import SQLiteConnectionCache, WRITER_PRAGMAS, file_signature
+from trendradar.storage.search_index import (
+    SearchIndex,
+    collect_news_documents,
+    collect_rss_documents,
+    news_source_order,
+    rss_source_order,
+)
+from trendradar.storage.sqlite_ops import (
+    find_new_rss_items,
+    find_new_titles,
+    iter_news_rows_by_platform,
+    iter_rss_rows_by_feed,
+    save_news_items,
+)
 from trendradar.utils.time import (
     get_configured_time,
     format_date_folder,
     format_time_filename,
 )
-from trendradar.utils.url import normalize_url
 
 
 class LocalStorageBackend(StorageBackend):
@@ -38,6 +52,9 @@ class LocalStorageBackend(StorageBackend):
         enable_txt: bool = True,
         enable_html: bool = True,
         timezone: str = "Asia/Shanghai",
+        bulk_write: bool = True,
+        max_connections: int = 8,
+        search_index: bool = True,
     ):
         """
         初始化本地存储后端
@@ -47,12 +64,19 @@ class LocalStorageBackend(StorageBackend):
             enable_txt: 是否启用 TXT 快照
             enable_html: 是否启用 HTML 报告
             timezone: 时区配置（默认 Asia/Shanghai）
+            bulk_write: 是否使用批量写入模式（默认开启，关闭时逐条写入）
+            max_connections: 最多同时保持打开的数据库连接数（LRU 淘汰）
+            search_index: 是否在保存后更新全文搜索索引（output/.cache/search_index.db）
         """
         self.data_dir = Path(data_dir)
         self.enable_txt = enable_txt
         self.enable_html = enable_html
         self.timezone = timezone
-        self._db_connections: Dict[str, sqlite3.Connection] = {}
+        self.bulk_write = bulk_write
+        # 按数据库文件缓存连接（WAL 模式，建表脚本每个文件只执行一次）
+        self._db_connections = SQLiteConnectionCache(max_connections, pragmas=WRITER_PRAGMAS)
+        self.search_index_enabled = search_index
+        self._search_index: Optional[SearchIndex] = None
 
     @property
     def backend_name(self) -> str:
@@ -105,15 +129,10 @@ class LocalStorageBackend(StorageBackend):
         Returns:
             数据库连接
         """
-        db_path = str(self._get_db_path(date, db_type))
-
-        if db_path not in self._db_connections:
-            conn = sqlite3.connect(db_path)
-            conn.row_factory = sqlite3.Row
-            self._init_tables(conn, db_type)
-            self._db_connections[db_path] = conn
-
-        return self._db_connections[db_path]
+        db_path = self._get_db_path(date, db_type)
+        return self._db_connections.get(
+            db_path, init=lambda conn: self._init_tables(conn, db_type)
+        )
 
     def _get_schema_path(self, db_type: str = "news") -> Path:
         """
@@ -148,6 +167,72 @@ class LocalStorageBackend(StorageBackend):
 
         conn.commit()
 
+    def _publish_changes(self, date: Optional[str], db_type: str = "news") -> Optional[str]:
+        """
+        提交后把 WAL 写回主库，返回新的数据变更令牌（文件签名）
+
+        读取方（MCP 缓存、搜索索引）通过文件签名判断数据是否变化。检查点放在写入方：
+        否则连接关闭时的自动检查点会再次改变签名，读取方会误认为数据有变化而重新读取。
+
+        Args:
+            date: 日期字符串
+            db_type: 数据库类型 ("news" 或 "rss")
+
+        Returns:
+            变更令牌，失败时返回 None
+        """
+        try:
+            self._get_connection(date, db_type).execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            return file_signature(self._get_db_path(date, db_type))
+        except Exception as e:
+            print(f"[本地存储] 写回 WAL 失败: {e}")
+            return None
+
+    def _update_search_index(
+        self,
+        date: Optional[str],
+        db_type: str,
+        source_ids: List[str],
+        previous_signature: Optional[str],
+        signature: Optional[str],
+    ) -> None:
+        """
+        保存后更新全文搜索索引
+
+        索引与保存前的数据库一致时只替换本次保存的来源，否则（首次索引、
+        数据库被其他途径修改）重建当天的全部文档。失败不影响保存结果。
+
+        Args:
+            date: 日期字符串
+            db_type: 数据库类型 ("news" 或 "rss")
+            source_ids: 本次保存的来源 ID
+            previous_signature: 保存前的数据库文件签名
+            signature: 保存后的数据库文件签名（_publish_changes 的返回值）
+        """
+        if not self.search_index_enabled or signature is None:
+            return
+        try:
+            if self._search_index is None:
+                self._search_index = SearchIndex(self.data_dir / ".cache" / "search_index.db")
+            date_str = self._format_date_folder(date)
+            cursor = self._get_connection(date, db_type).cursor()
+            if db_type == "news":
+                collect, source_order = collect_news_documents, news_source_order
+            else:
+                collect, source_order = collect_rss_documents, rss_source_order
+
+            if previous_signature is not None and \
+                    self._search_index.get_signature(db_type, date_str) == previous_signature:
+                documents = collect(cursor, source_ids) if source_ids else []
+                self._search_index.replace_documents(
+                    db_type, date_str, documents, signature,
+                    source_ids=source_ids, source_order=source_order(cursor),
+                )
+            else:
+                self._search_index.replace_documents(db_type, date_str, collect(cursor), signature)
+        except Exception as e:
+            print(f"[本地存储] 更新搜索索引失败: {e}")
+
     def save_news_data(self, data: NewsData) -> bool:
         """
         保存新闻数据到 SQLite（以 URL 为唯一标识，支持标题更新检测）
@@ -159,6 +244,7 @@ class LocalStorageBackend(StorageBackend):
             是否保存成功
         """
         try:
+            previous_signature = file_signature(self._get_db_path(data.date))
             conn = self._get_connection(data.date)
             cursor = conn.cursor()
 
@@ -175,103 +261,11 @@ class LocalStorageBackend(StorageBackend):
                         updated_at = excluded.updated_at
                 """, (source_id, source_name, now_str))
 
-            # 统计计数器
-            new_count = 0
-            updated_count = 0
-            title_changed_count = 0
-            success_sources = []
-
-            for source_id, news_list in data.items.items():
-                success_sources.append(source_id)
-
-                for item in news_list:
-                    try:
-                        # 标准化 URL（去除动态参数，如微博的 band_rank）
-                        normalized_url = normalize_url(item.url, source_id) if item.url else ""
-
-                        # 检查是否已存在（通过标准化 URL + platform_id）
-                        if normalized_url:
-                            cursor.execute("""
-                                SELECT id, title FROM news_items
-                                WHERE url = ? AND platform_id = ?
-                            """, (normalized_url, source_id))
-                            existing = cursor.fetchone()
-
-                            if existing:
-                                # 已存在，更新记录
-                                existing_id, existing_title = existing
-
-                                # 检查标题是否变化
-                                if existing_title != item.title:
-                                    # 记录标题变更
-                                    cursor.execute("""
-                                        INSERT INTO title_changes
-                                        (news_item_id, old_title, new_title, changed_at)
-                                        VALUES (?, ?, ?, ?)
-                                    """, (existing_id, existing_title, item.title, now_str))
-                                    title_changed_count += 1
-
-                                # 记录排名历史
-                                cursor.execute("""
-                                    INSERT INTO rank_history
-                                    (news_item_id, rank, crawl_time, created_at)
-                                    VALUES (?, ?, ?, ?)
-                                """, (existing_id, item.rank, data.crawl_time, now_str))
-
-                                # 更新现有记录
-                                cursor.execute("""
-                                    UPDATE news_items SET
-                                        title = ?,
-                                        rank = ?,
-                                        mobile_url = ?,
-                                        last_crawl_time = ?,
-                                        crawl_count = crawl_count + 1,
-                                        updated_at = ?
-                                    WHERE id = ?
-                                """, (item.title, item.rank, item.mobile_url,
-                                      data.crawl_time, now_str, existing_id))
-                                updated_count += 1
-                            else:
-                                # 不存在，插入新记录（存储标准化后的 URL）
-                                cursor.execute("""
-                                    INSERT INTO news_items
-                                    (title, platform_id, rank, url, mobile_url,
-                                     first_crawl_time, last_crawl_time, crawl_count,
-                                     created_at, updated_at)
-                                    VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
-                                """, (item.title, source_id, item.rank, normalized_url,
-                                      item.mobile_url, data.crawl_time, data.crawl_time,
-                                      now_str, now_str))
-                                new_id = cursor.lastrowid
-                                # 记录初始排名
-                                cursor.execute("""
-                                    INSERT INTO rank_history
-                                    (news_item_id, rank, crawl_time, created_at)
-                                    VALUES (?, ?, ?, ?)
-                                """, (new_id, item.rank, data.crawl_time, now_str))
-                                new_count += 1
-                        else:
-                            # URL 为空的情况，直接插入（不做去重）
-                            cursor.execute("""
-                                INSERT INTO news_items
-                                (title, platform_id, rank, url, mobile_url,
-                                 first_crawl_time, last_crawl_time, crawl_count,
-                                 created_at, updated_at)
-                                VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
-                            """, (item.title, source_id, item.rank, "",
-                                  item.mobile_url, data.crawl_time, data.crawl_time,
-                                  now_str, now_str))
-                            new_id = cursor.lastrowid
-                            # 记录初始排名
-                            cursor.execute("""
-                                INSERT INTO rank_history
-                                (news_item_id, rank, crawl_time, created_at)
-                                VALUES (?, ?, ?, ?)
-                            """, (new_id, item.rank, data.crawl_time, now_str))
-                            new_count += 1
-
-                    except sqlite3.Error as e:
-                        print(f"保存新闻条目失败 [{item.title[:30]}...]: {e}")
+            # 写入新闻条目（批量模式按平台一次查询 + executemany，出错时回退为逐条写入）
+            success_sources = list(data.items.keys())
+            new_count, updated_count, title_changed_count = save_news_items(
+                cursor, data, now_str, bulk=self.bulk_write, log_prefix="[本地存储]"
+            )
 
             total_items = new_count + updated_count
 
@@ -314,6 +308,10 @@ class LocalStorageBackend(StorageBackend):
 
             conn.commit()
 
+            # 发布变更令牌，更新搜索索引（只替换本次抓取的平台）
+            signature = self._publish_changes(data.date, "news")
+            self._update_search_index(data.date, "news", success_sources, previous_signature, signature)
+
             # 输出详细的存储统计日志
             log_parts = [f"[本地存储] 处理完成：新增 {new_count} 条"]
             if updated_count > 0:
@@ -346,71 +344,32 @@ class LocalStorageBackend(StorageBackend):
             conn = self._get_connection(date)
             cursor = conn.cursor()
 
-            # 获取所有新闻数据（包含 id 用于查询排名历史）
-            cursor.execute("""
-                SELECT n.id, n.title, n.platform_id, p.name as platform_name,
-                       n.rank, n.url, n.mobile_url,
-                       n.first_crawl_time, n.last_crawl_time, n.crawl_count
-                FROM news_items n
-                LEFT JOIN platforms p ON n.platform_id = p.id
-                ORDER BY n.platform_id, n.last_crawl_time
-            """)
-
-            rows = cursor.fetchall()
-            if not rows:
-                return None
-
-            # 收集所有 news_item_id
-            news_ids = [row[0] for row in rows]
-
-            # 批量查询排名历史
-            rank_history_map: Dict[int, List[int]] = {}
-            if news_ids:
-                placeholders = ",".join("?" * len(news_ids))
-                cursor.execute(f"""
-                    SELECT news_item_id, rank FROM rank_history
-                    WHERE news_item_id IN ({placeholders})
-                    ORDER BY news_item_id, crawl_time
-                """, news_ids)
-                for rh_row in cursor.fetchall():
-                    news_id, rank = rh_row[0], rh_row[1]
-                    if news_id not in rank_history_map:
-                        rank_history_map[news_id] = []
-                    if rank not in rank_history_map[news_id]:
-                        rank_history_map[news_id].append(rank)
-
-            # 按 platform_id 分组
+            # 按平台读取所有新闻（含排名历史）
             items: Dict[str, List[NewsItem]] = {}
             id_to_name: Dict[str, str] = {}
             crawl_date = self._format_date_folder(date)
 
-            for row in rows:
-                news_id = row[0]
-                platform_id = row[2]
-                title = row[1]
-                platform_name = row[3] or platform_id
-
+            for platform_id, platform_name, rows in iter_news_rows_by_platform(cursor):
                 id_to_name[platform_id] = platform_name
+                items[platform_id] = [
+                    NewsItem(
+                        title=row.title,
+                        source_id=platform_id,
+                        source_name=platform_name,
+                        rank=row.rank,
+                        url=row.url,
+                        mobile_url=row.mobile_url,
+                        crawl_time=row.last_time,
+                        ranks=row.ranks,
+                        first_time=row.first_time,
+                        last_time=row.last_time,
+                        count=row.count,
+                    )
+                    for row in rows
+                ]
 
-                if platform_id not in items:
-                    items[platform_id] = []
-
-                # 获取排名历史，如果没有则使用当前排名
-                ranks = rank_history_map.get(news_id, [row[4]])
-
-                items[platform_id].append(NewsItem(
-                    title=title,
-                    source_id=platform_id,
-                    source_name=platform_name,
-                    rank=row[4],
-                    url=row[5] or "",
-                    mobile_url=row[6] or "",
-                    crawl_time=row[8],  # last_crawl_time
-                    ranks=ranks,
-                    first_time=row[7],  # first_crawl_time
-                    last_time=row[8],   # last_crawl_time
-                    count=row[9],       # crawl_count
-                ))
+            if not items:
+                return None
 
             final_items = items
 
@@ -445,6 +404,47 @@ class LocalStorageBackend(StorageBackend):
             print(f"[本地存储] 读取数据失败: {e}")
             return None
 
+    def iter_news_rows(
+        self,
+        date: Optional[str] = None,
+        platform_ids: Optional[List[str]] = None,
+    ) -> Iterator[Tuple[str, str, List[NewsRow]]]:
+        """
+        按平台流式读取指定日期的所有新闻（每次只查询一个平台）
+
+        Args:
+            date: 日期字符串，默认为今天
+            platform_ids: 只读取这些平台，None 表示全部
+
+        Yields:
+            (平台 ID, 平台名称, 新闻行列表)
+        """
+        if not self._get_db_path(date).exists():
+            return
+        cursor = self._get_connection(date).cursor()
+        try:
+            yield from iter_news_rows_by_platform(cursor, platform_ids)
+        finally:
+            cursor.close()
+
+    def iter_rss_rows(self, date: Optional[str] = None) -> Iterator[Tuple[str, str, List[RSSRow]]]:
+        """
+        按 Feed 流式读取指定日期的所有 RSS 条目（每次只查询一个 Feed）
+
+        Args:
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+
+        Yields:
+            (Feed ID, Feed 名称, 条目行列表)
+        """
+        if not self._get_db_path(date, db_type="rss").exists():
+            return
+        cursor = self._get_connection(date, db_type="rss").cursor()
+        try:
+            yield from iter_rss_rows_by_feed(cursor)
+        finally:
+            cursor.close()
+
     def get_latest_crawl_data(self, date: Optional[str] = None) -> Optional[NewsData]:
         """
         获取最新一次抓取的数据
@@ -561,60 +561,35 @@ class LocalStorageBackend(StorageBackend):
             print(f"[本地存储] 获取最新数据失败: {e}")
             return None
 
-    def detect_new_titles(self, current_data: NewsData) -> Dict[str, Dict]:
+    def detect_new_titles(
+        self,
+        current_data: NewsData,
+        platform_ids: Optional[List[str]] = None,
+    ) -> Dict[str, Dict]:
         """
         检测新增的标题
 
         该方法比较当前抓取数据与历史数据，找出新增的标题。
         关键逻辑：只有在历史批次中从未出现过的标题才算新增。
+        直接按当前批次的 (平台, 标题) 查询索引，不加载当天全部数据。
 
         Args:
             current_data: 当前抓取的数据
+            platform_ids: 判断是否有历史数据时只考虑这些平台（None 表示全部）
 
         Returns:
             新增的标题数据 {source_id: {title: NewsItem}}
         """
         try:
-            # 获取历史数据
-            historical_data = self.get_today_all_data(current_data.date)
-
-            if not historical_data:
+            if not self._get_db_path(current_data.date).exists():
                 # 没有历史数据，所有都是新的
-                new_titles = {}
-                for source_id, news_list in current_data.items.items():
-                    new_titles[source_id] = {item.title: item for item in news_list}
-                return new_titles
-
-            # 获取当前批次时间
-            current_time = current_data.crawl_time
-
-            # 收集历史标题（first_time < current_time 的标题）
-            # 这样可以正确处理同一标题因 URL 变化而产生多条记录的情况
-            historical_titles: Dict[str, set] = {}
-            for source_id, news_list in historical_data.items.items():
-                historical_titles[source_id] = set()
-                for item in news_list:
-                    first_time = getattr(item, 'first_time', item.crawl_time)
-                    if first_time < current_time:
-                        historical_titles[source_id].add(item.title)
-
-            # 检查是否有历史数据
-            has_historical_data = any(len(titles) > 0 for titles in historical_titles.values())
-            if not has_historical_data:
-                # 第一次抓取，没有"新增"概念
-                return {}
-
-            # 检测新增
-            new_titles = {}
-            for source_id, news_list in current_data.items.items():
-                hist_set = historical_titles.get(source_id, set())
-                for item in news_list:
-                    if item.title not in hist_set:
-                        if source_id not in new_titles:
-                            new_titles[source_id] = {}
-                        new_titles[source_id][item.title] = item
-
-            return new_titles
+                return {
+                    source_id: {item.title: item for item in news_list}
+                    for source_id, news_list in current_data.items.items()
+                }
+
+            conn = self._get_connection(current_data.date)
+            return find_new_titles(conn.cursor(), current_data, platform_ids)
 
         except Exception as e:
             print(f"[本地存储] 检测新标题失败: {e}")
@@ -776,14 +751,10 @@ class LocalStorageBackend(StorageBackend):
 
     def cleanup(self) -> None:
         """清理资源（关闭数据库连接）"""
-        for db_path, conn in self._db_connections.items():
-            try:
-                conn.close()
-                print(f"[本地存储] 关闭数据库连接: {db_path}")
-            except Exception as e:
-                print(f"[本地存储] 关闭连接失败 {db_path}: {e}")
-
-        self._db_connections.clear()
+        for db_path in self._db_connections.close_all():
+            print(f"[本地存储] 关闭数据库连接: {db_path}")
+        if self._search_index is not None:
+            self._search_index.close()
 
     def cleanup_old_data(self, retention_days: int) -> int:
         """
@@ -848,17 +819,13 @@ class LocalStorageBackend(StorageBackend):
                     file_date = parse_date_from_name(db_file.name)
                     if file_date and file_date < cutoff_date:
                         # 先关闭数据库连接
-                        db_path = str(db_file)
-                        if db_path in self._db_connections:
-                            try:
-                                self._db_connections[db_path].close()
-                                del self._db_connections[db_path]
-                            except Exception:
-                                pass
-
-                        # 删除文件
+                        self._db_connections.close(db_file, forget=True)
+
+                        # 删除文件（连同 WAL 附属文件）
                         try:
                             db_file.unlink()
+                            for suffix in ("-wal", "-shm"):
+                                Path(f"{db_file}{suffix}").unlink(missing_ok=True)
                             deleted_count += 1
                             print(f"[本地存储] 清理过期数据: {db_type}/{db_file.name}")
                         except Exception as e:
@@ -972,6 +939,7 @@ class LocalStorageBackend(StorageBackend):
             是否保存成功
         """
         try:
+            previous_signature = file_signature(self._get_db_path(data.date, "rss"))
             conn = self._get_connection(data.date, db_type="rss")
             cursor = conn.cursor()
 
@@ -1086,6 +1054,10 @@ class LocalStorageBackend(StorageBackend):
 
             conn.commit()
 
+            # 发布变更令牌，更新搜索索引（只替换本次抓取的 Feed）
+            signature = self._publish_changes(data.date, "rss")
+            self._update_search_index(data.date, "rss", list(data.items.keys()), previous_signature, signature)
+
             # 输出统计日志
             log_parts = [f"[本地存储] RSS 处理完成：新增 {new_count} 条"]
             if updated_count > 0:
@@ -1189,6 +1161,7 @@ class LocalStorageBackend(StorageBackend):
 
         该方法比较当前抓取数据与历史数据，找出新增的 RSS 条目。
         关键逻辑：只有在历史批次中从未出现过的 URL 才算新增。
+        直接按当前批次的 (源, URL) 查询索引，不加载当天全部数据。
 
         Args:
             current_data: 当前抓取的 RSS 数据
@@ -1197,44 +1170,8 @@ class LocalStorageBackend(StorageBackend):
             新增的 RSS 条目 {feed_id: [RSSItem, ...]}
         """
         try:
-            # 获取历史数据
-            historical_data = self.get_rss_data(current_data.date)
-
-            if not historical_data:
-                # 没有历史数据，所有都是新的
-                return current_data.items.copy()
-
-            # 获取当前批次时间
-            current_time = current_data.crawl_time
-
-            # 收集历史 URL（first_time < current_time 的条目）
-            historical_urls: Dict[str, set] = {}
-            for feed_id, rss_list in historical_data.items.items():
-                historical_urls[feed_id] = set()
-                for item in rss_list:
-                    first_time = getattr(item, 'first_time', item.crawl_time)
-                    if first_time < current_time:
-                        if item.url:
-                            historical_urls[feed_id].add(item.url)
-
-            # 检查是否有历史数据
-            has_historical_data = any(len(urls) > 0 for urls in historical_urls.values())
-            if not has_historical_data:
-                # 第一次抓取，没有"新增"概念
-                return {}
-
-            # 检测新增
-            new_items: Dict[str, List[RSSItem]] = {}
-            for feed_id, rss_list in current_data.items.items():
-                hist_set = historical_urls.get(feed_id, set())
-                for item in rss_list:
-                    # 通过 URL 判断是否新增
-                    if item.url and item.url not in hist_set:
-                        if feed_id not in new_items:
-                            new_items[feed_id] = []
-                        new_items[feed_id].append(item)
-
-            return new_items
+            conn = self._get_connection(current_data.date, db_type="rss")
+            return find_new_rss_items(conn.cursor(), current_data)
 
         except Exception as e:
             print(f"[本地存储] 检测新 RSS 条目失败: {e}")
@@ -6,7 +6,8 @@
 """
 
 import os
-from typing import Optional
+from datetime import timedelta
+from typing import List, Optional
 
 from trendradar.storage.base import StorageBackend, NewsData, RSSData
 
@@ -38,6 +39,7 @@ class StorageManager:
         pull_enabled: bool = False,
         pull_days: int = 0,
         timezone: str = "Asia/Shanghai",
+        archive_enabled: bool = False,
     ):
         """
         初始化存储管理器
@@ -53,6 +55,7 @@ class StorageManager:
             pull_enabled: 是否启用启动时自动拉取
             pull_days: 拉取最近 N 天的数据
             timezone: 时区配置（默认 Asia/Shanghai）
+            archive_enabled: 是否将已结束日期的本地数据归档为 Parquet（供 MCP 多日查询）
         """
         self.backend_type = backend_type
         self.data_dir = data_dir
@@ -64,6 +67,7 @@ class StorageManager:
         self.pull_enabled = pull_enabled
         self.pull_days = pull_days
         self.timezone = timezone
+        self.archive_enabled = archive_enabled
 
         self._backend: Optional[StorageBackend] = None
         self._remote_backend: Optional[StorageBackend] = None
@@ -134,6 +138,10 @@ class StorageManager:
                 secret_access_key=self.remote_config.get("secret_access_key") or os.environ.get("S3_SECRET_ACCESS_KEY", ""),
                 endpoint_url=self.remote_config.get("endpoint_url") or os.environ.get("S3_ENDPOINT_URL", ""),
                 region=self.remote_config.get("region") or os.environ.get("S3_REGION", ""),
+                sync_mode=self.remote_config.get("sync_mode", "full"),
+                compact_every=self.remote_config.get("compact_every", 12),
+                transfer_workers=self.remote_config.get("transfer_workers", 4),
+                cache_dir=os.path.join(self.data_dir, ".cache", "remote"),
                 enable_txt=self.enable_txt,
                 enable_html=self.enable_html,
                 timezone=self.timezone,
@@ -209,6 +217,10 @@ class StorageManager:
         """获取指定日期的所有 RSS 数据（当日汇总模式）"""
         return self.get_backend().get_rss_data(date)
 
+    def iter_rss_rows(self, date: Optional[str] = None):
+        """按 Feed 流式读取指定日期的所有 RSS 条目"""
+        return self.get_backend().iter_rss_rows(date)
+
     def get_latest_rss_data(self, date: Optional[str] = None) -> Optional[RSSData]:
         """获取最新一次抓取的 RSS 数据（当前榜单模式）"""
         return self.get_backend().get_latest_rss_data(date)
@@ -221,13 +233,21 @@ class StorageManager:
         """获取当天所有数据"""
         return self.get_backend().get_today_all_data(date)
 
+    def iter_news_rows(self, date: Optional[str] = None, platform_ids: Optional[List[str]] = None):
+        """按平台流式读取当天所有数据"""
+        return self.get_backend().iter_news_rows(date, platform_ids)
+
     def get_latest_crawl_data(self, date: Optional[str] = None) -> Optional[NewsData]:
         """获取最新抓取数据"""
         return self.get_backend().get_latest_crawl_data(date)
 
-    def detect_new_titles(self, current_data: NewsData) -> dict:
+    def detect_new_titles(
+        self,
+        current_data: NewsData,
+        platform_ids: Optional[List[str]] = None,
+    ) -> dict:
         """检测新增标题"""
-        return self.get_backend().detect_new_titles(current_data)
+        return self.get_backend().detect_new_titles(current_data, platform_ids)
 
     def save_txt_snapshot(self, data: NewsData) -> Optional[str]:
         """保存 TXT 快照"""
@@ -261,6 +281,10 @@ class StorageManager:
         if self.local_retention_days > 0:
             total_deleted += self.get_backend().cleanup_old_data(self.local_retention_days)
 
+        # 归档已结束的日期（仅本地后端，远程后端的数据库在临时目录中）
+        if self.archive_enabled and self.get_backend().backend_name == "local":
+            self.archive_closed_days()
+
         # 清理远程数据（如果配置了）
         if self.remote_retention_days > 0 and self._has_remote_config():
             if self._remote_backend is None:
@@ -270,6 +294,27 @@ class StorageManager:
 
         return total_deleted
 
+    def archive_closed_days(self) -> int:
+        """
+        将今天之前的本地数据库归档到 {data_dir}/archive/，并按本地保留天数清理过期归档
+
+        Returns:
+            本次归档的日期数量
+        """
+        from trendradar.storage.archive import compact_closed_days, prune_archive
+        from trendradar.utils.time import get_configured_time
+
+        now = get_configured_time(self.timezone)
+        try:
+            archived = compact_closed_days(self.data_dir, before_date=now.strftime("%Y-%m-%d"))
+            if self.local_retention_days > 0:
+                cutoff = now - timedelta(days=self.local_retention_days)
+                prune_archive(self.data_dir, before_date=cutoff.strftime("%Y-%m-%d"))
+            return archived
+        except Exception as e:
+            print(f"[存储管理器] 归档失败: {e}")
+            return 0
+
     @property
     def backend_name(self) -> str:
         """获取当前后端名称"""
@@ -319,6 +364,7 @@ def get_storage_manager(
     pull_enabled: bool = False,
     pull_days: int = 0,
     timezone: str = "Asia/Shanghai",
+    archive_enabled: bool = False,
     force_new: bool = False,
 ) -> StorageManager:
     """
@@ -335,6 +381,7 @@ def get_storage_manager(
         pull_enabled: 是否启用启动时自动拉取
         pull_days: 拉取最近 N 天的数据
         timezone: 时区配置（默认 Asia/Shanghai）
+        archive_enabled: 是否归档已结束日期的本地数据
         force_new: 是否强制创建新实例
 
     Returns:
@@ -354,6 +401,7 @@ def get_storage_manager(
             pull_enabled=pull_enabled,
             pull_days=pull_days,
             timezone=timezone,
+            archive_enabled=archive_enabled,
         )
 
     return _storage_manager
@@ -5,17 +5,38 @@
 支持 Cloudflare R2、阿里云 OSS、腾讯云 COS、AWS S3、MinIO 等
 使用 S3 兼容 API (boto3) 访问对象存储
 数据流程：下载当天 SQLite → 合并新数据 → 上传回远程
+
+同步模式（sync_mode）：
+- full: 每次保存后上传整个数据库文件（默认）
+- delta: 每次保存后只上传本次变更的行（增量段），段数达到 compact_every 时
+  上传整库作为新的基础库并删除旧段，详见 delta_sync 模块
+
+大文件传输：
+- 上传按分段流式读取文件，超过 PART_SIZE 时使用分段上传（multipart），
+  每段带 Content-MD5 由服务端校验，失败只重传该段
+- 下载按 Range 分段并行写入 .part 文件，已完成的分段记录在 .part.json 中，
+  重试或下次运行时从断点继续；完成后按 MD5 校验再替换目标文件
+
+本地副本（cache_dir）：
+- 与远程一致的数据库保存为 {cache_dir}/{对象键}，并记录其基础库的内容标识
+- 下次运行时基础库未变（未发生压缩或整库上传）则复制本地副本，只下载新的增量段
 """
 
+import base64
+import hashlib
+import json
 import pytz
 import re
 import shutil
 import sys
 import tempfile
+import threading
+import time
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
 try:
     import boto3
@@ -28,13 +49,37 @@ except ImportError:
     BotoConfig = None
     ClientError = Exception
 
-from trendradar.storage.base import StorageBackend, NewsItem, NewsData, RSSItem, RSSData
+# 不可重试的错误码（对象不存在、无权限、对象在下载过程中被替换）
+NON_RETRYABLE_ERRORS = ("404", "NoSuchKey", "Not Found", "403", "AccessDenied",
+                        "412", "PreconditionFailed")
+
+from trendradar.storage.base import StorageBackend, NewsItem, NewsData, NewsRow, RSSItem, RSSData, RSSRow
+from trendradar.storage.connection import SQLiteConnectionCache, WRITER_PRAGMAS
+from trendradar.storage.delta_sync import (
+    apply_changeset,
+    clear_changes,
+    collect_changeset,
+    decode_changeset,
+    enable_change_tracking,
+    encode_changeset,
+    get_sync_seq,
+    parse_segment_seq,
+    segment_key,
+    segment_prefix,
+    set_sync_seq,
+)
+from trendradar.storage.sqlite_ops import (
+    find_new_rss_items,
+    find_new_titles,
+    iter_news_rows_by_platform,
+    iter_rss_rows_by_feed,
+    save_news_items,
+)
 from trendradar.utils.time import (
     get_configured_time,
     format_date_folder,
     format_time_filename,
 )
-from trendradar.utils.url import normalize_url
 
 
 class RemoteStorageBackend(StorageBackend):
@@ -50,6 +95,13 @@ class RemoteStorageBackend(StorageBackend):
     - 运行结束后自动清理临时文件
     """
 
+    # 分段大小：超过该大小的文件使用分段上传 / 分段并行下载
+    PART_SIZE = 16 * 1024 * 1024
+    # 单个请求（单段）的最大尝试次数
+    TRANSFER_RETRIES = 3
+    # 本地副本保留时间（秒），保存其他日期的副本时删除超时的副本
+    REPLICA_MAX_AGE = 2 * 24 * 3600
+
     def __init__(
         self,
         bucket_name: str,
@@ -61,6 +113,12 @@ class RemoteStorageBackend(StorageBackend):
         enable_html: bool = True,
         temp_dir: Optional[str] = None,
         timezone: str = "Asia/Shanghai",
+        bulk_write: bool = True,
+        max_connections: int = 8,
+        sync_mode: str = "full",
+        compact_every: int = 12,
+        transfer_workers: int = 4,
+        cache_dir: Optional[str] = None,
     ):
         """
         初始化远程存储后端
@@ -75,6 +133,12 @@ class RemoteStorageBackend(StorageBackend):
             enable_html: 是否启用 HTML 报告
             temp_dir: 临时目录路径（默认使用系统临时目录）
             timezone: 时区配置（默认 Asia/Shanghai）
+            bulk_write: 是否使用批量写入模式（默认开启，关闭时逐条写入）
+            max_connections: 最多同时保持打开的数据库连接数（LRU 淘汰）
+            sync_mode: 同步模式（"full" 整库上传，"delta" 增量段上传）
+            compact_every: 增量模式下累计多少个段后上传整库（压缩）
+            transfer_workers: 并行传输线程数（多个对象并行拉取 / 单个大对象分段并行下载）
+            cache_dir: 本地副本目录（跨运行保留，基础库未变时只下载新的增量段；默认不保留）
         """
         if not HAS_BOTO3:
             raise ImportError("远程存储后端需要安装 boto3: pip install boto3")
@@ -85,10 +149,18 @@ class RemoteStorageBackend(StorageBackend):
         self.enable_txt = enable_txt
         self.enable_html = enable_html
         self.timezone = timezone
+        self.bulk_write = bulk_write
+        if sync_mode not in ("full", "delta"):
+            print(f"[远程存储] 未知的同步模式 {sync_mode}，使用 full")
+            sync_mode = "full"
+        self.sync_mode = sync_mode
+        self.compact_every = max(1, compact_every)
+        self.transfer_workers = max(1, transfer_workers)
 
         # 创建临时目录
         self.temp_dir = Path(temp_dir) if temp_dir else Path(tempfile.mkdtemp(prefix="trendradar_"))
         self.temp_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_dir = Path(cache_dir) if cache_dir else None
 
         # 初始化 S3 客户端
         # 使用 virtual-hosted style addressing（主流）
@@ -98,10 +170,22 @@ class RemoteStorageBackend(StorageBackend):
         is_tencent_cos = "myqcloud.com" in endpoint_url.lower()
         signature_version = 's3' if is_tencent_cos else 's3v4'
 
-        s3_config = BotoConfig(
-            s3={"addressing_style": "virtual"},
-            signature_version=signature_version,
-        )
+        config_kwargs = {
+            "s3": {"addressing_style": "virtual"},
+            "signature_version": signature_version,
+            # 并行传输时每个线程占用一个连接
+            "max_pool_connections": max(10, self.transfer_workers * 4),
+        }
+        try:
+            # botocore >= 1.36 默认为请求附加 CRC 校验（aws-chunked 编码），
+            # 部分 S3 兼容服务不支持；完整性由 Content-MD5 保证
+            s3_config = BotoConfig(
+                request_checksum_calculation="when_required",
+                response_checksum_validation="when_required",
+                **config_kwargs,
+            )
+        except TypeError:
+            s3_config = BotoConfig(**config_kwargs)
 
         client_kwargs = {
             "endpoint_url": endpoint_url,
@@ -116,7 +200,15 @@ class RemoteStorageBackend(StorageBackend):
 
         # 跟踪下载的文件（用于清理）
         self._downloaded_files: List[Path] = []
-        self._db_connections: Dict[str, sqlite3.Connection] = {}
+        # 临时数据库整体上传，保持默认日志模式（不使用 WAL，避免上传前还需 checkpoint）
+        self._db_connections = SQLiteConnectionCache(
+            max_connections,
+            pragmas={k: v for k, v in WRITER_PRAGMAS.items() if k not in ("journal_mode", "synchronous")},
+        )
+        # 增量模式：远程已存在基础库的对象键
+        self._remote_bases: Set[str] = set()
+        # 各对象键当前基础库的内容标识（用于本地副本）
+        self._base_identities: Dict[str, str] = {}
 
         print(f"[远程存储] 初始化完成，存储桶: {bucket_name}，签名版本: {signature_version}")
 
@@ -180,28 +272,101 @@ class RemoteStorageBackend(StorageBackend):
         Returns:
             是否存在
         """
+        return self._head_object(r2_key) is not None
+
+    def _head_object(self, r2_key: str) -> Optional[Dict]:
+        """
+        获取远程对象的元信息
+
+        Args:
+            r2_key: 远程对象键
+
+        Returns:
+            head_object 响应，对象不存在时返回 None
+        """
         try:
-            self.s3_client.head_object(Bucket=self.bucket_name, Key=r2_key)
-            return True
+            return self.s3_client.head_object(Bucket=self.bucket_name, Key=r2_key)
         except ClientError as e:
             error_code = e.response.get("Error", {}).get("Code", "")
             # S3 兼容存储可能返回 404, NoSuchKey, 或其他变体
             if error_code in ("404", "NoSuchKey", "Not Found"):
-                return False
+                return None
             # 其他错误（如权限问题）也视为不存在，但打印警告
             print(f"[远程存储] 检查对象存在性失败 ({r2_key}): {e}")
-            return False
+            return None
         except Exception as e:
             print(f"[远程存储] 检查对象存在性异常 ({r2_key}): {e}")
+            return None
+
+    @staticmethod
+    def _object_identity(head: Dict) -> str:
+        """对象的内容标识（上传时写入的 md5 元数据，没有时使用 ETag）"""
+        return head.get("Metadata", {}).get("md5") or head.get("ETag", "").strip('"')
+
+    def _get_replica_path(self, r2_key: str) -> Optional[Path]:
+        """本地副本路径 {cache_dir}/{对象键}，未设置 cache_dir 时返回 None"""
+        return self.cache_dir / r2_key if self.cache_dir else None
+
+    def _load_replica(self, r2_key: str, identity: str, local_path: Path) -> bool:
+        """
+        基础库未变时把本地副本复制到 local_path
+
+        Args:
+            r2_key: 远程对象键
+            identity: 远程基础库当前的内容标识
+            local_path: 本地目标路径
+
+        Returns:
+            是否使用了本地副本
+        """
+        replica = self._get_replica_path(r2_key)
+        if replica is None or not replica.exists():
             return False
+        try:
+            meta = json.loads(replica.with_name(replica.name + ".json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False
+        if meta.get("base") != identity:
+            return False
+        shutil.copyfile(replica, local_path)
+        return True
+
+    def _save_replica(self, r2_key: str, local_path: Path, identity: Optional[str]) -> None:
+        """
+        把与远程一致的数据库保存为本地副本，并记录其基础库的内容标识
+
+        副本只是缓存，保存失败时只打印警告。同时删除超过 REPLICA_MAX_AGE 的其他副本。
+
+        Args:
+            r2_key: 远程对象键
+            local_path: 已同步的本地数据库
+            identity: 远程基础库的内容标识
+        """
+        replica = self._get_replica_path(r2_key)
+        if replica is None or not identity:
+            return
+        meta_path = replica.with_name(replica.name + ".json")
+        try:
+            replica.parent.mkdir(parents=True, exist_ok=True)
+            # 先删除标识再替换副本，中途失败时副本不会被误用
+            meta_path.unlink(missing_ok=True)
+            tmp_path = replica.with_name(replica.name + ".tmp")
+            shutil.copyfile(local_path, tmp_path)
+            tmp_path.replace(replica)
+            meta_path.write_text(json.dumps({"base": identity}), encoding="utf-8")
+
+            now = time.time()
+            for path in replica.parent.glob("*.db"):
+                if path != replica and now - path.stat().st_mtime > self.REPLICA_MAX_AGE:
+                    path.unlink(missing_ok=True)
+                    path.with_name(path.name + ".json").unlink(missing_ok=True)
+        except Exception as e:
+            print(f"[远程存储] 保存本地副本失败 ({r2_key}): {e}")
 
     def _download_sqlite(self, date: Optional[str] = None, db_type: str = "news") -> Optional[Path]:
         """
         从远程存储下载当天的 SQLite 文件到本地临时目录
 
-        使用 get_object + iter_chunks 替代 download_file，
-        以正确处理腾讯云 COS 的 chunked transfer encoding。
-
         Args:
             date: 日期字符串
             db_type: 数据库类型 ("news" 或 "rss")
@@ -215,35 +380,416 @@ class RemoteStorageBackend(StorageBackend):
         # 确保目录存在
         local_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # 先检查文件是否存在
-        if not self._check_object_exists(r2_key):
-            print(f"[远程存储] 文件不存在，将创建新数据库: {r2_key}")
+        if self.download_database(r2_key, local_path, db_type) is None:
             return None
+        self._downloaded_files.append(local_path)
+        return local_path
+
+    def _with_retries(self, func, description: str):
+        """
+        执行单个传输请求，失败时指数退避重试
+
+        Args:
+            func: 无参数的请求函数
+            description: 用于日志的请求描述
+
+        Returns:
+            func 的返回值
+        """
+        for attempt in range(self.TRANSFER_RETRIES):
+            try:
+                return func()
+            except Exception as e:
+                if isinstance(e, ClientError):
+                    error_code = e.response.get("Error", {}).get("Code", "")
+                    if error_code in NON_RETRYABLE_ERRORS:
+                        raise
+                if attempt == self.TRANSFER_RETRIES - 1:
+                    raise
+                print(f"[远程存储] {description} 失败，{2 ** attempt} 秒后重试: {e}")
+                time.sleep(2 ** attempt)
+
+    @staticmethod
+    def _content_md5(data: bytes) -> str:
+        """请求体的 Content-MD5（Base64 编码的 MD5 摘要）"""
+        return base64.b64encode(hashlib.md5(data).digest()).decode("ascii")
+
+    @staticmethod
+    def _file_md5(path: Path) -> str:
+        """流式计算文件 MD5（十六进制）"""
+        digest = hashlib.md5()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _get_object_to_file(self, r2_key: str, local_path: Path) -> None:
+        """
+        下载单个对象到本地文件
+
+        使用 get_object + iter_chunks 替代 download_file，
+        以正确处理腾讯云 COS 的 chunked transfer encoding。
+
+        按 PART_SIZE 划分 Range 并行下载到 {local_path}.part，
+        已完成的分段记录在 {local_path}.part.json（带 ETag），
+        重试或下次运行时只下载缺失的分段（对象已被替换时重新开始）。
+        完成后校验 MD5（上传时写入的 md5 元数据，或非分段上传对象的 ETag），
+        通过后再替换目标文件。
+        """
+        local_path = Path(local_path)
+        head = self.s3_client.head_object(Bucket=self.bucket_name, Key=r2_key)
+        size = head["ContentLength"]
+        etag = head["ETag"]
+        expected_md5 = head.get("Metadata", {}).get("md5")
+        if not expected_md5 and "-" not in etag:
+            expected_md5 = etag.strip('"')
+
+        part_path = local_path.with_name(local_path.name + ".part")
+        progress_path = local_path.with_name(local_path.name + ".part.json")
+        ranges = [(start, min(start + self.PART_SIZE, size) - 1)
+                  for start in range(0, size, self.PART_SIZE)]
+
+        # 断点续传：只沿用同一对象（ETag 相同）的已完成分段
+        done: Set[int] = set()
+        if part_path.exists() and progress_path.exists():
+            try:
+                progress = json.loads(progress_path.read_text(encoding="utf-8"))
+                if progress.get("etag") == etag and part_path.stat().st_size == size:
+                    done = set(progress.get("done", []))
+            except (OSError, ValueError):
+                done = set()
+        if not done:
+            with open(part_path, 'wb') as f:
+                f.truncate(size)
+        if done:
+            print(f"[远程存储] 断点续传: {r2_key}（已完成 {len(done)}/{len(ranges)} 段）")
+
+        lock = threading.Lock()
+
+        def fetch_range(index: int) -> None:
+            start, end = ranges[index]
+
+            def request():
+                response = self.s3_client.get_object(
+                    Bucket=self.bucket_name,
+                    Key=r2_key,
+                    Range=f"bytes={start}-{end}",
+                    IfMatch=etag,
+                )
+                with open(part_path, 'r+b') as f:
+                    f.seek(start)
+                    for chunk in response['Body'].iter_chunks(chunk_size=1024*1024):
+                        f.write(chunk)
+
+            self._with_retries(request, f"下载 {r2_key} [{start}-{end}]")
+            with lock:
+                done.add(index)
+                progress_path.write_text(
+                    json.dumps({"etag": etag, "done": sorted(done)}), encoding="utf-8"
+                )
+
+        pending = [i for i in range(len(ranges)) if i not in done]
+        if len(pending) > 1 and self.transfer_workers > 1:
+            with ThreadPoolExecutor(max_workers=min(self.transfer_workers, len(pending))) as executor:
+                # list() 传播各分段的异常
+                list(executor.map(fetch_range, pending))
+        else:
+            for index in pending:
+                fetch_range(index)
 
+        if expected_md5 and self._file_md5(part_path) != expected_md5:
+            part_path.unlink()
+            progress_path.unlink(missing_ok=True)
+            raise ValueError(f"下载校验失败（MD5 不一致）: {r2_key}")
+
+        part_path.replace(local_path)
+        progress_path.unlink(missing_ok=True)
+
+    def _put_file(self, local_path: Path, r2_key: str, content_type: str) -> None:
+        """
+        流式上传本地文件（不把整个文件读入内存）
+
+        不超过 PART_SIZE 的文件单次 put_object，更大的文件使用分段上传，
+        每次只读取一段。每个请求带 Content-MD5 由服务端校验，失败只重试该段；
+        整个文件的 MD5 写入对象元数据 md5，供下载方校验（分段上传对象的 ETag 不是 MD5）。
+
+        Args:
+            local_path: 本地文件路径
+            r2_key: 远程对象键
+            content_type: 对象 Content-Type
+        """
+        size = local_path.stat().st_size
+        metadata = {"md5": self._file_md5(local_path)}
+        content_md5 = self._content_md5
+
+        if size <= self.PART_SIZE:
+            # 读取为 bytes 并明确设置 ContentLength，
+            # 避免传入文件对象时使用 chunked transfer encoding（腾讯云 COS 等无法正确处理）
+            with open(local_path, 'rb') as f:
+                body = f.read()
+            self._with_retries(
+                lambda: self.s3_client.put_object(
+                    Bucket=self.bucket_name,
+                    Key=r2_key,
+                    Body=body,
+                    ContentLength=size,
+                    ContentMD5=content_md5(body),
+                    ContentType=content_type,
+                    Metadata=metadata,
+                ),
+                f"上传 {r2_key}",
+            )
+            return
+
+        upload_id = self.s3_client.create_multipart_upload(
+            Bucket=self.bucket_name,
+            Key=r2_key,
+            ContentType=content_type,
+            Metadata=metadata,
+        )["UploadId"]
         try:
-            # 使用 get_object + iter_chunks 替代 download_file
-            # iter_chunks 会自动处理 chunked transfer encoding
-            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=r2_key)
-            with open(local_path, 'wb') as f:
-                for chunk in response['Body'].iter_chunks(chunk_size=1024*1024):
-                    f.write(chunk)
-            self._downloaded_files.append(local_path)
-            print(f"[远程存储] 已下载: {r2_key} -> {local_path}")
-            return local_path
-        except ClientError as e:
-            error_code = e.response.get("Error", {}).get("Code", "")
-            # S3 兼容存储可能返回不同的错误码
-            if error_code in ("404", "NoSuchKey", "Not Found"):
+            parts = []
+            with open(local_path, 'rb') as f:
+                for part_number in range(1, (size + self.PART_SIZE - 1) // self.PART_SIZE + 1):
+                    data = f.read(self.PART_SIZE)
+                    response = self._with_retries(
+                        lambda: self.s3_client.upload_part(
+                            Bucket=self.bucket_name,
+                            Key=r2_key,
+                            UploadId=upload_id,
+                            PartNumber=part_number,
+                            Body=data,
+                            ContentLength=len(data),
+                            ContentMD5=content_md5(data),
+                        ),
+                        f"上传 {r2_key} 第 {part_number} 段",
+                    )
+                    parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+
+            self._with_retries(
+                lambda: self.s3_client.complete_multipart_upload(
+                    Bucket=self.bucket_name,
+                    Key=r2_key,
+                    UploadId=upload_id,
+                    MultipartUpload={"Parts": parts},
+                ),
+                f"完成分段上传 {r2_key}",
+            )
+        except Exception:
+            try:
+                self.s3_client.abort_multipart_upload(
+                    Bucket=self.bucket_name, Key=r2_key, UploadId=upload_id
+                )
+            except Exception as e:
+                print(f"[远程存储] 取消分段上传失败: {e}")
+            raise
+
+    def download_database(
+        self,
+        r2_key: str,
+        local_path: Path,
+        db_type: str = "news",
+    ) -> Optional[Path]:
+        """
+        下载远程数据库到指定路径（基础库 + 回放增量段）
+
+        设置了 cache_dir 且基础库未变时，复制本地副本代替下载基础库，
+        只下载副本之后的增量段；完成后更新本地副本。
+
+        Args:
+            r2_key: 远程对象键，如 "news/2025-12-28.db"
+            local_path: 本地目标路径
+            db_type: 数据库类型 ("news" 或 "rss")
+
+        Returns:
+            本地文件路径，如果远程不存在返回 None
+        """
+        local_path = Path(local_path)
+
+        # 基础库与增量段之间可能被并发压缩，段号不连续时重新下载一次
+        for attempt in range(2):
+            head = self._head_object(r2_key)
+            segments = self._list_segments(r2_key)
+            if head is None and not segments:
                 print(f"[远程存储] 文件不存在，将创建新数据库: {r2_key}")
                 return None
-            else:
+
+            try:
+                identity = self._object_identity(head) if head is not None else None
+                if head is not None:
+                    # 段号不连续重试时不再使用本地副本
+                    if attempt == 0 and self._load_replica(r2_key, identity, local_path):
+                        print(f"[远程存储] 基础库未变，使用本地副本: {r2_key}")
+                    else:
+                        self._get_object_to_file(r2_key, local_path)
+                        print(f"[远程存储] 已下载: {r2_key} -> {local_path}")
+                    self._remote_bases.add(r2_key)
+                    self._base_identities[r2_key] = identity
+                elif local_path.exists():
+                    local_path.unlink()
+
+                if not segments or self._apply_segments(r2_key, local_path, db_type, segments):
+                    self._save_replica(r2_key, local_path, identity)
+                    return local_path
+            except ClientError as e:
+                error_code = e.response.get("Error", {}).get("Code", "")
+                # S3 兼容存储可能返回不同的错误码
+                if error_code in ("404", "NoSuchKey", "Not Found") and attempt == 0:
+                    continue
+                if error_code in ("404", "NoSuchKey", "Not Found"):
+                    print(f"[远程存储] 文件不存在，将创建新数据库: {r2_key}")
+                    return None
                 print(f"[远程存储] 下载失败 (错误码: {error_code}): {e}")
                 raise
-        except Exception as e:
-            print(f"[远程存储] 下载异常: {e}")
-            raise
+            except Exception as e:
+                print(f"[远程存储] 下载异常: {e}")
+                raise
+
+        print(f"[远程存储] 增量段不连续，使用已下载的数据: {r2_key}")
+        return local_path
+
+    def _list_segments(self, r2_key: str) -> List[Tuple[int, str]]:
+        """
+        列出数据库的增量段
+
+        Returns:
+            [(段号, 对象键)]，按段号升序
+        """
+        segments = []
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=segment_prefix(r2_key)):
+            for obj in page.get('Contents', []):
+                seq = parse_segment_seq(obj['Key'])
+                if seq is not None:
+                    segments.append((seq, obj['Key']))
+        return sorted(segments)
+
+    def _apply_segments(
+        self,
+        r2_key: str,
+        local_path: Path,
+        db_type: str,
+        segments: List[Tuple[int, str]],
+    ) -> bool:
+        """
+        在本地数据库上按序回放尚未应用的增量段
+
+        Returns:
+            段号是否连续（不连续时说明基础库已被更新的压缩替换，需要重新下载）
+        """
+        conn = sqlite3.connect(str(local_path))
+        try:
+            self._init_tables(conn, db_type)
+            seq, _ = get_sync_seq(conn)
+            pending = [(n, key) for n, key in segments if n > seq]
+            if pending and pending[0][0] != seq + 1:
+                return False
+
+            rows = 0
+            for n, key in pending:
+                response = self.s3_client.get_object(Bucket=self.bucket_name, Key=key)
+                rows += apply_changeset(conn, decode_changeset(response['Body'].read()))
+                set_sync_seq(conn, n)
+            conn.commit()
+        finally:
+            conn.close()
+
+        if pending:
+            print(f"[远程存储] 已回放 {len(pending)} 个增量段（{rows} 行）: {r2_key}")
+        return True
 
     def _upload_sqlite(self, date: Optional[str] = None, db_type: str = "news") -> bool:
+        """
+        同步本地 SQLite 到远程存储（按 sync_mode 整库上传或上传增量段）
+
+        Args:
+            date: 日期字符串
+            db_type: 数据库类型 ("news" 或 "rss")
+
+        Returns:
+            是否同步成功
+        """
+        if self.sync_mode == "delta":
+            return self._upload_changeset(date, db_type)
+        return self._upload_whole_file(date, db_type)
+
+    def _upload_changeset(self, date: Optional[str] = None, db_type: str = "news") -> bool:
+        """
+        上传自上次同步以来的变更行（增量段）
+
+        远程尚无基础库，或累计段数达到 compact_every 时，改为上传整库（压缩）
+        并删除已合并的段。
+
+        Args:
+            date: 日期字符串
+            db_type: 数据库类型 ("news" 或 "rss")
+
+        Returns:
+            是否同步成功
+        """
+        r2_key = self._get_remote_db_key(date, db_type)
+        conn = self._get_connection(date, db_type)
+        seq, base_seq = get_sync_seq(conn)
+
+        if r2_key not in self._remote_bases or seq - base_seq >= self.compact_every:
+            # 压缩：基础库记录其已包含的段号，读取方据此跳过旧段
+            set_sync_seq(conn, seq, base_seq=seq)
+            conn.commit()
+            if not self._upload_whole_file(date, db_type):
+                set_sync_seq(conn, seq, base_seq=base_seq)
+                conn.commit()
+                return False
+            clear_changes(conn)
+            conn.commit()
+            self._remote_bases.add(r2_key)
+            self._delete_segments(r2_key, up_to=seq)
+            return True
+
+        changeset = collect_changeset(conn)
+        if changeset is None:
+            return True
+
+        body = encode_changeset(changeset)
+        key = segment_key(r2_key, seq + 1)
+        rows = sum(len(t["upsert"]) + len(t["delete"]) for t in changeset["tables"].values())
+        try:
+            self._with_retries(
+                lambda: self.s3_client.put_object(
+                    Bucket=self.bucket_name,
+                    Key=key,
+                    Body=body,
+                    ContentLength=len(body),
+                    ContentMD5=self._content_md5(body),
+                    ContentType='application/gzip',
+                ),
+                f"上传增量段 {key}",
+            )
+        except Exception as e:
+            print(f"[远程存储] 增量段上传失败: {e}")
+            return False
+
+        set_sync_seq(conn, seq + 1)
+        clear_changes(conn)
+        conn.commit()
+        print(f"[远程存储] 已上传增量段: {key} ({len(body)} bytes, {rows} 行)")
+        self._save_replica(r2_key, self._get_local_db_path(date, db_type), self._base_identities.get(r2_key))
+        return True
+
+    def _delete_segments(self, r2_key: str, up_to: int) -> None:
+        """删除已合并到基础库的增量段"""
+        try:
+            keys = [{'Key': key} for n, key in self._list_segments(r2_key) if n <= up_to]
+            for i in range(0, len(keys), 1000):
+                self.s3_client.delete_objects(
+                    Bucket=self.bucket_name,
+                    Delete={'Objects': keys[i:i + 1000]}
+                )
+            if keys:
+                print(f"[远程存储] 已合并并删除 {len(keys)} 个增量段: {r2_key}")
+        except Exception as e:
+            print(f"[远程存储] 删除增量段失败: {e}")
+
+    def _upload_whole_file(self, date: Optional[str] = None, db_type: str = "news") -> bool:
         """
         上传本地 SQLite 文件到远程存储
 
@@ -266,25 +812,15 @@ class RemoteStorageBackend(StorageBackend):
             local_size = local_path.stat().st_size
             print(f"[远程存储] 准备上传: {local_path} ({local_size} bytes) -> {r2_key}")
 
-            # 读取文件内容为 bytes 后上传
-            # 避免传入文件对象时 requests 库使用 chunked transfer encoding
-            # 腾讯云 COS 等 S3 兼容服务可能无法正确处理 chunked encoding
-            with open(local_path, 'rb') as f:
-                file_content = f.read()
-
-            # 使用 put_object 并明确设置 ContentLength，确保不使用 chunked encoding
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=r2_key,
-                Body=file_content,
-                ContentLength=local_size,
-                ContentType='application/x-sqlite3',
-            )
+            self._put_file(local_path, r2_key, 'application/x-sqlite3')
             print(f"[远程存储] 已上传: {local_path} -> {r2_key}")
 
             # 验证上传成功
-            if self._check_object_exists(r2_key):
+            head = self._head_object(r2_key)
+            if head is not None:
                 print(f"[远程存储] 上传验证成功: {r2_key}")
+                self._base_identities[r2_key] = self._object_identity(head)
+                self._save_replica(r2_key, local_path, self._base_identities[r2_key])
                 return True
             else:
                 print(f"[远程存储] 上传验证失败: 文件未在远程存储中找到")
@@ -306,9 +842,8 @@ class RemoteStorageBackend(StorageBackend):
             数据库连接
         """
         local_path = self._get_local_db_path(date, db_type)
-        db_path = str(local_path)
 
-        if db_path not in self._db_connections:
+        if local_path not in self._db_connections:
             # 确保目录存在
             local_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -316,12 +851,11 @@ class RemoteStorageBackend(StorageBackend):
             if not local_path.exists():
                 self._download_sqlite(date, db_type)
 
-            conn = sqlite3.connect(db_path)
-            conn.row_factory = sqlite3.Row
-            self._init_tables(conn, db_type)
-            self._db_connections[db_path] = conn
-
-        return self._db_connections[db_path]
+        return self._db_connections.get(
+            local_path,
+            init=lambda conn: self._init_tables(conn, db_type),
+            on_connect=enable_change_tracking if self.sync_mode == "delta" else None,
+        )
 
     def _get_schema_path(self, db_type: str = "news") -> Path:
         """
@@ -392,103 +926,11 @@ class RemoteStorageBackend(StorageBackend):
                         updated_at = excluded.updated_at
                 """, (source_id, source_name, now_str))
 
-            # 统计计数器
-            new_count = 0
-            updated_count = 0
-            title_changed_count = 0
-            success_sources = []
-
-            for source_id, news_list in data.items.items():
-                success_sources.append(source_id)
-
-                for item in news_list:
-                    try:
-                        # 标准化 URL（去除动态参数，如微博的 band_rank）
-                        normalized_url = normalize_url(item.url, source_id) if item.url else ""
-
-                        # 检查是否已存在（通过标准化 URL + platform_id）
-                        if normalized_url:
-                            cursor.execute("""
-                                SELECT id, title FROM news_items
-                                WHERE url = ? AND platform_id = ?
-                            """, (normalized_url, source_id))
-                            existing = cursor.fetchone()
-
-                            if existing:
-                                # 已存在，更新记录
-                                existing_id, existing_title = existing
-
-                                # 检查标题是否变化
-                                if existing_title != item.title:
-                                    # 记录标题变更
-                                    cursor.execute("""
-                                        INSERT INTO title_changes
-                                        (news_item_id, old_title, new_title, changed_at)
-                                        VALUES (?, ?, ?, ?)
-                                    """, (existing_id, existing_title, item.title, now_str))
-                                    title_changed_count += 1
-
-                                # 记录排名历史
-                                cursor.execute("""
-                                    INSERT INTO rank_history
-                                    (news_item_id, rank, crawl_time, created_at)
-                                    VALUES (?, ?, ?, ?)
-                                """, (existing_id, item.rank, data.crawl_time, now_str))
-
-                                # 更新现有记录
-                                cursor.execute("""
-                                    UPDATE news_items SET
-                                        title = ?,
-                                        rank = ?,
-                                        mobile_url = ?,
-                                        last_crawl_time = ?,
-                                        crawl_count = crawl_count + 1,
-                                        updated_at = ?
-                                    WHERE id = ?
-                                """, (item.title, item.rank, item.mobile_url,
-                                      data.crawl_time, now_str, existing_id))
-                                updated_count += 1
-                            else:
-                                # 不存在，插入新记录（存储标准化后的 URL）
-                                cursor.execute("""
-                                    INSERT INTO news_items
-                                    (title, platform_id, rank, url, mobile_url,
-                                     first_crawl_time, last_crawl_time, crawl_count,
-                                     created_at, updated_at)
-                                    VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
-                                """, (item.title, source_id, item.rank, normalized_url,
-                                      item.mobile_url, data.crawl_time, data.crawl_time,
-                                      now_str, now_str))
-                                new_id = cursor.lastrowid
-                                # 记录初始排名
-                                cursor.execute("""
-                                    INSERT INTO rank_history
-                                    (news_item_id, rank, crawl_time, created_at)
-                                    VALUES (?, ?, ?, ?)
-                                """, (new_id, item.rank, data.crawl_time, now_str))
-                                new_count += 1
-                        else:
-                            # URL 为空的情况，直接插入（不做去重）
-                            cursor.execute("""
-                                INSERT INTO news_items
-                                (title, platform_id, rank, url, mobile_url,
-                                 first_crawl_time, last_crawl_time, crawl_count,
-                                 created_at, updated_at)
-                                VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
-                            """, (item.title, source_id, item.rank, "",
-                                  item.mobile_url, data.crawl_time, data.crawl_time,
-                                  now_str, now_str))
-                            new_id = cursor.lastrowid
-                            # 记录初始排名
-                            cursor.execute("""
-                                INSERT INTO rank_history
-                                (news_item_id, rank, crawl_time, created_at)
-                                VALUES (?, ?, ?, ?)
-                            """, (new_id, item.rank, data.crawl_time, now_str))
-                            new_count += 1
-
-                    except sqlite3.Error as e:
-                        print(f"[远程存储] 保存新闻条目失败 [{item.title[:30]}...]: {e}")
+            # 写入新闻条目（批量模式按平台一次查询 + executemany，出错时回退为逐条写入）
+            success_sources = list(data.items.keys())
+            new_count, updated_count, title_changed_count = save_news_items(
+                cursor, data, now_str, bulk=self.bulk_write, log_prefix="[远程存储]"
+            )
 
             total_items = new_count + updated_count
 
@@ -563,71 +1005,32 @@ class RemoteStorageBackend(StorageBackend):
             conn = self._get_connection(date)
             cursor = conn.cursor()
 
-            # 获取所有新闻数据（包含 id 用于查询排名历史）
-            cursor.execute("""
-                SELECT n.id, n.title, n.platform_id, p.name as platform_name,
-                       n.rank, n.url, n.mobile_url,
-                       n.first_crawl_time, n.last_crawl_time, n.crawl_count
-                FROM news_items n
-                LEFT JOIN platforms p ON n.platform_id = p.id
-                ORDER BY n.platform_id, n.last_crawl_time
-            """)
-
-            rows = cursor.fetchall()
-            if not rows:
-                return None
-
-            # 收集所有 news_item_id
-            news_ids = [row[0] for row in rows]
-
-            # 批量查询排名历史
-            rank_history_map: Dict[int, List[int]] = {}
-            if news_ids:
-                placeholders = ",".join("?" * len(news_ids))
-                cursor.execute(f"""
-                    SELECT news_item_id, rank FROM rank_history
-                    WHERE news_item_id IN ({placeholders})
-                    ORDER BY news_item_id, crawl_time
-                """, news_ids)
-                for rh_row in cursor.fetchall():
-                    news_id, rank = rh_row[0], rh_row[1]
-                    if news_id not in rank_history_map:
-                        rank_history_map[news_id] = []
-                    if rank not in rank_history_map[news_id]:
-                        rank_history_map[news_id].append(rank)
-
-            # 按 platform_id 分组
+            # 按平台读取所有新闻（含排名历史）
             items: Dict[str, List[NewsItem]] = {}
             id_to_name: Dict[str, str] = {}
             crawl_date = self._format_date_folder(date)
 
-            for row in rows:
-                news_id = row[0]
-                platform_id = row[2]
-                title = row[1]
-                platform_name = row[3] or platform_id
-
+            for platform_id, platform_name, rows in iter_news_rows_by_platform(cursor):
                 id_to_name[platform_id] = platform_name
-
-                if platform_id not in items:
-                    items[platform_id] = []
-
-                # 获取排名历史，如果没有则使用当前排名
-                ranks = rank_history_map.get(news_id, [row[4]])
-
-                items[platform_id].append(NewsItem(
-                    title=title,
-                    source_id=platform_id,
-                    source_name=platform_name,
-                    rank=row[4],
-                    url=row[5] or "",
-                    mobile_url=row[6] or "",
-                    crawl_time=row[8],  # last_crawl_time
-                    ranks=ranks,
-                    first_time=row[7],  # first_crawl_time
-                    last_time=row[8],   # last_crawl_time
-                    count=row[9],       # crawl_count
-                ))
+                items[platform_id] = [
+                    NewsItem(
+                        title=row.title,
+                        source_id=platform_id,
+                        source_name=platform_name,
+                        rank=row.rank,
+                        url=row.url,
+                        mobile_url=row.mobile_url,
+                        crawl_time=row.last_time,
+                        ranks=row.ranks,
+                        first_time=row.first_time,
+                        last_time=row.last_time,
+                        count=row.count,
+                    )
+                    for row in rows
+                ]
+
+            if not items:
+                return None
 
             final_items = items
 
@@ -662,6 +1065,43 @@ class RemoteStorageBackend(StorageBackend):
             print(f"[远程存储] 读取数据失败: {e}")
             return None
 
+    def iter_news_rows(
+        self,
+        date: Optional[str] = None,
+        platform_ids: Optional[List[str]] = None,
+    ) -> Iterator[Tuple[str, str, List[NewsRow]]]:
+        """
+        按平台流式读取指定日期的所有新闻（每次只查询一个平台）
+
+        Args:
+            date: 日期字符串，默认为今天
+            platform_ids: 只读取这些平台，None 表示全部
+
+        Yields:
+            (平台 ID, 平台名称, 新闻行列表)
+        """
+        cursor = self._get_connection(date).cursor()
+        try:
+            yield from iter_news_rows_by_platform(cursor, platform_ids)
+        finally:
+            cursor.close()
+
+    def iter_rss_rows(self, date: Optional[str] = None) -> Iterator[Tuple[str, str, List[RSSRow]]]:
+        """
+        按 Feed 流式读取指定日期的所有 RSS 条目（每次只查询一个 Feed）
+
+        Args:
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+
+        Yields:
+            (Feed ID, Feed 名称, 条目行列表)
+        """
+        cursor = self._get_connection(date, db_type="rss").cursor()
+        try:
+            yield from iter_rss_rows_by_feed(cursor)
+        finally:
+            cursor.close()
+
     def get_latest_crawl_data(self, date: Optional[str] = None) -> Optional[NewsData]:
         """获取最新一次抓取的数据"""
         try:
@@ -743,51 +1183,21 @@ class RemoteStorageBackend(StorageBackend):
             print(f"[远程存储] 获取最新数据失败: {e}")
             return None
 
-    def detect_new_titles(self, current_data: NewsData) -> Dict[str, Dict]:
+    def detect_new_titles(
+        self,
+        current_data: NewsData,
+        platform_ids: Optional[List[str]] = None,
+    ) -> Dict[str, Dict]:
         """
         检测新增的标题
 
         该方法比较当前抓取数据与历史数据，找出新增的标题。
         关键逻辑：只有在历史批次中从未出现过的标题才算新增。
+        直接按当前批次的 (平台, 标题) 查询索引，不加载当天全部数据。
         """
         try:
-            historical_data = self.get_today_all_data(current_data.date)
-
-            if not historical_data:
-                new_titles = {}
-                for source_id, news_list in current_data.items.items():
-                    new_titles[source_id] = {item.title: item for item in news_list}
-                return new_titles
-
-            # 获取当前批次时间
-            current_time = current_data.crawl_time
-
-            # 收集历史标题（first_time < current_time 的标题）
-            # 这样可以正确处理同一标题因 URL 变化而产生多条记录的情况
-            historical_titles: Dict[str, set] = {}
-            for source_id, news_list in historical_data.items.items():
-                historical_titles[source_id] = set()
-                for item in news_list:
-                    first_time = getattr(item, 'first_time', item.crawl_time)
-                    if first_time < current_time:
-                        historical_titles[source_id].add(item.title)
-
-            # 检查是否有历史数据
-            has_historical_data = any(len(titles) > 0 for titles in historical_titles.values())
-            if not has_historical_data:
-                # 第一次抓取，没有"新增"概念
-                return {}
-
-            new_titles = {}
-            for source_id, news_list in current_data.items.items():
-                hist_set = historical_titles.get(source_id, set())
-                for item in news_list:
-                    if item.title not in hist_set:
-                        if source_id not in new_titles:
-                            new_titles[source_id] = {}
-                        new_titles[source_id][item.title] = item
-
-            return new_titles
+            conn = self._get_connection(current_data.date)
+            return find_new_titles(conn.cursor(), current_data, platform_ids)
 
         except Exception as e:
             print(f"[远程存储] 检测新标题失败: {e}")
@@ -887,16 +1297,10 @@ class RemoteStorageBackend(StorageBackend):
             return
 
         # 关闭数据库连接
-        db_connections = getattr(self, "_db_connections", {})
-        for db_path, conn in list(db_connections.items()):
-            try:
-                conn.close()
+        db_connections = getattr(self, "_db_connections", None)
+        if db_connections is not None:
+            for db_path in db_connections.close_all():
                 print(f"[远程存储] 关闭数据库连接: {db_path}")
-            except Exception as e:
-                print(f"[远程存储] 关闭连接失败 {db_path}: {e}")
-
-        if db_connections:
-            db_connections.clear()
 
         # 删除临时目录
         temp_dir = getattr(self, "temp_dir", None)
@@ -950,7 +1354,7 @@ class RemoteStorageBackend(StorageBackend):
                     folder_date = None
                     try:
                         # ISO 格式: news/YYYY-MM-DD.db
-                        date_match = re.match(r'news/(\d{4})-(\d{2})-(\d{2})\.db$', key)
+                        date_match = re.match(r'news/(\d{4})-(\d{2})-(\d{2})\.db(\.segments/.*)?$', key)
                         if date_match:
                             folder_date = datetime(
                                 int(date_match.group(1)),
@@ -1315,6 +1719,7 @@ class RemoteStorageBackend(StorageBackend):
 
         该方法比较当前抓取数据与历史数据，找出新增的 RSS 条目。
         关键逻辑：只有在历史批次中从未出现过的 URL 才算新增。
+        直接按当前批次的 (源, URL) 查询索引，不加载当天全部数据。
 
         Args:
             current_data: 当前抓取的 RSS 数据
@@ -1323,44 +1728,8 @@ class RemoteStorageBackend(StorageBackend):
             新增的 RSS 条目 {feed_id: [RSSItem, ...]}
         """
         try:
-            # 获取历史数据
-            historical_data = self.get_rss_data(current_data.date)
-
-            if not historical_data:
-                # 没有历史数据，所有都是新的
-                return current_data.items.copy()
-
-            # 获取当前批次时间
-            current_time = current_data.crawl_time
-
-            # 收集历史 URL（first_time < current_time 的条目）
-            historical_urls: Dict[str, set] = {}
-            for feed_id, rss_list in historical_data.items.items():
-                historical_urls[feed_id] = set()
-                for item in rss_list:
-                    first_time = getattr(item, 'first_time', item.crawl_time)
-                    if first_time < current_time:
-                        if item.url:
-                            historical_urls[feed_id].add(item.url)
-
-            # 检查是否有历史数据
-            has_historical_data = any(len(urls) > 0 for urls in historical_urls.values())
-            if not has_historical_data:
-                # 第一次抓取，没有"新增"概念
-                return {}
-
-            # 检测新增
-            new_items: Dict[str, List[RSSItem]] = {}
-            for feed_id, rss_list in current_data.items.items():
-                hist_set = historical_urls.get(feed_id, set())
-                for item in rss_list:
-                    # 通过 URL 判断是否新增
-                    if item.url and item.url not in hist_set:
-                        if feed_id not in new_items:
-                            new_items[feed_id] = []
-                        new_items[feed_id].append(item)
-
-            return new_items
+            conn = self._get_connection(current_data.date, db_type="rss")
+            return find_new_rss_items(conn.cursor(), current_data)
 
         except Exception as e:
             print(f"[远程存储] 检测新 RSS 条目失败: {e}")
@@ -1468,13 +1837,49 @@ class RemoteStorageBackend(StorageBackend):
             # Python 关闭时可能会出错，忽略即可
             pass
 
-    def pull_recent_days(self, days: int, local_data_dir: str = "output") -> int:
+    def download_databases(
+        self,
+        targets: List[Tuple[str, Path]],
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, Tuple[Optional[Path], Optional[str]]]:
+        """
+        并行下载多个远程数据库（基础库 + 回放增量段）
+
+        Args:
+            targets: [(远程对象键, 本地目标路径)]
+            max_workers: 最大并行数（默认 transfer_workers）
+
+        Returns:
+            {远程对象键: (本地路径, 错误信息)}，远程不存在时本地路径和错误信息均为 None
+        """
+        def download(target: Tuple[str, Path]) -> Tuple[Optional[Path], Optional[str]]:
+            r2_key, local_path = target
+            local_path = Path(local_path)
+            try:
+                local_path.parent.mkdir(parents=True, exist_ok=True)
+                db_type = r2_key.split("/", 1)[0]
+                return self.download_database(r2_key, local_path, db_type), None
+            except Exception as e:
+                return None, str(e)
+
+        workers = max(1, min(max_workers or self.transfer_workers, len(targets) or 1))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(download, targets))
+        return {r2_key: result for (r2_key, _), result in zip(targets, results)}
+
+    def pull_recent_days(
+        self,
+        days: int,
+        local_data_dir: str = "output",
+        max_workers: Optional[int] = None,
+    ) -> int:
         """
         从远程拉取最近 N 天的数据到本地
 
         Args:
             days: 拉取天数
             local_data_dir: 本地数据目录
+            max_workers: 并行下载数（默认 transfer_workers）
 
         Returns:
             成功拉取的数据库文件数量
@@ -1485,18 +1890,17 @@ class RemoteStorageBackend(StorageBackend):
         local_dir = Path(local_data_dir)
         local_dir.mkdir(parents=True, exist_ok=True)
 
-        pulled_count = 0
         now = self._get_configured_time()
 
         print(f"[远程存储] 开始拉取最近 {days} 天的数据...")
 
+        targets = []
         for i in range(days):
             date = now - timedelta(days=i)
             date_str = date.strftime("%Y-%m-%d")
 
             # 本地目标路径
-            local_date_dir = local_dir / date_str
-            local_db_path = local_date_dir / "news.db"
+            local_db_path = local_dir / date_str / "news.db"
 
             # 如果本地已存在，跳过
             if local_db_path.exists():
@@ -1504,24 +1908,24 @@ class RemoteStorageBackend(StorageBackend):
                 continue
 
             # 远程对象键
-            remote_key = f"news/{date_str}.db"
+            targets.append((date_str, f"news/{date_str}.db", local_db_path))
 
-            # 检查远程是否存在
-            if not self._check_object_exists(remote_key):
-                print(f"[远程存储] 跳过（远程不存在）: {date_str}")
-                continue
+        # 并行下载（基础库 + 增量段），远程不存在的日期返回 None
+        results = self.download_databases(
+            [(remote_key, local_db_path) for _, remote_key, local_db_path in targets],
+            max_workers=max_workers,
+        )
 
-            # 下载（使用 get_object + iter_chunks 处理 chunked encoding）
-            try:
-                local_date_dir.mkdir(parents=True, exist_ok=True)
-                response = self.s3_client.get_object(Bucket=self.bucket_name, Key=remote_key)
-                with open(local_db_path, 'wb') as f:
-                    for chunk in response['Body'].iter_chunks(chunk_size=1024*1024):
-                        f.write(chunk)
+        pulled_count = 0
+        for date_str, remote_key, local_db_path in targets:
+            path, error = results[remote_key]
+            if error:
+                print(f"[远程存储] 拉取失败 ({date_str}): {error}")
+            elif path is None:
+                print(f"[远程存储] 跳过（远程不存在）: {date_str}")
+            else:
                 print(f"[远程存储] 已拉取: {remote_key} -> {local_db_path}")
                 pulled_count += 1
-            except Exception as e:
-                print(f"[远程存储] 拉取失败 ({date_str}): {e}")
 
         print(f"[远程存储] 拉取完成，共下载 {pulled_count} 个数据库文件")
         return pulled_count
@@ -106,6 +106,10 @@ CREATE INDEX IF NOT EXISTS idx_news_crawl_time ON news_items(last_crawl_time);
 -- 标题索引（用于标题搜索）
 CREATE INDEX IF NOT EXISTS idx_news_title ON news_items(title);
 
+-- 平台 + 标题索引（用于增量检测新标题，覆盖 first_crawl_time）
+CREATE INDEX IF NOT EXISTS idx_news_platform_title
+    ON news_items(platform_id, title, first_crawl_time);
+
 -- URL + platform_id 唯一索引（仅对非空 URL，实现去重）
 CREATE UNIQUE INDEX IF NOT EXISTS idx_news_url_platform
     ON news_items(url, platform_id) WHERE url != '';
@@ -0,0 +1,555 @@
+# coding=utf-8
+"""
+全文搜索索引 - 跨日期的 SQLite FTS5 倒排索引
+
+按日期分库的 news/rss 数据库只能逐天打开并逐条比较标题，搜索一个月的数据要读取 30 个库。
+这里把所有日期的标题（RSS 还包括摘要）写入同一个索引库 output/.cache/search_index.db：
+
+- documents 表保存搜索结果需要的字段（来源、标题、链接、排名历史、发布时间、摘要等）
+- documents_fts 为 FTS5 外部内容表，使用 trigram 分词：按 3 字符切片，
+  中文（无空格分词）和英文单词的任意子串都能命中，与原来的 `keyword in title` 语义一致
+- 不足 3 个字符的关键词 trigram 无法检索，退回对 documents 表按日期过滤后逐行比较
+  （仍然只读取一个库）；SQLite 不支持 FTS5/trigram 时同样退回逐行比较
+- 所有命中结果最后再用 Python 的 `keyword.lower() in text.lower()` 校验，结果与逐条比较完全相同
+
+索引按 (类型, 日期, 来源) 增量维护：存储后端保存数据后替换对应来源的文档，
+indexed_days 表记录每天索引时源数据库的文件签名，读取方发现签名不一致
+（如数据来自远程同步或历史归档）时重新索引该日期。
+"""
+
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from trendradar.storage.connection import SQLiteConnectionCache, WRITER_PRAGMAS
+
+
+# trigram 分词的最短可检索长度
+TRIGRAM_MIN_LENGTH = 3
+
+# 索引库表结构版本（变化时重建索引）
+_SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS index_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,                  -- news / rss
+    date TEXT NOT NULL,                  -- YYYY-MM-DD
+    source_id TEXT NOT NULL,             -- 平台 ID / Feed ID
+    source_name TEXT NOT NULL,
+    source_order INTEGER NOT NULL,       -- 来源在当天的顺序（与按日读取时的顺序一致）
+    seq INTEGER NOT NULL,                -- 来源内的顺序
+    title TEXT NOT NULL,
+    url TEXT DEFAULT '',
+    mobile_url TEXT DEFAULT '',
+    ranks TEXT DEFAULT '[]',             -- 排名历史（JSON）
+    published_at TEXT DEFAULT '',
+    summary TEXT DEFAULT '',
+    author TEXT DEFAULT ''
+);
+
+CREATE INDEX IF NOT EXISTS idx_documents_day
+    ON documents(kind, date, source_order, seq);
+
+CREATE TABLE IF NOT EXISTS indexed_days (
+    kind TEXT NOT NULL,
+    date TEXT NOT NULL,
+    signature TEXT NOT NULL,             -- 源数据文件签名
+    PRIMARY KEY (kind, date)
+);
+"""
+
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(
+    title, summary, content='documents', content_rowid='id', tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS documents_ai AFTER INSERT ON documents BEGIN
+    INSERT INTO documents_fts(rowid, title, summary) VALUES (new.id, new.title, new.summary);
+END;
+
+CREATE TRIGGER IF NOT EXISTS documents_ad AFTER DELETE ON documents BEGIN
+    INSERT INTO documents_fts(documents_fts, rowid, title, summary)
+    VALUES ('delete', old.id, old.title, old.summary);
+END;
+"""
+
+
+class SearchDocument(NamedTuple):
+    """待索引的文档（一个来源在一天内的一条标题）"""
+    source_id: str
+    source_name: str
+    title: str
+    url: str = ""
+    mobile_url: str = ""
+    ranks: List[int] = []
+    published_at: str = ""
+    summary: str = ""
+    author: str = ""
+
+
+class SearchHit(NamedTuple):
+    """搜索结果"""
+    date: str
+    source_id: str
+    source_name: str
+    title: str
+    url: str
+    mobile_url: str
+    ranks: List[int]
+    published_at: str
+    summary: str
+    author: str
+    score: float              # bm25 相关度（越小越相关，逐行比较时为 0）
+    match_in: str             # "title" 或 "summary"
+
+
+def documents_from_titles(all_titles: Dict, id_to_name: Dict) -> List[SearchDocument]:
+    """
+    由按日读取的数据（all_titles, id_to_name）构建文档
+
+    Args:
+        all_titles: {来源 ID: {标题: 信息}}（MCP 解析服务 / 历史归档的返回结构）
+        id_to_name: 来源 ID 到名称的映射
+
+    Returns:
+        文档列表
+    """
+    documents = []
+    for source_id, titles in all_titles.items():
+        source_name = id_to_name.get(source_id, source_id)
+        for title, info in titles.items():
+            documents.append(SearchDocument(
+                source_id=source_id,
+                source_name=source_name,
+                title=title,
+                url=info.get("url", "") or "",
+                mobile_url=info.get("mobileUrl", "") or "",
+                ranks=list(info.get("ranks", []) or []),
+                published_at=info.get("published_at", "") or "",
+                summary=info.get("summary", "") or "",
+                author=info.get("author", "") or "",
+            ))
+    return documents
+
+
+def _placeholders(values: Sequence) -> str:
+    return ",".join("?" * len(values))
+
+
+# documents 表中除 id/kind/date 外的列（与 replace_documents 构建的行顺序一致）
+_DOCUMENT_FIELDS = (
+    "source_id", "source_name", "source_order", "seq", "title", "url",
+    "mobile_url", "ranks", "published_at", "summary", "author",
+)
+_DOCUMENT_COLUMNS = ", ".join(_DOCUMENT_FIELDS)
+
+
+def _document_key(row: Sequence) -> Tuple[str, str, str]:
+    """(kind, date, 字段...) 行中决定 FTS 内容的键：来源、标题、摘要"""
+    return row[2], row[6], row[11]
+
+
+def collect_news_documents(
+    cursor: sqlite3.Cursor,
+    platform_ids: Optional[Sequence[str]] = None,
+) -> List[SearchDocument]:
+    """
+    从当天的热榜数据库读取文档（与 MCP 解析服务按日读取的结果相同）
+
+    Args:
+        cursor: 热榜数据库游标
+        platform_ids: 只读取这些平台，None 表示全部
+
+    Returns:
+        文档列表
+    """
+    where = f"WHERE n.platform_id IN ({_placeholders(platform_ids)})" if platform_ids else ""
+    params = list(platform_ids or [])
+
+    cursor.execute(f"""
+        SELECT rh.news_item_id, rh.rank
+        FROM rank_history rh
+        JOIN news_items n ON n.id = rh.news_item_id
+        {where}
+        ORDER BY rh.news_item_id, rh.crawl_time
+    """, params)
+    rank_history: Dict[int, List[int]] = {}
+    for news_id, rank in cursor.fetchall():
+        rank_history.setdefault(news_id, []).append(rank)
+
+    cursor.execute(f"""
+        SELECT n.id, n.platform_id, p.name, n.title, n.rank, n.url, n.mobile_url
+        FROM news_items n
+        LEFT JOIN platforms p ON n.platform_id = p.id
+        {where}
+        ORDER BY n.id
+    """, params)
+    all_titles: Dict[str, Dict[str, Dict]] = {}
+    id_to_name: Dict[str, str] = {}
+    for news_id, platform_id, platform_name, title, rank, url, mobile_url in cursor.fetchall():
+        id_to_name.setdefault(platform_id, platform_name or platform_id)
+        all_titles.setdefault(platform_id, {})[title] = {
+            "ranks": rank_history.get(news_id, [rank]),
+            "url": url or "",
+            "mobileUrl": mobile_url or "",
+        }
+    return documents_from_titles(all_titles, id_to_name)
+
+
+def collect_rss_documents(
+    cursor: sqlite3.Cursor,
+    feed_ids: Optional[Sequence[str]] = None,
+) -> List[SearchDocument]:
+    """
+    从当天的 RSS 数据库读取文档（与 MCP 解析服务按日读取的结果相同）
+
+    Args:
+        cursor: RSS 数据库游标
+        feed_ids: 只读取这些 Feed，None 表示全部
+
+    Returns:
+        文档列表
+    """
+    where = f"WHERE i.feed_id IN ({_placeholders(feed_ids)})" if feed_ids else ""
+    cursor.execute(f"""
+        SELECT i.feed_id, f.name, i.title, i.url, i.published_at, i.summary, i.author
+        FROM rss_items i
+        LEFT JOIN rss_feeds f ON i.feed_id = f.id
+        {where}
+        ORDER BY i.published_at DESC
+    """, list(feed_ids or []))
+    all_items: Dict[str, Dict[str, Dict]] = {}
+    id_to_name: Dict[str, str] = {}
+    for feed_id, feed_name, title, url, published_at, summary, author in cursor.fetchall():
+        id_to_name.setdefault(feed_id, feed_name or feed_id)
+        all_items.setdefault(feed_id, {})[title] = {
+            "url": url or "",
+            "published_at": published_at or "",
+            "summary": summary or "",
+            "author": author or "",
+        }
+    return documents_from_titles(all_items, id_to_name)
+
+
+def news_source_order(cursor: sqlite3.Cursor) -> List[str]:
+    """
+    热榜数据库中平台的顺序（按日读取时平台按首条新闻出现的先后排列）
+
+    Args:
+        cursor: 热榜数据库游标
+
+    Returns:
+        平台 ID 列表
+    """
+    cursor.execute("SELECT platform_id FROM news_items GROUP BY platform_id ORDER BY MIN(id)")
+    return [row[0] for row in cursor.fetchall()]
+
+
+def rss_source_order(cursor: sqlite3.Cursor) -> List[str]:
+    """
+    RSS 数据库中 Feed 的顺序（按日读取时条目按发布时间降序排列）
+
+    Args:
+        cursor: RSS 数据库游标
+
+    Returns:
+        Feed ID 列表
+    """
+    cursor.execute("SELECT feed_id FROM rss_items GROUP BY feed_id ORDER BY MAX(published_at) DESC")
+    return [row[0] for row in cursor.fetchall()]
+
+
+class SearchIndex:
+    """
+    跨日期全文搜索索引
+
+    同一个索引文件可被抓取进程（写入新数据）和 MCP 服务（补齐索引、查询）同时使用，
+    WAL 模式下读写互不阻塞，写入之间由 SQLite 文件锁串行化。
+    """
+
+    # 排序方式
+    ORDER_DATE = "date"            # 日期升序，日期内按来源顺序与来源内顺序
+    ORDER_PUBLISHED = "published"  # 发布时间降序（RSS）
+    ORDER_RELEVANCE = "relevance"  # bm25 相关度，相同时日期降序
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Args:
+            path: 索引文件路径
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connections = SQLiteConnectionCache(1, pragmas=WRITER_PRAGMAS, row_factory=None)
+        self._lock = threading.RLock()
+        self.fts_enabled = False
+
+    def _init_schema(self, conn: sqlite3.Connection) -> None:
+        """建表；表结构版本变化时清空重建"""
+        conn.executescript(_SCHEMA)
+        row = conn.execute("SELECT value FROM index_meta WHERE key = 'schema_version'").fetchone()
+        if row is not None and row[0] != str(_SCHEMA_VERSION):
+            conn.executescript("""
+                DROP TABLE IF EXISTS documents_fts;
+                DELETE FROM documents;
+                DELETE FROM indexed_days;
+            """)
+        conn.execute(
+            "INSERT OR REPLACE INTO index_meta (key, value) VALUES ('schema_version', ?)",
+            (str(_SCHEMA_VERSION),),
+        )
+        try:
+            conn.executescript(_FTS_SCHEMA)
+        except sqlite3.OperationalError as e:
+            # SQLite 未编译 FTS5 或版本低于 3.34（无 trigram 分词）
+            print(f"[搜索索引] FTS5 trigram 不可用，使用逐行匹配: {e}")
+        conn.commit()
+
+    def _on_connect(self, conn: sqlite3.Connection) -> None:
+        """注册 Python 小写函数（SQLite 的 lower() 只处理 ASCII），检测 FTS 表是否可用"""
+        conn.create_function("py_lower", 1, lambda text: text.lower() if text else "", deterministic=True)
+        self.fts_enabled = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'documents_fts'"
+        ).fetchone() is not None
+
+    def _connection(self) -> sqlite3.Connection:
+        return self._connections.get(self.path, init=self._init_schema, on_connect=self._on_connect)
+
+    def close(self) -> None:
+        """关闭索引连接"""
+        with self._lock:
+            self._connections.close_all()
+
+    # ========================================
+    # 维护
+    # ========================================
+
+    def get_signature(self, kind: str, date: str) -> Optional[str]:
+        """
+        获取某天索引时记录的源数据签名
+
+        Args:
+            kind: "news" 或 "rss"
+            date: 日期字符串（YYYY-MM-DD）
+
+        Returns:
+            签名，未索引时返回 None
+        """
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT signature FROM indexed_days WHERE kind = ? AND date = ?", (kind, date)
+            ).fetchone()
+        return row[0] if row else None
+
+    def replace_documents(
+        self,
+        kind: str,
+        date: str,
+        documents: Iterable[SearchDocument],
+        signature: Optional[str],
+        source_ids: Optional[Iterable[str]] = None,
+        source_order: Optional[Sequence[str]] = None,
+    ) -> int:
+        """
+        替换某天的文档（一个事务内完成，查询方不会看到中间状态）
+
+        Args:
+            kind: "news" 或 "rss"
+            date: 日期字符串
+            documents: 新文档（按日读取时的顺序）
+            signature: 源数据签名（None 表示该日期已无数据，同时删除记录）
+            source_ids: 只替换这些来源的文档，None 表示替换整天
+            source_order: 当天全部来源的顺序（news_source_order / rss_source_order），
+                None 时按 documents 中来源出现的先后排列
+
+        Returns:
+            写入的文档数
+        """
+        documents = list(documents)
+        if source_order is None:
+            source_order = list(dict.fromkeys(doc.source_id for doc in documents))
+        order = {source_id: position for position, source_id in enumerate(source_order)}
+
+        rows = []
+        seq: Dict[str, int] = {}
+        for doc in documents:
+            position = seq.get(doc.source_id, 0)
+            seq[doc.source_id] = position + 1
+            rows.append((
+                kind, date, doc.source_id, doc.source_name, order.get(doc.source_id, len(order)),
+                position, doc.title, doc.url, doc.mobile_url, json.dumps(doc.ranks),
+                doc.published_at, doc.summary, doc.author,
+            ))
+
+        with self._lock:
+            conn = self._connection()
+            try:
+                day_filter = "kind = ? AND date = ?"
+                day_params: List = [kind, date]
+                if source_ids is not None:
+                    source_ids = list(source_ids)
+                    day_filter += f" AND source_id IN ({_placeholders(source_ids)})"
+                    day_params.extend(source_ids)
+                    # 新来源可能改变其他来源的顺序
+                    conn.executemany(
+                        "UPDATE documents SET source_order = ? "
+                        "WHERE kind = ? AND date = ? AND source_id = ? AND source_order != ?",
+                        [(position, kind, date, source_id, position) for source_id, position in order.items()],
+                    )
+
+                # 标题/摘要不变的文档（多数条目每次抓取只有排名变化）原地更新其余字段，
+                # 只有新增和删除的文档需要维护 FTS
+                existing: Dict[Tuple[str, str, str], Tuple] = {}
+                stale_ids = []
+                if source_ids is None or source_ids:
+                    for row in conn.execute(
+                        f"SELECT id, kind, date, {_DOCUMENT_COLUMNS} FROM documents WHERE {day_filter}",
+                        day_params,
+                    ):
+                        key = _document_key(row[1:])
+                        if key in existing:
+                            stale_ids.append(row[0])
+                        else:
+                            existing[key] = row
+
+                inserts, updates = [], []
+                for row in rows:
+                    current = existing.pop(_document_key(row), None)
+                    if current is None:
+                        inserts.append(row)
+                    elif current[1:] != row:
+                        updates.append((*row[2:], current[0]))
+                stale_ids.extend(current[0] for current in existing.values())
+
+                conn.executemany("DELETE FROM documents WHERE id = ?", [(i,) for i in stale_ids])
+                conn.executemany(f"""
+                    UPDATE documents SET ({_DOCUMENT_COLUMNS}) = ({_placeholders(_DOCUMENT_FIELDS)})
+                    WHERE id = ?
+                """, updates)
+                conn.executemany(f"""
+                    INSERT INTO documents (kind, date, {_DOCUMENT_COLUMNS})
+                    VALUES (?, ?, {_placeholders(_DOCUMENT_FIELDS)})
+                """, inserts)
+                if signature is None:
+                    conn.execute("DELETE FROM indexed_days WHERE kind = ? AND date = ?", (kind, date))
+                else:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO indexed_days (kind, date, signature) VALUES (?, ?, ?)",
+                        (kind, date, signature),
+                    )
+                conn.commit()
+            except sqlite3.Error:
+                conn.rollback()
+                raise
+        return len(rows)
+
+    def remove_day(self, kind: str, date: str) -> None:
+        """删除某天的所有文档"""
+        self.replace_documents(kind, date, [], None)
+
+    # ========================================
+    # 查询
+    # ========================================
+
+    def search(
+        self,
+        kind: str,
+        keyword: str,
+        dates: Sequence[str],
+        source_ids: Optional[Sequence[str]] = None,
+        include_summary: bool = False,
+        order: str = ORDER_DATE,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> Tuple[List[SearchHit], int]:
+        """
+        搜索包含关键词的文档（不区分大小写的子串匹配）
+
+        Args:
+            kind: "news" 或 "rss"
+            keyword: 关键词
+            dates: 日期列表
+            source_ids: 来源过滤，None 表示全部
+            include_summary: 是否同时匹配摘要
+            order: 排序方式（ORDER_DATE / ORDER_PUBLISHED / ORDER_RELEVANCE）
+            limit: 返回条数，None 表示全部
+            offset: 跳过的条数
+
+        Returns:
+            (当前页结果, 命中总数)
+        """
+        keyword_lower = keyword.lower()
+        if not keyword_lower or not dates:
+            return [], 0
+
+        conditions = ["d.kind = ?", f"d.date IN ({_placeholders(dates)})"]
+        params: List = [kind, *dates]
+        if source_ids:
+            conditions.append(f"d.source_id IN ({_placeholders(source_ids)})")
+            params.extend(source_ids)
+
+        order_by = {
+            self.ORDER_DATE: "d.date, d.source_order, d.seq",
+            self.ORDER_PUBLISHED: "d.published_at DESC, d.date, d.source_order, d.seq",
+            self.ORDER_RELEVANCE: "score, d.date DESC, d.source_order, d.seq",
+        }.get(order)
+        if order_by is None:
+            raise ValueError(f"不支持的排序方式: {order}")
+
+        columns = ("d.date, d.source_id, d.source_name, d.title, d.url, d.mobile_url, "
+                   "d.ranks, d.published_at, d.summary, d.author")
+        with self._lock:
+            conn = self._connection()
+            if self.fts_enabled and len(keyword_lower) >= TRIGRAM_MIN_LENGTH:
+                column_filter = "{title summary}" if include_summary else "title"
+                phrase = '"' + keyword_lower.replace('"', '""') + '"'
+                # CROSS JOIN 固定以 FTS 结果为外层循环，避免规划器按日期逐行执行 MATCH
+                sql = f"""
+                    SELECT {columns}, bm25(documents_fts) AS score
+                    FROM documents_fts
+                    CROSS JOIN documents d ON d.id = documents_fts.rowid
+                    WHERE documents_fts MATCH ? AND {" AND ".join(conditions)}
+                    ORDER BY {order_by}
+                """
+                rows = conn.execute(sql, [f"{column_filter} : {phrase}", *params]).fetchall()
+            else:
+                match = "instr(py_lower(d.title), ?) > 0"
+                match_params = [keyword_lower]
+                if include_summary:
+                    match = f"({match} OR instr(py_lower(d.summary), ?) > 0)"
+                    match_params.append(keyword_lower)
+                sql = f"""
+                    SELECT {columns}, 0.0 AS score
+                    FROM documents d
+                    WHERE {" AND ".join(conditions)} AND {match}
+                    ORDER BY {order_by}
+                """
+                rows = conn.execute(sql, [*params, *match_params]).fetchall()
+
+        hits = []
+        for (date, source_id, source_name, title, url, mobile_url,
+             ranks, published_at, summary, author, score) in rows:
+            # 以 Python 的大小写转换为准校验（FTS 的大小写折叠规则与 str.lower() 略有不同）
+            if keyword_lower in title.lower():
+                match_in = "title"
+            elif include_summary and summary and keyword_lower in summary.lower():
+                match_in = "summary"
+            else:
+                continue
+            hits.append(SearchHit(
+                date, source_id, source_name, title, url or "", mobile_url or "",
+                json.loads(ranks or "[]"), published_at or "", summary or "", author or "",
+                score, match_in,
+            ))
+
+        total = len(hits)
+        offset = max(0, offset)
+        page = hits[offset:offset + limit] if limit is not None else hits[offset:]
+        return page, total
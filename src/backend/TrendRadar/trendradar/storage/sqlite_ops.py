@@ -0,0 +1,636 @@
+# coding=utf-8
+"""
+SQLite 写入操作 - 本地/远程后端共用
+
+提供两种新闻条目写入方式：
+- save_news_items_bulk: 批量写入（默认），按平台一次性查询已有记录，
+  使用 executemany 批量写入 news_items / title_changes / rank_history
+- save_news_items_rowwise: 逐条写入（兼容旧逻辑），每条新闻单独 SELECT + UPDATE/INSERT
+
+两种方式的写入结果完全一致，调用方负责事务提交。
+save_news_items 按配置选择写入方式：批量写入出错时回滚批量写入的部分，
+改为逐条写入（与旧逻辑一致，单条失败只跳过该条）。
+
+批量写入时，NewsData.unchanged_ids 中的平台（响应与上次抓取完全相同）
+直接用两条集合语句刷新上次抓取的记录，跳过 URL 标准化和逐条比对。
+
+新增检测（find_new_titles / find_new_rss_items）只按当前批次的标题/URL
+做索引查询，耗时与批次大小成正比，而不是重新加载当天全部历史数据。
+
+流式读取（iter_news_rows_by_platform / iter_rss_rows_by_feed）每次只查询并产出
+一个平台/Feed 的数据，峰值内存与单个平台的数据量成正比。
+"""
+
+import sqlite3
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from trendradar.storage.base import NewsData, NewsItem, NewsRow, RSSData, RSSItem, RSSRow
+from trendradar.utils.url import normalize_url
+
+
+# SQLite 单条语句的参数上限（旧版本为 999），查询时按此分块
+SQLITE_MAX_PARAMS = 900
+
+
+def _chunked(values: Sequence, size: int = SQLITE_MAX_PARAMS):
+    """按固定大小切分序列"""
+    for i in range(0, len(values), size):
+        yield values[i:i + size]
+
+
+def _lookup_existing(
+    cursor: sqlite3.Cursor,
+    platform_id: str,
+    urls: Sequence[str],
+) -> Dict[str, Tuple[int, str]]:
+    """
+    按 (url, platform_id) 批量查询已有记录
+
+    Args:
+        cursor: 数据库游标
+        platform_id: 平台 ID
+        urls: 标准化后的 URL 列表
+
+    Returns:
+        {url: (news_item_id, title)}
+    """
+    existing: Dict[str, Tuple[int, str]] = {}
+    for chunk in _chunked(list(urls)):
+        placeholders = ",".join("?" * len(chunk))
+        cursor.execute(f"""
+            SELECT id, url, title FROM news_items
+            WHERE platform_id = ? AND url IN ({placeholders})
+        """, (platform_id, *chunk))
+        for row in cursor.fetchall():
+            existing[row[1]] = (row[0], row[2])
+    return existing
+
+
+def _touch_unchanged_platform(
+    cursor: sqlite3.Cursor,
+    platform_id: str,
+    news_list: List[NewsItem],
+    crawl_time: str,
+    now_str: str,
+) -> bool:
+    """
+    刷新响应未变化的平台：沿用上次抓取的记录，只追加排名历史并更新抓取时间/次数
+
+    仅当上次抓取的记录与本次条目一一对应时才走快速路径
+    （所有条目都有 URL，且上次抓取时间下的记录数与条目数相同），否则返回 False。
+
+    Args:
+        cursor: 数据库游标
+        platform_id: 平台 ID
+        news_list: 本次抓取的条目
+        crawl_time: 本次抓取时间
+        now_str: 当前时间字符串
+
+    Returns:
+        是否已完成刷新
+    """
+    if not news_list or any(not item.url for item in news_list):
+        return False
+
+    cursor.execute("""
+        SELECT last_crawl_time, COUNT(*) FROM news_items
+        WHERE platform_id = ?
+        GROUP BY last_crawl_time
+        ORDER BY last_crawl_time DESC
+        LIMIT 1
+    """, (platform_id,))
+    row = cursor.fetchone()
+    if not row or row[0] >= crawl_time or row[1] != len(news_list):
+        return False
+
+    prev_crawl_time = row[0]
+    cursor.execute("""
+        INSERT INTO rank_history (news_item_id, rank, crawl_time, created_at)
+        SELECT id, rank, ?, ? FROM news_items
+        WHERE platform_id = ? AND last_crawl_time = ?
+    """, (crawl_time, now_str, platform_id, prev_crawl_time))
+    cursor.execute("""
+        UPDATE news_items SET
+            last_crawl_time = ?,
+            crawl_count = crawl_count + 1,
+            updated_at = ?
+        WHERE platform_id = ? AND last_crawl_time = ?
+    """, (crawl_time, now_str, platform_id, prev_crawl_time))
+    return True
+
+
+def save_news_items_bulk(
+    cursor: sqlite3.Cursor,
+    data: NewsData,
+    now_str: str,
+) -> Tuple[int, int, int]:
+    """
+    批量写入新闻条目（以标准化 URL + platform_id 为唯一标识）
+
+    流程（每个平台）：
+    1. 预先标准化所有 URL
+    2. 一次查询解析已存在的记录
+    3. executemany 插入新记录，再一次查询取回新记录 id
+    4. 按原顺序计算标题变更与更新，executemany 写入 title_changes / news_items / rank_history
+
+    同一批次内重复出现的 URL 与逐条写入的语义一致：首次出现时插入，之后视为更新。
+
+    Args:
+        cursor: 数据库游标
+        data: 新闻数据
+        now_str: 当前时间字符串（YYYY-MM-DD HH:MM:SS）
+
+    Returns:
+        (新增数, 更新数, 标题变更数)
+    """
+    new_count = 0
+    updated_count = 0
+    title_changed_count = 0
+    crawl_time = data.crawl_time
+    unchanged_ids = set(data.unchanged_ids)
+
+    for source_id, news_list in data.items.items():
+        # 响应未变化的平台走快速路径
+        if source_id in unchanged_ids and _touch_unchanged_platform(
+            cursor, source_id, news_list, crawl_time, now_str
+        ):
+            updated_count += len(news_list)
+            continue
+
+        # 1. 预先标准化 URL
+        url_items: List[Tuple[str, NewsItem]] = []
+        empty_url_items: List[NewsItem] = []
+        for item in news_list:
+            normalized_url = normalize_url(item.url, source_id) if item.url else ""
+            if normalized_url:
+                url_items.append((normalized_url, item))
+            else:
+                empty_url_items.append(item)
+
+        # 2. 一次查询解析已存在的记录
+        state = _lookup_existing(cursor, source_id, {url for url, _ in url_items})
+
+        # 区分首次插入和更新（批次内重复 URL 的后续出现视为更新）
+        insert_rows = []
+        inserted_urls: List[str] = []
+        first_ranks: Dict[str, int] = {}
+        pending_updates: List[Tuple[str, NewsItem]] = []
+        for url, item in url_items:
+            if url in state or url in first_ranks:
+                pending_updates.append((url, item))
+            else:
+                first_ranks[url] = item.rank
+                inserted_urls.append(url)
+                insert_rows.append((
+                    item.title, source_id, item.rank, url, item.mobile_url,
+                    crawl_time, crawl_time, now_str, now_str,
+                ))
+
+        rank_rows = []
+
+        # 3. 批量插入新记录并取回 id
+        if insert_rows:
+            cursor.executemany("""
+                INSERT INTO news_items
+                (title, platform_id, rank, url, mobile_url,
+                 first_crawl_time, last_crawl_time, crawl_count,
+                 created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
+            """, insert_rows)
+            state.update(_lookup_existing(cursor, source_id, inserted_urls))
+            for url in inserted_urls:
+                rank_rows.append((state[url][0], first_ranks[url], crawl_time, now_str))
+            new_count += len(insert_rows)
+
+        # 4. 按原顺序计算标题变更与更新
+        title_change_rows = []
+        update_rows = []
+        for url, item in pending_updates:
+            existing_id, existing_title = state[url]
+            if existing_title != item.title:
+                title_change_rows.append((existing_id, existing_title, item.title, now_str))
+                state[url] = (existing_id, item.title)
+            rank_rows.append((existing_id, item.rank, crawl_time, now_str))
+            update_rows.append((item.title, item.rank, item.mobile_url,
+                                crawl_time, now_str, existing_id))
+
+        if title_change_rows:
+            cursor.executemany("""
+                INSERT INTO title_changes
+                (news_item_id, old_title, new_title, changed_at)
+                VALUES (?, ?, ?, ?)
+            """, title_change_rows)
+            title_changed_count += len(title_change_rows)
+
+        if update_rows:
+            cursor.executemany("""
+                UPDATE news_items SET
+                    title = ?,
+                    rank = ?,
+                    mobile_url = ?,
+                    last_crawl_time = ?,
+                    crawl_count = crawl_count + 1,
+                    updated_at = ?
+                WHERE id = ?
+            """, update_rows)
+            updated_count += len(update_rows)
+
+        # URL 为空的条目没有唯一键，逐条插入以获取 id（这类条目很少）
+        for item in empty_url_items:
+            cursor.execute("""
+                INSERT INTO news_items
+                (title, platform_id, rank, url, mobile_url,
+                 first_crawl_time, last_crawl_time, crawl_count,
+                 created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
+            """, (item.title, source_id, item.rank, "",
+                  item.mobile_url, crawl_time, crawl_time,
+                  now_str, now_str))
+            rank_rows.append((cursor.lastrowid, item.rank, crawl_time, now_str))
+            new_count += 1
+
+        if rank_rows:
+            cursor.executemany("""
+                INSERT INTO rank_history
+                (news_item_id, rank, crawl_time, created_at)
+                VALUES (?, ?, ?, ?)
+            """, rank_rows)
+
+    return new_count, updated_count, title_changed_count
+
+
+def save_news_items_rowwise(
+    cursor: sqlite3.Cursor,
+    data: NewsData,
+    now_str: str,
+    log_prefix: str = "[存储]",
+) -> Tuple[int, int, int]:
+    """
+    逐条写入新闻条目（旧逻辑，单条失败不影响其他条目）
+
+    Args:
+        cursor: 数据库游标
+        data: 新闻数据
+        now_str: 当前时间字符串（YYYY-MM-DD HH:MM:SS）
+        log_prefix: 日志前缀
+
+    Returns:
+        (新增数, 更新数, 标题变更数)
+    """
+    new_count = 0
+    updated_count = 0
+    title_changed_count = 0
+
+    for source_id, news_list in data.items.items():
+        for item in news_list:
+            try:
+                # 标准化 URL（去除动态参数，如微博的 band_rank）
+                normalized_url = normalize_url(item.url, source_id) if item.url else ""
+
+                existing = None
+                if normalized_url:
+                    cursor.execute("""
+                        SELECT id, title FROM news_items
+                        WHERE url = ? AND platform_id = ?
+                    """, (normalized_url, source_id))
+                    existing = cursor.fetchone()
+
+                if existing:
+                    existing_id, existing_title = existing[0], existing[1]
+
+                    # 检查标题是否变化
+                    if existing_title != item.title:
+                        cursor.execute("""
+                            INSERT INTO title_changes
+                            (news_item_id, old_title, new_title, changed_at)
+                            VALUES (?, ?, ?, ?)
+                        """, (existing_id, existing_title, item.title, now_str))
+                        title_changed_count += 1
+
+                    # 记录排名历史
+                    cursor.execute("""
+                        INSERT INTO rank_history
+                        (news_item_id, rank, crawl_time, created_at)
+                        VALUES (?, ?, ?, ?)
+                    """, (existing_id, item.rank, data.crawl_time, now_str))
+
+                    # 更新现有记录
+                    cursor.execute("""
+                        UPDATE news_items SET
+                            title = ?,
+                            rank = ?,
+                            mobile_url = ?,
+                            last_crawl_time = ?,
+                            crawl_count = crawl_count + 1,
+                            updated_at = ?
+                        WHERE id = ?
+                    """, (item.title, item.rank, item.mobile_url,
+                          data.crawl_time, now_str, existing_id))
+                    updated_count += 1
+                else:
+                    # 不存在或 URL 为空，插入新记录（存储标准化后的 URL）
+                    cursor.execute("""
+                        INSERT INTO news_items
+                        (title, platform_id, rank, url, mobile_url,
+                         first_crawl_time, last_crawl_time, crawl_count,
+                         created_at, updated_at)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
+                    """, (item.title, source_id, item.rank, normalized_url,
+                          item.mobile_url, data.crawl_time, data.crawl_time,
+                          now_str, now_str))
+                    new_id = cursor.lastrowid
+                    # 记录初始排名
+                    cursor.execute("""
+                        INSERT INTO rank_history
+                        (news_item_id, rank, crawl_time, created_at)
+                        VALUES (?, ?, ?, ?)
+                    """, (new_id, item.rank, data.crawl_time, now_str))
+                    new_count += 1
+
+            except sqlite3.Error as e:
+                print(f"{log_prefix} 保存新闻条目失败 [{item.title[:30]}...]: {e}")
+
+    return new_count, updated_count, title_changed_count
+
+
+def save_news_items(
+    cursor: sqlite3.Cursor,
+    data: NewsData,
+    now_str: str,
+    bulk: bool = True,
+    log_prefix: str = "[存储]",
+) -> Tuple[int, int, int]:
+    """
+    写入新闻条目（批量写入失败时回退为逐条写入）
+
+    批量写入在保存点内执行，出错时只回滚本次写入的新闻条目（同一事务中
+    已写入的平台信息等保留），再逐条写入，单条失败不影响其他条目。
+
+    Args:
+        cursor: 数据库游标
+        data: 新闻数据
+        now_str: 当前时间字符串（YYYY-MM-DD HH:MM:SS）
+        bulk: 是否使用批量写入
+        log_prefix: 日志前缀
+
+    Returns:
+        (新增数, 更新数, 标题变更数)
+    """
+    if not bulk:
+        return save_news_items_rowwise(cursor, data, now_str, log_prefix=log_prefix)
+
+    cursor.execute("SAVEPOINT save_news_items")
+    try:
+        result = save_news_items_bulk(cursor, data, now_str)
+    except sqlite3.Error as e:
+        cursor.execute("ROLLBACK TO SAVEPOINT save_news_items")
+        cursor.execute("RELEASE SAVEPOINT save_news_items")
+        print(f"{log_prefix} 批量写入失败，改为逐条写入: {e}")
+        return save_news_items_rowwise(cursor, data, now_str, log_prefix=log_prefix)
+    cursor.execute("RELEASE SAVEPOINT save_news_items")
+    return result
+
+
+def _has_items_before(
+    cursor: sqlite3.Cursor,
+    table: str,
+    owner_column: str,
+    before_time: str,
+    owner_ids: Optional[Iterable[str]] = None,
+) -> bool:
+    """
+    检查是否存在首次抓取时间早于 before_time 的记录
+
+    Args:
+        cursor: 数据库游标
+        table: 表名（news_items / rss_items）
+        owner_column: 来源列名（platform_id / feed_id）
+        before_time: 当前批次时间
+        owner_ids: 只检查这些来源（None 表示全部）
+    """
+    extra = ""
+    if table == "rss_items":
+        extra = " AND url != ''"
+
+    if owner_ids is None:
+        cursor.execute(
+            f"SELECT 1 FROM {table} WHERE first_crawl_time < ?{extra} LIMIT 1",
+            (before_time,),
+        )
+        return cursor.fetchone() is not None
+
+    for chunk in _chunked(list(owner_ids)):
+        placeholders = ",".join("?" * len(chunk))
+        cursor.execute(f"""
+            SELECT 1 FROM {table}
+            WHERE first_crawl_time < ?{extra} AND {owner_column} IN ({placeholders})
+            LIMIT 1
+        """, (before_time, *chunk))
+        if cursor.fetchone() is not None:
+            return True
+    return False
+
+
+def _lookup_seen(
+    cursor: sqlite3.Cursor,
+    table: str,
+    owner_column: str,
+    key_column: str,
+    owner_id: str,
+    keys: Sequence[str],
+    before_time: str,
+) -> Set[str]:
+    """
+    按 (来源, 标题/URL) 批量查询在 before_time 之前已出现过的键
+
+    Returns:
+        已出现过的键集合
+    """
+    seen: Set[str] = set()
+    for chunk in _chunked(list(keys)):
+        placeholders = ",".join("?" * len(chunk))
+        cursor.execute(f"""
+            SELECT DISTINCT {key_column} FROM {table}
+            WHERE {owner_column} = ? AND first_crawl_time < ?
+              AND {key_column} IN ({placeholders})
+        """, (owner_id, before_time, *chunk))
+        seen.update(row[0] for row in cursor.fetchall())
+    return seen
+
+
+def find_new_titles(
+    cursor: sqlite3.Cursor,
+    current_data: NewsData,
+    platform_ids: Optional[Iterable[str]] = None,
+) -> Dict[str, Dict[str, NewsItem]]:
+    """
+    增量检测新增标题
+
+    只有在当前批次之前（first_crawl_time < crawl_time）从未出现过的标题才算新增；
+    同一标题因 URL 变化产生多条记录时，任意一条是历史记录即视为历史标题。
+
+    - 当天没有任何记录：所有标题都是新增
+    - 有记录但都不早于当前批次（当天第一次抓取）：没有"新增"概念，返回空
+
+    Args:
+        cursor: 数据库游标
+        current_data: 当前抓取的数据
+        platform_ids: 判断"是否有历史数据"时只考虑这些平台（None 表示全部）
+
+    Returns:
+        新增的标题数据 {source_id: {title: NewsItem}}
+    """
+    cursor.execute("SELECT 1 FROM news_items LIMIT 1")
+    if cursor.fetchone() is None:
+        return {
+            source_id: {item.title: item for item in news_list}
+            for source_id, news_list in current_data.items.items()
+        }
+
+    current_time = current_data.crawl_time
+    if not _has_items_before(cursor, "news_items", "platform_id", current_time, platform_ids):
+        return {}
+
+    new_titles: Dict[str, Dict[str, NewsItem]] = {}
+    for source_id, news_list in current_data.items.items():
+        seen = _lookup_seen(
+            cursor, "news_items", "platform_id", "title",
+            source_id, {item.title for item in news_list}, current_time,
+        )
+        for item in news_list:
+            if item.title not in seen:
+                new_titles.setdefault(source_id, {})[item.title] = item
+
+    return new_titles
+
+
+def find_new_rss_items(
+    cursor: sqlite3.Cursor,
+    current_data: RSSData,
+) -> Dict[str, List[RSSItem]]:
+    """
+    增量检测新增 RSS 条目（以 URL 判断）
+
+    语义与 find_new_titles 相同：当天没有任何记录时全部视为新增，
+    没有早于当前批次的记录时返回空；URL 为空的条目不算新增。
+
+    Args:
+        cursor: 数据库游标
+        current_data: 当前抓取的 RSS 数据
+
+    Returns:
+        新增的 RSS 条目 {feed_id: [RSSItem, ...]}
+    """
+    cursor.execute("SELECT 1 FROM rss_items LIMIT 1")
+    if cursor.fetchone() is None:
+        return current_data.items.copy()
+
+    current_time = current_data.crawl_time
+    if not _has_items_before(cursor, "rss_items", "feed_id", current_time):
+        return {}
+
+    new_items: Dict[str, List[RSSItem]] = {}
+    for feed_id, rss_list in current_data.items.items():
+        seen = _lookup_seen(
+            cursor, "rss_items", "feed_id", "url",
+            feed_id, {item.url for item in rss_list if item.url}, current_time,
+        )
+        for item in rss_list:
+            if item.url and item.url not in seen:
+                new_items.setdefault(feed_id, []).append(item)
+
+    return new_items
+
+
+def iter_news_rows_by_platform(
+    cursor: sqlite3.Cursor,
+    platform_ids: Optional[Iterable[str]] = None,
+) -> Iterator[Tuple[str, str, List[NewsRow]]]:
+    """
+    按平台流式读取当天所有新闻（含去重后的排名历史）
+
+    平台按 ID 排序，平台内按最后出现时间排序（与 get_today_all_data 一致）。
+
+    Args:
+        cursor: 数据库游标（迭代期间不应被调用方用于其他查询）
+        platform_ids: 只读取这些平台，None 表示全部
+
+    Yields:
+        (平台 ID, 平台名称, 新闻行列表)
+    """
+    wanted = set(platform_ids) if platform_ids is not None else None
+    cursor.execute("""
+        SELECT n.platform_id, p.name
+        FROM (SELECT DISTINCT platform_id FROM news_items) n
+        LEFT JOIN platforms p ON n.platform_id = p.id
+        ORDER BY n.platform_id
+    """)
+    platforms = cursor.fetchall()
+
+    for platform_id, platform_name in platforms:
+        if wanted is not None and platform_id not in wanted:
+            continue
+
+        rank_history: Dict[int, List[int]] = {}
+        cursor.execute("""
+            SELECT rh.news_item_id, rh.rank
+            FROM rank_history rh
+            JOIN news_items n ON n.id = rh.news_item_id
+            WHERE n.platform_id = ?
+            ORDER BY rh.news_item_id, rh.crawl_time
+        """, (platform_id,))
+        for news_id, rank in cursor:
+            ranks = rank_history.setdefault(news_id, [])
+            if rank not in ranks:
+                ranks.append(rank)
+
+        cursor.execute("""
+            SELECT id, title, rank, url, mobile_url,
+                   first_crawl_time, last_crawl_time, crawl_count
+            FROM news_items
+            WHERE platform_id = ?
+            ORDER BY last_crawl_time, id
+        """, (platform_id,))
+        rows = [
+            NewsRow(title, rank, url or "", mobile_url or "",
+                    rank_history.get(news_id, [rank]), first_time, last_time, count)
+            for news_id, title, rank, url, mobile_url, first_time, last_time, count in cursor
+        ]
+        yield platform_id, platform_name or platform_id, rows
+
+
+def iter_rss_rows_by_feed(cursor: sqlite3.Cursor) -> Iterator[Tuple[str, str, List[RSSRow]]]:
+    """
+    按 Feed 流式读取当天所有 RSS 条目
+
+    Feed 按最新发布时间降序（即在 published_at DESC 全表顺序中首次出现的顺序，
+    与 get_rss_data 返回的字典顺序一致），Feed 内按发布时间降序。
+
+    Args:
+        cursor: 数据库游标（迭代期间不应被调用方用于其他查询）
+
+    Yields:
+        (Feed ID, Feed 名称, 条目行列表)
+    """
+    cursor.execute("""
+        SELECT i.feed_id, f.name
+        FROM (SELECT feed_id, MAX(published_at) AS latest FROM rss_items GROUP BY feed_id) i
+        LEFT JOIN rss_feeds f ON i.feed_id = f.id
+        ORDER BY i.latest DESC
+    """)
+    feeds = cursor.fetchall()
+
+    for feed_id, feed_name in feeds:
+        cursor.execute("""
+            SELECT title, url, published_at, summary, author,
+                   first_crawl_time, last_crawl_time, crawl_count
+            FROM rss_items
+            WHERE feed_id = ?
+            ORDER BY published_at DESC
+        """, (feed_id,))
+        rows = [
+            RSSRow(title, url or "", published_at or "", summary or "", author or "",
+                   first_time, last_time, count)
+            for title, url, published_at, summary, author, first_time, last_time, count in cursor
+        ]
+        yield feed_id, feed_name or feed_id, rows
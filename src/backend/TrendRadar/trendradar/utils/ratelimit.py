@@ -0,0 +1,129 @@
+# coding=utf-8
+"""
+请求限速工具模块
+
+提供线程安全的请求间隔限速器，用于并发抓取时仍然遵守配置的请求间隔：
+- RateLimiter: 按最小间隔发放请求许可（全局预算）
+- HostRateLimiter: 按主机独立限速，并限制单个主机的并发数
+"""
+
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Tuple
+from urllib.parse import urlparse
+
+
+class RateLimiter:
+    """
+    线程安全的请求间隔限速器
+
+    将配置的请求间隔（毫秒）视为请求预算：任意两次请求的发出时间
+    至少相隔 interval（加随机抖动），与并发的线程数无关。
+    第一次请求不等待。
+    """
+
+    def __init__(
+        self,
+        interval_ms: float,
+        jitter_ms: Tuple[int, int] = (0, 0),
+        min_interval_ms: float = 0,
+    ):
+        """
+        初始化限速器
+
+        Args:
+            interval_ms: 请求间隔（毫秒）
+            jitter_ms: 每次间隔附加的随机抖动范围（毫秒），如 (-10, 20)
+            min_interval_ms: 加上抖动后的最小间隔（毫秒）
+        """
+        self.interval_ms = interval_ms
+        self.jitter_ms = jitter_ms
+        self.min_interval_ms = min_interval_ms
+        self._lock = threading.Lock()
+        self._next_time = 0.0
+
+    def _next_interval(self) -> float:
+        """计算下一次间隔（秒）"""
+        interval = self.interval_ms
+        if self.jitter_ms != (0, 0):
+            interval += random.randint(*self.jitter_ms)
+        return max(self.min_interval_ms, interval) / 1000
+
+    def acquire(self) -> float:
+        """
+        获取一次请求许可，必要时阻塞等待
+
+        Returns:
+            实际等待的秒数
+        """
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_time)
+            self._next_time = start + self._next_interval()
+
+        wait = start - now
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class HostRateLimiter:
+    """
+    按主机限速器
+
+    每个主机拥有独立的 RateLimiter 和并发信号量：
+    同一主机的请求遵守请求间隔并受并发上限约束，不同主机之间互不等待。
+    """
+
+    def __init__(
+        self,
+        interval_ms: float,
+        jitter_ms: Tuple[int, int] = (0, 0),
+        max_per_host: int = 1,
+        min_interval_ms: float = 0,
+    ):
+        """
+        初始化按主机限速器
+
+        Args:
+            interval_ms: 同一主机的请求间隔（毫秒）
+            jitter_ms: 每次间隔附加的随机抖动范围（毫秒）
+            max_per_host: 单个主机的最大并发请求数
+            min_interval_ms: 加上抖动后的最小间隔（毫秒）
+        """
+        self.interval_ms = interval_ms
+        self.jitter_ms = jitter_ms
+        self.max_per_host = max(1, max_per_host)
+        self.min_interval_ms = min_interval_ms
+        self._lock = threading.Lock()
+        self._hosts: Dict[str, Tuple[threading.Semaphore, RateLimiter]] = {}
+
+    @staticmethod
+    def get_host(url: str) -> str:
+        """从 URL 提取主机名（无法解析时返回原字符串）"""
+        return urlparse(url).netloc.lower() or url
+
+    def _get(self, host: str) -> Tuple[threading.Semaphore, RateLimiter]:
+        """获取（必要时创建）主机对应的信号量和限速器"""
+        with self._lock:
+            if host not in self._hosts:
+                self._hosts[host] = (
+                    threading.Semaphore(self.max_per_host),
+                    RateLimiter(self.interval_ms, self.jitter_ms, self.min_interval_ms),
+                )
+            return self._hosts[host]
+
+    @contextmanager
+    def limit(self, url: str) -> Iterator[None]:
+        """
+        在主机并发上限内执行一次请求（进入时按请求间隔等待）
+
+        Args:
+            url: 请求 URL 或主机名
+        """
+        semaphore, limiter = self._get(self.get_host(url))
+        with semaphore:
+            limiter.acquire()
+            yield